@@ -0,0 +1,72 @@
+// This code is generated by pgen2/grammar.py
+
+namespace grammar_nt {
+  const int augassign = 256;
+  const int and_expr = 257;
+  const int and_test = 258;
+  const int arglist = 259;
+  const int argument = 260;
+  const int arith_expr = 261;
+  const int array_item = 262;
+  const int array_literal = 263;
+  const int atom = 264;
+  const int braced_var_sub = 265;
+  const int char_literal = 266;
+  const int class_literal = 267;
+  const int class_literal_term = 268;
+  const int command_expr = 269;
+  const int comp_for = 270;
+  const int comp_op = 271;
+  const int comparison = 272;
+  const int dict = 273;
+  const int dict_pair = 274;
+  const int dq_string = 275;
+  const int end_stmt = 276;
+  const int expr = 277;
+  const int factor = 278;
+  const int func_param = 279;
+  const int func_params = 280;
+  const int lambdef = 281;
+  const int name_type = 282;
+  const int name_type_list = 283;
+  const int not_test = 284;
+  const int oil_arglist = 285;
+  const int oil_expr = 286;
+  const int oil_expr_sub = 287;
+  const int oil_for = 288;
+  const int oil_func = 289;
+  const int oil_place_mutation = 290;
+  const int oil_proc = 291;
+  const int oil_var_decl = 292;
+  const int or_test = 293;
+  const int place_list = 294;
+  const int power = 295;
+  const int proc_param = 296;
+  const int proc_params = 297;
+  const int range_char = 298;
+  const int range_expr = 299;
+  const int re_alt = 300;
+  const int re_atom = 301;
+  const int re_flag = 302;
+  const int re_flags = 303;
+  const int regex = 304;
+  const int repeat_op = 305;
+  const int repeat_range = 306;
+  const int sh_array_literal = 307;
+  const int sh_command_sub = 308;
+  const int shift_expr = 309;
+  const int simple_var_sub = 310;
+  const int splat_expr = 311;
+  const int sq_string = 312;
+  const int subscript = 313;
+  const int subscriptlist = 314;
+  const int term = 315;
+  const int test = 316;
+  const int testlist = 317;
+  const int testlist_comp = 318;
+  const int trailer = 319;
+  const int type_expr = 320;
+  const int type_expr_list = 321;
+  const int xor_expr = 322;
+
+}  // namespace grammar_nt
@@ -0,0 +1,69 @@
+# This code is generated by pgen2/grammar.py
+
+augassign = 256
+and_expr = 257
+and_test = 258
+arglist = 259
+argument = 260
+arith_expr = 261
+array_item = 262
+array_literal = 263
+atom = 264
+braced_var_sub = 265
+char_literal = 266
+class_literal = 267
+class_literal_term = 268
+command_expr = 269
+comp_for = 270
+comp_op = 271
+comparison = 272
+dict = 273
+dict_pair = 274
+dq_string = 275
+end_stmt = 276
+expr = 277
+factor = 278
+func_param = 279
+func_params = 280
+lambdef = 281
+name_type = 282
+name_type_list = 283
+not_test = 284
+oil_arglist = 285
+oil_expr = 286
+oil_expr_sub = 287
+oil_for = 288
+oil_func = 289
+oil_place_mutation = 290
+oil_proc = 291
+oil_var_decl = 292
+or_test = 293
+place_list = 294
+power = 295
+proc_param = 296
+proc_params = 297
+range_char = 298
+range_expr = 299
+re_alt = 300
+re_atom = 301
+re_flag = 302
+re_flags = 303
+regex = 304
+repeat_op = 305
+repeat_range = 306
+sh_array_literal = 307
+sh_command_sub = 308
+shift_expr = 309
+simple_var_sub = 310
+splat_expr = 311
+sq_string = 312
+subscript = 313
+subscriptlist = 314
+term = 315
+test = 316
+testlist = 317
+testlist_comp = 318
+trailer = 319
+type_expr = 320
+type_expr_list = 321
+xor_expr = 322
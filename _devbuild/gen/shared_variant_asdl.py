@@ -0,0 +1,318 @@
+from asdl import pybase
+from typing import Optional, List, Tuple, Dict, Any, cast
+
+from asdl import runtime  # For runtime.NO_SPID
+from asdl.runtime import NewRecord, NewLeaf
+from _devbuild.gen.hnode_asdl import color_e, hnode, hnode_e, hnode_t, field
+
+class expr_e(object):
+  Binary = 1
+  DoubleQuoted = 1001
+
+_expr_str = {
+  1: 'expr.Binary',
+  1001: 'expr.DoubleQuoted',
+}
+
+def expr_str(tag):
+  # type: (int) -> str
+  return _expr_str[tag]
+
+class expr_t(pybase.CompoundObj):
+  def tag_(self):
+    # type: () -> int
+    return self.tag
+  pass
+
+class expr__Binary(expr_t):
+  tag = 1
+  __slots__ = ('left', 'right', 'left_spid', 'right_spid')
+
+  def __init__(self, left=None, right=None, left_spid=None, right_spid=None):
+    # type: (Optional[expr_t], Optional[expr_t], Optional[int], Optional[int]) -> None
+    self.left = left
+    self.right = right
+    self.left_spid = left_spid
+    self.right_spid = right_spid
+  def PrettyTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('expr.Binary')
+    L = out_node.fields
+
+    assert self.left is not None
+    x0 = self.left.PrettyTree()
+    L.append(field('left', x0))
+
+    assert self.right is not None
+    x1 = self.right.PrettyTree()
+    L.append(field('right', x1))
+
+    x2 = hnode.Leaf(str(self.left_spid), color_e.OtherConst)
+    L.append(field('left_spid', x2))
+
+    x3 = hnode.Leaf(str(self.right_spid), color_e.OtherConst)
+    L.append(field('right_spid', x3))
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('expr.Binary')
+    L = out_node.fields
+    assert self.left is not None
+    x0 = self.left.AbbreviatedTree()
+    L.append(field('left', x0))
+
+    assert self.right is not None
+    x1 = self.right.AbbreviatedTree()
+    L.append(field('right', x1))
+
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> hnode_t
+    return self._AbbreviatedTree()
+
+class expr(object):
+  Binary = expr__Binary
+
+class word_part_e(object):
+  Literal = 1
+  DoubleQuoted = 1001
+
+_word_part_str = {
+  1: 'word_part.Literal',
+  1001: 'word_part.DoubleQuoted',
+}
+
+def word_part_str(tag):
+  # type: (int) -> str
+  return _word_part_str[tag]
+
+class word_part_t(pybase.CompoundObj):
+  def tag_(self):
+    # type: () -> int
+    return self.tag
+  pass
+
+class word_part__Literal(word_part_t):
+  tag = 1
+  __slots__ = ('s',)
+
+  def __init__(self, s=None):
+    # type: (Optional[str]) -> None
+    self.s = s
+  def PrettyTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('word_part.Literal')
+    L = out_node.fields
+
+    x0 = NewLeaf(self.s, color_e.StringConst)
+    L.append(field('s', x0))
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('word_part.Literal')
+    L = out_node.fields
+    x0 = NewLeaf(self.s, color_e.StringConst)
+    L.append(field('s', x0))
+
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> hnode_t
+    return self._AbbreviatedTree()
+
+class word_part(object):
+  Literal = word_part__Literal
+
+class cflow_e(object):
+  Break = 1
+  Continue = 2
+  Return = 3
+
+_cflow_str = {
+  1: 'cflow.Break',
+  2: 'cflow.Continue',
+  3: 'cflow.Return',
+}
+
+def cflow_str(tag):
+  # type: (int) -> str
+  return _cflow_str[tag]
+
+class cflow_t(pybase.CompoundObj):
+  def tag_(self):
+    # type: () -> int
+    return self.tag
+  pass
+
+class cflow__Break(cflow_t):
+  tag = 1
+  __slots__ = ()
+
+  def __init__(self, ):
+    # type: () -> None
+    pass
+  def PrettyTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('cflow.Break')
+    L = out_node.fields
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('cflow.Break')
+    L = out_node.fields
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> hnode_t
+    return self._AbbreviatedTree()
+
+class cflow__Continue(cflow_t):
+  tag = 2
+  __slots__ = ()
+
+  def __init__(self, ):
+    # type: () -> None
+    pass
+  def PrettyTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('cflow.Continue')
+    L = out_node.fields
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('cflow.Continue')
+    L = out_node.fields
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> hnode_t
+    return self._AbbreviatedTree()
+
+class cflow__Return(cflow_t):
+  tag = 3
+  __slots__ = ('val',)
+
+  def __init__(self, val=None):
+    # type: (Optional[int]) -> None
+    self.val = val
+  def PrettyTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('cflow.Return')
+    L = out_node.fields
+
+    x0 = hnode.Leaf(str(self.val), color_e.OtherConst)
+    L.append(field('val', x0))
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('cflow.Return')
+    L = out_node.fields
+    x0 = hnode.Leaf(str(self.val), color_e.OtherConst)
+    L.append(field('val', x0))
+
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> hnode_t
+    return self._AbbreviatedTree()
+
+class cflow(object):
+  Break = cflow__Break
+  Continue = cflow__Continue
+  Return = cflow__Return
+
+class prod_with_attrs(pybase.CompoundObj):
+  tag = 1000
+  __slots__ = ('a', 'b', 'spid')
+
+  def __init__(self, a=None, b=None, spid=None):
+    # type: (Optional[str], Optional[str], Optional[int]) -> None
+    self.a = a
+    self.b = b
+    self.spid = spid
+  def PrettyTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('prod_with_attrs')
+    L = out_node.fields
+
+    x0 = NewLeaf(self.a, color_e.StringConst)
+    L.append(field('a', x0))
+
+    x1 = NewLeaf(self.b, color_e.StringConst)
+    L.append(field('b', x1))
+
+    x2 = hnode.Leaf(str(self.spid), color_e.OtherConst)
+    L.append(field('spid', x2))
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('prod_with_attrs')
+    L = out_node.fields
+    x0 = NewLeaf(self.a, color_e.StringConst)
+    L.append(field('a', x0))
+
+    x1 = NewLeaf(self.b, color_e.StringConst)
+    L.append(field('b', x1))
+
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> hnode_t
+    return self._AbbreviatedTree()
+
+class double_quoted(expr_t, word_part_t):
+  tag = 1001
+  __slots__ = ('left', 'tokens')
+
+  def __init__(self, left=None, tokens=None):
+    # type: (Optional[int], Optional[List[str]]) -> None
+    self.left = left
+    self.tokens = tokens or []
+  def PrettyTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('double_quoted')
+    L = out_node.fields
+
+    x0 = hnode.Leaf(str(self.left), color_e.OtherConst)
+    L.append(field('left', x0))
+
+    if self.tokens:  # ArrayType
+      x1 = hnode.Array([])
+      for i1 in self.tokens:
+        x1.children.append(NewLeaf(i1, color_e.StringConst))
+      L.append(field('tokens', x1))
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('double_quoted')
+    L = out_node.fields
+    x0 = hnode.Leaf(str(self.left), color_e.OtherConst)
+    L.append(field('left', x0))
+
+    if self.tokens:  # ArrayType
+      x1 = hnode.Array([])
+      for i1 in self.tokens:
+        x1.children.append(NewLeaf(i1, color_e.StringConst))
+      L.append(field('tokens', x1))
+
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> hnode_t
+    return self._AbbreviatedTree()
+
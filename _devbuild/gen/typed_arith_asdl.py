@@ -0,0 +1,565 @@
+from asdl import pybase
+from typing import Optional, List, Tuple, Dict, Any, cast
+
+from asdl import runtime  # For runtime.NO_SPID
+from asdl.runtime import NewRecord, NewLeaf
+from _devbuild.gen.hnode_asdl import color_e, hnode, hnode_e, hnode_t, field
+
+class arith_expr_e(object):
+  NoOp = 1
+  Const = 2
+  Var = 3
+  Unary = 4
+  Binary = 5
+  Ternary = 6
+  FuncCall = 7
+  Index = 8
+  Slice = 9
+
+_arith_expr_str = {
+  1: 'arith_expr.NoOp',
+  2: 'arith_expr.Const',
+  3: 'arith_expr.Var',
+  4: 'arith_expr.Unary',
+  5: 'arith_expr.Binary',
+  6: 'arith_expr.Ternary',
+  7: 'arith_expr.FuncCall',
+  8: 'arith_expr.Index',
+  9: 'arith_expr.Slice',
+}
+
+def arith_expr_str(tag):
+  # type: (int) -> str
+  return _arith_expr_str[tag]
+
+class arith_expr_t(pybase.CompoundObj):
+  def tag_(self):
+    # type: () -> int
+    return self.tag
+  pass
+
+class arith_expr__NoOp(arith_expr_t):
+  tag = 1
+  __slots__ = ('spids',)
+
+  def __init__(self, spids=None):
+    # type: (Optional[List[int]]) -> None
+    self.spids = spids or []
+  def PrettyTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('arith_expr.NoOp')
+    L = out_node.fields
+
+    if self.spids:  # ArrayType
+      x0 = hnode.Array([])
+      for i0 in self.spids:
+        x0.children.append(hnode.Leaf(str(i0), color_e.OtherConst))
+      L.append(field('spids', x0))
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('arith_expr.NoOp')
+    L = out_node.fields
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> hnode_t
+    return self._AbbreviatedTree()
+
+class arith_expr__Const(arith_expr_t):
+  tag = 2
+  __slots__ = ('i', 'spids')
+
+  def __init__(self, i=None, spids=None):
+    # type: (Optional[int], Optional[List[int]]) -> None
+    self.i = i
+    self.spids = spids or []
+  def PrettyTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('arith_expr.Const')
+    L = out_node.fields
+
+    x0 = hnode.Leaf(str(self.i), color_e.OtherConst)
+    L.append(field('i', x0))
+
+    if self.spids:  # ArrayType
+      x1 = hnode.Array([])
+      for i1 in self.spids:
+        x1.children.append(hnode.Leaf(str(i1), color_e.OtherConst))
+      L.append(field('spids', x1))
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('arith_expr.Const')
+    L = out_node.fields
+    x0 = hnode.Leaf(str(self.i), color_e.OtherConst)
+    L.append(field('i', x0))
+
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> hnode_t
+    p = _arith_expr__Const(self)
+    return p if p else self._AbbreviatedTree()
+
+class arith_expr__Var(arith_expr_t):
+  tag = 3
+  __slots__ = ('name', 'spids')
+
+  def __init__(self, name=None, spids=None):
+    # type: (Optional[str], Optional[List[int]]) -> None
+    self.name = name
+    self.spids = spids or []
+  def PrettyTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('arith_expr.Var')
+    L = out_node.fields
+
+    x0 = NewLeaf(self.name, color_e.StringConst)
+    L.append(field('name', x0))
+
+    if self.spids:  # ArrayType
+      x1 = hnode.Array([])
+      for i1 in self.spids:
+        x1.children.append(hnode.Leaf(str(i1), color_e.OtherConst))
+      L.append(field('spids', x1))
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('arith_expr.Var')
+    L = out_node.fields
+    x0 = NewLeaf(self.name, color_e.StringConst)
+    L.append(field('name', x0))
+
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> hnode_t
+    p = _arith_expr__Var(self)
+    return p if p else self._AbbreviatedTree()
+
+class arith_expr__Unary(arith_expr_t):
+  tag = 4
+  __slots__ = ('op', 'a', 'spids')
+
+  def __init__(self, op=None, a=None, spids=None):
+    # type: (Optional[str], Optional[arith_expr_t], Optional[List[int]]) -> None
+    self.op = op
+    self.a = a
+    self.spids = spids or []
+  def PrettyTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('arith_expr.Unary')
+    L = out_node.fields
+
+    x0 = NewLeaf(self.op, color_e.StringConst)
+    L.append(field('op', x0))
+
+    assert self.a is not None
+    x1 = self.a.PrettyTree()
+    L.append(field('a', x1))
+
+    if self.spids:  # ArrayType
+      x2 = hnode.Array([])
+      for i2 in self.spids:
+        x2.children.append(hnode.Leaf(str(i2), color_e.OtherConst))
+      L.append(field('spids', x2))
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('arith_expr.Unary')
+    L = out_node.fields
+    x0 = NewLeaf(self.op, color_e.StringConst)
+    L.append(field('op', x0))
+
+    assert self.a is not None
+    x1 = self.a.AbbreviatedTree()
+    L.append(field('a', x1))
+
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> hnode_t
+    p = _arith_expr__Unary(self)
+    return p if p else self._AbbreviatedTree()
+
+class arith_expr__Binary(arith_expr_t):
+  tag = 5
+  __slots__ = ('op', 'left', 'right', 'spids')
+
+  def __init__(self, op=None, left=None, right=None, spids=None):
+    # type: (Optional[str], Optional[arith_expr_t], Optional[arith_expr_t], Optional[List[int]]) -> None
+    self.op = op
+    self.left = left
+    self.right = right
+    self.spids = spids or []
+  def PrettyTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('arith_expr.Binary')
+    L = out_node.fields
+
+    x0 = NewLeaf(self.op, color_e.StringConst)
+    L.append(field('op', x0))
+
+    assert self.left is not None
+    x1 = self.left.PrettyTree()
+    L.append(field('left', x1))
+
+    assert self.right is not None
+    x2 = self.right.PrettyTree()
+    L.append(field('right', x2))
+
+    if self.spids:  # ArrayType
+      x3 = hnode.Array([])
+      for i3 in self.spids:
+        x3.children.append(hnode.Leaf(str(i3), color_e.OtherConst))
+      L.append(field('spids', x3))
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('arith_expr.Binary')
+    L = out_node.fields
+    x0 = NewLeaf(self.op, color_e.StringConst)
+    L.append(field('op', x0))
+
+    assert self.left is not None
+    x1 = self.left.AbbreviatedTree()
+    L.append(field('left', x1))
+
+    assert self.right is not None
+    x2 = self.right.AbbreviatedTree()
+    L.append(field('right', x2))
+
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> hnode_t
+    p = _arith_expr__Binary(self)
+    return p if p else self._AbbreviatedTree()
+
+class arith_expr__Ternary(arith_expr_t):
+  tag = 6
+  __slots__ = ('cond', 'true_expr', 'false_expr', 'spids')
+
+  def __init__(self, cond=None, true_expr=None, false_expr=None, spids=None):
+    # type: (Optional[arith_expr_t], Optional[arith_expr_t], Optional[arith_expr_t], Optional[List[int]]) -> None
+    self.cond = cond
+    self.true_expr = true_expr
+    self.false_expr = false_expr
+    self.spids = spids or []
+  def PrettyTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('arith_expr.Ternary')
+    L = out_node.fields
+
+    assert self.cond is not None
+    x0 = self.cond.PrettyTree()
+    L.append(field('cond', x0))
+
+    assert self.true_expr is not None
+    x1 = self.true_expr.PrettyTree()
+    L.append(field('true_expr', x1))
+
+    assert self.false_expr is not None
+    x2 = self.false_expr.PrettyTree()
+    L.append(field('false_expr', x2))
+
+    if self.spids:  # ArrayType
+      x3 = hnode.Array([])
+      for i3 in self.spids:
+        x3.children.append(hnode.Leaf(str(i3), color_e.OtherConst))
+      L.append(field('spids', x3))
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('arith_expr.Ternary')
+    L = out_node.fields
+    assert self.cond is not None
+    x0 = self.cond.AbbreviatedTree()
+    L.append(field('cond', x0))
+
+    assert self.true_expr is not None
+    x1 = self.true_expr.AbbreviatedTree()
+    L.append(field('true_expr', x1))
+
+    assert self.false_expr is not None
+    x2 = self.false_expr.AbbreviatedTree()
+    L.append(field('false_expr', x2))
+
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> hnode_t
+    return self._AbbreviatedTree()
+
+class arith_expr__FuncCall(arith_expr_t):
+  tag = 7
+  __slots__ = ('name', 'args', 'spids')
+
+  def __init__(self, name=None, args=None, spids=None):
+    # type: (Optional[str], Optional[List[arith_expr_t]], Optional[List[int]]) -> None
+    self.name = name
+    self.args = args or []
+    self.spids = spids or []
+  def PrettyTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('arith_expr.FuncCall')
+    L = out_node.fields
+
+    x0 = NewLeaf(self.name, color_e.StringConst)
+    L.append(field('name', x0))
+
+    if self.args:  # ArrayType
+      x1 = hnode.Array([])
+      for i1 in self.args:
+        x1.children.append(i1.PrettyTree())
+      L.append(field('args', x1))
+
+    if self.spids:  # ArrayType
+      x2 = hnode.Array([])
+      for i2 in self.spids:
+        x2.children.append(hnode.Leaf(str(i2), color_e.OtherConst))
+      L.append(field('spids', x2))
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('arith_expr.FuncCall')
+    L = out_node.fields
+    x0 = NewLeaf(self.name, color_e.StringConst)
+    L.append(field('name', x0))
+
+    if self.args:  # ArrayType
+      x1 = hnode.Array([])
+      for i1 in self.args:
+        x1.children.append(i1.AbbreviatedTree())
+      L.append(field('args', x1))
+
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> hnode_t
+    return self._AbbreviatedTree()
+
+class arith_expr__Index(arith_expr_t):
+  tag = 8
+  __slots__ = ('a', 'index', 'spids')
+
+  def __init__(self, a=None, index=None, spids=None):
+    # type: (Optional[arith_expr_t], Optional[arith_expr_t], Optional[List[int]]) -> None
+    self.a = a
+    self.index = index
+    self.spids = spids or []
+  def PrettyTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('arith_expr.Index')
+    L = out_node.fields
+
+    assert self.a is not None
+    x0 = self.a.PrettyTree()
+    L.append(field('a', x0))
+
+    assert self.index is not None
+    x1 = self.index.PrettyTree()
+    L.append(field('index', x1))
+
+    if self.spids:  # ArrayType
+      x2 = hnode.Array([])
+      for i2 in self.spids:
+        x2.children.append(hnode.Leaf(str(i2), color_e.OtherConst))
+      L.append(field('spids', x2))
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('arith_expr.Index')
+    L = out_node.fields
+    assert self.a is not None
+    x0 = self.a.AbbreviatedTree()
+    L.append(field('a', x0))
+
+    assert self.index is not None
+    x1 = self.index.AbbreviatedTree()
+    L.append(field('index', x1))
+
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> hnode_t
+    return self._AbbreviatedTree()
+
+class arith_expr__Slice(arith_expr_t):
+  tag = 9
+  __slots__ = ('a', 'begin', 'end', 'stride', 'spids')
+
+  def __init__(self, a=None, begin=None, end=None, stride=None, spids=None):
+    # type: (Optional[arith_expr_t], Optional[arith_expr_t], Optional[arith_expr_t], Optional[arith_expr_t], Optional[List[int]]) -> None
+    self.a = a
+    self.begin = begin or None
+    self.end = end or None
+    self.stride = stride or None
+    self.spids = spids or []
+  def PrettyTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('arith_expr.Slice')
+    L = out_node.fields
+
+    assert self.a is not None
+    x0 = self.a.PrettyTree()
+    L.append(field('a', x0))
+
+    if self.begin is not None:  # MaybeType
+      x1 = self.begin.PrettyTree()
+      L.append(field('begin', x1))
+
+    if self.end is not None:  # MaybeType
+      x2 = self.end.PrettyTree()
+      L.append(field('end', x2))
+
+    if self.stride is not None:  # MaybeType
+      x3 = self.stride.PrettyTree()
+      L.append(field('stride', x3))
+
+    if self.spids:  # ArrayType
+      x4 = hnode.Array([])
+      for i4 in self.spids:
+        x4.children.append(hnode.Leaf(str(i4), color_e.OtherConst))
+      L.append(field('spids', x4))
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('arith_expr.Slice')
+    L = out_node.fields
+    assert self.a is not None
+    x0 = self.a.AbbreviatedTree()
+    L.append(field('a', x0))
+
+    if self.begin is not None:  # MaybeType
+      x1 = self.begin.AbbreviatedTree()
+      L.append(field('begin', x1))
+
+    if self.end is not None:  # MaybeType
+      x2 = self.end.AbbreviatedTree()
+      L.append(field('end', x2))
+
+    if self.stride is not None:  # MaybeType
+      x3 = self.stride.AbbreviatedTree()
+      L.append(field('stride', x3))
+
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> hnode_t
+    return self._AbbreviatedTree()
+
+class arith_expr(object):
+  NoOp = arith_expr__NoOp
+  Const = arith_expr__Const
+  Var = arith_expr__Var
+  Unary = arith_expr__Unary
+  Binary = arith_expr__Binary
+  Ternary = arith_expr__Ternary
+  FuncCall = arith_expr__FuncCall
+  Index = arith_expr__Index
+  Slice = arith_expr__Slice
+
+class pipeline(pybase.CompoundObj):
+  tag = 1000
+  __slots__ = ('negated',)
+
+  def __init__(self, negated=None):
+    # type: (Optional[bool]) -> None
+    self.negated = negated
+  def PrettyTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('pipeline')
+    L = out_node.fields
+
+    x0 = hnode.Leaf('T' if self.negated else 'F', color_e.OtherConst)
+    L.append(field('negated', x0))
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('pipeline')
+    L = out_node.fields
+    x0 = hnode.Leaf('T' if self.negated else 'F', color_e.OtherConst)
+    L.append(field('negated', x0))
+
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> hnode_t
+    return self._AbbreviatedTree()
+
+#
+# CONCATENATED FILE
+#
+
+"""
+typed_arith_abbrev.py - Abbreviations for pretty-printing typed_arith.asdl.
+"""
+
+from asdl import runtime
+from _devbuild.gen.hnode_asdl import hnode__Record
+
+def _arith_expr__Unary(obj):
+  # type: (arith_expr__Unary) -> hnode__Record
+
+  p_node = runtime.NewRecord('U')
+  p_node.abbrev = True
+  n = runtime.NewLeaf(str(obj.op), color_e.StringConst)
+  p_node.unnamed_fields.append(n)
+  p_node.unnamed_fields.append(obj.a.AbbreviatedTree())  # type: ignore
+  return p_node
+
+
+def _arith_expr__Binary(obj):
+  # type: (arith_expr__Binary) -> Optional[hnode__Record]
+
+  if obj.op == '=':  # test for fallback
+    return None
+
+  p_node = runtime.NewRecord('B')
+  p_node.abbrev = True
+  n = runtime.NewLeaf(str(obj.op), color_e.StringConst)
+  p_node.unnamed_fields.append(n)
+  p_node.unnamed_fields.append(obj.left.AbbreviatedTree())  # type: ignore
+  p_node.unnamed_fields.append(obj.right.AbbreviatedTree())  # type: ignore
+  return p_node
+
+
+def _arith_expr__Const(obj):
+  # type: (arith_expr__Const) -> hnode__Record
+  p_node = runtime.NewRecord('')
+  p_node.abbrev = True
+  n = runtime.NewLeaf(str(obj.i), color_e.OtherConst)
+  p_node.unnamed_fields.append(n)
+  return p_node
+
+
+def _arith_expr__Var(obj):
+  # type: (arith_expr__Var) -> hnode__Record
+  p_node = runtime.NewRecord('$')
+  p_node.abbrev = True
+  n = runtime.NewLeaf(str(obj.name), color_e.StringConst)
+  p_node.unnamed_fields.append(n)
+  return p_node
+
@@ -0,0 +1,646 @@
+from asdl import pybase
+from typing import Optional, List, Tuple, Dict, Any, cast
+
+from asdl import runtime  # For runtime.NO_SPID
+from asdl.runtime import NewRecord, NewLeaf
+from _devbuild.gen.hnode_asdl import color_e, hnode, hnode_e, hnode_t, field
+
+class op_id_t(pybase.SimpleObj):
+  pass
+
+class op_id_e(object):
+  Plus = op_id_t(1)
+  Minus = op_id_t(2)
+  Star = op_id_t(3)
+
+_op_id_str = {
+  1: 'op_id.Plus',
+  2: 'op_id.Minus',
+  3: 'op_id.Star',
+}
+
+def op_id_str(val):
+  # type: (op_id_t) -> str
+  return _op_id_str[val]
+
+class cflow_e(object):
+  Break = 1
+  Continue = 2
+  Return = 3
+
+_cflow_str = {
+  1: 'cflow.Break',
+  2: 'cflow.Continue',
+  3: 'cflow.Return',
+}
+
+def cflow_str(tag):
+  # type: (int) -> str
+  return _cflow_str[tag]
+
+class cflow_t(pybase.CompoundObj):
+  def tag_(self):
+    # type: () -> int
+    return self.tag
+  pass
+
+class cflow__Break(cflow_t):
+  tag = 1
+  __slots__ = ()
+
+  def __init__(self, ):
+    # type: () -> None
+    pass
+  def PrettyTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('cflow.Break')
+    L = out_node.fields
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('cflow.Break')
+    L = out_node.fields
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> hnode_t
+    return self._AbbreviatedTree()
+
+class cflow__Continue(cflow_t):
+  tag = 2
+  __slots__ = ()
+
+  def __init__(self, ):
+    # type: () -> None
+    pass
+  def PrettyTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('cflow.Continue')
+    L = out_node.fields
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('cflow.Continue')
+    L = out_node.fields
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> hnode_t
+    return self._AbbreviatedTree()
+
+class cflow__Return(cflow_t):
+  tag = 3
+  __slots__ = ('status',)
+
+  def __init__(self, status=None):
+    # type: (Optional[int]) -> None
+    self.status = status
+  def PrettyTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('cflow.Return')
+    L = out_node.fields
+
+    x0 = hnode.Leaf(str(self.status), color_e.OtherConst)
+    L.append(field('status', x0))
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('cflow.Return')
+    L = out_node.fields
+    x0 = hnode.Leaf(str(self.status), color_e.OtherConst)
+    L.append(field('status', x0))
+
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> hnode_t
+    return self._AbbreviatedTree()
+
+class cflow(object):
+  Break = cflow__Break
+  Continue = cflow__Continue
+  Return = cflow__Return
+
+class bool_expr_e(object):
+  Binary = 1
+  Unary = 2
+  LogicalNot = 3
+  LogicalBinary = 4
+
+_bool_expr_str = {
+  1: 'bool_expr.Binary',
+  2: 'bool_expr.Unary',
+  3: 'bool_expr.LogicalNot',
+  4: 'bool_expr.LogicalBinary',
+}
+
+def bool_expr_str(tag):
+  # type: (int) -> str
+  return _bool_expr_str[tag]
+
+class bool_expr_t(pybase.CompoundObj):
+  def tag_(self):
+    # type: () -> int
+    return self.tag
+  pass
+
+class bool_expr__Binary(bool_expr_t):
+  tag = 1
+  __slots__ = ('left', 'right')
+
+  def __init__(self, left=None, right=None):
+    # type: (Optional[word], Optional[word]) -> None
+    self.left = left
+    self.right = right
+  def PrettyTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('bool_expr.Binary')
+    L = out_node.fields
+
+    assert self.left is not None
+    x0 = self.left.PrettyTree()
+    L.append(field('left', x0))
+
+    assert self.right is not None
+    x1 = self.right.PrettyTree()
+    L.append(field('right', x1))
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('bool_expr.Binary')
+    L = out_node.fields
+    assert self.left is not None
+    x0 = self.left.AbbreviatedTree()
+    L.append(field('left', x0))
+
+    assert self.right is not None
+    x1 = self.right.AbbreviatedTree()
+    L.append(field('right', x1))
+
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> hnode_t
+    return self._AbbreviatedTree()
+
+class bool_expr__Unary(bool_expr_t):
+  tag = 2
+  __slots__ = ('child',)
+
+  def __init__(self, child=None):
+    # type: (Optional[word]) -> None
+    self.child = child
+  def PrettyTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('bool_expr.Unary')
+    L = out_node.fields
+
+    assert self.child is not None
+    x0 = self.child.PrettyTree()
+    L.append(field('child', x0))
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('bool_expr.Unary')
+    L = out_node.fields
+    assert self.child is not None
+    x0 = self.child.AbbreviatedTree()
+    L.append(field('child', x0))
+
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> hnode_t
+    return self._AbbreviatedTree()
+
+class bool_expr__LogicalNot(bool_expr_t):
+  tag = 3
+  __slots__ = ('b',)
+
+  def __init__(self, b=None):
+    # type: (Optional[bool_expr_t]) -> None
+    self.b = b
+  def PrettyTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('bool_expr.LogicalNot')
+    L = out_node.fields
+
+    assert self.b is not None
+    x0 = self.b.PrettyTree()
+    L.append(field('b', x0))
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('bool_expr.LogicalNot')
+    L = out_node.fields
+    assert self.b is not None
+    x0 = self.b.AbbreviatedTree()
+    L.append(field('b', x0))
+
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> hnode_t
+    return self._AbbreviatedTree()
+
+class bool_expr__LogicalBinary(bool_expr_t):
+  tag = 4
+  __slots__ = ('op', 'left', 'right')
+
+  def __init__(self, op=None, left=None, right=None):
+    # type: (Optional[op_id_t], Optional[bool_expr_t], Optional[bool_expr_t]) -> None
+    self.op = op
+    self.left = left
+    self.right = right
+  def PrettyTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('bool_expr.LogicalBinary')
+    L = out_node.fields
+
+    assert self.op is not None
+    x0 = hnode.Leaf(op_id_str(self.op), color_e.TypeName)
+    L.append(field('op', x0))
+
+    assert self.left is not None
+    x1 = self.left.PrettyTree()
+    L.append(field('left', x1))
+
+    assert self.right is not None
+    x2 = self.right.PrettyTree()
+    L.append(field('right', x2))
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('bool_expr.LogicalBinary')
+    L = out_node.fields
+    assert self.op is not None
+    x0 = hnode.Leaf(op_id_str(self.op), color_e.TypeName)
+    L.append(field('op', x0))
+
+    assert self.left is not None
+    x1 = self.left.AbbreviatedTree()
+    L.append(field('left', x1))
+
+    assert self.right is not None
+    x2 = self.right.AbbreviatedTree()
+    L.append(field('right', x2))
+
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> hnode_t
+    return self._AbbreviatedTree()
+
+class bool_expr(object):
+  Binary = bool_expr__Binary
+  Unary = bool_expr__Unary
+  LogicalNot = bool_expr__LogicalNot
+  LogicalBinary = bool_expr__LogicalBinary
+
+class cflow2_e(object):
+  Break = 1
+  Continue = 2
+  Return = 3
+
+_cflow2_str = {
+  1: 'cflow2.Break',
+  2: 'cflow2.Continue',
+  3: 'cflow2.Return',
+}
+
+def cflow2_str(tag):
+  # type: (int) -> str
+  return _cflow2_str[tag]
+
+class cflow2_t(pybase.CompoundObj):
+  def tag_(self):
+    # type: () -> int
+    return self.tag
+  pass
+
+class cflow2__Break(cflow2_t):
+  tag = 1
+  __slots__ = ()
+
+  def __init__(self, ):
+    # type: () -> None
+    pass
+  def PrettyTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('cflow2.Break')
+    L = out_node.fields
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('cflow2.Break')
+    L = out_node.fields
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> hnode_t
+    return self._AbbreviatedTree()
+
+class cflow2__Continue(cflow2_t):
+  tag = 2
+  __slots__ = ()
+
+  def __init__(self, ):
+    # type: () -> None
+    pass
+  def PrettyTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('cflow2.Continue')
+    L = out_node.fields
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('cflow2.Continue')
+    L = out_node.fields
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> hnode_t
+    return self._AbbreviatedTree()
+
+class cflow2__Return(cflow2_t):
+  tag = 3
+  __slots__ = ('status',)
+
+  def __init__(self, status=None):
+    # type: (Optional[int]) -> None
+    self.status = status
+  def PrettyTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('cflow2.Return')
+    L = out_node.fields
+
+    x0 = hnode.Leaf(str(self.status), color_e.OtherConst)
+    L.append(field('status', x0))
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('cflow2.Return')
+    L = out_node.fields
+    x0 = hnode.Leaf(str(self.status), color_e.OtherConst)
+    L.append(field('status', x0))
+
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> hnode_t
+    return self._AbbreviatedTree()
+
+class cflow2(object):
+  Break = cflow2__Break
+  Continue = cflow2__Continue
+  Return = cflow2__Return
+
+class op_array(pybase.CompoundObj):
+  tag = 1000
+  __slots__ = ('ops',)
+
+  def __init__(self, ops=None):
+    # type: (Optional[List[op_id_t]]) -> None
+    self.ops = ops or []
+  def PrettyTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('op_array')
+    L = out_node.fields
+
+    if self.ops:  # ArrayType
+      x0 = hnode.Array([])
+      for i0 in self.ops:
+        x0.children.append(hnode.Leaf(op_id_str(i0), color_e.TypeName))
+      L.append(field('ops', x0))
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('op_array')
+    L = out_node.fields
+    if self.ops:  # ArrayType
+      x0 = hnode.Array([])
+      for i0 in self.ops:
+        x0.children.append(hnode.Leaf(op_id_str(i0), color_e.TypeName))
+      L.append(field('ops', x0))
+
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> hnode_t
+    return self._AbbreviatedTree()
+
+class assign(pybase.CompoundObj):
+  tag = 1001
+  __slots__ = ('name', 'flags')
+
+  def __init__(self, name=None, flags=None):
+    # type: (Optional[str], Optional[List[str]]) -> None
+    self.name = name
+    self.flags = flags or []
+  def PrettyTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('assign')
+    L = out_node.fields
+
+    x0 = NewLeaf(self.name, color_e.StringConst)
+    L.append(field('name', x0))
+
+    if self.flags:  # ArrayType
+      x1 = hnode.Array([])
+      for i1 in self.flags:
+        x1.children.append(NewLeaf(i1, color_e.StringConst))
+      L.append(field('flags', x1))
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('assign')
+    L = out_node.fields
+    x0 = NewLeaf(self.name, color_e.StringConst)
+    L.append(field('name', x0))
+
+    if self.flags:  # ArrayType
+      x1 = hnode.Array([])
+      for i1 in self.flags:
+        x1.children.append(NewLeaf(i1, color_e.StringConst))
+      L.append(field('flags', x1))
+
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> hnode_t
+    return self._AbbreviatedTree()
+
+class source_location(pybase.CompoundObj):
+  tag = 1002
+  __slots__ = ('path', 'line', 'col', 'length')
+
+  def __init__(self, path=None, line=None, col=None, length=None):
+    # type: (Optional[str], Optional[int], Optional[int], Optional[int]) -> None
+    self.path = path
+    self.line = line
+    self.col = col
+    self.length = length
+  def PrettyTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('source_location')
+    L = out_node.fields
+
+    x0 = NewLeaf(self.path, color_e.StringConst)
+    L.append(field('path', x0))
+
+    x1 = hnode.Leaf(str(self.line), color_e.OtherConst)
+    L.append(field('line', x1))
+
+    x2 = hnode.Leaf(str(self.col), color_e.OtherConst)
+    L.append(field('col', x2))
+
+    x3 = hnode.Leaf(str(self.length), color_e.OtherConst)
+    L.append(field('length', x3))
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('source_location')
+    L = out_node.fields
+    x0 = NewLeaf(self.path, color_e.StringConst)
+    L.append(field('path', x0))
+
+    x1 = hnode.Leaf(str(self.line), color_e.OtherConst)
+    L.append(field('line', x1))
+
+    x2 = hnode.Leaf(str(self.col), color_e.OtherConst)
+    L.append(field('col', x2))
+
+    x3 = hnode.Leaf(str(self.length), color_e.OtherConst)
+    L.append(field('length', x3))
+
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> hnode_t
+    return self._AbbreviatedTree()
+
+class word(pybase.CompoundObj):
+  tag = 1003
+  __slots__ = ('value',)
+
+  def __init__(self, value=None):
+    # type: (Optional[str]) -> None
+    self.value = value
+  def PrettyTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('word')
+    L = out_node.fields
+
+    x0 = NewLeaf(self.value, color_e.StringConst)
+    L.append(field('value', x0))
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('word')
+    L = out_node.fields
+    x0 = NewLeaf(self.value, color_e.StringConst)
+    L.append(field('value', x0))
+
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> hnode_t
+    return self._AbbreviatedTree()
+
+class Token(pybase.CompoundObj):
+  tag = 1004
+  __slots__ = ('s', 'b')
+
+  def __init__(self, s=None, b=None):
+    # type: (Optional[str], Optional[bool]) -> None
+    self.s = s
+    self.b = b
+  def PrettyTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('Token')
+    L = out_node.fields
+
+    x0 = NewLeaf(self.s, color_e.StringConst)
+    L.append(field('s', x0))
+
+    x1 = hnode.Leaf('T' if self.b else 'F', color_e.OtherConst)
+    L.append(field('b', x1))
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('Token')
+    L = out_node.fields
+    x0 = NewLeaf(self.s, color_e.StringConst)
+    L.append(field('s', x0))
+
+    x1 = hnode.Leaf('T' if self.b else 'F', color_e.OtherConst)
+    L.append(field('b', x1))
+
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> hnode_t
+    return self._AbbreviatedTree()
+
+class other(pybase.CompoundObj):
+  tag = 1005
+  __slots__ = ('t',)
+
+  def __init__(self, t=None):
+    # type: (Optional[Token]) -> None
+    self.t = t
+  def PrettyTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('other')
+    L = out_node.fields
+
+    assert self.t is not None
+    x0 = self.t.PrettyTree()
+    L.append(field('t', x0))
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('other')
+    L = out_node.fields
+    assert self.t is not None
+    x0 = self.t.AbbreviatedTree()
+    L.append(field('t', x0))
+
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> hnode_t
+    return self._AbbreviatedTree()
+
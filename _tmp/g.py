@@ -0,0 +1,9 @@
+import sys, time
+sys.argv[0] = 'bin/oil.py'
+from core import pyutil, meta
+t=time.time(); g=meta.LoadOilGrammar(pyutil.GetResourceLoader()); t1=time.time()
+from frontend import parse_lib
+n=parse_lib.MakeGrammarNames(g); t2=time.time()
+from oil_lang import expr_to_ast
+expr_to_ast.Transformer(g); t3=time.time()
+print (t1-t)*1000, (t2-t1)*1000, (t3-t2)*1000
@@ -0,0 +1,13 @@
+x=(a b)
+code='if test -n "$on"; then shopt -s parse_at; fi
+echo @x
+echo line3 $LINENO'
+on=''; eval "$code"
+on=1; eval "$code"
+shopt -u parse_at
+on=''; eval "$code"
+acode='if test -n "$on"; then alias e2="echo ALIAS"; fi
+e2 hi'
+on=''; eval "$acode"
+on=1; eval "$acode"
+on=1; eval "$acode"
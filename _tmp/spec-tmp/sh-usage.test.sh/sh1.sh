@@ -0,0 +1 @@
+argv.py "$@"
@@ -0,0 +1,92 @@
+from __future__ import print_function
+"""
+import_prof.py
+
+Measure how long each module takes to import.  bin/oil.py starts this before
+its imports when $OIL_IMPORT_PROF is set to an output path, and writes the
+report at exit:
+
+  OIL_IMPORT_PROF=_tmp/imports.txt bin/osh -c 'echo hi'
+  head -n 20 _tmp/imports.txt
+
+"Self" time excludes the modules that a module imports, so it's the number to
+look at when deciding what to defer.
+"""
+
+import __builtin__
+import sys
+import time
+
+
+def _LoadedModules():
+  """Names of the modules in sys.modules.
+
+  Python 2 also puts None there for failed relative imports, like core.sys.
+  """
+  return set(name for name, mod in sys.modules.items() if mod is not None)
+
+
+class ImportProfiler(object):
+
+  def __init__(self):
+    self.orig_import = None
+    self.start_time = 0.0
+    # For each import in progress, the time spent in nested imports, and the
+    # modules they loaded.
+    self.child_secs = []
+    self.child_modules = []
+    self.records = {}  # module names -> [total secs, self secs]
+
+  def Start(self):
+    self.start_time = time.time()
+    self.orig_import = __builtin__.__import__
+    __builtin__.__import__ = self._Import
+
+  def Stop(self):
+    __builtin__.__import__ = self.orig_import
+
+  def _Import(self, name, globals=None, locals=None, fromlist=None, level=-1):
+    before = _LoadedModules()
+    self.child_secs.append(0.0)
+    self.child_modules.append(set())
+    start = time.time()
+    try:
+      return self.orig_import(name, globals, locals, fromlist, level)
+    finally:
+      elapsed = time.time() - start
+      child = self.child_secs.pop()
+      loaded = _LoadedModules() - before
+      # e.g. 'from core import alloc' loads core.alloc, and alloc loads its own
+      # imports, which have their own rows.
+      own = loaded - self.child_modules.pop()
+      if self.child_secs:
+        self.child_secs[-1] += elapsed
+        self.child_modules[-1].update(loaded)
+
+      # Only count statements that actually loaded something, not lookups in
+      # sys.modules.  'from core import a, b' loads both in one row.
+      if own:
+        key = ','.join(sorted(own))
+        rec = self.records.setdefault(key, [0.0, 0.0])
+        rec[0] += elapsed
+        rec[1] += elapsed - child
+
+  def Report(self, f):
+    """Write a table sorted by self time."""
+    rows = sorted(self.records.items(), key=lambda item: -item[1][1])
+    f.write('%10s %10s  %s\n' % ('SELF_MS', 'TOTAL_MS', 'MODULE'))
+    self_secs = 0.0
+    num_modules = 0
+    for names, (total, self_) in rows:
+      f.write('%10.3f %10.3f  %s\n' % (self_ * 1000, total * 1000, names))
+      self_secs += self_
+      num_modules += len(names.split(','))
+    f.write('\n')
+    f.write('%10.3f ms importing %d modules\n' % (self_secs * 1000, num_modules))
+    f.write('%10.3f ms since the profiler started\n' %
+            ((time.time() - self.start_time) * 1000))
+
+  def WriteReport(self, path):
+    self.Stop()
+    with open(path, 'w') as f:
+      self.Report(f)
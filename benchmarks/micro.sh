@@ -42,4 +42,166 @@ printf-loop-complex() {
   done | wc -l
 }
 
+# Count the syscalls that 'read' makes per line.  When stdin is a regular
+# file, OSH reads a block and seeks back (fstat + read + lseek per line), like
+# bash.  When it's a pipe, it has to read one byte at a time.
+#
+# Usage:
+#   benchmarks/micro.sh read-syscalls bin/osh
+#   benchmarks/micro.sh read-syscalls bash
+
+read-syscalls() {
+  local sh=${1:-bin/osh}
+  local num_lines=${2:-10000}
+
+  local in=_tmp/read-syscalls.txt
+  mkdir -p _tmp
+  seq $num_lines | sed 's/$/ the quick brown fox jumps over the lazy dog/' > $in
+
+  local code='while read line; do : ; done'
+
+  for mode in file pipe; do
+    local out=_tmp/read-syscalls-$mode.txt
+    if test $mode = file; then
+      strace -f -e trace=read,lseek,fstat -o $out $sh -c "$code" < $in
+    else
+      cat $in | strace -f -e trace=read,lseek,fstat -o $out $sh -c "$code"
+    fi
+
+    # Only count syscalls on descriptor 0, not the ones made at startup.
+    local total
+    total=$(egrep -c '^([0-9]+ +)?(read|lseek|fstat)\(0,' $out)
+    echo "$sh $mode: $total syscalls for $num_lines lines"
+    awk -v n=$num_lines -v t=$total \
+      'BEGIN { printf "  %.1f syscalls per line\n", t / n }'
+  done
+}
+
+# Compare starting /bin/true with posix_.spawn() and with fork() + execve(),
+# which is what core/process.py does for external commands.  fork() has to
+# copy the page tables of the heap, so it gets slower as the heap grows.
+#
+# Usage:
+#   benchmarks/micro.sh spawn-vs-fork [NUM_PROCS] [HEAP_MB]
+
+spawn-vs-fork() {
+  local num_procs=${1:-2000}
+  local heap_mb=${2:-200}
+
+  PYTHONPATH=. python2 - $num_procs $heap_mb <<'EOF2'
+import sys, time
+import posix_ as posix
+
+n = int(sys.argv[1])
+heap = ['x' * 1000 for i in xrange(int(sys.argv[2]) * 1000)]
+argv = ['true']
+env = {'PATH': '/bin:/usr/bin'}
+
+def ForkExec():
+  pid = posix.fork()
+  if pid == 0:
+    posix.execve('/bin/true', argv, env)
+  return pid
+
+def Spawn():
+  return posix.spawn('/bin/true', argv, env, [])
+
+for name, start in [('fork', ForkExec), ('spawn', Spawn)]:
+  t0 = time.time()
+  for i in xrange(n):
+    posix.waitpid(start(), 0)
+  elapsed = time.time() - t0
+  print('%-5s %4d MB heap: %6.0f processes/sec' % (
+        name, len(heap) / 1000, n / elapsed))
+EOF2
+}
+
+# With shopt -s nofork_pipeline, 'echo "$x" | read a b' runs both sides in the
+# shell process, because echo runs to completion first and read gets its output
+# from a temp file, or a pipe if it's small.
+#
+# OSH: 2.0 s (49 s when echo was forked)
+
+echo-read-loop() {
+  local sh=${1:-bin/osh}
+  time $sh -c '
+  shopt -s nofork_pipeline
+  i=0
+  while test $i -lt 2000; do
+    echo "a $i" | read x y
+    i=$((i+1))
+  done
+  echo $y'
+}
+
+# Compare the cost of set -x with the structured trace in $OSH_TRACE_LOG.
+#
+# OSH: 2.9 s untraced, 3.3 s with set -x, 2.6 s with OSH_TRACE_LOG (noisy)
+
+trace-overhead() {
+  local sh=${1:-bin/osh}
+  local code='i=0; while test $i -lt 5000; do echo $i >/dev/null; i=$((i+1)); done'
+
+  mkdir -p _tmp
+  rm -f _tmp/trace-overhead.jsonl
+
+  echo 'untraced'
+  time $sh -c "$code"
+  echo 'set -x'
+  time $sh -x -c "$code" 2>/dev/null
+  echo 'OSH_TRACE_LOG'
+  time OSH_TRACE_LOG=_tmp/trace-overhead.jsonl $sh -c "$code"
+}
+
+# Generated code that's eval'd in a loop is parsed once.  See
+# frontend/parse_cache.py.  Pass --debug-file to see the hit count.
+#
+# OSH: 5.5 s without the cache, 2.1 s with it (with the pure Python lexer)
+
+eval-loop() {
+  local sh=${1:-bin/osh}
+  time $sh -c '
+  i=0
+  while test $i -lt 3000; do
+    eval "y=\$((i+1)); z=\${y}x"
+    i=$((i+1))
+  done
+  echo $y'
+}
+
+# The pgen2 parser engine on a corpus of Oil expressions: the generated one in
+# benchmarks/pgen2_parse.py, and the assignments in the spec tests.  pgen
+# compiles the grammar into a transition table, so addtoken() does one lookup
+# per token.
+#
+# 17.1 us/token searching the arcs and first sets, 14.0 us/token with the
+# table.  Most of the rest is pushing and popping nonterminals.
+
+oil-expr-parse() {
+  local corpus=_tmp/oil-expr-corpus.txt
+  mkdir -p _tmp
+  grep -h '^ *\(var\|const\|setvar\) ' spec/oil-*.test.sh > $corpus
+
+  PYTHONPATH=.:vendor benchmarks/pgen2_parse.py
+  PYTHONPATH=.:vendor benchmarks/pgen2_parse.py $corpus
+}
+
+# Arithmetic in an Oil loop.  Literals are converted and constant
+# subexpressions are folded when the expression is parsed, in
+# oil_lang/expr_to_ast.py.
+#
+# Oil: 1.9 s before, 1.5 s after
+
+oil-arith-loop() {
+  local sh=${1:-bin/oil}
+  time $sh -c '
+  var i = 0
+  var total = 0
+  while (i < 20000) {
+    setvar total = total + i * 2 + 60 * 60 * 24 - 0x10 mod 7
+    setvar i = i + 1
+  }
+  echo $total'
+}
+
 "$@"
@@ -0,0 +1,141 @@
+#!/usr/bin/env python2
+from __future__ import print_function
+"""
+pgen2_parse.py
+
+Measure the pgen2 parser engine on a corpus of Oil expressions, without the
+lexer, which dominates the time in Python:
+
+  benchmarks/pgen2_parse.py [FILE...]
+
+Each line of the files is parsed as OSH, and the tokens that the expression
+parser gives to Parser.addtoken() are recorded.  Then the recorded tokens are
+parsed again many times.  With no files, a generated corpus is used.  See
+'oil-expr-parse' in benchmarks/micro.sh.
+"""
+
+import sys
+import time
+
+from _devbuild.gen.syntax_asdl import source
+from core import alloc
+from core import error
+from core import meta
+from core import pyutil
+from core import test_lib
+from frontend import reader
+from pgen2 import parse
+
+# Used when there are no files.  'N' is replaced with a number.
+_TEMPLATES = [
+    'var xN = 1 + 2 * 3 - aN div 4 ^ 2 mod 5',
+    'var yN = [xN, "dq $x", {key: xN, other: [1, 2, 3]}]',
+    'setvar z[N] = f(xN, yN[0], named=true) if xN > 0 and not yN else null',
+    'var wN = [i * 2 for i in range(10) if i mod 2 == 0]',
+    'const cN = xN.attr->method(1)[2:3] or $(echo hi) or xN ~ / d+ /',
+]
+
+
+class _Recorder(object):
+  """Record the token streams that the expression parser pushes."""
+
+  def __init__(self):
+    self.streams = []  # list of (start symbol, [(typ, opaque, ilabel)])
+    self.orig_setup = None
+    self.orig_addtoken = None
+
+  def Start(self):
+    self.orig_setup = parse.Parser.setup
+    self.orig_addtoken = parse.Parser.addtoken
+
+    def setup(p, start):
+      self.streams.append((start, []))
+      self.orig_setup(p, start)
+
+    def addtoken(p, typ, opaque, ilabel):
+      self.streams[-1][1].append((typ, opaque, ilabel))
+      return self.orig_addtoken(p, typ, opaque, ilabel)
+
+    parse.Parser.setup = setup
+    parse.Parser.addtoken = addtoken
+
+  def Stop(self):
+    parse.Parser.setup = self.orig_setup
+    parse.Parser.addtoken = self.orig_addtoken
+
+
+def _Record(lines, gr):
+  arena = alloc.Arena()
+  arena.PushSource(source.Unused(''))
+  parse_ctx = None
+
+  rec = _Recorder()
+  rec.Start()
+  num_errors = 0
+  try:
+    for line in lines:
+      if parse_ctx is None:
+        parse_ctx = test_lib.InitParseContext(arena=arena, oil_grammar=gr)
+      n = len(rec.streams)
+      line_reader = reader.StringLineReader(line, arena)
+      c_parser = parse_ctx.MakeOshParser(line_reader)
+      try:
+        c_parser.ParseLogicalLine()
+      except (error.Parse, AssertionError):
+        # A line of a multi-line construct, or an expression nested in an
+        # expression (see ParseOilArgList).  Start over with a new context.
+        del rec.streams[n:]
+        num_errors += 1
+        parse_ctx = None
+  finally:
+    rec.Stop()
+  return rec.streams, num_errors
+
+
+def _Replay(gr, streams):
+  p = parse.Parser(gr)
+  for start, tokens in streams:
+    p.setup(start)
+    for typ, opaque, ilabel in tokens:
+      done = p.addtoken(typ, opaque, ilabel)
+    assert done, 'Expected the end of the expression'
+
+
+def main(argv):
+  paths = argv[1:]
+  if paths:
+    lines = []
+    for path in paths:
+      with open(path) as f:
+        lines.extend(f)
+  else:
+    lines = [t.replace('N', str(i)) + '\n'
+             for i in xrange(100) for t in _TEMPLATES]
+
+  gr = meta.LoadOilGrammar(pyutil.GetResourceLoader())
+  streams, num_errors = _Record(lines, gr)
+  num_tokens = sum(len(tokens) for _, tokens in streams)
+  print('%d lines, %d expressions, %d tokens (%d lines skipped)' %
+        (len(lines), len(streams), num_tokens, num_errors))
+  if not streams:
+    return 1
+
+  # Parse at least 1M tokens, and report the best of 3.
+  num_iters = 1000000 // num_tokens + 1
+  best = None
+  for _ in xrange(3):
+    start_time = time.time()
+    for _ in xrange(num_iters):
+      _Replay(gr, streams)
+    elapsed = time.time() - start_time
+    if best is None or elapsed < best:
+      best = elapsed
+
+  n = num_tokens * num_iters
+  print('%d tokens in %.3f s: %.0f tokens/sec, %.2f us/token' %
+        (n, best, n / best, best / n * 1e6))
+  return 0
+
+
+if __name__ == '__main__':
+  sys.exit(main(sys.argv))
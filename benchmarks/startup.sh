@@ -116,6 +116,66 @@ compare-time() {
   compare time-callback
 }
 
+# Startup latency and syscall count for batch (non-interactive) invocations.
+# These shouldn't pay for the Oil grammar, or the parsers that completion and
+# history need.
+#
+# Usage:
+#   benchmarks/startup.sh batch [NUM_ITERS]
+
+_batch-row() {
+  local num_iters=$1
+  shift
+
+  local out=_tmp/startup-batch-strace.txt
+  local num_syscalls
+  if which strace >/dev/null; then
+    strace -f -o $out "$@" >/dev/null
+    num_syscalls=$(wc -l < $out)
+  else
+    num_syscalls='-'
+  fi
+
+  local start end
+  start=$(date +%s%N)
+  for i in $(seq $num_iters); do
+    "$@" >/dev/null
+  done
+  end=$(date +%s%N)
+
+  awk -v start=$start -v end=$end -v n=$num_iters -v sys=$num_syscalls \
+      -v cmd="$*" \
+    'BEGIN { printf "%8.1f %8s  %s\n", (end - start) / n / 1e6, sys, cmd }'
+}
+
+batch() {
+  local num_iters=${1:-20}
+
+  mkdir -p _tmp
+  printf '%8s %8s  %s\n' 'MS' 'SYSCALLS' 'COMMAND'
+
+  for sh in dash bash; do
+    _batch-row $num_iters $sh -c 'echo hi'
+  done
+
+  _batch-row $num_iters bin/osh -c 'echo hi'
+  _batch-row $num_iters bin/oil -c 'echo hi'
+  # This one loads the grammar.
+  _batch-row $num_iters bin/osh -c 'var x = 1; echo $x'
+}
+
+# Which modules does OSH spend its startup time importing?  See
+# benchmarks/import_prof.py.
+
+import-prof() {
+  local out=_tmp/import-prof.txt
+  mkdir -p _tmp
+  OIL_IMPORT_PROF=$out bin/osh -c 'echo hi' >/dev/null
+  head -n 20 $out
+  echo ...
+  tail -n 2 $out
+}
+
 import-stats() {
   # 152 sys calls!  More than bash needs to start up.
   echo json
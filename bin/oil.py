@@ -19,7 +19,7 @@ from __future__ import print_function
 import posix_ as posix
 import sys
 import time  # for perf measurement
-from typing import List, NoReturn
+from typing import Dict, List, NoReturn
 
 _trace_path = posix.environ.get('_PY_TRACE')
 if _trace_path:
@@ -29,6 +29,15 @@ if _trace_path:
 else:
   _tracer = None
 
+# Per-module import times.  See benchmarks/import_prof.py.
+_import_prof_path = posix.environ.get('OIL_IMPORT_PROF')
+if _import_prof_path:
+  import atexit
+  from benchmarks import import_prof
+  _import_prof = import_prof.ImportProfiler()
+  _import_prof.Start()
+  atexit.register(_import_prof.WriteReport, _import_prof_path)
+
 # Uncomment this to see startup time problems.
 if posix.environ.get('OIL_TIMING'):
   start_time = time.time()
@@ -72,21 +81,18 @@ from core.util import log
 from core import vm
 
 from frontend import args
+from frontend import ast_cache
 from frontend import reader
 from frontend import py_reader
+from frontend import parse_cache
 from frontend import parse_lib
 
 from oil_lang import expr_eval
-from oil_lang import builtin_oil
 from oil_lang import builtin_funcs
 
 from osh import builtin_assign
-from osh import builtin_bracket
-from osh import builtin_comp
 from osh import builtin_meta
 from osh import builtin_misc
-from osh import builtin_lib
-from osh import builtin_printf
 from osh import builtin_process
 from osh import builtin_pure
 from osh import cmd_eval
@@ -99,10 +105,6 @@ from osh import word_eval
 
 from pylib import os_path
 
-from tools import deps
-from tools import osh2oil
-from tools import readlink
-
 import libc
 
 try:
@@ -135,6 +137,8 @@ OSH_SPEC.LongFlag('--ast-format',
 
 # Defines completion style.
 OSH_SPEC.LongFlag('--completion-display', ['minimal', 'nice'], default='nice')
+# Show partial results if user-defined completion takes longer.  0 is no limit.
+OSH_SPEC.LongFlag('--completion-timeout-ms', args.Int, default=0)
 # TODO: Add option for Oil prompt style?  RHS prompt?
 
 # Don't reparse a[x+1] and ``.  Only valid in -n mode.
@@ -155,13 +159,53 @@ OSH_SPEC.LongFlag('--rcfile', args.Str)
 builtin_pure.AddOptionsToArgSpec(OSH_SPEC)
 
 
+# These modules are only used by builtins and subcommands, so they're imported
+# the first time they're needed.  See builtin_factories in ShellMain.
+# build/app_deps.py imports them up front so they end up in the app bundle.
+LAZY_IMPORTS = [
+    'osh.builtin_bracket',
+    'osh.builtin_comp',
+    'osh.builtin_lib',
+    'osh.builtin_printf',
+    'oil_lang.builtin_oil',
+    'tools.deps',
+    'tools.osh2oil',
+    'tools.readlink',
+]
+
+
+def _ImportPrintf():
+  from osh import builtin_printf
+  return builtin_printf
+
+
+def _ImportComp():
+  from osh import builtin_comp
+  return builtin_comp
+
+
+def _ImportLib():
+  from osh import builtin_lib
+  return builtin_lib
+
+
+def _ImportBracket():
+  from osh import builtin_bracket
+  return builtin_bracket
+
+
+def _ImportOil():
+  from oil_lang import builtin_oil  # imports yajl
+  return builtin_oil
+
+
 def _MakeBuiltinArgv(argv):
   argv = [''] + argv  # add dummy for argv[0]
   # no location info
   return cmd_value.Argv(argv, [runtime.NO_SPID] * len(argv))
 
 
-def _InitDefaultCompletions(cmd_ev, complete_builtin, comp_lookup):
+def _InitDefaultCompletions(complete_builtin, comp_lookup):
   # register builtins and words
   complete_builtin.Run(_MakeBuiltinArgv(['-E', '-A', 'command']))
   # register path completion
@@ -187,6 +231,19 @@ def _MaybeWriteHistoryFile(history_filename):
     pass
 
 
+def _MakeHistoryEvaluator(parse_opts, aliases, grammar_loader, debug_f):
+  """Only interactive shells need a ParseContext for history expansion."""
+  hist_arena = alloc.Arena()
+  hist_arena.PushSource(source.Unused('history'))
+  trail = parse_lib.Trail()
+  # All ParseContext instances SHARE aliases.
+  hist_ctx = parse_lib.ParseContext(hist_arena, parse_opts, aliases, None)
+  hist_ctx.Init_GrammarLoader(grammar_loader)
+  hist_ctx.Init_Trail(trail)
+  # History evaluation is a no-op if line_input is None.
+  return history.Evaluator(line_input, hist_ctx, debug_f)
+
+
 def _InitReadline(readline_mod, history_filename, root_comp, display, debug_f):
   assert readline_mod
 
@@ -372,31 +429,17 @@ def ShellMain(lang, argv0, argv, login_shell):
   builtin_pure.SetShellOpts(mutable_opts, opts.opt_changes, opts.shopt_changes)
   aliases = {}  # feedback between runtime and parser
 
-  oil_grammar = meta.LoadOilGrammar(loader)
+  # Loaded when the first Oil expression is parsed, which many scripts never
+  # do.
+  grammar_loader = meta.GrammarLoader(loader)
 
   if opts.one_pass_parse and not exec_opts.noexec():
     raise args.UsageError('--one-pass-parse requires noexec (-n)')
-  parse_ctx = parse_lib.ParseContext(arena, parse_opts, aliases, oil_grammar)
+  parse_ctx = parse_lib.ParseContext(arena, parse_opts, aliases, None)
+  parse_ctx.Init_GrammarLoader(grammar_loader)
   parse_ctx.Init_OnePassParse(opts.one_pass_parse)
-
-  # Three ParseContext instances SHARE aliases.
-  comp_arena = alloc.Arena()
-  comp_arena.PushSource(source.Unused('completion'))
-  trail1 = parse_lib.Trail()
-  # one_pass_parse needs to be turned on to complete inside backticks.  TODO:
-  # fix the issue where ` gets erased because it's not part of
-  # set_completer_delims().
-  comp_ctx = parse_lib.ParseContext(comp_arena, parse_opts, aliases,
-                                    oil_grammar)
-  comp_ctx.Init_Trail(trail1)
-  comp_ctx.Init_OnePassParse(True)
-
-  hist_arena = alloc.Arena()
-  hist_arena.PushSource(source.Unused('history'))
-  trail2 = parse_lib.Trail()
-  hist_ctx = parse_lib.ParseContext(hist_arena, parse_opts, aliases,
-                                    oil_grammar)
-  hist_ctx.Init_Trail(trail2)
+  # For code that's parsed repeatedly: eval, trap, and PROMPT_COMMAND.
+  code_cache = parse_cache.ParseCache(parse_ctx)
 
   # Deps helps manages dependencies.  These dependencies are circular:
   # - cmd_ev and word_ev, arith_ev -- for command sub, arith sub
@@ -445,6 +488,8 @@ def ShellMain(lang, argv0, argv, login_shell):
   debug_f.log('%s [%d] OSH started with argv %s', iso_stamp, my_pid, argv)
   if debug_path:
     debug_f.log('Writing logs to %r', debug_path)
+    # Hit and miss counts, for tuning
+    atexit.register(code_cache.LogStats, debug_f)
 
   interp = posix.environ.get('OSH_HIJACK_SHEBANG', '')
   search_path = state.SearchPath(mem)
@@ -474,6 +519,7 @@ def ShellMain(lang, argv0, argv, login_shell):
     trace_f = util.DebugFile(sys.stderr)
 
   comp_lookup = completion.Lookup()
+  dir_cache = completion.DirCache()
 
   # Various Global State objects to work around readline interfaces
   compopt_state = completion.OptionState()
@@ -493,73 +539,105 @@ def ShellMain(lang, argv0, argv, login_shell):
       builtin_i.readonly: builtin_assign.Readonly(mem, errfmt),
   }
 
-  true_ = builtin_pure.Boolean(0)
-
-  builtins = {
-      builtin_i.echo: builtin_pure.Echo(exec_opts),
-      builtin_i.printf: builtin_printf.Printf(mem, parse_ctx, errfmt),
-
-      builtin_i.pushd: builtin_misc.Pushd(mem, dir_stack, errfmt),
-      builtin_i.popd: builtin_misc.Popd(mem, dir_stack, errfmt),
-      builtin_i.dirs: builtin_misc.Dirs(mem, dir_stack, errfmt),
-      builtin_i.pwd: builtin_misc.Pwd(mem, errfmt),
-
-      builtin_i.times: builtin_misc.Times(),
-      builtin_i.read: builtin_misc.Read(splitter, mem),
-      builtin_i.help: builtin_misc.Help(loader, errfmt),
-      builtin_i.history: builtin_misc.History(line_input),
-
-      # Completion (more added below)
-      builtin_i.compopt: builtin_comp.CompOpt(compopt_state, errfmt),
-      builtin_i.compadjust: builtin_comp.CompAdjust(mem),
+  # Builtins are instantiated the first time they're run, and modules that only
+  # builtins use are imported then.  See ShellExecutor.GetBuiltin().  The
+  # lambdas refer to evaluators that are created below.
+  builtins = {}  # type: Dict[int, builtin_misc._Builtin]
+  builtin_factories = {
+      builtin_i.echo: lambda: builtin_pure.Echo(exec_opts),
+      builtin_i.printf:
+          lambda: _ImportPrintf().Printf(mem, parse_ctx, errfmt),
+
+      builtin_i.pushd: lambda: builtin_misc.Pushd(mem, dir_stack, errfmt),
+      builtin_i.popd: lambda: builtin_misc.Popd(mem, dir_stack, errfmt),
+      builtin_i.dirs: lambda: builtin_misc.Dirs(mem, dir_stack, errfmt),
+      builtin_i.pwd: lambda: builtin_misc.Pwd(mem, errfmt),
+
+      builtin_i.times: lambda: builtin_misc.Times(),
+      builtin_i.read: lambda: builtin_misc.Read(splitter, mem),
+      builtin_i.help: lambda: builtin_misc.Help(loader, errfmt),
+      builtin_i.history: lambda: builtin_misc.History(line_input),
+
+      # Completion
+      builtin_i.complete: lambda: _ImportComp().Complete(
+          _MakeSpecBuilder(), comp_lookup),
+      builtin_i.compgen: lambda: _ImportComp().CompGen(_MakeSpecBuilder()),
+      builtin_i.compopt:
+          lambda: _ImportComp().CompOpt(compopt_state, errfmt),
+      builtin_i.compadjust: lambda: _ImportComp().CompAdjust(mem),
 
       # interactive
-      builtin_i.bind: builtin_lib.Bind(line_input, errfmt),
+      builtin_i.bind: lambda: _ImportLib().Bind(line_input, errfmt),
 
       # test / [ differ by need_right_bracket
-      builtin_i.test: builtin_bracket.Test(False, exec_opts, mem, errfmt),
-      builtin_i.bracket: builtin_bracket.Test(True, exec_opts, mem, errfmt),
+      builtin_i.test:
+          lambda: _ImportBracket().Test(False, exec_opts, mem, errfmt),
+      builtin_i.bracket:
+          lambda: _ImportBracket().Test(True, exec_opts, mem, errfmt),
 
-      builtin_i.shift: builtin_assign.Shift(mem),
+      builtin_i.shift: lambda: builtin_assign.Shift(mem),
+      builtin_i.unset: lambda: builtin_assign.Unset(mem, exec_opts, procs,
+                                                    parse_ctx, arith_ev,
+                                                    errfmt),
 
       # Pure
-      builtin_i.set: builtin_pure.Set(mutable_opts, mem),
-      builtin_i.shopt: builtin_pure.Shopt(mutable_opts),
+      builtin_i.set: lambda: builtin_pure.Set(mutable_opts, mem),
+      builtin_i.shopt: lambda: builtin_pure.Shopt(mutable_opts),
 
-      builtin_i.alias: builtin_pure.Alias(aliases, errfmt),
-      builtin_i.unalias: builtin_pure.UnAlias(aliases, errfmt),
+      builtin_i.alias: lambda: builtin_pure.Alias(aliases, errfmt),
+      builtin_i.unalias: lambda: builtin_pure.UnAlias(aliases, errfmt),
 
-      builtin_i.type: builtin_pure.Type(procs, aliases, search_path),
-      builtin_i.hash: builtin_pure.Hash(search_path),
-      builtin_i.getopts: builtin_pure.GetOpts(mem, errfmt),
+      builtin_i.type: lambda: builtin_pure.Type(procs, aliases, search_path),
+      builtin_i.hash: lambda: builtin_pure.Hash(search_path),
+      builtin_i.getopts: lambda: builtin_pure.GetOpts(mem, errfmt),
 
-      builtin_i.colon: true_,  # a "special" builtin 
-      builtin_i.true_: true_,
-      builtin_i.false_: builtin_pure.Boolean(1),
+      builtin_i.colon: lambda: builtin_pure.Boolean(0),  # a "special" builtin
+      builtin_i.true_: lambda: builtin_pure.Boolean(0),
+      builtin_i.false_: lambda: builtin_pure.Boolean(1),
+
+      # Meta
+      builtin_i.eval: lambda: builtin_meta.Eval(parse_ctx, exec_opts, cmd_ev,
+                                                code_cache),
+      builtin_i.builtin: lambda: builtin_meta.Builtin(shell_ex, errfmt),
+      builtin_i.command: lambda: builtin_meta.Command(shell_ex, procs,
+                                                      aliases, search_path),
 
       # Process
-      builtin_i.exec_: builtin_process.Exec(mem, ext_prog,
-                                            fd_state, search_path,
-                                            errfmt),
-      builtin_i.wait: builtin_process.Wait(waiter,
-                                           job_state, mem, errfmt),
-      builtin_i.jobs: builtin_process.Jobs(job_state),
-      builtin_i.fg: builtin_process.Fg(job_state, waiter),
-      builtin_i.bg: builtin_process.Bg(job_state),
-      builtin_i.umask: builtin_process.Umask(),
+      builtin_i.exec_: lambda: builtin_process.Exec(mem, ext_prog,
+                                                    fd_state, search_path,
+                                                    errfmt),
+      builtin_i.wait: lambda: builtin_process.Wait(waiter,
+                                                   job_state, mem, errfmt),
+      builtin_i.jobs: lambda: builtin_process.Jobs(job_state),
+      builtin_i.fg: lambda: builtin_process.Fg(job_state, waiter),
+      builtin_i.bg: lambda: builtin_process.Bg(job_state),
+      builtin_i.umask: lambda: builtin_process.Umask(),
+      builtin_i.trap: lambda: builtin_process.Trap(sig_state, cmd_deps.traps,
+                                                   cmd_deps.trap_nodes,
+                                                   code_cache, errfmt),
+
+      # These builtins take blocks, and thus need cmd_ev.
+      builtin_i.cd: lambda: builtin_misc.Cd(mem, dir_stack, cmd_ev, errfmt),
+      builtin_i.json: lambda: _ImportOil().Json(mem, cmd_ev, errfmt),
+      builtin_i.pool: lambda: builtin_process.Pool(cmd_ev, waiter, job_state,
+                                                   mem, errfmt),
 
       # Oil
-      builtin_i.push: builtin_oil.Push(mem, errfmt),
-      builtin_i.append: builtin_oil.Append(mem, errfmt),
+      builtin_i.push: lambda: _ImportOil().Push(mem, errfmt),
+      builtin_i.append: lambda: _ImportOil().Append(mem, errfmt),
 
-      builtin_i.write: builtin_oil.Write(mem, errfmt),
-      builtin_i.getline: builtin_oil.Getline(mem, errfmt),
+      builtin_i.write: lambda: _ImportOil().Write(mem, errfmt),
+      builtin_i.getline: lambda: _ImportOil().Getline(mem, errfmt),
 
-      builtin_i.repr: builtin_oil.Repr(mem, errfmt),
-      builtin_i.use: builtin_oil.Use(mem, errfmt),
-      builtin_i.opts: builtin_oil.Opts(mem, errfmt),
+      builtin_i.repr: lambda: _ImportOil().Repr(mem, errfmt),
+      builtin_i.use: lambda: _ImportOil().Use(mem, errfmt),
+      builtin_i.opts: lambda: _ImportOil().Opts(mem, errfmt),
   }
 
+  def _MakeSpecBuilder():
+    return _ImportComp().SpecBuilder(cmd_ev, parse_ctx, word_ev, splitter,
+                                     comp_lookup, dir_cache)
+
   arith_ev = sh_expr_eval.ArithEvaluator(mem, exec_opts, parse_ctx, errfmt)
   bool_ev = sh_expr_eval.BoolEvaluator(mem, exec_opts, parse_ctx, errfmt)
   expr_ev = expr_eval.OilEvaluator(mem, procs, errfmt)
@@ -570,52 +648,46 @@ def ShellMain(lang, argv0, argv, login_shell):
   shell_ex = executor.ShellExecutor(
       mem, exec_opts, mutable_opts, procs, builtins, search_path,
       ext_prog, waiter, job_state, fd_state, errfmt)
+  shell_ex.Init_BuiltinFactories(builtin_factories)
 
   # PromptEvaluator rendering is needed in non-interactive shells for @P.
   prompt_ev = prompt.Evaluator(lang, parse_ctx, mem)
-  tracer = dev.Tracer(parse_ctx, exec_opts, mutable_opts, mem, word_ev, trace_f)
+  # A structured trace that's cheap enough to leave on.  Append to the file so
+  # that child shells can share it.  See devtools/trace_report.py.
+  trace_log = None
+  trace_log_path = posix.environ.get('OSH_TRACE_LOG', '')
+  if trace_log_path:
+    try:
+      trace_log = dev.TraceLog(fd_state.Open(trace_log_path, mode='a'), arena)
+    except OSError as e:
+      ui.Stderr("osh: Couldn't open %r: %s", trace_log_path,
+                posix.strerror(e.errno))
+      return 2
+    atexit.register(trace_log.Flush)
+
+  tracer = dev.Tracer(parse_ctx, exec_opts, mutable_opts, mem, word_ev, trace_f,
+                      trace_log)
 
   # Wire up circular dependencies.
   vm.InitCircularDeps(arith_ev, bool_ev, expr_ev, word_ev, cmd_ev, shell_ex,
                       prompt_ev, tracer)
 
-  #
-  # Add builtins that depend on various evaluators
-  #
-
-  builtins[builtin_i.unset] = builtin_assign.Unset(mem, exec_opts, procs,
-                                                   parse_ctx, arith_ev, errfmt)
-  builtins[builtin_i.eval] = builtin_meta.Eval(parse_ctx, exec_opts, cmd_ev)
+  # Opt-in cache of parsed files.  See frontend/ast_cache.py.
+  ast_cache_dir = posix.environ.get('OSH_AST_CACHE_DIR', '')
+  if ast_cache_dir:
+    cache = ast_cache.AstCache(ast_cache_dir, pyutil.GetVersion(), parse_ctx)
+  else:
+    cache = None
 
+  # 'source' and '.' share an instance.
   source_builtin = builtin_meta.Source(
-      parse_ctx, search_path, cmd_ev, fd_state, errfmt)
+      parse_ctx, search_path, cmd_ev, fd_state, errfmt, ast_cache=cache)
   builtins[builtin_i.source] = source_builtin
   builtins[builtin_i.dot] = source_builtin
 
-  builtins[builtin_i.builtin] = builtin_meta.Builtin(shell_ex, errfmt)
-  builtins[builtin_i.command] = builtin_meta.Command(shell_ex, procs, aliases,
-                                                      search_path)
-
-  spec_builder = builtin_comp.SpecBuilder(cmd_ev, parse_ctx, word_ev, splitter,
-                                          comp_lookup)
-  complete_builtin = builtin_comp.Complete(spec_builder, comp_lookup)
-  builtins[builtin_i.complete] = complete_builtin
-  builtins[builtin_i.compgen] = builtin_comp.CompGen(spec_builder)
-
-  # These builtins take blocks, and thus need cmd_ev.
-  builtins[builtin_i.cd] = builtin_misc.Cd(mem, dir_stack, cmd_ev, errfmt)
-  builtins[builtin_i.json] = builtin_oil.Json(mem, cmd_ev, errfmt)
-
   sig_state = process.SignalState()
   sig_state.InitShell()
 
-  builtins[builtin_i.trap] = builtin_process.Trap(sig_state, cmd_deps.traps,
-                                                  cmd_deps.trap_nodes,
-                                                  parse_ctx, errfmt)
-
-  # History evaluation is a no-op if line_input is None.
-  hist_ev = history.Evaluator(line_input, hist_ctx, debug_f)
-
   if opts.c is not None:
     arena.PushSource(source.CFlag())
     line_reader = reader.StringLineReader(opts.c, arena)
@@ -624,6 +696,8 @@ def ShellMain(lang, argv0, argv, login_shell):
 
   elif opts.i:  # force interactive
     arena.PushSource(source.Stdin(' -i'))
+    hist_ev = _MakeHistoryEvaluator(parse_opts, aliases, grammar_loader,
+                                    debug_f)
     line_reader = py_reader.InteractiveLineReader(
         arena, prompt_ev, hist_ev, line_input, prompt_state)
     mutable_opts.set_interactive()
@@ -633,6 +707,8 @@ def ShellMain(lang, argv0, argv, login_shell):
     if script_name is None:
       if sys.stdin.isatty():
         arena.PushSource(source.Interactive())
+        hist_ev = _MakeHistoryEvaluator(parse_opts, aliases, grammar_loader,
+                                        debug_f)
         line_reader = py_reader.InteractiveLineReader(
             arena, prompt_ev, hist_ev, line_input, prompt_state)
         mutable_opts.set_interactive()
@@ -648,10 +724,17 @@ def ShellMain(lang, argv0, argv, login_shell):
                   posix.strerror(e.errno))
         return 1
       line_reader = reader.FileLineReader(f, arena)
+      backing = pyutil.BackingFile(script_name, f)
+      if backing:
+        abs_path, st_dev, st_ino = backing
+        file_id = arena.AddBackingFile(abs_path, st_dev, st_ino)
+        line_reader.SetBackingFile(file_id)
 
   # TODO: assert arena.NumSourcePaths() == 1
   # TODO: .rc file needs its own arena.
   c_parser = parse_ctx.MakeOshParser(line_reader)
+  if cache:
+    c_parser = cache.MaybeWrap(c_parser)
 
   if exec_opts.interactive():
     # bash: 'set -o emacs' is the default only in the interactive shell
@@ -677,8 +760,22 @@ def ShellMain(lang, argv0, argv, login_shell):
       ev.prompt_ev = prompt_ev
       ev.CheckCircularDeps()
 
+      comp_arena = alloc.Arena()
+      comp_arena.PushSource(source.Unused('completion'))
+      trail = parse_lib.Trail()
+      # one_pass_parse needs to be turned on to complete inside backticks.
+      # TODO: fix the issue where ` gets erased because it's not part of
+      # set_completer_delims().
+      comp_ctx = parse_lib.ParseContext(comp_arena, parse_opts, aliases, None)
+      comp_ctx.Init_GrammarLoader(grammar_loader)
+      comp_ctx.Init_Trail(trail)
+      comp_ctx.Init_OnePassParse(True)
+
+      # A keypress on stdin also cancels completion.
+      budget = completion.Budget(opts.completion_timeout_ms, 0)
       root_comp = completion.RootCompleter(ev, mem, comp_lookup, compopt_state,
-                                           comp_ui_state, comp_ctx, debug_f)
+                                           comp_ui_state, dir_cache, budget,
+                                           comp_ctx, debug_f)
 
       term_width = 0
       if opts.completion_display == 'nice':
@@ -694,7 +791,8 @@ def ShellMain(lang, argv0, argv, login_shell):
         display = comp_ui.MinimalDisplay(comp_ui_state, prompt_state, debug_f)
 
       _InitReadline(line_input, history_filename, root_comp, display, debug_f)
-      _InitDefaultCompletions(cmd_ev, complete_builtin, comp_lookup)
+      _InitDefaultCompletions(shell_ex.GetBuiltin(builtin_i.complete),
+                              comp_lookup)
 
     else:  # Without readline module
       display = comp_ui.MinimalDisplay(comp_ui_state, prompt_state, debug_f)
@@ -709,7 +807,7 @@ def ShellMain(lang, argv0, argv, login_shell):
 
     line_reader.Reset()  # After sourcing startup file, render $PS1
 
-    prompt_plugin = prompt.UserPlugin(mem, parse_ctx, cmd_ev)
+    prompt_plugin = prompt.UserPlugin(mem, code_cache, cmd_ev)
     try:
       status = main_loop.Interactive(opts, cmd_ev, c_parser, display,
                                      prompt_plugin, errfmt)
@@ -845,6 +943,9 @@ def OshCommandMain(argv):
 
   # stderr: show how we're following imports?
 
+  from tools import deps
+  from tools import osh2oil
+
   if action == 'translate':
     osh2oil.PrintAsOil(arena, node)
 
@@ -929,6 +1030,7 @@ def AppBundleMain(argv):
   elif main_name == 'false':
     return 1
   elif main_name == 'readlink':
+    from tools import readlink
     return readlink.main(main_argv)
   else:
     raise args.UsageError('Invalid applet name %r.' % main_name)
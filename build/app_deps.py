@@ -36,6 +36,11 @@ def ImportMain(main_module, old_modules):
     # TODO: print better error.
     raise
 
+  # The app may defer some imports until they're needed, e.g. the builtins in
+  # bin/oil.py.  They still have to be in the bundle.
+  for name in getattr(sys.modules[main_module], 'LAZY_IMPORTS', []):
+    __import__(name)
+
   new_modules = sys.modules
   log('After importing: %d modules', len(new_modules))
 
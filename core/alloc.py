@@ -15,9 +15,11 @@ from _devbuild.gen.syntax_asdl import (
     line_span, source_t, source_e, source__MainFile, source__SourcedFile
 )
 from asdl import runtime
+from core import pyutil
 from core.util import log
+from mycpp import mylib
 
-from typing import List, Dict, cast
+from typing import List, Dict, Optional, cast
 
 
 class Arena(object):
@@ -30,14 +32,34 @@ class Arena(object):
   def __init__(self):
     # type: () -> None
 
-    # Three parallel arrays indexed by line_id.
-    self.line_vals = []  # type: List[str]
-    self.line_nums = []  # type: List[int]
+    # Parallel arrays indexed by line_id.  For lines of a backing file,
+    # line_vals has None, and line_file_ids and line_offsets say where to find
+    # the line on disk.
+    self.line_vals = []  # type: List[Optional[str]]
+    self.line_nums = mylib.NewIntArray()
     self.line_srcs = []  # type: List[source_t]
+    self.line_file_ids = mylib.NewIntArray()  # -1 if the line is in memory
+    self.line_offsets = mylib.NewIntArray()
     self.line_num_strs = {}  # type: Dict[int, str]  # an INTERN table
 
-    # indexed by span_id
-    self.spans = []  # type: List[line_span]
+    # Parallel arrays indexed by file_id.  See AddBackingFile().
+    self.file_paths = []  # type: List[str]
+    self.file_devs = []  # type: List[int]
+    self.file_inos = []  # type: List[int]
+
+    # The parser reads back lines of the logical line it's parsing, e.g. for
+    # aliases and a[x]=1, so we keep those in memory.  Reading them from disk
+    # would give the wrong text if the file changed.  See ReleaseFileLines().
+    self.file_lines = {}  # type: Dict[int, str]
+    self.last_file_line_id = -1
+
+    # Three parallel arrays indexed by span_id.  An arena for a big file has
+    # millions of spans that live as long as the shell, so we store columns of
+    # machine integers rather than a line_span object per token.  GetLineSpan()
+    # creates line_span objects on demand.
+    self.span_line_ids = mylib.NewIntArray()
+    self.span_cols = mylib.NewIntArray()
+    self.span_lengths = mylib.NewIntArray()
 
     # reuse these instances in many line_span instances
     self.source_instances = []  # type: List[source_t]
@@ -60,29 +82,88 @@ class Arena(object):
     self.line_vals.append(line)
     self.line_nums.append(line_num)
     self.line_srcs.append(self.source_instances[-1])
+    self.line_file_ids.append(-1)
+    self.line_offsets.append(-1)
     return line_id
 
+  def AddBackingFile(self, path, dev, ino):
+    # type: (str, int, int) -> int
+    """Register a regular file that lines can be read back from.
+
+    Args:
+      path: an absolute path, since the shell may change directories
+      dev, ino: to detect that the file was replaced
+
+    Returns:
+      A file_id for AddFileLine().
+    """
+    file_id = len(self.file_paths)
+    self.file_paths.append(path)
+    self.file_devs.append(dev)
+    self.file_inos.append(ino)
+    return file_id
+
+  def AddFileLine(self, line, line_num, file_id, offset):
+    # type: (str, int, int, int) -> int
+    """Like AddLine(), but don't keep the line in memory.
+
+    Args:
+      line: the line, or '' if the caller doesn't have it
+      offset: byte offset of the line in the backing file
+    """
+    line_id = len(self.line_vals)
+    self.line_vals.append(None)
+    self.line_nums.append(line_num)
+    self.line_srcs.append(self.source_instances[-1])
+    self.line_file_ids.append(file_id)
+    self.line_offsets.append(offset)
+
+    if len(line):
+      self.file_lines[line_id] = line
+      self.last_file_line_id = line_id
+    return line_id
+
+  def ReleaseFileLines(self):
+    # type: () -> None
+    """Forget the lines of backing files, except the last one read.
+
+    Called by the parser before each logical line.
+    """
+    if len(self.file_lines) > 1:
+      last_line = self.file_lines[self.last_file_line_id]
+      self.file_lines.clear()
+      self.file_lines[self.last_file_line_id] = last_line
+
   def GetLine(self, line_id):
     # type: (int) -> str
     """Return the text of a line.
 
-    TODO: This should be hidden behind an interface like Python's line cache?
-    It should store offsets (and maybe checkums).  It will have two
-    implementions: in-memory for interactive, and on-disk for batch and
-    'sourced' files.
+    Lines of backing files are read from disk, which is fine for error
+    messages.  If the file was replaced, we return an empty line.
     """
     assert line_id >= 0, line_id
-    return self.line_vals[line_id]
+    line = self.line_vals[line_id]
+    if line is not None:
+      return line
+
+    if line_id in self.file_lines:
+      return self.file_lines[line_id]
+
+    file_id = self.line_file_ids[line_id]
+    s = ''
+    if mylib.PYTHON:
+      s = pyutil.ReadLineAt(self.file_paths[file_id], self.file_devs[file_id],
+                            self.file_inos[file_id],
+                            self.line_offsets[line_id])
+    return s
 
   def GetLineNumber(self, line_id):
     # type: (int) -> int
     return self.line_nums[line_id]
 
-  # NOTE: Not used yet.  Using an intern table seems like a good idea, but I
-  # haven't measured the performance benefit of it.  The case I'm thinking of
-  # is where you have a tight loop and every line uses $LINENO.  It's better to
-  # create 3 objects rather than 3*N objects, where N is the number of loop
-  # iterations.
+  # Used for $LINENO and ${BASH_LINENO[@]}.  The case I'm thinking of is where
+  # you have a tight loop and every line uses $LINENO.  It's better to create 3
+  # objects rather than 3*N objects, where N is the number of loop iterations.
   def GetLineNumStr(self, line_id):
     # type: (int) -> str
     line_num = self.line_nums[line_id]
@@ -118,22 +199,37 @@ class Arena(object):
   def AddLineSpan(self, line_id, col, length):
     # type: (int, int, int) -> int
     """Save a line_span and return a new span ID for later retrieval."""
-    span_id = len(self.spans)  # spids are just array indices
-    span = line_span(line_id, col, length)
-    self.spans.append(span)
+    span_id = len(self.span_line_ids)  # spids are just array indices
+    self.span_line_ids.append(line_id)
+    self.span_cols.append(col)
+    self.span_lengths.append(length)
     return span_id
 
   def GetLineSpan(self, span_id):
     # type: (int) -> line_span
+    """Return a new line_span.  Callers shouldn't mutate it or rely on its
+    identity."""
+    line_id = self.GetSpanLineId(span_id)
+    return line_span(line_id, self.span_cols[span_id],
+                     self.span_lengths[span_id])
+
+  def GetSpanLineId(self, span_id):
+    # type: (int) -> int
+    """Like GetLineSpan(span_id).line_id, without allocating."""
     assert span_id != runtime.NO_SPID, span_id
     try:
-      return self.spans[span_id]
+      return self.span_line_ids[span_id]
     except IndexError:
       log('Span ID out of range: %d is greater than %d', span_id,
-          len(self.spans))
+          len(self.span_line_ids))
       raise
 
   def LastSpanId(self):
     # type: () -> int
     """Return one past the last span ID."""
-    return len(self.spans)
+    return len(self.span_line_ids)
+
+  def LastLineId(self):
+    # type: () -> int
+    """Return one past the last line ID."""
+    return len(self.line_vals)
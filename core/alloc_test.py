@@ -3,6 +3,9 @@
 alloc_test.py: Tests for alloc.py
 """
 
+import os
+import shutil
+import tempfile
 import unittest
 
 from _devbuild.gen.syntax_asdl import source
@@ -34,6 +37,11 @@ class AllocTest(unittest.TestCase):
     self.assertEqual('one.oil', arena.GetLineSource(1).path)
     self.assertEqual(2, arena.GetLineNumber(1))
 
+    span = arena.GetLineSpan(span_id)
+    self.assertEqual((0, 1, 2), (span.line_id, span.col, span.length))
+    self.assertEqual(0, arena.GetSpanLineId(span_id))
+    self.assertEqual(1, arena.LastSpanId())
+
   def testPushSource(self):
     arena = self.arena
 
@@ -55,6 +63,36 @@ class AllocTest(unittest.TestCase):
     self.assertEqual('one.oil', arena.GetLineSource(id3).path)
     self.assertEqual(3, arena.GetLineNumber(id3))
 
+  def testBackingFile(self):
+    arena = self.arena
+    tmp_dir = tempfile.mkdtemp()
+    try:
+      path = os.path.join(tmp_dir, 'lib.sh')
+      with open(path, 'w') as f:
+        f.write('a[1+1]=x \\\n  y=z\necho\n')
+      st = os.stat(path)
+      file_id = arena.AddBackingFile(path, st.st_dev, st.st_ino)
+
+      arena.PushSource(source.MainFile(path))
+      id1 = arena.AddFileLine('a[1+1]=x \\\n', 1, file_id, 0)
+      id2 = arena.AddFileLine('  y=z\n', 2, file_id, 11)
+      arena.PopSource()
+
+      # Replace the file while parsing.  Lines of the logical line are still
+      # in memory.
+      with open(path + '.new', 'w') as f:
+        f.write('replaced\n')
+      os.rename(path + '.new', path)
+      self.assertEqual('a[1+1]=x \\\n', arena.GetLine(id1))
+      self.assertEqual('  y=z\n', arena.GetLine(id2))
+
+      # After the logical line, earlier lines are read from disk
+      arena.ReleaseFileLines()
+      self.assertEqual('', arena.GetLine(id1))
+      self.assertEqual('  y=z\n', arena.GetLine(id2))
+    finally:
+      shutil.rmtree(tmp_dir)
+
 
 if __name__ == '__main__':
   unittest.main()
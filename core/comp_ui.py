@@ -80,6 +80,10 @@ class State(object):
     # completion candidate descriptions
     self.descriptions = {}  # type: Dict[str, str]
 
+    # Why the candidates are incomplete, e.g. 'timed out after 500 ms'.  Then
+    # line_until_tab is one of the matches, and shouldn't be displayed.
+    self.stopped = ''
+
 
 class _IDisplay(object):
   """Interface for completion displays."""
@@ -106,6 +110,14 @@ class _IDisplay(object):
     """Abstract method."""
     raise NotImplementedError()
 
+  def _PartialMatches(self, matches):
+    # type: (List[str]) -> List[str]
+    """Remove the placeholder that RootCompleter adds to partial results."""
+    if not self.comp_state.stopped:
+      return matches
+    line_until_tab = self.comp_state.line_until_tab
+    return [m for m in matches if m != line_until_tab]
+
   def Reset(self):
     # type: () -> None
     """Call this in between commands."""
@@ -165,6 +177,8 @@ class MinimalDisplay(_IDisplay):
     display_pos = self.comp_state.display_pos
     assert display_pos != -1
 
+    matches = self._PartialMatches(matches)
+
     too_many = False
     i = 0
     for m in matches:
@@ -182,6 +196,9 @@ class MinimalDisplay(_IDisplay):
       if num_left:
         self.f.write(' ... and %d more\n' % num_left)
 
+    if self.comp_state.stopped:
+      self.f.write(' ... %s\n' % self.comp_state.stopped)
+
     self._RedrawPrompt()
 
   def PrintRequired(self, msg, *args):
@@ -376,6 +393,8 @@ class NiceDisplay(_IDisplay):
     self.EraseLines()  # Delete previous completions!
     #log('_PrintCandidates %r', unused_subst, file=DEBUG_F)
 
+    matches = self._PartialMatches(matches)
+
     # Figure out if the user hit TAB multiple times to show more matches.
     # It's not correct to hash the line itself, because two different lines can
     # have the same completions:
@@ -416,6 +435,11 @@ class NiceDisplay(_IDisplay):
       num_lines = _PrintPacked(to_display, max_match_len, term_width,
                                max_lines, self.f)
 
+    if self.comp_state.stopped:
+      fmt2 = ansi.BOLD + ansi.BLUE + '%' + str(term_width-2) + 's' + ansi.RESET
+      self.f.write(fmt2 % ('... %s\n' % self.comp_state.stopped))
+      num_lines += 1
+
     self._ReturnToPrompt(num_lines+1)
     self.num_lines_last_displayed = num_lines
 
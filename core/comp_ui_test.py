@@ -148,6 +148,33 @@ class UiTest(unittest.TestCase):
 
       disp.ShowPromptOnRight('RIGHT')
 
+  def testPartialMatches(self):
+    comp_ui_state = comp_ui.State()
+    prompt_state = comp_ui.PromptState()
+    prompt_state.SetLastPrompt('$ ')
+    debug_f = util.DebugFile(sys.stdout)
+
+    comp_ui_state.line_until_tab = 'echo o'
+    comp_ui_state.display_pos = 5
+    comp_ui_state.stopped = 'timed out after 100 ms'
+
+    # RootCompleter adds the line itself to partial results.
+    matches = ['echo one', 'echo only', 'echo o']
+
+    f = cStringIO.StringIO()
+    d = comp_ui.MinimalDisplay(comp_ui_state, prompt_state, debug_f, f=f)
+    d.PrintCandidates(None, matches, None)
+    self.assertEqual(
+        '\n one\n only\n ... timed out after 100 ms\n$ echo o', f.getvalue())
+
+    f = cStringIO.StringIO()
+    d = comp_ui.NiceDisplay(80, comp_ui_state, prompt_state, debug_f,
+                            line_input, f=f)
+    d.PrintCandidates(None, matches, None)
+    out = f.getvalue()
+    self.assertIn('timed out after 100 ms', out)
+    self.assertEqual(2, d.num_lines_last_displayed)
+
 
 class PromptTest(unittest.TestCase):
 
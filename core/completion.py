@@ -73,6 +73,25 @@ class _RetryCompletion(Exception):
   pass
 
 
+class _BudgetExhausted(Exception):
+  """Raised by UserSpec and the file system actions when the Budget is out."""
+  def __init__(self, reason):
+    Exception.__init__(self)
+    self.reason = reason
+
+
+# Budget.Check() costs a syscall, so loops over directory entries only call it
+# this often.
+_CHECK_EVERY = 100
+
+
+def _CheckBudget(budget):
+  if budget:
+    stopped = budget.Check()
+    if stopped:
+      raise _BudgetExhausted(stopped)
+
+
 CH_Break, CH_Other = xrange(2)  # Character types
 ST_Begin, ST_Break, ST_Other = xrange(3)  # States
 
@@ -107,8 +126,30 @@ def AdjustArg(arg, break_chars, argv_out):
     begin = end
 
 
+class SpecStats(object):
+  """How long a compspec took to generate candidates.  For 'complete -T'."""
+
+  def __init__(self):
+    self.num_calls = 0
+    self.num_matches = 0
+    self.num_stopped = 0  # timed out or cancelled
+    self.total_ms = 0.0
+    self.max_ms = 0.0
+
+  def Record(self, elapsed_ms, num_matches, stopped):
+    self.num_calls += 1
+    self.num_matches += num_matches
+    if stopped:
+      self.num_stopped += 1
+    self.total_ms += elapsed_ms
+    self.max_ms = max(self.max_ms, elapsed_ms)
+
+
 class NullCompleter(object):
 
+  def __init__(self):
+    self.stats = SpecStats()
+
   def Matches(self, comp):
     return []
 
@@ -164,6 +205,21 @@ class Lookup(object):
     for pat, spec in self.patterns:
       print('%s = %s' % (pat, spec))
 
+  def PrintStats(self):
+    """For 'complete -T'.  Only shows compspecs that have been used."""
+    rows = [(name, user_spec) for name, (_, user_spec) in self.lookup.items()]
+    rows.extend((pat, user_spec) for pat, _, user_spec in self.patterns)
+
+    # NOTE: Can't use %.2f in production build!
+    fmt = '%-15s %6s %8s %8s %8s %8s'
+    print(fmt % ('NAME', 'CALLS', 'MATCHES', 'STOPPED', 'TOTAL_MS', 'MAX_MS'))
+    for name, user_spec in sorted(rows):
+      st = user_spec.stats
+      if st.num_calls == 0:
+        continue
+      print(fmt % (name, st.num_calls, st.num_matches, st.num_stopped,
+                   int(st.total_ms), int(st.max_ms)))
+
   def ClearCommandsChanged(self):
     del self.commands_with_spec_changes[:]
 
@@ -222,6 +278,10 @@ class Api(object):
     self.end = end
     # NOTE: COMP_WORDBREAKS is initialized in Mem().
 
+    # Set by RootCompleter for TAB, but not for compgen, which can't be
+    # stopped early.
+    self.budget = None
+
   # NOTE: to_complete could be 'cur'
   def Update(self, first='', to_complete='', prev='', index=0,
              partial_argv=None):
@@ -277,6 +337,7 @@ class TestAction(CompletionAction):
     for w in self.words:
       if w.startswith(comp.to_complete):
         if self.delay:
+          _CheckBudget(comp.budget)  # like a FileSystemAction
           time.sleep(self.delay)
         yield w
 
@@ -304,12 +365,115 @@ class DynamicWordsAction(CompletionAction):
         yield c
 
 
+class _DirListing(object):
+  """One directory in the DirCache."""
+
+  def __init__(self, mtime, entries):
+    # (name, d_type) from posix.scandir()
+    self.mtime = mtime
+    self.entries = entries
+    self.types = dict(entries)  # name -> d_type
+
+
+class DirCache(object):
+  """Directory listings shared by completion actions.
+
+  Hitting TAB repeatedly in a big directory, or completing commands in $PATH,
+  shouldn't list the directory each time.  A listing is reused until the
+  directory's mtime changes, and the least recently used ones are evicted.
+
+  posix.scandir() gives us the type of each entry, so we don't stat() every
+  file to find directories.
+
+  Whether a file is executable isn't cached, since chmod doesn't change the
+  directory's mtime.
+  """
+  def __init__(self, max_dirs=64):
+    self.max_dirs = max_dirs
+    self.listings = {}  # path -> _DirListing
+    self.lru = []  # paths, least recently used first
+
+  def _Get(self, path):
+    """Return a current _DirListing, or None if the path can't be listed."""
+    try:
+      st = posix.stat(path)
+    except OSError as e:
+      return None
+    # Include the inode in case the directory was replaced.
+    mtime = (st.st_mtime, st.st_ino)
+
+    listing = self.listings.get(path)
+    if listing is not None:
+      self.lru.remove(path)
+      if listing.mtime == mtime:
+        self.lru.append(path)
+        return listing
+
+    try:
+      entries = posix.scandir(path)
+    except OSError as e:
+      self.listings.pop(path, None)
+      return None
+
+    listing = _DirListing(mtime, entries)
+    self.listings[path] = listing
+    self.lru.append(path)
+    if len(self.lru) > self.max_dirs:
+      del self.listings[self.lru.pop(0)]
+    return listing
+
+  def List(self, path):
+    """Returns a list of (name, d_type), which may be empty."""
+    listing = self._Get(path)
+    return listing.entries if listing else []
+
+  def Executables(self, path, prefix, budget=None):
+    """Returns the names of executable files in a directory, e.g. in $PATH.
+
+    Only names that start with 'prefix' are checked with access().  Raises
+    _BudgetExhausted if the budget runs out.
+    """
+    listing = self._Get(path)
+    if listing is None:
+      return []
+    exes = []
+    for i, (name, _) in enumerate(listing.entries):
+      if i % _CHECK_EVERY == _CHECK_EVERY - 1:
+        _CheckBudget(budget)
+      if (name.startswith(prefix) and
+          posix.access(os_path.join(path, name), posix.X_OK_)):
+        exes.append(name)
+    return exes
+
+  def IsDir(self, path, d_type=None):
+    """Is 'path' a directory?  Only symlinks and unknown types are stat()'d.
+
+    Args:
+      d_type: from List(), or None to look it up in a listing we already have.
+        A listing isn't revalidated here, since it was just used to generate
+        the candidate.
+    """
+    if d_type is None:
+      dirname, basename = os_path.split(path)
+      listing = self.listings.get(dirname or '.')
+      if listing is not None:
+        d_type = listing.types.get(basename)
+
+    if d_type == posix.DT_DIR:
+      return True
+    if d_type is None or d_type in (posix.DT_LNK, posix.DT_UNKNOWN):
+      return path_stat.isdir(path)
+    return False
+
+
 class FileSystemAction(CompletionAction):
   """Complete paths from the file system.
 
   Directories will have a / suffix.
   """
-  def __init__(self, dirs_only=False, exec_only=False, add_slash=False):
+  def __init__(self, dir_cache, dirs_only=False, exec_only=False,
+               add_slash=False):
+    self.dir_cache = dir_cache
     self.dirs_only = dirs_only
     self.exec_only = exec_only
 
@@ -337,32 +501,24 @@ class FileSystemAction(CompletionAction):
       log('to_list %r', to_list)
       log('dirname %r', dirname)
 
-    try:
-      names = posix.listdir(to_list)
-    except OSError as e:
-      return  # nothing
-
-    for name in names:
+    entries = self.dir_cache.List(to_list)
+    for i, (name, d_type) in enumerate(entries):
+      if i % _CHECK_EVERY == _CHECK_EVERY - 1:
+        _CheckBudget(comp.budget)
       path = os_path.join(dirname, name)
 
       if path.startswith(to_complete):
         if self.dirs_only:  # add_slash not used here
-          # NOTE: There is a duplicate isdir() check later to add a trailing
-          # slash.  Consolidate the checks for fewer stat() ops.  This is hard
-          # because all the completion actions must obey the same interface.
-          # We could have another type like candidate = File | Dir |
-          # OtherString ?
-          if path_stat.isdir(path):
+          # NOTE: RootCompleter._PostProcess() checks for directories again to
+          # add a trailing slash, but the DirCache answers without stat().
+          if self.dir_cache.IsDir(path, d_type):
             yield path
           continue
 
-        if self.exec_only:
-          # TODO: Handle exception if file gets deleted in between listing and
-          # check?
-          if not posix.access(path, posix.X_OK_):
-            continue
+        if self.exec_only and not posix.access(path, posix.X_OK_):
+          continue
 
-        if self.add_slash and path_stat.isdir(path):
+        if self.add_slash and self.dir_cache.IsDir(path, d_type):
           yield path + '/'
         else:
           yield path
@@ -474,37 +630,17 @@ class ExternalCommandAction(CompletionAction):
 
   This is PART of compge -A command.
   """
-  def __init__(self, mem):
+  def __init__(self, mem, dir_cache):
     """
     Args:
       mem: for looking up Path
+      dir_cache: listings of the directories in $PATH, reused until their
+        mtime changes.
     """
     self.mem = mem
-    # Should we list everything executable in $PATH here?  And then whenever
-    # $PATH is changed, regenerated it?
-    # Or we can cache directory listings?  What if the contents of the dir
-    # changed?
-    # Can we look at the dir timestamp?
-    #
-    # (dir, timestamp) -> list of entries perhaps?  And then every time you hit
-    # tab, do you have to check the timestamp?  It should be cached by the
-    # kernel, so yes.
-    self.ext = []
-
-    # (dir, timestamp) -> list
-    # NOTE: This cache assumes that listing a directory is slower than statting
-    # it to get the mtime.  That may not be true on all systems?  Either way
-    # you are reading blocks of metadata.  But I guess /bin on many systems is
-    # huge, and will require lots of sys calls.
-    self.cache = {}
+    self.dir_cache = dir_cache
 
   def Matches(self, comp):
-    """
-    TODO: Cache is never cleared.
-
-    - When we get a newer timestamp, we should clear the old one.
-    - When PATH is changed, we can remove old entries.
-    """
     val = self.mem.GetVar('PATH')
     if val.tag != value_e.Str:
       # No matches if not a string
@@ -512,35 +648,13 @@ class ExternalCommandAction(CompletionAction):
     path_dirs = val.s.split(':')
     #log('path: %s', path_dirs)
 
-    executables = []
-    for d in path_dirs:
-      try:
-        st = posix.stat(d)
-      except OSError as e:
-        # There could be a directory that doesn't exist in the $PATH.
-        continue
-      key = (d, st.st_mtime)
-
-      dir_exes = self.cache.get(key)
-      if dir_exes is None:
-        entries = posix.listdir(d)
-        dir_exes = []
-        for name in entries:
-          path = os_path.join(d, name)
-          # TODO: Handle exception if file gets deleted in between listing and
-          # check?
-          if not posix.access(path, posix.X_OK_):
-            continue
-          dir_exes.append(name)  # append the name, not the path
-
-        self.cache[key] = dir_exes
-
-      executables.extend(dir_exes)
-
     # TODO: Shouldn't do the prefix / space thing ourselves.  readline does
     # that at the END of the line.
-    for word in executables:
-      if word.startswith(comp.to_complete):
+    for d in path_dirs:
+      _CheckBudget(comp.budget)
+      # There could be a directory that doesn't exist in the $PATH.
+      for word in self.dir_cache.Executables(d, comp.to_complete,
+                                             budget=comp.budget):
         yield word
 
 
@@ -588,12 +702,20 @@ class UserSpec(object):
     self.predicate = predicate  # for -X
     self.prefix = prefix
     self.suffix = suffix
+    self.stats = SpecStats()  # updated by RootCompleter
 
   def Matches(self, comp):
-    """Yield completion candidates."""
+    """Yield completion candidates.
+
+    If comp.budget runs out, _BudgetExhausted is raised before an action
+    runs, or by an action that reads the file system.  A ShellFuncAction is
+    always run to completion, and its candidates aren't truncated.
+    """
     num_matches = 0
 
     for a in self.actions:
+      if not isinstance(a, ShellFuncAction):
+        _CheckBudget(comp.budget)
       is_fs_action = isinstance(a, FileSystemAction)
       for match in a.Matches(comp):
         # Special case hack to match bash for compgen -F.  It doesn't filter by
@@ -617,12 +739,14 @@ class UserSpec(object):
 
     # for -o plusdirs
     for a in self.extra_actions:
+      _CheckBudget(comp.budget)
       for match in a.Matches(comp):
         yield match, True  # We know plusdirs is a file system action
 
     # for -o default and -o dirnames
     if num_matches == 0:
       for a in self.else_actions:
+        _CheckBudget(comp.budget)
         for match in a.Matches(comp):
           yield match, True  # both are FileSystemAction
 
@@ -667,6 +791,44 @@ def WordEndsWithCompDummy(w):
   )
 
 
+class Budget(object):
+  """Limits how long a TAB press spends generating candidates.
+
+  Readline calls the completer synchronously, so we can't generate candidates
+  in the background.  Instead UserSpec checks the budget between actions, and
+  the actions that read the file system check it as they go.  They stop early
+  if time is up or the user pressed a key, and the candidates so far are
+  displayed as a partial result.
+
+  Shell functions aren't subject to the budget.  We can't stop one in the
+  middle, and its COMPREPLY is only available when it's done, so truncating
+  it would only throw away work.  A slow function can be interrupted with
+  Ctrl-C.
+  """
+  def __init__(self, timeout_ms, stdin_fd):
+    """
+    Args:
+      timeout_ms: 0 for no limit
+      stdin_fd: checked for a keypress, or -1 to not check
+    """
+    self.timeout_ms = timeout_ms
+    self.stdin_fd = stdin_fd
+    self.deadline = 0.0
+
+  def Start(self):
+    if self.timeout_ms:
+      self.deadline = time.time() + self.timeout_ms / 1000.0
+
+  def Check(self):
+    """Returns the reason to stop, or '' to keep going."""
+    if self.timeout_ms and time.time() > self.deadline:
+      return 'timed out after %d ms' % self.timeout_ms
+    # The key stays in the buffer, so readline handles it after we return.
+    if self.stdin_fd != -1 and posix.input_pending(self.stdin_fd):
+      return 'cancelled by keypress'
+    return ''
+
+
 class RootCompleter(object):
   """Dispatch to various completers.
 
@@ -674,10 +836,12 @@ class RootCompleter(object):
   - Statically evaluate argv and dispatch to a command completer.
   """
   def __init__(self, word_ev, mem, comp_lookup, compopt_state, comp_ui_state,
-               parse_ctx, debug_f):
+               dir_cache, budget, parse_ctx, debug_f):
     self.word_ev = word_ev  # for static evaluation of words
     self.mem = mem  # to complete variable names
     self.comp_lookup = comp_lookup
+    self.dir_cache = dir_cache  # for redirects, and trailing slashes
+    self.budget = budget  # for user-defined completion
     self.compopt_state = compopt_state  # for compopt builtin
     self.comp_ui_state = comp_ui_state
 
@@ -698,6 +862,7 @@ class RootCompleter(object):
     # Pass the original line "out of band" to the completion callback.
     line_until_tab = comp.line[:comp.end]
     self.comp_ui_state.line_until_tab = line_until_tab
+    self.comp_ui_state.stopped = ''
 
     self.parse_ctx.trail.Clear()
     line_reader = reader.StringLineReader(line_until_tab, self.parse_ctx.arena)
@@ -853,7 +1018,7 @@ class RootCompleter(object):
 
           comp.Update(to_complete=val.s)  # FileSystemAction uses only this
           n = len(val.s)
-          action = FileSystemAction(add_slash=True)
+          action = FileSystemAction(self.dir_cache, add_slash=True)
           for name in action.Matches(comp):
             yield line_until_tab + ShellQuoteB(name[n:])
           return
@@ -972,6 +1137,8 @@ class RootCompleter(object):
     dynamic_opts = {}
     self.compopt_state.dynamic_opts = dynamic_opts
     self.compopt_state.currently_completing = True
+    self.budget.Start()  # The time for retries counts too
+    comp.budget = self.budget
     try:
       done = False
       while not done:
@@ -1002,6 +1169,7 @@ class RootCompleter(object):
   def _PostProcess(self, base_opts, dynamic_opts, user_spec, comp):
     """
     Add trailing spaces / slashes to completion candidates, and time them.
+    Stops early if the Budget runs out.
 
     NOTE: This post-processing MUST go here, and not in UserSpec, because it's
     in READLINE in bash.  compgen doesn't see it.
@@ -1012,7 +1180,17 @@ class RootCompleter(object):
     # TODO: dedupe candidates?  You can get two 'echo' in bash, which is dumb.
 
     i = 0
-    for candidate, is_fs_action in user_spec.Matches(comp):
+    stopped = ''
+    it = iter(user_spec.Matches(comp))
+    while True:
+      try:
+        candidate, is_fs_action = it.next()
+      except StopIteration:
+        break
+      except _BudgetExhausted as e:
+        stopped = e.reason
+        break
+
       # SUBTLE: dynamic_opts is part of compopt_state, which ShellFuncAction
       # can mutate!  So we don't want to pull this out of the loop.
       #
@@ -1048,24 +1226,22 @@ class RootCompleter(object):
 
       # compopt -o filenames is for user-defined actions.  Or any
       # FileSystemAction needs it.
-      if is_fs_action or opt_filenames:
-        if path_stat.isdir(candidate):  # TODO: test coverage
-          yield line_until_word + ShellQuoteB(candidate) + '/'
-          continue
-
-      opt_nospace = base_opts.get('nospace', False)
-      if 'nospace' in dynamic_opts:
-        opt_nospace = dynamic_opts['nospace']
+      if ((is_fs_action or opt_filenames) and
+          self.dir_cache.IsDir(candidate)):  # TODO: test coverage
+        yield line_until_word + ShellQuoteB(candidate) + '/'
+      else:
+        opt_nospace = base_opts.get('nospace', False)
+        if 'nospace' in dynamic_opts:
+          opt_nospace = dynamic_opts['nospace']
 
-      sp = '' if opt_nospace else ' '
-      yield line_until_word + ShellQuoteB(candidate) + sp
+        sp = '' if opt_nospace else ' '
+        yield line_until_word + ShellQuoteB(candidate) + sp
 
       # NOTE: Can't use %.2f in production build!
       i += 1
       elapsed_ms = (time.time() - start_time) * 1000.0
       plural = '' if i == 1 else 'es'
 
-      # TODO: Show this in the UI if it takes too long!
       if 0:
         self.debug_f.log(
             '... %d match%s for %r in %d ms (Ctrl-C to cancel)', i,
@@ -1073,9 +1249,22 @@ class RootCompleter(object):
 
     elapsed_ms = (time.time() - start_time) * 1000.0
     plural = '' if i == 1 else 'es'
-    self.debug_f.log(
-        'Found %d match%s for %r in %d ms', i,
-        plural, comp.line, elapsed_ms)
+    user_spec.stats.Record(elapsed_ms, i, stopped)
+
+    if stopped:
+      self.debug_f.log(
+          'Stopped after %d match%s for %r: %s', i,
+          plural, comp.line, stopped)
+      if i != 0:
+        # The candidates are incomplete, so readline shouldn't insert their
+        # common prefix, or a single candidate.  Adding the line itself
+        # prevents that, and the display hides it.
+        self.comp_ui_state.stopped = stopped
+        yield self.comp_ui_state.line_until_tab
+    else:
+      self.debug_f.log(
+          'Found %d match%s for %r in %d ms', i,
+          plural, comp.line, elapsed_ms)
 
    
 class ReadlineCallback(object):
@@ -11,6 +11,7 @@ completion_test.py: Tests for completion.py
 from __future__ import print_function
 
 import os
+import time
 import unittest
 import sys
 
@@ -45,7 +46,7 @@ def MockApi(line):
   return completion.Api(line=line, begin=0, end=len(line))
 
 
-def _MakeRootCompleter(parse_ctx=None, comp_lookup=None):
+def _MakeRootCompleter(parse_ctx=None, comp_lookup=None, budget=None):
   #comp_state = comp_state or completion.State()
   compopt_state = completion.OptionState()
   comp_ui_state = comp_ui.State()
@@ -66,7 +67,9 @@ def _MakeRootCompleter(parse_ctx=None, comp_lookup=None):
   state.InitMem(mem, {})
 
   return completion.RootCompleter(ev, mem, comp_lookup, compopt_state,
-                                  comp_ui_state, parse_ctx, debug_f)
+                                  comp_ui_state, completion.DirCache(),
+                                  budget or completion.Budget(0, -1),
+                                  parse_ctx, debug_f)
 
 
 class FunctionsTest(unittest.TestCase):
@@ -120,7 +123,7 @@ class CompletionTest(unittest.TestCase):
 
   def testExternalCommandAction(self):
     mem = state.Mem('dummy', [], None, [])
-    a = completion.ExternalCommandAction(mem)
+    a = completion.ExternalCommandAction(mem, completion.DirCache())
     comp = self._CompApi([], 0, 'f')
     print(list(a.Matches(comp)))
 
@@ -134,7 +137,8 @@ class CompletionTest(unittest.TestCase):
         ('opy/doc', ['opy/doc']),
     ]
 
-    a = completion.FileSystemAction()
+    dir_cache = completion.DirCache()
+    a = completion.FileSystemAction(dir_cache)
     for prefix, expected in CASES:
       log('')
       log('-- PREFIX %r', prefix)
@@ -165,7 +169,7 @@ class CompletionTest(unittest.TestCase):
         ('./b', ['./benchmarks/', './bin/', './build/']),
     ]
 
-    a = completion.FileSystemAction(add_slash=True)
+    a = completion.FileSystemAction(dir_cache, add_slash=True)
     for prefix, expected in ADD_SLASH_CASES:
       log('')
       log('-- PREFIX %s', prefix)
@@ -181,13 +185,56 @@ class CompletionTest(unittest.TestCase):
         ('i', ['install'])
     ]
 
-    a = completion.FileSystemAction(exec_only=True)
+    a = completion.FileSystemAction(dir_cache, exec_only=True)
     for prefix, expected in EXEC_ONLY_CASES:
       log('')
       log('-- PREFIX %s', prefix)
       comp = self._CompApi([], 0, prefix)
       self.assertEqual(expected, sorted(a.Matches(comp)))
 
+  def testDirCache(self):
+    tmp_dir = '/tmp/oil_dir_cache_test'
+    os.system('rm -r -f %s; mkdir -p %s/sub' % (tmp_dir, tmp_dir))
+    os.system('touch %s/a.txt; ln -s sub %s/link' % (tmp_dir, tmp_dir))
+    os.system('touch %s/prog; chmod +x %s/prog' % (tmp_dir, tmp_dir))
+
+    c = completion.DirCache(max_dirs=2)
+    self.assertEqual(
+        ['a.txt', 'link', 'prog', 'sub'],
+        sorted(name for name, _ in c.List(tmp_dir)))
+    # Like access(X_OK), which is also true for directories
+    self.assertEqual(['link', 'prog', 'sub'],
+                     sorted(c.Executables(tmp_dir, '')))
+    self.assertEqual(['prog'], c.Executables(tmp_dir, 'p'))
+    self.assertEqual([], c.List('/nonexistent'))
+
+    # Looked up in the cached listing, and symlinks are followed
+    self.assertEqual(True, c.IsDir(tmp_dir + '/sub'))
+    self.assertEqual(True, c.IsDir(tmp_dir + '/link'))
+    self.assertEqual(False, c.IsDir(tmp_dir + '/a.txt'))
+
+    # The same listing is reused until the directory changes.
+    listing = c.listings[tmp_dir]
+    c.List(tmp_dir)
+    self.assertIs(listing, c.listings[tmp_dir])
+
+    # chmod doesn't change the directory
+    os.system('chmod -x %s/prog' % tmp_dir)
+    self.assertEqual([], c.Executables(tmp_dir, 'p'))
+    self.assertIs(listing, c.listings[tmp_dir])
+
+    # Make sure the mtime changes even on file systems with 1 second
+    # resolution.
+    os.system('touch %s/b.txt; touch -d "+1 minute" %s' % (tmp_dir, tmp_dir))
+    self.assertEqual(5, len(c.List(tmp_dir)))
+    self.assertIsNot(listing, c.listings[tmp_dir])
+
+    # Least recently used directory is evicted
+    c.List(tmp_dir + '/sub')
+    c.List('core')
+    self.assertEqual([tmp_dir + '/sub', 'core'], c.lru)
+    self.assertEqual(2, len(c.listings))
+
   def testShellFuncExecution(self):
     arena = test_lib.MakeArena('testShellFuncExecution')
     c_parser = test_lib.InitCommandParser("""\
@@ -206,6 +253,13 @@ class CompletionTest(unittest.TestCase):
     matches = list(a.Matches(comp))
     self.assertEqual(['f1', 'f2'], matches)
 
+    # Functions aren't subject to the budget
+    comp.budget = completion.Budget(1, -1)
+    comp.budget.Start()
+    time.sleep(0.01)
+    spec = completion.UserSpec([a], [], [], lambda candidate: True)
+    self.assertEqual([('f1', False), ('f2', False)], list(spec.Matches(comp)))
+
   def testUserSpec(self):
     comp = self._CompApi(['f'], 0, 'f')
     matches = list(U1.Matches(comp))
@@ -254,6 +308,66 @@ class RootCompleterTest(unittest.TestCase):
     m = list(r.Matches(MockApi('var=$v')))
     m = list(r.Matches(MockApi('local var=$v')))
 
+  def testBudget(self):
+    slow = completion.TestAction(['m%d' % i for i in xrange(10)], delay=0.05)
+    spec = completion.UserSpec([slow], [], [], lambda candidate: True)
+    comp_lookup = completion.Lookup()
+    comp_lookup.RegisterName('slowc', BASE_OPTS, spec)
+
+    # Partial results, and the line itself so readline doesn't insert anything
+    r = _MakeRootCompleter(comp_lookup=comp_lookup,
+                           budget=completion.Budget(120, -1))
+    m = list(r.Matches(MockApi('slowc m')))
+    self.assertEqual(['slowc m0 ', 'slowc m1 ', 'slowc m2 '], m[:3])
+    self.assertLess(len(m), 10)
+    self.assertEqual('slowc m', m[-1])
+    self.assertEqual('timed out after 120 ms', r.comp_ui_state.stopped)
+
+    # A keypress cancels before the action runs, so there's nothing to show
+    read_fd, write_fd = os.pipe()
+    os.write(write_fd, 'x')
+    r = _MakeRootCompleter(comp_lookup=comp_lookup,
+                           budget=completion.Budget(0, read_fd))
+    m = list(r.Matches(MockApi('slowc m')))
+    self.assertEqual([], m)
+    os.close(read_fd)
+    os.close(write_fd)
+
+    # Directory listings are checked as they go
+    tmp_dir = '/tmp/oil_budget_test'
+    os.system('rm -r -f %s; mkdir -p %s' % (tmp_dir, tmp_dir))
+    os.system('cd %s && touch $(seq 250)' % tmp_dir)
+    read_fd, write_fd = os.pipe()
+    os.write(write_fd, 'x')
+    comp = MockApi('ls %s/' % tmp_dir)
+    comp.Update(to_complete=tmp_dir + '/')
+    comp.budget = completion.Budget(0, read_fd)
+    a = completion.FileSystemAction(completion.DirCache())
+    m = []
+    try:
+      for candidate in a.Matches(comp):
+        m.append(candidate)
+    except completion._BudgetExhausted as e:
+      self.assertEqual('cancelled by keypress', e.reason)
+    else:
+      self.fail('Expected _BudgetExhausted')
+    self.assertLess(len(m), 100)
+    self.assertRaises(completion._BudgetExhausted,
+                      completion.DirCache().Executables, tmp_dir, '',
+                      budget=comp.budget)
+    os.close(read_fd)
+    os.close(write_fd)
+
+    # No limit
+    r = _MakeRootCompleter(comp_lookup=comp_lookup)
+    m = list(r.Matches(MockApi('slowc m')))
+    self.assertEqual(10, len(m))
+    self.assertEqual('', r.comp_ui_state.stopped)
+
+    self.assertEqual(3, spec.stats.num_calls)
+    self.assertEqual(2, spec.stats.num_stopped)
+    comp_lookup.PrintStats()
+
   def testCompletesHomeDirs(self):
     r = _MakeRootCompleter()
 
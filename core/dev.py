@@ -16,9 +16,11 @@ from pylib import os_path
 from mycpp import mylib
 
 import posix_ as posix
+import time
 
-from typing import List, Dict, Tuple, Any, cast, TYPE_CHECKING
+from typing import List, Dict, Tuple, Optional, IO, Any, cast, TYPE_CHECKING
 if TYPE_CHECKING:
+  from core.alloc import Arena
   from _devbuild.gen.syntax_asdl import assign_op_t, compound_word
   from _devbuild.gen.runtime_asdl import lvalue_t, value_t, scope_t
   from core.error import _ErrorWithLocation
@@ -149,11 +151,125 @@ class CrashDumper(object):
       log('[%d] Wrote crash dump to %s', my_pid, path)
 
 
+def _JsonString(s):
+  # type: (str) -> str
+  """Encode a string for TraceLog.
+
+  Bytes that aren't printable ASCII are written as \\u00XX, so a reader gets
+  the original bytes back with .encode('latin-1'), even if they aren't UTF-8.
+  """
+  if pretty.IsPlainWord(s):  # fast path: no escaping needed
+    return '"' + s + '"'
+
+  parts = ['"']
+  for c in s:
+    if c == '"' or c == '\\':
+      parts.append('\\' + c)
+    elif c == '\n':
+      parts.append('\\n')
+    elif ' ' <= c and c <= '~':
+      parts.append(c)
+    else:
+      parts.append('\\u%04x' % ord(c))
+  parts.append('"')
+  return ''.join(parts)
+
+
+# Flush when the buffer gets this big.
+_TRACE_BUF_SIZE = 1 << 16
+
+
+class TraceLog(object):
+  """A structured trace of every simple command, enabled with $OSH_TRACE_LOG.
+
+  Unlike set -x, it doesn't evaluate PS4 or quote argv for humans, so it's
+  cheap enough to leave on.  Each command is a line of JSON with the PID, span
+  ID, start time, duration, status, and argv.  The first time a process refers
+  to a source line, it writes another record with the path, line number, and
+  text, so devtools/trace_report.py can show where commands came from.
+
+  Records are buffered.  Processes share the file, which is opened with
+  O_APPEND, so each flush is a single write() of whole lines.  After fork(),
+  the child drops the parent's buffer and starts over with its own PID.
+  """
+  def __init__(self, f, arena):
+    # type: (IO[str], Arena) -> None
+    self.f = f  # keep it open
+    self.fd = f.fileno()
+    self.arena = arena
+
+    self.pid = posix.getpid()
+    self.buf = []  # type: List[str]
+    self.num_bytes = 0
+    self.lines_written = {}  # type: Dict[int, bool]  # line_id -> True
+
+  def _CheckFork(self):
+    # type: () -> None
+    pid = posix.getpid()
+    if pid != self.pid:
+      self.pid = pid
+      del self.buf[:]  # the parent will write these
+      self.num_bytes = 0
+      self.lines_written.clear()  # line IDs are per process
+
+  def _Append(self, record):
+    # type: (str) -> None
+    self.buf.append(record)
+    self.num_bytes += len(record)
+    if self.num_bytes >= _TRACE_BUF_SIZE:
+      self.Flush()
+
+  def _LineRecord(self, line_id):
+    # type: (int) -> None
+    self.lines_written[line_id] = True
+    arena = self.arena
+    self._Append(
+        '{"type": "line", "pid": %d, "line_id": %d, "path": %s, '
+        '"line_num": %d, "text": %s}\n' % (
+        self.pid, line_id, _JsonString(arena.GetLineSourceString(line_id)),
+        arena.GetLineNumber(line_id), _JsonString(arena.GetLine(line_id))))
+
+  def OnCommand(self, span_id, argv, start_time, status):
+    # type: (int, List[str], float, int) -> None
+    self._CheckFork()
+
+    now = time.time()
+    if span_id == runtime.NO_SPID:
+      line_id = -1
+    else:
+      line_id = self.arena.GetSpanLineId(span_id)
+      if line_id not in self.lines_written:
+        self._LineRecord(line_id)
+
+    # NOTE: Can't use %.6f in production build!  Use integer microseconds.
+    self._Append(
+        '{"type": "cmd", "pid": %d, "span_id": %d, "line_id": %d, '
+        '"start_us": %d, "dur_us": %d, "status": %d, "argv": [%s]}\n' % (
+        self.pid, span_id, line_id, int(start_time * 1000000),
+        int((now - start_time) * 1000000), status,
+        ', '.join([_JsonString(a) for a in argv])))
+
+  def Flush(self):
+    # type: () -> None
+    """Called when the buffer is full, before exec(), and at exit."""
+    if posix.getpid() != self.pid:  # inherited from the parent
+      return
+    if not self.buf:
+      return
+    s = ''.join(self.buf)
+    del self.buf[:]
+    self.num_bytes = 0
+    try:
+      posix.write(self.fd, s)
+    except OSError:
+      pass  # Tracing shouldn't make the shell fail
+
+
 class Tracer(object):
   """A tracer for this process.
 
-  TODO: Connect it somehow to tracers for other processes.  So you can make an
-  HTML report offline.
+  Handles set -x, and the TraceLog, which processes share.  It can be turned
+  into an HTML report offline with devtools/trace_report.py.
 
   https://www.gnu.org/software/bash/manual/html_node/Bash-Variables.html#Bash-Variables
 
@@ -170,6 +286,7 @@ class Tracer(object):
                mem,  # type: Mem
                word_ev,  # type: NormalWordEvaluator
                f,  # type: DebugFile
+               trace_log,  # type: Optional[TraceLog]
                ):
     # type: (...) -> None
     """
@@ -178,6 +295,7 @@ class Tracer(object):
       exec_opts: For xtrace setting
       mem: for retrieving PS4
       word_ev: for evaluating PS4
+      trace_log: structured trace, independent of xtrace.  May be None.
     """
     self.parse_ctx = parse_ctx
     self.exec_opts = exec_opts
@@ -185,6 +303,7 @@ class Tracer(object):
     self.mem = mem
     self.word_ev = word_ev
     self.f = f  # can be the --debug-file as well
+    self.trace_log = trace_log
 
     # PS4 value -> compound_word.  PS4 is scoped.
     self.parse_cache = {}  # type: Dict[str, compound_word]
@@ -245,6 +364,20 @@ class Tracer(object):
     cmd = ' '.join(tmp)
     self.f.log('%s%s%s', first_char, prefix, cmd)
 
+  def StartCommand(self, do_fork):
+    # type: (bool) -> float
+    """Returns the start time for OnCommandDone(), or 0.0 if not tracing."""
+    if not self.trace_log:
+      return 0.0
+    if not do_fork:  # The shell may exec() and never return
+      self.trace_log.Flush()
+    return time.time()
+
+  def OnCommandDone(self, span_id, argv, start_time, status):
+    # type: (int, List[str], float, int) -> None
+    if self.trace_log:
+      self.trace_log.OnCommand(span_id, argv, start_time, status)
+
   def OnShAssignment(self, lval, op, val, flags, lookup_mode):
     # type: (lvalue_t, assign_op_t, value_t, int, scope_t) -> None
     # NOTE: I think tracing should be on by default?  For post-mortem viewing.
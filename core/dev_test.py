@@ -0,0 +1,86 @@
+#!/usr/bin/env python2
+"""
+dev_test.py: Tests for dev.py
+"""
+from __future__ import print_function
+
+import json
+import os
+import tempfile
+import unittest
+
+from asdl import runtime
+from core import dev  # module under test
+from core import test_lib
+
+
+class TraceLogTest(unittest.TestCase):
+
+  def _Records(self, f):
+    f.seek(0)
+    return [json.loads(line) for line in f]
+
+  def testOnCommand(self):
+    arena = test_lib.MakeArena('<dev_test.py>')
+    line_id = arena.AddLine('echo hi\n', 1)
+    span_id = arena.AddLineSpan(line_id, 0, 4)
+
+    f = tempfile.TemporaryFile()
+    log = dev.TraceLog(f, arena)
+    log.OnCommand(span_id, ['echo', 'hi'], 1.5, 0)
+    log.OnCommand(span_id, ['echo', 'a "b"\n\xce\xbc'], 2.0, 1)
+    log.OnCommand(runtime.NO_SPID, [], 3.0, 0)
+    self.assertEqual([], self._Records(f))  # buffered
+
+    log.Flush()
+    recs = self._Records(f)
+    self.assertEqual(4, len(recs))  # one line record
+
+    self.assertEqual('line', recs[0]['type'])
+    self.assertEqual('<dev_test.py>', recs[0]['path'])
+    self.assertEqual(1, recs[0]['line_num'])
+    self.assertEqual('echo hi\n', recs[0]['text'])
+
+    self.assertEqual('cmd', recs[1]['type'])
+    self.assertEqual(os.getpid(), recs[1]['pid'])
+    self.assertEqual(line_id, recs[1]['line_id'])
+    self.assertEqual(1500000, recs[1]['start_us'])
+    self.assertEqual(['echo', 'hi'], recs[1]['argv'])
+
+    # Arbitrary bytes survive
+    argv = [a.encode('latin-1') for a in recs[2]['argv']]
+    self.assertEqual(['echo', 'a "b"\n\xce\xbc'], argv)
+    self.assertEqual(1, recs[2]['status'])
+
+    self.assertEqual(-1, recs[3]['line_id'])
+
+  def testFork(self):
+    arena = test_lib.MakeArena('<dev_test.py>')
+    line_id = arena.AddLine('echo hi\n', 1)
+    span_id = arena.AddLineSpan(line_id, 0, 4)
+
+    f = tempfile.TemporaryFile()
+    log = dev.TraceLog(f, arena)
+    log.OnCommand(span_id, ['parent'], 1.0, 0)
+
+    pid = os.fork()
+    if pid == 0:
+      # The parent's buffer isn't written twice.
+      log.Flush()
+      log.OnCommand(span_id, ['child'], 2.0, 0)
+      log.Flush()
+      os._exit(0)
+    os.waitpid(pid, 0)
+    log.Flush()
+
+    recs = self._Records(f)
+    argvs = [r['argv'] for r in recs if r['type'] == 'cmd']
+    self.assertEqual([['child'], ['parent']], argvs)
+
+    # The child describes the line with its own PID.
+    lines = [r['pid'] for r in recs if r['type'] == 'line']
+    self.assertEqual([pid, os.getpid()], lines)
+
+
+if __name__ == '__main__':
+  unittest.main()
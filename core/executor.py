@@ -8,7 +8,9 @@ import sys
 
 #from _devbuild.gen.option_asdl import builtin_i
 from _devbuild.gen.id_kind_asdl import Id
-from _devbuild.gen.runtime_asdl import (value_e, value__Obj, redirect)
+from _devbuild.gen.runtime_asdl import (
+    value_e, value__Str, value__Obj, redirect,
+)
 from _devbuild.gen.syntax_asdl import (
     command_e, command__Pipeline, command__ControlFlow,
     command_str,
@@ -20,12 +22,13 @@ from core.util import log, e_die
 from frontend import args
 from frontend import consts
 from oil_lang import objects
+from osh import nofork
 from mycpp import mylib
 from mycpp.mylib import NewStr
 
 import posix_ as posix
 
-from typing import cast, Dict, List, TYPE_CHECKING
+from typing import cast, Callable, Dict, List, Tuple, TYPE_CHECKING
 if TYPE_CHECKING:
   from _devbuild.gen.id_kind_asdl import Id_t
   from _devbuild.gen.runtime_asdl import cmd_value__Argv
@@ -39,6 +42,10 @@ if TYPE_CHECKING:
   from osh import cmd_eval
 
 
+# Writes of up to this many bytes to an empty pipe don't block.
+_PIPE_BUF = 4096
+
+
 class ShellExecutor(object):
   """
   This CommandEvaluator is combined with the OSH language evaluators in osh/ to create
@@ -66,6 +73,8 @@ class ShellExecutor(object):
     self.mutable_opts = mutable_opts
     self.procs = procs
     self.builtins = builtins
+    # Builtins that are instantiated on first use.  See GetBuiltin().
+    self.builtin_factories = {}  # type: Dict[int, Callable[[], _Builtin]]
     self.search_path = search_path
     self.ext_prog = ext_prog
     self.waiter = waiter
@@ -74,10 +83,31 @@ class ShellExecutor(object):
     self.fd_state = fd_state
     self.errfmt = errfmt
 
+    # For shopt -s nofork_command_sub
+    self.nofork_checker = nofork.Checker(procs)
+    self.nofork_count = 0  # for unique temp file names
+
   def CheckCircularDeps(self):
     # type: () -> None
     assert self.cmd_ev is not None
 
+  def Init_BuiltinFactories(self, builtin_factories):
+    # type: (Dict[int, Callable[[], _Builtin]]) -> None
+    self.builtin_factories = builtin_factories
+
+  def GetBuiltin(self, builtin_id):
+    # type: (int) -> _Builtin
+    """Return a builtin, instantiating it the first time it's used.
+
+    A factory may import the module its builtin lives in, so short-lived
+    shells don't pay for subsystems they never use.
+    """
+    builtin_func = self.builtins.get(builtin_id)
+    if builtin_func is None:
+      builtin_func = self.builtin_factories[builtin_id]()
+      self.builtins[builtin_id] = builtin_func
+    return builtin_func
+
   def _MakeProcess(self, node, parent_pipeline=None, inherit_errexit=True):
     # type: (command_t, process.Pipeline, bool) -> process.Process
     """
@@ -112,7 +142,7 @@ class ShellExecutor(object):
     # type: (int, cmd_value__Argv) -> int
     """Run a builtin.  Also called by the 'builtin' builtin."""
 
-    builtin_func = self.builtins[builtin_id]
+    builtin_func = self.GetBuiltin(builtin_id)
 
     # note: could be second word, like 'builtin read'
     self.errfmt.PushLocation(cmd_val.arg_spids[0])
@@ -273,6 +303,11 @@ class ShellExecutor(object):
     #  makes bookkeeping somewhat simpler."
     UP_node = node
 
+    pool = None  # type: process.JobPool
+    if len(self.job_state.pools):
+      pool = self.job_state.pools[-1]
+      pool.MakeRoom()  # may wait
+
     if UP_node.tag_() == command_e.Pipeline:
       node = cast(command__Pipeline, UP_node)
       pi = process.Pipeline()
@@ -285,6 +320,8 @@ class ShellExecutor(object):
 
       job_id = self.job_state.AddJob(pi)  # show in 'jobs' list
       log('[%%%d] Started Pipeline with PID %d', job_id, last_pid)
+      if pool:
+        pool.Add(pi.pids)
 
     else:
       # Problem: to get the 'set -b' behavior of immediate notifications, we
@@ -297,23 +334,63 @@ class ShellExecutor(object):
       self.mem.last_bg_pid = pid  # for $!
       job_id = self.job_state.AddJob(p)  # show in 'jobs' list
       log('[%%%d] Started PID %d', job_id, pid)
+      if pool:
+        pool.Add([pid])
     return 0
 
-  def RunPipeline(self, node):
-    # type: (command__Pipeline) -> int
-
+  def _RunStages(self, children):
+    # type: (List[command_t]) -> List[int]
     pi = process.Pipeline()
 
     # First n-1 processes (which is empty when n == 1)
-    n = len(node.children)
+    n = len(children)
     for i in xrange(n - 1):
-      p = self._MakeProcess(node.children[i], parent_pipeline=pi)
+      p = self._MakeProcess(children[i], parent_pipeline=pi)
       pi.Add(p)
 
     # Last piece of code is in THIS PROCESS.  'echo foo | read line; echo $line'
-    pi.AddLast((self.cmd_ev, node.children[n-1]))
+    pi.AddLast((self.cmd_ev, children[n-1]))
+
+    return pi.Run(self.waiter, self.fd_state)
+
+  def RunPipeline(self, node):
+    # type: (command__Pipeline) -> int
+
+    children = node.children
+    fd = -1
+    if (len(children) > 1 and self.exec_opts.nofork_pipeline() and
+        not self.exec_opts.unsafe_arith_eval() and
+        self.nofork_checker.CanRunBeforeReader(children[0])):
+      try:
+        fd = self._OpenTempFile()
+      except OSError:  # e.g. $TMPDIR doesn't exist, so fork instead
+        pass
+
+    if fd != -1:
+      # 'echo "$x" | read a b' doesn't need to fork for echo.  It runs to
+      # completion here, and the rest of the pipeline reads its output.
+      try:
+        first_status = self._RunInProcess(children[0], fd)
+        fd = self._MoveToPipe(fd)
+
+        self.fd_state.PushStdinFromPipe(fd)
+        try:
+          if len(children) == 2:
+            # Like Pipeline.Run(), which doesn't handle zero processes
+            self.cmd_ev.ExecuteAndCatch(children[1])
+            rest = [self.mem.LastStatus()]
+          else:
+            rest = self._RunStages(children[1:])
+        finally:
+          self.fd_state.Pop()
+      finally:
+        posix.close(fd)
+
+      pipe_status = [first_status]
+      pipe_status.extend(rest)
+    else:
+      pipe_status = self._RunStages(children)
 
-    pipe_status = pi.Run(self.waiter, self.fd_state)
     self.mem.SetPipeStatus(pipe_status)
 
     if self.exec_opts.pipefail():
@@ -333,26 +410,112 @@ class ShellExecutor(object):
     p = self._MakeProcess(node.child)
     return p.Run(self.waiter)
 
-  def RunCommandSub(self, node):
-    # type: (command_t) -> str
-    p = self._MakeProcess(node,
-                          inherit_errexit=self.exec_opts.inherit_errexit())
+  def _CanRunInProcess(self, node):
+    # type: (command_t) -> bool
+    """Can we run this command sub without forking?"""
+    if not self.exec_opts.nofork_command_sub():
+      return False
+    # Arithmetic on strings could have side effects.
+    if self.exec_opts.unsafe_arith_eval():
+      return False
+    # A forked child disables errexit unless inherit_errexit is on.  Rather
+    # than toggling it here, only handle the case where they agree.
+    if self.exec_opts.errexit() and not self.exec_opts.inherit_errexit():
+      return False
+    return self.nofork_checker.CanRunInProcess(node)
+
+  def _OpenTempFile(self):
+    # type: () -> int
+    """Return an unlinked temp file, for running a command without forking.
+
+    A pipe would deadlock when the output is bigger than the pipe buffer,
+    since we're also the reader.
+    """
+    val = self.mem.GetVar('TMPDIR')
+    tmp_dir = '/tmp'
+    if val.tag_() == value_e.Str:
+      tmp_dir = cast(value__Str, val).s
+
+    self.nofork_count += 1
+    path = '%s/osh-nofork-%d-%d' % (tmp_dir, posix.getpid(), self.nofork_count)
+    fd = posix.open(path, posix.O_RDWR | posix.O_CREAT | posix.O_EXCL, 0o600)
+    posix.unlink(path)
+    return fd
+
+  def _RunInProcess(self, node, fd):
+    # type: (command_t, int) -> int
+    """Run a command sub or pipeline stage in this process.
+
+    Its stdout goes to 'fd', which is rewound afterward.  Returns the exit
+    status.
+    """
+    sys.stdout.flush()
+    self.fd_state.PushStdoutTo(fd)
+    snap = self.mem.Snapshot()
+    try:
+      self.cmd_ev.ExecuteAndCatch(node)
+      status = self.mem.LastStatus()
+    finally:
+      sys.stdout.flush()
+      self.fd_state.Pop()
+      self.mem.Restore(snap)
+
+    posix.lseek(fd, 0, 0)  # SEEK_SET
+    return status
+
+  def _MoveToPipe(self, fd):
+    # type: (int) -> int
+    """Move small output in a temp file to a pipe.
+
+    So the next pipeline stage reads from a pipe, like it would if the first
+    one were forked.  Larger output stays in the file.  Returns the descriptor
+    to read from.
+    """
+    size = posix.fstat(fd).st_size
+    if size > _PIPE_BUF:
+      return fd
 
     r, w = posix.pipe()
-    p.AddStateChange(process.StdoutToPipe(r, w))
-    _ = p.Start()
-    #log('Command sub started %d', pid)
+    posix.write(w, posix.read(fd, size))
+    posix.close(w)
+    posix.close(fd)
+    return r
+
+  def RunCommandSub(self, node):
+    # type: (command_t) -> str
+    fd = -1
+    if self._CanRunInProcess(node):
+      try:
+        fd = self._OpenTempFile()
+      except OSError:  # e.g. $TMPDIR doesn't exist, so fork instead
+        pass
 
-    chunks = []  # type: List[str]
-    posix.close(w)  # not going to write
-    while True:
-      byte_str = posix.read(r, 4096)
-      if len(byte_str) == 0:
-        break
-      chunks.append(byte_str)
-    posix.close(r)
+    if fd != -1:
+      try:
+        status = self._RunInProcess(node, fd)
+        stdout_str = posix.read_all(fd, True)
+      finally:
+        posix.close(fd)
+    else:
+      p = self._MakeProcess(node,
+                            inherit_errexit=self.exec_opts.inherit_errexit())
+
+      r, w = posix.pipe()
+      p.AddStateChange(process.StdoutToPipe(r, w))
+      _ = p.Start()
+      #log('Command sub started %d', pid)
+
+      posix.close(w)  # not going to write
+      # Runtime errors test case: # $("echo foo > $@")
+      # Why strip trailing newlines?
+      # https://unix.stackexchange.com/questions/17747/why-does-shell-command-substitution-gobble-up-a-trailing-newline-char
+      #
+      # read_all() fills one growing buffer and strips them in place, rather
+      # than joining a list of small chunks and copying it again to rstrip().
+      stdout_str = posix.read_all(r, True)
+      posix.close(r)
 
-    status = p.Wait(self.waiter)
+      status = p.Wait(self.waiter)
 
     # OSH has the concept of aborting in the middle of a WORD.  We're not
     # waiting until the command is over!
@@ -373,10 +536,7 @@ class ShellExecutor(object):
       self.cmd_ev.check_command_sub_status = True
       self.mem.SetLastStatus(status)
 
-    # Runtime errors test case: # $("echo foo > $@")
-    # Why rstrip()?
-    # https://unix.stackexchange.com/questions/17747/why-does-shell-command-substitution-gobble-up-a-trailing-newline-char
-    return ''.join(chunks).rstrip('\n')
+    return stdout_str
 
   def RunProcessSub(self, node, op_id):
     # type: (command_t, Id_t) -> str
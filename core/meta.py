@@ -6,7 +6,7 @@ TODO: Move to core/pyutil.py
 
 from pgen2 import grammar
 
-from typing import TYPE_CHECKING
+from typing import Optional, TYPE_CHECKING
 if TYPE_CHECKING:
   from core.pyutil import _ResourceLoader
 
@@ -19,3 +19,22 @@ def LoadOilGrammar(loader):
   f.close()
   oil_grammar.loads(contents)
   return oil_grammar
+
+
+class GrammarLoader(object):
+  """Unmarshals the Oil grammar the first time it's needed.
+
+  Most shell scripts never parse an Oil expression, so they shouldn't pay for
+  it at startup.  See ParseContext.Init_GrammarLoader.
+  """
+
+  def __init__(self, loader):
+    # type: (_ResourceLoader) -> None
+    self.loader = loader
+    self.oil_grammar = None  # type: Optional[grammar.Grammar]
+
+  def Get(self):
+    # type: () -> grammar.Grammar
+    if self.oil_grammar is None:
+      self.oil_grammar = LoadOilGrammar(self.loader)
+    return self.oil_grammar
@@ -59,6 +59,10 @@ NO_FD = -1
 _SHELL_MIN_FD = 100
 
 
+# The signals that SignalState_AfterForkingChild() resets, for posix.spawn().
+_SPAWN_SIGDEFAULT = [signal.SIGQUIT, signal.SIGPIPE, signal.SIGTSTP]
+
+
 def SignalState_AfterForkingChild():
   # type: () -> None
   """Not a member of SignalState since we didn't do dependency injection."""
@@ -167,6 +171,8 @@ class FdState(object):
       fd_mode = posix.O_RDONLY
     elif mode == 'w':
       fd_mode = posix.O_CREAT | posix.O_RDWR
+    elif mode == 'a':
+      fd_mode = posix.O_CREAT | posix.O_WRONLY | posix.O_APPEND
     else:
       raise AssertionError(mode)
 
@@ -462,6 +468,19 @@ class FdState(object):
     self._PushDup(r, redir_loc.Fd(0))
     return True
 
+  def PushStdoutTo(self, fd):
+    # type: (int) -> bool
+    """Save the current stdout and make it go to descriptor 'fd'.
+
+    For command subs that run without forking, e.g. x=$(myfunc)
+    """
+    new_frame = _FdFrame()
+    self.stack.append(new_frame)
+    self.cur_frame = new_frame
+
+    self._PushDup(fd, redir_loc.Fd(1))
+    return True
+
   def Pop(self):
     # type: () -> None
     frame = self.stack.pop()
@@ -569,6 +588,23 @@ class ExternalProgram(object):
     self._Exec(argv0_path, cmd_val.argv, cmd_val.arg_spids[0], environ, True)
     assert False, "This line should never execute" # NO RETURN
 
+  def Spawn(self, argv0_path, cmd_val, environ):
+    # type: (str, cmd_value__Argv, Dict[str, str]) -> int
+    """Start a program without forking the shell.
+
+    Returns:
+      The PID, or -1 if the caller should fork and call Exec() instead.  That
+      path handles shebang hijacking, the /bin/sh retry on ENOEXEC, and error
+      messages.
+    """
+    if self.hijack_shebang:
+      return -1
+
+    try:
+      return posix.spawn(argv0_path, cmd_val.argv, environ, _SPAWN_SIGDEFAULT)
+    except OSError:
+      return -1
+
   def _Exec(self, argv0_path, argv, argv0_spid, environ, should_retry):
     # type: (str, List[str], int, Dict[str, str], bool) -> None
     if self.hijack_shebang:
@@ -639,6 +675,15 @@ class Thunk(object):
     """Returns a status code."""
     raise NotImplementedError()
 
+  def Spawn(self):
+    # type: () -> int
+    """Start a process without forking the shell.
+
+    Returns:
+      The PID, or -1 if this thunk has to be Run() in a forked child.
+    """
+    return -1
+
   def DisplayLine(self):
     # type: () -> str
     """Display for the 'jobs' list."""
@@ -676,6 +721,10 @@ class ExternalThunk(Thunk):
     """
     self.ext_prog.Exec(self.argv0_path, self.cmd_val, self.environ)
 
+  def Spawn(self):
+    # type: () -> int
+    return self.ext_prog.Spawn(self.argv0_path, self.cmd_val, self.environ)
+
 
 class SubProgramThunk(Thunk):
   """A subprogram that can be executed in another process."""
@@ -822,6 +871,8 @@ class Process(Job):
 
     self.pid = -1
     self.status = -1
+    # Set when 'wait -n' returns the status, so it isn't returned again.
+    self.reported = False
 
   def __repr__(self):
     # type: () -> str
@@ -844,7 +895,7 @@ class Process(Job):
 
   def Start(self):
     # type: () -> int
-    """Start this process with fork(), handling redirects."""
+    """Start this process with fork() or posix_spawn(), handling redirects."""
     # TODO: If OSH were a job control shell, we might need to call some of
     # these here.  They control the distribution of signals, some of which
     # originate from a terminal.  All the processes in a pipeline should be in
@@ -859,19 +910,27 @@ class Process(Job):
     #
     # The whole job control mechanism is complicated and hacky.
 
-    pid = posix.fork()
-    if pid < 0:
-      # When does this happen?
-      raise RuntimeError('Fatal error in posix.fork()')
+    # Redirects like 'ls >out' have already been applied to this process, so
+    # an external command with no other state changes doesn't need a copy of
+    # the shell.  fork() has to copy the page tables of the whole heap.
+    pid = -1
+    if len(self.state_changes) == 0:
+      pid = self.thunk.Spawn()
+
+    if pid == -1:
+      pid = posix.fork()
+      if pid < 0:
+        # When does this happen?
+        raise RuntimeError('Fatal error in posix.fork()')
 
-    elif pid == 0:  # child
-      SignalState_AfterForkingChild()
+      elif pid == 0:  # child
+        SignalState_AfterForkingChild()
 
-      for st in self.state_changes:
-        st.Apply()
+        for st in self.state_changes:
+          st.Apply()
 
-      self.thunk.Run()
-      # Never returns
+        self.thunk.Run()
+        # Never returns
 
     #log('STARTED process %s, pid = %d', self, pid)
 
@@ -1119,6 +1178,10 @@ class JobState(object):
     self.last_stopped_pid = None  # type: int  # for basic 'fg' implementation
     self.job_id = 1  # Strictly increasing
 
+    # Background jobs are added to the innermost pool.  See the 'pool'
+    # builtin.
+    self.pools = []  # type: List[JobPool]
+
   # TODO: This isn't a PID.  This is a process group ID?
   #
   # What should the table look like?
@@ -1232,6 +1295,12 @@ class JobState(object):
     """For jobs -n, which I think is also used in the interactive prompt."""
     pass
 
+  def RunningPids(self):
+    # type: () -> List[int]
+    """PIDs of child processes that haven't exited.  Used by 'wait -n -t'."""
+    return [pid for pid, proc in self.child_procs.iteritems()
+            if proc.state == job_state_e.Running]
+
   def NoneAreRunning(self):
     # type: () -> bool
     """Test if all jobs are done.  Used by 'wait' builtin."""
@@ -1256,6 +1325,78 @@ class JobState(object):
       log("AssertionError: PID %d should have never been in the job list", pid)
 
 
+class JobPool(object):
+  """Keeps at most N background jobs running.
+
+  Used by the 'pool' builtin:
+
+  pool -j 8 {
+    for f in *.gz; do
+      process $f &  # waits here while 8 jobs are running
+    done
+  }  # waits for the rest
+  """
+  def __init__(self, waiter, job_state, max_jobs):
+    # type: (Waiter, JobState, int) -> None
+    self.waiter = waiter
+    self.job_state = job_state
+    self.max_jobs = max_jobs
+    self.jobs = []  # type: List[List[int]]  # PIDs of each job, in order
+    self.running = []  # type: List[List[int]]
+
+  def _IsRunning(self, pids):
+    # type: (List[int]) -> bool
+    for pid in pids:
+      if self.job_state.child_procs[pid].state == job_state_e.Running:
+        return True
+    return False
+
+  def _Prune(self):
+    # type: () -> None
+    """Forget jobs that are done.
+
+    They may have been reaped by a foreground command, or 'wait'.
+    """
+    self.running = [job for job in self.running if self._IsRunning(job)]
+
+  def _WaitForOneJob(self):
+    # type: () -> None
+    self._Prune()
+    pids = []  # type: List[int]
+    for job in self.running:
+      for pid in job:
+        if self.job_state.child_procs[pid].state == job_state_e.Running:
+          pids.append(pid)
+    if len(pids) == 0:  # WaitForAny() would block forever
+      return
+
+    self.waiter.WaitForAny(pids, -1.0)
+    self._Prune()
+
+  def MakeRoom(self):
+    # type: () -> None
+    """Called before a background job starts."""
+    self._Prune()
+    while len(self.running) >= self.max_jobs:
+      self._WaitForOneJob()
+
+  def Add(self, pids):
+    # type: (List[int]) -> None
+    """Add a process, or the processes of a pipeline."""
+    self.jobs.append(pids)
+    self.running.append(pids)
+
+  def WaitAll(self):
+    # type: () -> List[int]
+    """Returns the status of each job, in the order they started.
+
+    A pipeline's status is the status of its last process.
+    """
+    while len(self.running):
+      self._WaitForOneJob()
+    return [self.job_state.child_procs[job[-1]].status for job in self.jobs]
+
+
 class Waiter(object):
   """A capability to wait for processes.
 
@@ -1321,6 +1462,47 @@ class Waiter(object):
         raise  # abort a batch script
 
     #log('WAIT got %s %s', pid, status)
+    self._OnStatus(pid, status)
+    return True  # caller should keep waiting
+
+  def WaitForAny(self, pids, timeout):
+    # type: (List[int], float) -> int
+    """Wait until one of the given child processes exits.
+
+    Unlike WaitForOne(), this doesn't return for other children, and it gives
+    up after 'timeout' seconds, unless 'timeout' is negative.
+
+    Returns:
+      The PID that exited, or -1 if the timeout expired.
+
+    Raises:
+      OSError, e.g. ENOSYS with a timeout on kernels without pidfds.
+    """
+    timeout_ms = -1 if timeout < 0 else int(timeout * 1000)
+    try:
+      ready = posix.pidfd_poll(pids, timeout_ms)
+    except OSError as e:
+      if e.errno != errno.ENOSYS or timeout >= 0:
+        raise
+      # No pidfd_open() before Linux 5.3.  We can still wait without a
+      # timeout, reaping other children along the way.
+      while True:
+        for pid in pids:
+          if self.job_state.child_procs[pid].state != job_state_e.Running:
+            return pid
+        if not self.WaitForOne():
+          raise AssertionError('Expected one of %s to be running' % pids)
+
+    if len(ready) == 0:
+      return -1
+
+    pid, status = posix.waitpid(ready[0], posix.WUNTRACED)
+    self._OnStatus(pid, status)
+    return pid
+
+  def _OnStatus(self, pid, status):
+    # type: (int, int) -> None
+    """Update the job state for a status from waitpid()."""
 
     # All child processes are suppoed to be in this doc.  But this may
     # legitimately happen if a grandchild outlives the child (its parent).
@@ -1329,7 +1511,7 @@ class Waiter(object):
     # any knowledge of such processes, so print a warning.
     if pid not in self.job_state.child_procs:
       ui.Stderr("osh: PID %d stopped, but osh didn't start it", pid)
-      return True  # caller should keep waiting
+      return
 
     proc = self.job_state.child_procs[pid]
 
@@ -1358,5 +1540,3 @@ class Waiter(object):
       proc.WhenStopped()
 
     self.last_status = status  # for wait -n
-
-    return True  # caller should keep waiting
@@ -4,6 +4,7 @@ pyutil.py: Code that's only needed in Python.  C++ will use other mechanisms.
 from __future__ import print_function
 
 import cStringIO
+import stat
 import sys
 import zipimport  # NOT the zipfile module.
 
@@ -11,7 +12,7 @@ from pylib import os_path
 
 import posix_ as posix
 
-from typing import IO, NoReturn, Any
+from typing import IO, NoReturn, Any, Optional, Tuple
 
 
 # TODO: Move log, p_die, and e_die here too.  They have different
@@ -56,6 +57,44 @@ def strerror_OS(e):
   return posix.strerror(e.errno)
 
 
+def BackingFile(path, f):
+  # type: (str, Any) -> Optional[Tuple[str, int, int]]
+  """For Arena.AddBackingFile().
+
+  Returns:
+    (absolute path, st_dev, st_ino) if f is a regular file opened at the
+    beginning, or None.
+  """
+  try:
+    st = posix.fstat(f.fileno())
+  except OSError:
+    return None
+  if not stat.S_ISREG(st.st_mode):
+    return None
+  return os_path.abspath(path), st.st_dev, st.st_ino
+
+
+def ReadLineAt(path, dev, ino, offset):
+  # type: (str, int, int, int) -> str
+  """Read a line back from a file registered with BackingFile().
+
+  Returns an empty string if the file was removed or replaced.  (If it was
+  modified in place, we may return the wrong line, like Python's linecache.)
+  """
+  try:
+    f = open(path)
+  except IOError:
+    return ''
+  try:
+    st = posix.fstat(f.fileno())
+    if st.st_dev != dev or st.st_ino != ino:
+      return ''
+    f.seek(offset)
+    return f.readline()
+  finally:
+    f.close()
+
+
 class _ResourceLoader(object):
 
   def open(self, rel_path):
@@ -121,13 +160,20 @@ def GetResourceLoader():
   return _loader
 
 
-def ShowAppVersion(app_name):
-  # type: (str) -> None
-  """For Oil and OPy."""
+def GetVersion():
+  # type: () -> str
   loader = GetResourceLoader()
   f = loader.open('oil-version.txt')
   version = f.readline().strip()
   f.close()
+  return version
+
+
+def ShowAppVersion(app_name):
+  # type: (str) -> None
+  """For Oil and OPy."""
+  loader = GetResourceLoader()
+  version = GetVersion()
 
   try:
     f = loader.open('release-date.txt')
@@ -10,6 +10,7 @@ state.py - Interpreter state
 from __future__ import print_function
 
 import cStringIO
+import errno
 
 from _devbuild.gen.id_kind_asdl import Id, Id_t
 from _devbuild.gen.option_asdl import option_i
@@ -52,6 +53,24 @@ _READLINE_DELIMS = ' \t\n"\'><=;|&(:'
 
 LINE_ZERO = -2  # special value that's not runtime.NO_SPID
 
+# Variables whose values are computed from interpreter state.  Mem.GetVar()
+# checks this dict once, so ordinary variables pay for a single hash lookup.
+_ARGV = 1
+_PIPESTATUS = 2
+_FUNCNAME = 3
+_BASH_SOURCE = 4
+_BASH_LINENO = 5
+_LINENO = 6
+
+_COMPUTED_VARS = {
+    'ARGV': _ARGV,
+    'PIPESTATUS': _PIPESTATUS,
+    'FUNCNAME': _FUNCNAME,
+    'BASH_SOURCE': _BASH_SOURCE,
+    'BASH_LINENO': _BASH_LINENO,
+    'LINENO': _LINENO,
+}  # type: Dict[str, int]
+
 
 # flags for SetVar
 SetReadOnly   = 1 << 0
@@ -62,6 +81,10 @@ SetNameref    = 1 << 4
 ClearNameref  = 1 << 5
 
 
+# Bound the memory used for names that weren't found in $PATH.
+_MAX_MISSING = 256
+
+
 class SearchPath(object):
   """For looking up files in $PATH."""
 
@@ -70,6 +93,67 @@ class SearchPath(object):
     self.mem = mem
     self.cache = {}  # type: Dict[str, str]
 
+    # $PATH split into directories, keyed by the $PATH string.
+    self.path_str = None  # type: Optional[str]
+    self.path_list = []  # type: List[str]
+
+    # Directory -> ((mtime, inode), names), like DirCache in
+    # core/completion.py.  The names are None if the directory can't be read.
+    self.listings = {}  # type: Dict[str, Tuple[Any, Optional[Dict[str, bool]]]]
+
+    # Names that aren't in any listing.  Cleared when $PATH or a listing
+    # changes, or when it gets too big.
+    self.missing = {}  # type: Dict[str, bool]
+
+  def _GetPathList(self):
+    # type: () -> List[str]
+    val = self.mem.GetVar('PATH')
+    UP_val = val
+    if val.tag_() == value_e.Str:
+      val = cast(value__Str, UP_val)
+      if val.s != self.path_str:
+        self.path_str = val.s
+        self.path_list = val.s.split(':')
+        self.missing.clear()
+      return self.path_list
+    else:
+      return []  # treat as empty path
+
+  def _DirNames(self, path_dir):
+    # type: (str) -> Optional[Dict[str, bool]]
+    """Return the names in a directory of $PATH, or None if we don't know.
+
+    The listing is reused until the directory's mtime changes.  Files that are
+    added or removed change it, but chmod doesn't, so callers still check the
+    file they find.
+    """
+    if not path_dir.startswith('/'):
+      return None  # relative to the current directory
+
+    try:
+      st = posix.stat(path_dir)
+    except OSError as e:
+      if e.errno == errno.ENOENT:
+        return {}  # e.g. ~/bin doesn't exist
+      return None
+    # Include the inode in case the directory was replaced.
+    mtime = (st.st_mtime, st.st_ino)
+
+    entry = self.listings.get(path_dir)
+    if entry is not None and entry[0] == mtime:
+      return entry[1]
+
+    try:
+      names = {}  # type: Optional[Dict[str, bool]]
+      for name in posix.listdir(path_dir):
+        names[name] = True
+    except OSError:
+      names = None  # e.g. search permission without read permission
+
+    self.listings[path_dir] = (mtime, names)
+    self.missing.clear()
+    return names
+
   def Lookup(self, name, exec_required=True):
     # type: (str, bool) -> Optional[str]
     """
@@ -81,16 +165,18 @@ class SearchPath(object):
       else:
         return None
 
-    # TODO: Could cache this computation to avoid allocating every time for all
-    # the splitting.
-    val = self.mem.GetVar('PATH')
-    UP_val = val
-    if val.tag_() == value_e.Str:
-      val = cast(value__Str, UP_val)
-      path_list = val.s.split(':')
-    else:
-      path_list = []  # treat as empty path
+    path_list = self._GetPathList()
+
+    # A miss is remembered if no listing has changed.  Validating the listings
+    # costs a stat() per directory, instead of an access() per directory.
+    if mylib.PYTHON and name in self.missing:
+      for path_dir in path_list:
+        self._DirNames(path_dir)  # clears self.missing if it changed
+      if name in self.missing:
+        return None
 
+    # Hits don't use the listings, so we stop at the first one without
+    # listing or stat()-ing the rest of $PATH.
     for path_dir in path_list:
       full_path = os_path.join(path_dir, name)
 
@@ -105,8 +191,26 @@ class SearchPath(object):
       if found:
         return full_path
 
+    if mylib.PYTHON:
+      self._RememberMissing(path_list, name)
     return None
 
+  def _RememberMissing(self, path_list, name):
+    # type: (List[str], str) -> None
+    """Remember a miss if the name isn't in any directory.
+
+    If it's in a listing, it's there but not executable, and chmod can change
+    that without changing the directory.
+    """
+    for path_dir in path_list:
+      names = self._DirNames(path_dir)
+      if names is None or name in names:
+        return
+
+    if len(self.missing) >= _MAX_MISSING:
+      self.missing.clear()  # e.g. 'command -v' on many names in a loop
+    self.missing[name] = True
+
   def CachedLookup(self, name):
     # type: (str) -> Optional[str]
     if name in self.cache:
@@ -658,6 +762,20 @@ def InitMem(mem, environ):
   mem.SetPwd(pwd)
 
 
+class _MemSnapshot(object):
+  """State that Mem.Restore() puts back after a command sub runs in process."""
+
+  def __init__(self, mem):
+    # type: (Mem) -> None
+    self.last_status = mem.last_status[-1]
+    self.pipe_status = mem.pipe_status[-1]
+    self.current_spid = mem.current_spid
+
+    # Only for assertions.  Function calls and temp frames pop themselves.
+    self.num_var_frames = len(mem.var_stack)
+    self.num_argv_frames = len(mem.argv_stack)
+
+
 class Mem(object):
   """For storing variables.
 
@@ -684,6 +802,11 @@ class Mem(object):
     self.argv_stack = [_ArgFrame(argv)]
     self.var_stack = [{}]  # type: List[Dict[str, cell]]
 
+    # The environment for external commands, kept up to date as exported
+    # variables change, so we don't walk every scope on every command.  See
+    # _UpdateExported().
+    self.exported_env = {}  # type: Dict[str, str]
+
     self.arena = arena
 
     # The debug_stack isn't strictly necessary for execution.  We use it for
@@ -695,6 +818,13 @@ class Mem(object):
 
     self.line_num = value.Str('')
 
+    # FUNCNAME, BASH_SOURCE, and BASH_LINENO only change when debug_stack
+    # does.  Compute them lazily and throw them away in _PushDebugStack() and
+    # _PopDebugStack().  Each lookup gets a copy, since 'push' can mutate it.
+    self.func_name_strs = None  # type: Optional[List[str]]
+    self.bash_source_strs = None  # type: Optional[List[str]]
+    self.bash_lineno_strs = None  # type: Optional[List[str]]
+
     self.last_status = [0]  # type: List[int]  # a stack
     self.pipe_status = [[]]  # type: List[List[int]]  # stack
     self.last_bg_pid = -1  # Uninitialized value mutable public variable
@@ -806,6 +936,23 @@ class Mem(object):
     # type: (List[int]) -> None
     self.pipe_status[-1] = x
 
+  def Snapshot(self):
+    # type: () -> _MemSnapshot
+    """Save what a command sub can change without forking, e.g. $?
+
+    See osh/nofork.py for what's allowed.
+    """
+    return _MemSnapshot(self)
+
+  def Restore(self, snap):
+    # type: (_MemSnapshot) -> None
+    assert len(self.var_stack) == snap.num_var_frames, self.var_stack
+    assert len(self.argv_stack) == snap.num_argv_frames, self.argv_stack
+
+    self.last_status[-1] = snap.last_status
+    self.pipe_status[-1] = snap.pipe_status
+    self.current_spid = snap.current_spid
+
   #
   # Call Stack
   #
@@ -816,8 +963,8 @@ class Mem(object):
     self.argv_stack.append(_ArgFrame(argv))
     self.var_stack.append({})
 
-    span = self.arena.GetLineSpan(def_spid)
-    source_str = self.arena.GetLineSourceString(span.line_id)
+    line_id = self.arena.GetSpanLineId(def_spid)
+    source_str = self.arena.GetLineSourceString(line_id)
 
     # bash uses this order: top of stack first.
     self._PushDebugStack(source_str, func_name, None)
@@ -825,7 +972,7 @@ class Mem(object):
   def PopCall(self):
     # type: () -> None
     self._PopDebugStack()
-    self.var_stack.pop()
+    self._PopVarFrame()
     self.argv_stack.pop()
 
   def PushSource(self, source_name, argv):
@@ -853,7 +1000,15 @@ class Mem(object):
   def PopTemp(self):
     # type: () -> None
     self._PopDebugStack()
-    self.var_stack.pop()
+    self._PopVarFrame()
+
+  def _PopVarFrame(self):
+    # type: () -> None
+    """Pop a scope, then expose any variables it hid from the environment."""
+    frame = self.var_stack.pop()
+    for name, cell in iteritems(frame):
+      if cell.exported:
+        self._UpdateExported(name)
 
   def TopNamespace(self):
     # type: () -> Dict[str, runtime_asdl.cell]
@@ -874,10 +1029,18 @@ class Mem(object):
     self.debug_stack.append(
         DebugFrame(bash_source, func_name, source_name, self.current_spid, argv_i, var_i)
     )
+    self._InvalidateDebugVars()
 
   def _PopDebugStack(self):
     # type: () -> None
     self.debug_stack.pop()
+    self._InvalidateDebugVars()
+
+  def _InvalidateDebugVars(self):
+    # type: () -> None
+    self.func_name_strs = None
+    self.bash_source_strs = None
+    self.bash_lineno_strs = None
 
   #
   # Argv
@@ -1178,6 +1341,9 @@ class Mem(object):
                                    val)
           name_map[cell_name] = cell
 
+        if cell.exported or flags & ClearExport:
+          self._UpdateExported(cell_name)
+
         # Maintain invariant that only strings and undefined cells can be
         # exported.
         assert cell.val is not None, cell
@@ -1301,86 +1467,100 @@ class Mem(object):
     """
     cell = self.var_stack[0][name]
     cell.val = new_val
+    if cell.exported:
+      self._UpdateExported(name)
 
-  def GetVar(self, name, lookup_mode=scope_e.Dynamic):
-    # type: (str, scope_t) -> value_t
-    assert isinstance(name, str), name
-
-    # TODO: Short-circuit down to _ResolveNameOrRef by doing a single hash
-    # lookup:
-    # COMPUTED_VARS = {'PIPESTATUS': 1, 'FUNCNAME': 1, ...}
-    # if name not in COMPUTED_VARS: ...
+  def _GetComputedVar(self, which):
+    # type: (int) -> value_t
+    """Return the value of a variable in _COMPUTED_VARS.
 
-    if name == 'ARGV':
+    FUNCNAME, BASH_SOURCE, and BASH_LINENO are cached as lists, and callers
+    get a new array that they can mutate.
+    """
+    if which == _ARGV:
       # TODO:
       # - Reuse the MaybeStrArray?
       # - @@ could be an alias for ARGV (in command mode, but not expr mode)
       return value.MaybeStrArray(self.GetArgv())
 
-    if name == 'PIPESTATUS':
+    if which == _PIPESTATUS:
       return value.MaybeStrArray([str(i) for i in self.pipe_status[-1]])
 
     # Do lookup of system globals before looking at user variables.  Note: we
     # could optimize this at compile-time like $?.  That would break
     # ${!varref}, but it's already broken for $?.
-    if name == 'FUNCNAME':
-      # bash wants it in reverse order.  This is a little inefficient but we're
-      # not depending on deque().
-      strs = []  # type: List[str]
-      for frame in reversed(self.debug_stack):
-        if frame.func_name:
-          strs.append(frame.func_name)
-        if frame.source_name:
-          strs.append('source')  # bash doesn't tell you the filename.
-        # Temp stacks are ignored
-      return value.MaybeStrArray(strs)  # TODO: Reuse this object too?
+    if which == _FUNCNAME:
+      if self.func_name_strs is None:
+        # bash wants it in reverse order.  This is a little inefficient but
+        # we're not depending on deque().
+        strs = []  # type: List[str]
+        for frame in reversed(self.debug_stack):
+          if frame.func_name:
+            strs.append(frame.func_name)
+          if frame.source_name:
+            strs.append('source')  # bash doesn't tell you the filename.
+          # Temp stacks are ignored
+        self.func_name_strs = strs
+      return value.MaybeStrArray(list(self.func_name_strs))
 
     # This isn't the call source, it's the source of the function DEFINITION
     # (or the sourced # file itself).
-    if name == 'BASH_SOURCE':
-      strs = []
-      for frame in reversed(self.debug_stack):
-        if frame.bash_source:
-          strs.append(frame.bash_source)
-      return value.MaybeStrArray(strs)  # TODO: Reuse this object too?
-
-    # This is how bash source SHOULD be defined, but it's not!
-    if 0:
-      if name == 'CALL_SOURCE':
+    if which == _BASH_SOURCE:
+      if self.bash_source_strs is None:
         strs = []
         for frame in reversed(self.debug_stack):
-          # should only happen for the first entry
-          if frame.call_spid == runtime.NO_SPID:
-            continue
-          if frame.call_spid == -2:
-            strs.append('-')  # Bash does this to line up with main?
-            continue
-          span = self.arena.GetLineSpan(frame.call_spid)
-          source_str = self.arena.GetLineSourceString(span.line_id)
-          strs.append(source_str)
-        return value.MaybeStrArray(strs)  # TODO: Reuse this object too?
+          if frame.bash_source:
+            strs.append(frame.bash_source)
+        self.bash_source_strs = strs
+      return value.MaybeStrArray(list(self.bash_source_strs))
 
-    if name == 'BASH_LINENO':
+    # This is how bash source SHOULD be defined, but it's not!  It would be
+    # CALL_SOURCE.
+    if 0:
       strs = []
       for frame in reversed(self.debug_stack):
         # should only happen for the first entry
         if frame.call_spid == runtime.NO_SPID:
           continue
-        if frame.call_spid == LINE_ZERO:
-          strs.append('0')  # Bash does this to line up with main?
+        if frame.call_spid == -2:
+          strs.append('-')  # Bash does this to line up with main?
           continue
         span = self.arena.GetLineSpan(frame.call_spid)
-        line_num = self.arena.GetLineNumber(span.line_id)
-        strs.append(str(line_num))
+        source_str = self.arena.GetLineSourceString(span.line_id)
+        strs.append(source_str)
       return value.MaybeStrArray(strs)  # TODO: Reuse this object too?
 
-    if name == 'LINENO':
+    if which == _BASH_LINENO:
+      if self.bash_lineno_strs is None:
+        strs = []
+        for frame in reversed(self.debug_stack):
+          # should only happen for the first entry
+          if frame.call_spid == runtime.NO_SPID:
+            continue
+          if frame.call_spid == LINE_ZERO:
+            strs.append('0')  # Bash does this to line up with main?
+            continue
+          line_id = self.arena.GetSpanLineId(frame.call_spid)
+          strs.append(self.arena.GetLineNumStr(line_id))
+        self.bash_lineno_strs = strs
+      return value.MaybeStrArray(list(self.bash_lineno_strs))
+
+    if which == _LINENO:
       assert self.current_spid != -1, self.current_spid
-      span = self.arena.GetLineSpan(self.current_spid)
-      # TODO: maybe use interned GetLineNumStr?
-      self.line_num.s = str(self.arena.GetLineNumber(span.line_id))
+      line_id = self.arena.GetSpanLineId(self.current_spid)
+      self.line_num.s = self.arena.GetLineNumStr(line_id)
       return self.line_num
 
+    raise AssertionError(which)
+
+  def GetVar(self, name, lookup_mode=scope_e.Dynamic):
+    # type: (str, scope_t) -> value_t
+    assert isinstance(name, str), name
+
+    which = _COMPUTED_VARS.get(name, 0)
+    if which != 0:
+      return self._GetComputedVar(which)
+
     cell, _, _ = self._ResolveNameOrRef(name, lookup_mode)
 
     if cell:
@@ -1425,7 +1605,9 @@ class Mem(object):
     with tagswitch(lval) as case:
       if case(lvalue_e.Named):  # unset x
         name_map[cell_name].val = value.Undef()
-        cell.exported = False
+        if cell.exported:
+          cell.exported = False
+          self._UpdateExported(cell_name)
         # This should never happen because we do recursive lookups of namerefs.
         assert not cell.nameref, cell
 
@@ -1480,31 +1662,45 @@ class Mem(object):
     if cell:
       if flag & ClearExport:
         cell.exported = False
+        self._UpdateExported(name)
       if flag & ClearNameref:
         cell.nameref = False
       return True
     else:
       return False
 
+  def _UpdateExported(self, name):
+    # type: (str) -> None
+    """Recompute the environment entry for one variable.
+
+    Called whenever a cell that is (or was) exported changes.  The innermost
+    exported string wins, which means we notice these things:
+    - If an exported variable is changed.
+    - If the set of exported variables changes, e.g. 'export -n' or popping
+      a temp frame for 'FOO=bar cmd'.
+    """
+    for i in xrange(len(self.var_stack) - 1, -1, -1):
+      cell = self.var_stack[i].get(name)
+      # TODO: Disallow exporting at assignment time.  If an exported Str is
+      # changed to MaybeStrArray, also clear its 'exported' flag.
+      if cell and cell.exported and cell.val.tag_() == value_e.Str:
+        val = cast(value__Str, cell.val)
+        self.exported_env[name] = val.s
+        return
+
+    try:
+      del self.exported_env[name]
+    except KeyError:
+      pass
+
   def GetExported(self):
     # type: () -> Dict[str, str]
-    """Get all the variables that are marked exported."""
-    # TODO: This is run on every SimpleCommand.  Should we have a dirty flag?
-    # We have to notice these things:
-    # - If an exported variable is changed.
-    # - If the set of exported variables changes.
-
-    exported = {}  # type: Dict[str, str]
-    # Search from globals up.  Names higher on the stack will overwrite names
-    # lower on the stack.
-    for scope in self.var_stack:
-      for name, cell in iteritems(scope):
-        # TODO: Disallow exporting at assignment time.  If an exported Str is
-        # changed to MaybeStrArray, also clear its 'exported' flag.
-        if cell.exported and cell.val.tag_() == value_e.Str:
-          val = cast(value__Str, cell.val)
-          exported[name] = val.s
-    return exported
+    """Get all the variables that are marked exported.
+
+    This is run on every external command, so it returns the dict that's
+    maintained incrementally.  Callers must not modify it.
+    """
+    return self.exported_env
 
   def VarNames(self):
     # type: () -> List[str]
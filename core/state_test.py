@@ -15,7 +15,7 @@ from core import state  # module under test
 def _InitMem():
   # empty environment, no arena.
   arena = test_lib.MakeArena('<state_test.py>')
-  line_id = arena.AddLine(1, 'foo')
+  line_id = arena.AddLine('foo', 1)
   unused = arena.AddLineSpan(line_id, 0, 1)  # dummy
   return state.Mem('', [], arena, [])
 
@@ -29,6 +29,35 @@ class MemTest(unittest.TestCase):
     mem.PopCall()
     print(mem.GetVar('NONEXISTENT'))
 
+  def testComputedVars(self):
+    mem = _InitMem()
+    mem.SetCurrentSpanId(0)
+
+    self.assertEqual([], mem.GetVar('FUNCNAME').strs)
+
+    mem.PushCall('my-func', 0, ['a', 'b'])
+    self.assertEqual(['a', 'b'], mem.GetVar('ARGV').strs)
+
+    # Arrays derived from the debug stack are cached until it changes, but
+    # each lookup gets a copy that can be mutated, e.g. by 'push'.
+    func_name = mem.GetVar('FUNCNAME')
+    self.assertEqual(['my-func'], func_name.strs)
+    strs = mem.func_name_strs
+    func_name.strs.append('zz')
+    self.assertEqual(['my-func'], mem.GetVar('FUNCNAME').strs)
+    self.assertIs(strs, mem.func_name_strs)
+    self.assertEqual(['<state_test.py>'], mem.GetVar('BASH_SOURCE').strs)
+    self.assertEqual(['1'], mem.GetVar('BASH_LINENO').strs)
+    self.assertEqual('1', mem.GetVar('LINENO').s)
+
+    mem.PushCall('other-func', 0, [])
+    self.assertEqual(['other-func', 'my-func'], mem.GetVar('FUNCNAME').strs)
+    mem.PopCall()
+    self.assertEqual(['my-func'], mem.GetVar('FUNCNAME').strs)
+
+    mem.PopCall()
+    self.assertEqual([], mem.GetVar('FUNCNAME').strs)
+
   def testSearchPath(self):
     mem = _InitMem()
     #print(mem)
@@ -54,6 +83,57 @@ class MemTest(unittest.TestCase):
     else:
         self.assertEqual(search_path.Lookup('env'), '/usr/bin/env')
 
+    # The split $PATH is cached until $PATH changes
+    path_list = search_path.path_list
+    search_path.Lookup('env')
+    self.assertIs(path_list, search_path.path_list)
+
+    mem.SetVar(lvalue.Named('PATH'), value.Str('/nonexistent'),
+               scope_e.GlobalOnly)
+    self.assertEqual(None, search_path.Lookup('env'))
+    self.assertEqual(['/nonexistent'], search_path.path_list)
+
+  def testSearchPathListings(self):
+    mem = _InitMem()
+    search_path = state.SearchPath(mem)
+
+    tmp_dir = '/tmp/oil_search_path_test'
+    os.system('rm -r -f %s; mkdir -p %s' % (tmp_dir, tmp_dir))
+    mem.SetVar(lvalue.Named('PATH'), value.Str(tmp_dir + ':/nonexistent'),
+               scope_e.GlobalOnly)
+
+    # A miss is remembered until the directory changes
+    self.assertEqual(None, search_path.Lookup('prog'))
+    self.assertEqual({'prog': True}, search_path.missing)
+    self.assertEqual(None, search_path.Lookup('prog'))
+
+    # Make sure the mtime changes even on file systems with 1 second
+    # resolution.
+    os.system('touch %s/prog; touch -d "+1 minute" %s' % (tmp_dir, tmp_dir))
+    self.assertEqual({'prog': True}, search_path.missing)  # not validated yet
+    self.assertEqual(None, search_path.Lookup('prog'))  # not executable
+    self.assertEqual({}, search_path.missing)
+
+    # chmod doesn't change the directory, but the file is checked
+    os.system('chmod +x %s/prog' % tmp_dir)
+    self.assertEqual(tmp_dir + '/prog', search_path.Lookup('prog'))
+    self.assertEqual(tmp_dir + '/prog',
+                     search_path.Lookup('prog', exec_required=False))
+
+    os.system('rm %s/prog; touch -d "+2 minutes" %s' % (tmp_dir, tmp_dir))
+    self.assertEqual(None, search_path.Lookup('prog'))
+
+    # Hits don't list any directories
+    os.system('touch %s/prog2; chmod +x %s/prog2' % (tmp_dir, tmp_dir))
+    search_path.listings.clear()
+    self.assertEqual(tmp_dir + '/prog2', search_path.Lookup('prog2'))
+    self.assertEqual({}, search_path.listings)
+
+    # The misses are bounded
+    for i in xrange(state._MAX_MISSING + 1):
+      self.assertEqual(None, search_path.Lookup('nonexistent%d' % i))
+    self.assertEqual(1, len(search_path.missing))
+
 
   def testPushTemp(self):
     mem = _InitMem()
@@ -264,6 +344,65 @@ class MemTest(unittest.TestCase):
     e = mem.GetExported()
     self.assertEqual('u', e['U'])
 
+  def testExportedEnv(self):
+    mem = _InitMem()
+
+    # export X=global
+    mem.SetVar(
+        lvalue.Named('X'), value.Str('global'), scope_e.Dynamic,
+        flags=state.SetExport)
+    self.assertEqual({'X': 'global'}, mem.GetExported())
+
+    # X=temp Y=y cmd
+    mem.PushTemp()
+    mem.SetVar(
+        lvalue.Named('X'), value.Str('temp'), scope_e.LocalOnly,
+        flags=state.SetExport)
+    mem.SetVar(
+        lvalue.Named('Y'), value.Str('y'), scope_e.LocalOnly,
+        flags=state.SetExport)
+    self.assertEqual({'X': 'temp', 'Y': 'y'}, mem.GetExported())
+    mem.PopTemp()
+    self.assertEqual({'X': 'global'}, mem.GetExported())
+
+    # A local that isn't exported doesn't hide the global
+    mem.PushCall('f', 0, [])
+    mem.SetVar(
+        lvalue.Named('X'), value.Str('local'), scope_e.LocalOnly)
+    self.assertEqual({'X': 'global'}, mem.GetExported())
+
+    # export X=local, then unset it
+    mem.SetVar(
+        lvalue.Named('X'), None, scope_e.LocalOnly, flags=state.SetExport)
+    self.assertEqual({'X': 'local'}, mem.GetExported())
+    mem.Unset(lvalue.Named('X'), scope_e.LocalOnly, False)
+    self.assertEqual({'X': 'global'}, mem.GetExported())
+    mem.PopCall()
+
+    # export -n X
+    mem.ClearFlag('X', state.ClearExport, scope_e.Dynamic)
+    self.assertEqual({}, mem.GetExported())
+    self.assertEqual('global', mem.GetVar('X').s)
+
+  def testSnapshot(self):
+    mem = _InitMem()
+    mem.SetLastStatus(1)
+    mem.SetPipeStatus([1, 0])
+    snap = mem.Snapshot()
+
+    mem.SetLastStatus(0)
+    mem.SetPipeStatus([0])
+    mem.PushTemp()
+    mem.PopTemp()
+    mem.Restore(snap)
+
+    self.assertEqual(1, mem.LastStatus())
+    self.assertEqual([1, 0], mem.PipeStatus())
+
+    # Frames must have been popped
+    mem.PushTemp()
+    self.assertRaises(AssertionError, mem.Restore, snap)
+
   def testUnset(self):
     mem = _InitMem()
     # unset a
@@ -30,10 +30,22 @@ inline Tuple2<int, int>* regex_first_group_match(Str* pattern, Str* str, int pos
   assert(0);
 }
 
+inline Str* regex_replace_all(Str* pattern, Str* str, Str* replacement) {
+  assert(0);
+}
+
+inline Str* regex_replace_first(Str* pattern, Str* str, Str* replacement) {
+  assert(0);
+}
+
 inline void print_time(double real, double user, double sys) {
   assert(0);
 }
 
+inline List<Tuple2<int, int>*>* ifs_split(Str* s, Str* kinds, Str* edges) {
+  assert(0);
+}
+
 }  // namespace libc
 
 #endif  // LIBC_H
@@ -0,0 +1,170 @@
+#!/usr/bin/env python2
+"""
+trace_report.py
+
+Render the structured trace that OSH writes when $OSH_TRACE_LOG is set.  See
+TraceLog in core/dev.py.
+
+Usage:
+  OSH_TRACE_LOG=_tmp/trace.jsonl bin/osh myscript.sh
+
+  devtools/trace_report.py text _tmp/trace.jsonl     # every command, nested
+  devtools/trace_report.py summary _tmp/trace.jsonl  # slowest source lines
+  devtools/trace_report.py html _tmp/trace.jsonl > _tmp/trace.html
+"""
+from __future__ import print_function
+
+import cgi
+import json
+import sys
+
+
+def _Bytes(s):
+  """TraceLog writes bytes as \\u00XX.  Get them back."""
+  return s.encode('latin-1')
+
+
+class Trace(object):
+  """The commands in a trace, joined with their source lines."""
+
+  def __init__(self):
+    self.lines = {}  # (pid, line_id) -> (path, line_num, text)
+    self.cmds = []  # list of dicts, sorted by start time
+
+  def Load(self, f):
+    for i, line in enumerate(f):
+      try:
+        rec = json.loads(line)
+      except ValueError:
+        # The last line could be cut off if the shell was killed.
+        raise RuntimeError('Invalid record on line %d: %r' % (i+1, line))
+
+      if rec['type'] == 'line':
+        self.lines[rec['pid'], rec['line_id']] = (
+            _Bytes(rec['path']), rec['line_num'], _Bytes(rec['text']))
+      elif rec['type'] == 'cmd':
+        rec['argv'] = [_Bytes(a) for a in rec['argv']]
+        self.cmds.append(rec)
+
+  def Finish(self):
+    """Sort commands and compute how deeply each one is nested."""
+    # Outer commands start first.  If two start at the same time, the longer
+    # one is the outer one.
+    self.cmds.sort(key=lambda c: (c['start_us'], -c['dur_us']))
+
+    stacks = {}  # pid -> list of end times
+    for c in self.cmds:
+      end = c['start_us'] + c['dur_us']
+      stack = stacks.setdefault(c['pid'], [])
+      while stack and stack[-1] < end:
+        stack.pop()
+      c['depth'] = len(stack)
+      stack.append(end)
+
+  def Location(self, cmd):
+    """Returns (path, line_num, text)."""
+    return self.lines.get((cmd['pid'], cmd['line_id']), ('?', 0, ''))
+
+
+def _Argv(argv):
+  return ' '.join(repr(a) if (not a or ' ' in a or '\n' in a) else a
+                  for a in argv)
+
+
+def PrintText(trace, f):
+  for c in trace.cmds:
+    path, line_num, _ = trace.Location(c)
+    f.write('%10.3f ms  %3d  [%d] %s:%d  %s%s\n' % (
+        c['dur_us'] / 1000.0, c['status'], c['pid'], path, line_num,
+        '  ' * c['depth'], _Argv(c['argv'])))
+
+
+def PrintSummary(trace, f, limit=20):
+  # NOTE: The time for a function call includes the commands inside it, so
+  # lines can add up to more than the total.
+  by_line = {}  # (path, line_num) -> [count, total_us, max_us, text]
+  for c in trace.cmds:
+    path, line_num, text = trace.Location(c)
+    entry = by_line.setdefault((path, line_num), [0, 0, 0, text])
+    entry[0] += 1
+    entry[1] += c['dur_us']
+    entry[2] = max(entry[2], c['dur_us'])
+
+  rows = sorted(by_line.items(), key=lambda item: -item[1][1])
+  f.write('%8s %12s %10s  %s\n' % ('COUNT', 'TOTAL_MS', 'MAX_MS', 'LOCATION'))
+  for (path, line_num), (count, total_us, max_us, text) in rows[:limit]:
+    f.write('%8d %12.3f %10.3f  %s:%d  %s\n' % (
+        count, total_us / 1000.0, max_us / 1000.0, path, line_num,
+        text.strip()))
+
+
+def PrintHtml(trace, f):
+  f.write('''\
+<!DOCTYPE html>
+<html>
+  <head>
+    <title>OSH Trace</title>
+    <style>
+      body { font-family: monospace; }
+      td { padding: 0 1em; vertical-align: top; }
+      .num { text-align: right; }
+      .fail { color: darkred; }
+      .src { color: gray; }
+    </style>
+  </head>
+  <body>
+    <table>
+      <tr>
+        <th>ms</th> <th>status</th> <th>pid</th> <th>location</th>
+        <th>argv</th> <th>source</th>
+      </tr>
+''')
+  for c in trace.cmds:
+    path, line_num, text = trace.Location(c)
+    css_class = ' class="fail"' if c['status'] != 0 else ''
+    f.write('''\
+      <tr%s>
+        <td class="num">%.3f</td> <td class="num">%d</td> <td>%d</td>
+        <td>%s:%d</td>
+        <td>%s%s</td>
+        <td class="src">%s</td>
+      </tr>
+''' % (css_class, c['dur_us'] / 1000.0, c['status'], c['pid'],
+       cgi.escape(path), line_num, '&nbsp;&nbsp;' * c['depth'],
+       cgi.escape(_Argv(c['argv'])), cgi.escape(text.strip())))
+  f.write('''\
+    </table>
+  </body>
+</html>
+''')
+
+
+def main(argv):
+  try:
+    action = argv[1]
+    paths = argv[2:]
+  except IndexError:
+    raise RuntimeError('Usage: trace_report.py (text|summary|html) TRACE...')
+
+  trace = Trace()
+  for path in paths:
+    with open(path) as f:
+      trace.Load(f)
+  trace.Finish()
+
+  if action == 'text':
+    PrintText(trace, sys.stdout)
+  elif action == 'summary':
+    PrintSummary(trace, sys.stdout)
+  elif action == 'html':
+    PrintHtml(trace, sys.stdout)
+  else:
+    raise RuntimeError('Invalid action %r' % action)
+
+
+if __name__ == '__main__':
+  try:
+    main(sys.argv)
+  except RuntimeError as e:
+    print('FATAL: %s' % e, file=sys.stderr)
+    sys.exit(1)
@@ -0,0 +1,526 @@
+#!/usr/bin/env python2
+"""
+ast_cache.py - Cache the LST of sourced files and scripts on disk.
+
+Opt in by setting $OSH_AST_CACHE_DIR.  The 'source' builtin and the main
+script then save what CommandParser.ParseLogicalLine() returned, and the next
+shell that runs the same file loads it instead of parsing.
+
+Entries are keyed by path, size, mtime, the Oil version, and the parse options
+in effect.  We don't save an entry if:
+
+- The file wasn't parsed to EOF, e.g. because of 'return' or a parse error.
+- Aliases were defined, or parse options changed, while it was parsed.  Both
+  change how later lines are parsed.
+
+Likewise, when an entry is loaded and a command defines an alias or changes a
+parse option, the rest of the file is parsed again.  An entry that can't be
+decoded is treated as a miss.
+
+The arena lines and spans created by the parser are saved too.  Span IDs in
+the tree are remapped as it's decoded, since every shell has its own arena.
+
+Format: a line of text with the key, then the tree encoded with marshal.  The
+app bundle doesn't have pickle.  Compound objects are encoded as tuples of
+(class number, field values ...), and simple sum types as (~class number,
+int).
+"""
+from __future__ import print_function
+
+import bisect
+import marshal
+import sys
+
+from asdl import pybase
+from frontend import parse_cache
+
+import posix_ as posix
+
+from typing import List, Dict, Tuple, Optional, Any, TYPE_CHECKING
+if TYPE_CHECKING:
+  from _devbuild.gen.syntax_asdl import command_t, source_t
+  from core.alloc import Arena
+  from frontend.parse_lib import ParseContext
+  from osh.cmd_parse import CommandParser
+
+
+_MAGIC = 'oil-ast-cache-4'  # change when the encoding or schema changes
+
+# Classes of the objects in the tree are looked up in these modules.
+_MODULES = ['_devbuild.gen.syntax_asdl', '_devbuild.gen.id_kind_asdl']
+
+
+class _Uncacheable(Exception):
+  pass
+
+
+class _BadEntry(Exception):
+  pass
+
+
+# Kinds of fields
+_OTHER = 0
+_SPAN_ID = 1  # e.g. span_id, here_end_span_id, spid, left_spid, argv0_spid
+_SPIDS = 2  # the list of span IDs in attributes
+
+_FIELD_KINDS = {}  # type: Dict[Any, List[Tuple[str, int]]]
+
+
+def _Fields(cls):
+  # type: (Any) -> List[Tuple[str, int]]
+  """Return (name, kind) pairs for the fields of an ASDL class."""
+  fields = _FIELD_KINDS.get(cls)
+  if fields is None:
+    fields = []
+    for name in cls.__slots__:
+      if name == 'spids':
+        kind = _SPIDS
+      elif name.endswith('span_id') or name.endswith('spid'):
+        kind = _SPAN_ID
+      else:
+        kind = _OTHER
+      fields.append((name, kind))
+    _FIELD_KINDS[cls] = fields
+  return fields
+
+
+class _Encoder(object):
+  """Turn ASDL objects into values that marshal can serialize."""
+
+  def __init__(self, span_map):
+    # type: (_IdMap) -> None
+    self.span_map = span_map
+    self.class_names = []  # type: List[str]
+    self.class_nums = {}  # type: Dict[Any, int]
+
+  def _ClassNum(self, cls):
+    # type: (Any) -> int
+    num = self.class_nums.get(cls)
+    if num is None:
+      if cls.__module__ not in _MODULES:
+        raise _Uncacheable(cls)
+      num = len(self.class_names)
+      self.class_names.append('%s.%s' % (cls.__module__, cls.__name__))
+      self.class_nums[cls] = num
+    return num
+
+  def _MapSpanId(self, span_id):
+    # type: (Any) -> Any
+    if isinstance(span_id, int) and span_id >= 0:
+      return self.span_map.Map(span_id)  # raises _Uncacheable
+    return span_id  # runtime.NO_SPID or None
+
+  def Encode(self, obj):
+    # type: (Any) -> Any
+    if obj is None or isinstance(obj, (str, bool)):
+      return obj
+
+    if isinstance(obj, pybase.SimpleObj):
+      return (~self._ClassNum(obj.__class__), int(obj))
+
+    if isinstance(obj, (int, long, float)):  # e.g. the value of expr.Const
+      return obj
+
+    if isinstance(obj, list):
+      return [self.Encode(item) for item in obj]
+
+    if isinstance(obj, pybase.CompoundObj):
+      # Attributes outside of __slots__ wouldn't be saved.
+      if getattr(obj, '__dict__', None):
+        raise _Uncacheable(obj)
+
+      parts = [self._ClassNum(obj.__class__)]  # type: List[Any]
+      for name, kind in _Fields(obj.__class__):
+        val = getattr(obj, name)
+        if kind == _OTHER:
+          val = self.Encode(val)
+        elif kind == _SPAN_ID:
+          val = self._MapSpanId(val)
+        else:
+          val = [self._MapSpanId(span_id) for span_id in val]
+        parts.append(val)
+      return tuple(parts)
+
+    raise _Uncacheable(obj)
+
+
+class _Decoder(object):
+  """Inverse of _Encoder."""
+
+  def __init__(self, class_names, span_map):
+    # type: (List[str], _IdMap) -> None
+    self.classes = []  # type: List[Any]
+    for class_name in class_names:
+      # Only ASDL classes can be named, since we call them.
+      mod_name, _, name = class_name.rpartition('.')
+      if mod_name not in _MODULES:
+        raise _BadEntry(class_name)
+      cls = getattr(sys.modules[mod_name], name, None)
+      if not (isinstance(cls, type) and
+              issubclass(cls, (pybase.SimpleObj, pybase.CompoundObj))):
+        raise _BadEntry(class_name)
+      self.classes.append(cls)
+    self.span_map = span_map
+
+  def _Class(self, num, base):
+    # type: (int, Any) -> Any
+    if not (isinstance(num, int) and 0 <= num < len(self.classes)):
+      raise _BadEntry(num)
+    cls = self.classes[num]
+    if not issubclass(cls, base):
+      raise _BadEntry(cls)
+    return cls
+
+  def _MapSpanId(self, span_id):
+    # type: (Any) -> Any
+    if isinstance(span_id, int) and span_id >= 0:
+      return self.span_map.Map(span_id)
+    return span_id  # runtime.NO_SPID or None
+
+  def Decode(self, val):
+    # type: (Any) -> Any
+    if isinstance(val, tuple):
+      num = val[0]
+      if num < 0:
+        return self._Class(~num, pybase.SimpleObj)(val[1])
+
+      cls = self._Class(num, pybase.CompoundObj)
+      fields = _Fields(cls)
+      if len(val) != len(fields) + 1:
+        raise _BadEntry(cls)
+      obj = cls.__new__(cls)
+      i = 1
+      for name, kind in fields:
+        field = val[i]
+        if kind == _OTHER:
+          field = self.Decode(field)
+        elif kind == _SPAN_ID:
+          field = self._MapSpanId(field)
+        else:
+          field = [self._MapSpanId(span_id) for span_id in field]
+        setattr(obj, name, field)
+        i += 1
+      return obj
+
+    if isinstance(val, list):
+      return [self.Decode(item) for item in val]
+
+    return val
+
+
+class _IdMap(object):
+  """Map IDs in a list of [start, end) ranges to consecutive IDs."""
+
+  def __init__(self, ranges, base):
+    # type: (List[Tuple[int, int]], int) -> None
+    self.starts = [start for start, _ in ranges]
+    self.ends = [end for _, end in ranges]
+    self.new_starts = []  # type: List[int]
+    n = base
+    for start, end in ranges:
+      self.new_starts.append(n)
+      n += end - start
+
+  def Map(self, old_id):
+    # type: (int) -> int
+    i = bisect.bisect_right(self.starts, old_id) - 1
+    if i < 0 or old_id >= self.ends[i]:
+      raise _Uncacheable('ID %d not in any range' % old_id)
+    return self.new_starts[i] + old_id - self.starts[i]
+
+
+def _Ids(ranges):
+  # type: (List[Tuple[int, int]]) -> List[int]
+  ids = []  # type: List[int]
+  for start, end in ranges:
+    ids.extend(xrange(start, end))
+  return ids
+
+
+class AstCache(object):
+
+  def __init__(self, cache_dir, version, parse_ctx):
+    # type: (str, str, ParseContext) -> None
+    self.cache_dir = cache_dir
+    self.version = version
+    self.parse_ctx = parse_ctx
+    self.arena = parse_ctx.arena
+
+  def ParseOptsString(self):
+    # type: () -> str
+    return parse_cache.ParseOptsString(self.parse_ctx.parse_opts)
+
+  def MaybeWrap(self, c_parser):
+    # type: (CommandParser) -> Any
+    """Return an object with the interface of CommandParser that main_loop.Batch()
+    uses.
+
+    It's c_parser itself, a parser that saves its results, or one that loads
+    them from the cache.  Only files set up with
+    FileLineReader.SetBackingFile() are cached.
+    """
+    line_reader = c_parser.line_reader
+    file_id = line_reader.file_id
+    if file_id == -1:  # not a regular file
+      return c_parser
+    if len(self.parse_ctx.aliases):  # they may change how the file parses
+      return c_parser
+
+    abs_path = self.arena.file_paths[file_id]
+    if '\t' in abs_path or '\n' in abs_path:
+      return c_parser
+
+    try:
+      st = posix.stat(abs_path)
+    except OSError:
+      return c_parser
+    if (st.st_dev != self.arena.file_devs[file_id] or
+        st.st_ino != self.arena.file_inos[file_id]):
+      return c_parser
+
+    key = '\t'.join([
+        _MAGIC, self.version, abs_path, str(st.st_size), repr(st.st_mtime),
+        self.ParseOptsString()
+    ]) + '\n'
+
+    # Only one entry per path.  The key says whether it's fresh.
+    cache_path = '%s/%s-%x' % (
+        self.cache_dir, abs_path.split('/')[-1], hash(abs_path) & 0xffffffff)
+
+    entry = None  # type: Any
+    try:
+      with open(cache_path) as cache_f:
+        if cache_f.readline() == key:
+          entry = marshal.loads(cache_f.read())
+    except (IOError, ValueError, EOFError, TypeError):
+      pass
+
+    if entry is None:
+      return _SavingParser(self, c_parser, cache_path, key)
+    return _LoadingParser(self, c_parser, cache_path, key, entry)
+
+
+class _SavingParser(object):
+  """Wraps CommandParser and saves its results when it reaches EOF."""
+
+  def __init__(self, cache, c_parser, cache_path, key):
+    # type: (AstCache, CommandParser, str, str) -> None
+    self.cache = cache
+    self.c_parser = c_parser
+    self.line_reader = c_parser.line_reader  # for main_loop.Batch()
+    self.cache_path = cache_path
+    self.key = key
+
+    self.parse_opts_str = cache.ParseOptsString()
+    self.ok = True  # set to False if we can't save
+
+    self.nodes = []  # type: List[command_t]
+    # The line number after each node, so we can resume parsing there.
+    self.line_nums = []  # type: List[int]
+    # The parser creates lines and spans in these ranges.  Others are
+    # created when commands are executed in between.
+    self.line_ranges = []  # type: List[Tuple[int, int]]
+    self.span_ranges = []  # type: List[Tuple[int, int]]
+
+  def ParseLogicalLine(self):
+    # type: () -> Optional[command_t]
+    arena = self.cache.arena
+    if (len(self.cache.parse_ctx.aliases) or
+        self.cache.ParseOptsString() != self.parse_opts_str):
+      self.ok = False
+
+    line_start = arena.LastLineId()
+    span_start = arena.LastSpanId()
+    try:
+      node = self.c_parser.ParseLogicalLine()
+    except Exception:
+      self.ok = False
+      raise
+    self.line_ranges.append((line_start, arena.LastLineId()))
+    self.span_ranges.append((span_start, arena.LastSpanId()))
+
+    if node is not None:
+      self.nodes.append(node)
+      self.line_nums.append(self.line_reader.line_num)
+    return node
+
+  def CheckForPendingHereDocs(self):
+    # type: () -> None
+    self.c_parser.CheckForPendingHereDocs()  # may raise error.Parse
+    if self.ok:
+      try:
+        self._Save()
+      except (_Uncacheable, IOError, OSError, ValueError):
+        pass
+
+  def _Save(self):
+    # type: () -> None
+    arena = self.cache.arena
+    file_id = self.line_reader.file_id
+    outer_src = arena.source_instances[-1]
+
+    line_ids = _Ids(self.line_ranges)
+    line_map = _IdMap(self.line_ranges, 0)
+    enc = _Encoder(_IdMap(self.span_ranges, 0))
+
+    # Lines of the file itself are read back with their offsets.  Other lines,
+    # like the contents of `backticks`, are saved with their text and source.
+    # Source -1 is the file's own.
+    lines = []  # type: List[Any]
+    srcs = []  # type: List[source_t]
+    for line_id in line_ids:
+      line_num = arena.GetLineNumber(line_id)
+      if arena.line_file_ids[line_id] == file_id:
+        lines.append((line_num, arena.line_offsets[line_id]))
+      else:
+        src = arena.line_srcs[line_id]
+        if src is outer_src:
+          src_index = -1
+        else:
+          src_index = len(srcs)
+          srcs.append(src)
+        lines.append((line_num, arena.GetLine(line_id), src_index))
+
+    spans = []  # type: List[int]
+    for span_id in _Ids(self.span_ranges):
+      span = arena.GetLineSpan(span_id)
+      if span.line_id == -1:  # e.g. Eof in an empty file
+        spans.append(-1)
+      else:
+        spans.append(line_map.Map(span.line_id))
+      spans.append(span.col)
+      spans.append(span.length)
+
+    encoded_nodes = enc.Encode(self.nodes)
+    encoded_srcs = enc.Encode(srcs)
+    entry = (enc.class_names, lines, spans, encoded_srcs, encoded_nodes,
+             self.line_nums)
+
+    # Write atomically, since other shells may be reading it.  O_EXCL so we
+    # don't follow a symlink someone else put there.
+    tmp_path = '%s.%d' % (self.cache_path, posix.getpid())
+    fd = posix.open(tmp_path, posix.O_WRONLY | posix.O_CREAT | posix.O_EXCL,
+                    0o644)
+    try:
+      with posix.fdopen(fd, 'w') as f:
+        f.write(self.key)
+        f.write(marshal.dumps(entry))
+      posix.rename(tmp_path, self.cache_path)
+    except (IOError, OSError):
+      posix.unlink(tmp_path)
+      raise
+
+
+class _LoadingParser(object):
+  """Returns nodes from a cache entry instead of parsing.
+
+  Falls back to c_parser if the entry is bad, or a command changes how the rest
+  of the file parses.
+  """
+
+  def __init__(self, cache, c_parser, cache_path, key, entry):
+    # type: (AstCache, CommandParser, str, str, Any) -> None
+    self.cache = cache
+    self.c_parser = c_parser
+    self.line_reader = c_parser.line_reader  # for main_loop.Batch()
+    self.cache_path = cache_path
+    self.key = key
+    self.entry = entry
+
+    self.parse_opts_str = cache.ParseOptsString()
+    self.nodes = None  # type: Optional[List[command_t]]
+    self.line_nums = None  # type: Optional[List[int]]
+    self.i = 0
+
+    # Set if we have to parse the rest of the file.
+    self.fallback = None  # type: Any
+
+  def _Load(self):
+    # type: () -> None
+    """Decode the tree, and add lines and spans to the arena.
+
+    Called lazily, since the caller pushes the arena source after creating the
+    parser.  A malformed entry raises _BadEntry, ValueError, etc.
+    """
+    arena = self.cache.arena
+    file_id = self.line_reader.file_id
+    (class_names, lines, spans, encoded_srcs, encoded_nodes,
+     line_nums) = self.entry
+    self.entry = None
+
+    num_spans = len(spans) // 3
+    line_base = arena.LastLineId()
+    span_base = arena.LastSpanId()
+    dec = _Decoder(class_names, _IdMap([(0, num_spans)], span_base))
+    srcs = dec.Decode(encoded_srcs)
+    nodes = dec.Decode(encoded_nodes)
+    if not (isinstance(nodes, list) and len(nodes) == len(line_nums)):
+      raise _BadEntry(nodes)
+
+    for line in lines:
+      if len(line) == 2:
+        line_num, offset = line
+        arena.AddFileLine('', line_num, file_id, offset)
+      else:
+        line_num, text, src_index = line
+        if src_index == -1:
+          arena.AddLine(text, line_num)
+        else:
+          arena.PushSource(srcs[src_index])
+          arena.AddLine(text, line_num)
+          arena.PopSource()
+
+    for i in xrange(num_spans):
+      line_id = spans[3*i]
+      if line_id != -1:
+        line_id += line_base
+      arena.AddLineSpan(line_id, spans[3*i + 1], spans[3*i + 2])
+
+    self.nodes = nodes
+    self.line_nums = line_nums
+
+  def _ParseFrom(self, line_num):
+    # type: (int) -> Optional[command_t]
+    """Skip to line_num of the file, and parse the rest of it."""
+    line_reader = self.line_reader
+    while line_reader.line_num < line_num:
+      line = line_reader.f.readline()
+      if len(line) == 0:
+        break
+      line_reader.offset += len(line)
+      line_reader.line_num += 1
+    self.fallback = self.c_parser
+    return self.c_parser.ParseLogicalLine()
+
+  def ParseLogicalLine(self):
+    # type: () -> Optional[command_t]
+    if self.fallback:
+      return self.fallback.ParseLogicalLine()
+
+    if self.nodes is None:
+      try:
+        self._Load()
+      except (_BadEntry, _Uncacheable, ValueError, TypeError, IndexError,
+              KeyError, AttributeError):
+        # Parse the file, and overwrite the entry.
+        self.fallback = _SavingParser(self.cache, self.c_parser,
+                                      self.cache_path, self.key)
+        return self.fallback.ParseLogicalLine()
+
+    nodes = self.nodes
+    i = self.i
+    if i == len(nodes):
+      return None
+
+    if i != 0 and (len(self.cache.parse_ctx.aliases) or
+                   self.cache.ParseOptsString() != self.parse_opts_str):
+      # The last command defined an alias or changed parse options.
+      return self._ParseFrom(self.line_nums[i-1])
+
+    self.i = i + 1
+    return nodes[i]
+
+  def CheckForPendingHereDocs(self):
+    # type: () -> None
+    if self.fallback:
+      self.fallback.CheckForPendingHereDocs()
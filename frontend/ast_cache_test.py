@@ -0,0 +1,172 @@
+#!/usr/bin/env python2
+"""
+ast_cache_test.py: Tests for ast_cache.py
+"""
+from __future__ import print_function
+
+import marshal
+import os
+import shutil
+import tempfile
+import unittest
+
+from _devbuild.gen.syntax_asdl import source, source_e, command_e
+from core import alloc
+from core import pyutil
+from core import test_lib
+from frontend import ast_cache  # module under test
+from frontend import reader
+
+
+CODE = """\
+f() {
+  echo `echo backticks` "$1"
+  cat <<EOF
+here doc $x
+EOF
+}
+a[1+2]=x
+f one
+"""
+
+
+def _Parse(path, cache_dir, arena, aliases=None, after_first=None):
+  arena.PushSource(source.MainFile(path))
+  parse_ctx = test_lib.InitParseContext(arena=arena, aliases=aliases)
+  with open(path) as f:
+    line_reader = reader.FileLineReader(f, arena)
+    abs_path, st_dev, st_ino = pyutil.BackingFile(path, f)
+    line_reader.SetBackingFile(arena.AddBackingFile(abs_path, st_dev, st_ino))
+
+    c_parser = parse_ctx.MakeOshParser(line_reader)
+    cache = ast_cache.AstCache(cache_dir, 'test-version', parse_ctx)
+    p = cache.MaybeWrap(c_parser)
+
+    nodes = []
+    while True:
+      node = p.ParseLogicalLine()
+      if node is None:
+        p.CheckForPendingHereDocs()
+        break
+      nodes.append(node)
+      if after_first:  # like a command that runs between lines
+        after_first()
+        after_first = None
+
+  arena.PopSource()
+  return p, nodes
+
+
+class AstCacheTest(unittest.TestCase):
+
+  def setUp(self):
+    self.tmp_dir = tempfile.mkdtemp()
+    self.cache_dir = os.path.join(self.tmp_dir, 'cache')
+    os.mkdir(self.cache_dir)
+    self.path = os.path.join(self.tmp_dir, 'lib.sh')
+    with open(self.path, 'w') as f:
+      f.write(CODE)
+
+  def tearDown(self):
+    shutil.rmtree(self.tmp_dir)
+
+  def testSaveAndLoad(self):
+    arena1 = alloc.Arena()
+    p1, nodes1 = _Parse(self.path, self.cache_dir, arena1)
+    self.assertEqual('_SavingParser', p1.__class__.__name__)
+    self.assertEqual(1, len(os.listdir(self.cache_dir)))
+
+    arena2 = alloc.Arena()
+    p2, nodes2 = _Parse(self.path, self.cache_dir, arena2)
+    self.assertEqual('_LoadingParser', p2.__class__.__name__)
+
+    self.assertEqual(len(nodes1), len(nodes2))
+    for node1, node2 in zip(nodes1, nodes2):
+      test_lib.AssertAsdlEqual(self, node1, node2)
+
+    # Another arena, with some spans already in it
+    arena3 = test_lib.MakeArena('<ast_cache_test.py>')
+    line_id = arena3.AddLine('echo hi\n', 1)
+    for i in xrange(3):
+      arena3.AddLineSpan(line_id, 0, 4)
+    _, nodes3 = _Parse(self.path, self.cache_dir, arena3)
+
+    # Span IDs were remapped to the new arena
+    self.assertEqual(arena1.LastSpanId() + 3, arena3.LastSpanId())
+    tok = nodes3[2].words[0].parts[0]  # f
+    span = arena3.GetLineSpan(tok.span_id)
+    line = arena3.GetLine(span.line_id)
+    self.assertEqual('f', line[span.col : span.col + span.length])
+    self.assertEqual(8, arena3.GetLineNumber(span.line_id))
+
+    # The contents of backticks are in memory, and have their own source
+    num_lines = arena3.LastLineId()
+    srcs = [arena3.GetLineSource(i) for i in xrange(num_lines)]
+    num_backticks = sum(1 for src in srcs if src.tag_() == source_e.Backticks)
+    self.assertEqual(1, num_backticks)
+
+  def testNotSaved(self):
+    # Aliases could change how the file is parsed.
+    arena = alloc.Arena()
+    p, _ = _Parse(self.path, self.cache_dir, arena, aliases={'f': 'echo'})
+    self.assertEqual('CommandParser', p.__class__.__name__)
+    self.assertEqual([], os.listdir(self.cache_dir))
+
+    # Changing the file makes the entry stale.
+    _Parse(self.path, self.cache_dir, alloc.Arena())
+    with open(self.path, 'a') as f:
+      f.write('echo more\n')
+    p, nodes = _Parse(self.path, self.cache_dir, alloc.Arena())
+    self.assertEqual('_SavingParser', p.__class__.__name__)
+    self.assertEqual(4, len(nodes))
+
+  def testBadEntry(self):
+    _Parse(self.path, self.cache_dir, alloc.Arena())
+    cache_path = os.path.join(self.cache_dir, os.listdir(self.cache_dir)[0])
+    with open(cache_path) as f:
+      key = f.readline()
+      entry = marshal.loads(f.read())
+
+    # Only ASDL classes can be named
+    class_names = list(entry[0])
+    class_names[0] = 'posix.system'
+    bad_entries = [(class_names,) + entry[1:], entry[:-1], entry[1:]]
+
+    for bad_entry in bad_entries:
+      with open(cache_path, 'w') as f:
+        f.write(key)
+        f.write(marshal.dumps(bad_entry))
+
+      p, nodes = _Parse(self.path, self.cache_dir, alloc.Arena())
+      self.assertEqual('_LoadingParser', p.__class__.__name__)
+      self.assertEqual('_SavingParser', p.fallback.__class__.__name__)
+      self.assertEqual(3, len(nodes))
+
+    # The entry was overwritten
+    p, nodes = _Parse(self.path, self.cache_dir, alloc.Arena())
+    self.assertEqual(None, p.fallback)
+    self.assertEqual(3, len(nodes))
+
+  def testAliasDefinedWhileLoading(self):
+    _Parse(self.path, self.cache_dir, alloc.Arena())
+
+    aliases = {}
+    def DefineAlias():
+      aliases['f'] = 'echo ALIASED'
+
+    arena = alloc.Arena()
+    p, nodes = _Parse(self.path, self.cache_dir, arena, aliases=aliases,
+                      after_first=DefineAlias)
+    self.assertEqual('CommandParser', p.fallback.__class__.__name__)
+    self.assertEqual(3, len(nodes))
+
+    # 'f one' on line 8 was parsed again, and the alias expanded
+    self.assertEqual(command_e.ExpandedAlias, nodes[2].tag_())
+
+    node = nodes[1]  # a[1+2]=x on line 7
+    span = arena.GetLineSpan(node.spids[0])
+    self.assertEqual(7, arena.GetLineNumber(span.line_id))
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -229,6 +229,8 @@ def _Init(opt_def):
   # shopt options that aren't in any groups.
   opt_def.Add('failglob')  # not implemented.
   opt_def.Add('unsafe_arith_eval')  # dynamic parsing and evaluation (ble.sh)
+  opt_def.Add('nofork_command_sub')  # run some $(myfunc) without forking
+  opt_def.Add('nofork_pipeline')  # run echo/printf in 'echo x | f' without forking
 
   # Two strict options that from bash's shopt
   for name in ['nullglob', 'inherit_errexit']:
@@ -0,0 +1,261 @@
+#!/usr/bin/env python2
+"""
+parse_cache.py - Reuse the LST of strings that are parsed over and over.
+
+'eval' in a loop, trap handlers, and $PROMPT_COMMAND parse the same code many
+times.  This is an in-memory LRU cache from the code string to the nodes that
+CommandParser.ParseLogicalLine() returned.
+
+Nodes and their arena spans are shared by every use, so the key includes the
+location of the code, e.g. the 'eval' word.  Otherwise a runtime error would
+point at the first place the same string was parsed.  An 'eval' in a loop
+still hits, since it's at the same location every time.
+
+The key also includes the parse options and aliases in effect, since they change how
+code parses.  Code that changes them is parsed incrementally:
+
+- When the code is first run, we don't save an entry if they changed between
+  lines.
+- When an entry is replayed and a command changes them, the rest of the string
+  is parsed again.
+
+Compare with frontend/ast_cache.py, which caches files on disk.
+"""
+from __future__ import print_function
+
+from _devbuild.gen.syntax_asdl import (
+    command, source_e, source__EvalArg, source__Trap, source__PromptCommand,
+)
+from asdl import runtime
+from frontend import option_def
+from frontend import reader
+
+from typing import List, Dict, Tuple, Optional, Any, cast, TYPE_CHECKING
+if TYPE_CHECKING:
+  from _devbuild.gen.syntax_asdl import command_t, source_t
+  from core import optview
+  from core.util import DebugFile
+  from frontend.parse_lib import ParseContext
+  from osh.cmd_parse import CommandParser
+
+
+def ParseOptsString(parse_opts):
+  # type: (optview.Parse) -> str
+  """Encode the parse options for a cache key."""
+  return ''.join(
+      '1' if getattr(parse_opts, name)() else '0'
+      for name in option_def.PARSE_OPTION_NAMES)
+
+
+def _Site(src):
+  # type: (source_t) -> Tuple[int, int]
+  """The kind of code and its location, for a cache key."""
+  UP_src = src
+  tag = src.tag_()
+  if tag == source_e.EvalArg:
+    src = cast(source__EvalArg, UP_src)
+    return tag, src.eval_spid
+  if tag == source_e.Trap:
+    src = cast(source__Trap, UP_src)
+    return tag, src.word_spid
+  if tag == source_e.PromptCommand:
+    src = cast(source__PromptCommand, UP_src)
+    return tag, src.spid
+  return tag, runtime.NO_SPID
+
+
+class _Entry(object):
+
+  def __init__(self, nodes, line_nums):
+    # type: (List[command_t], List[int]) -> None
+    self.nodes = nodes
+    # The line number after each node, so we can resume parsing there.
+    self.line_nums = line_nums
+
+
+class ParseCache(object):
+
+  def __init__(self, parse_ctx, max_entries=256):
+    # type: (ParseContext, int) -> None
+    self.parse_ctx = parse_ctx
+    self.arena = parse_ctx.arena
+    self.max_entries = max_entries
+
+    self.entries = {}  # type: Dict[Tuple[Any, ...], _Entry]
+    self.lru = []  # type: List[Tuple[Any, ...]]  # least recent first
+
+    # For tuning max_entries
+    self.hits = 0
+    self.misses = 0
+
+  def _State(self):
+    # type: () -> Tuple[str, Any]
+    """The parse options and aliases in effect."""
+    aliases = self.parse_ctx.aliases
+    alias_key = tuple(sorted(aliases.iteritems())) if aliases else ()
+    return ParseOptsString(self.parse_ctx.parse_opts), alias_key
+
+  def _Key(self, code_str, src):
+    # type: (str, source_t) -> Tuple[Any, ...]
+    opts_str, alias_key = self._State()
+    return code_str, _Site(src), opts_str, alias_key
+
+  def _Get(self, key):
+    # type: (Tuple[Any, ...]) -> Optional[_Entry]
+    entry = self.entries.get(key)
+    if entry is None:
+      self.misses += 1
+      return None
+
+    self.hits += 1
+    if self.lru[-1] != key:  # the common case is the same code in a loop
+      self.lru.remove(key)
+      self.lru.append(key)
+    return entry
+
+  def _Put(self, key, entry):
+    # type: (Tuple[Any, ...], _Entry) -> None
+    if key in self.entries:
+      self.lru.remove(key)
+    self.entries[key] = entry
+    self.lru.append(key)
+    if len(self.lru) > self.max_entries:
+      del self.entries[self.lru.pop(0)]
+
+  def _Evict(self, key):
+    # type: (Tuple[Any, ...]) -> None
+    if key in self.entries:
+      del self.entries[key]
+      self.lru.remove(key)
+
+  def _MakeOshParser(self, code_str, line_num=1):
+    # type: (str, int) -> CommandParser
+    """Make a parser for code_str, starting at the given line."""
+    pos = 0
+    for _ in xrange(line_num - 1):
+      pos = code_str.index('\n', pos) + 1
+    line_reader = reader.StringLineReader(code_str[pos:], self.arena)
+    line_reader.line_num = line_num
+    return self.parse_ctx.MakeOshParser(line_reader)
+
+  def MakeParser(self, code_str, src):
+    # type: (str, source_t) -> Any
+    """Return an object with the interface of CommandParser that
+    main_loop.Batch() uses.
+
+    The caller should push the arena source 'src', as usual.
+    """
+    key = self._Key(code_str, src)
+    entry = self._Get(key)
+    if entry is None:
+      return _SavingParser(self, self._MakeOshParser(code_str), key)
+    return _CachedParser(self, code_str, key, entry)
+
+  def ParseWhole(self, code_str, src):
+    # type: (str, source_t) -> command_t
+    """Like main_loop.ParseWholeFile(), for trap and $PROMPT_COMMAND.
+
+    The caller should push the arena source 'src'.  Raises error.Parse.
+    """
+    key = self._Key(code_str, src)
+    entry = self._Get(key)
+    if entry is None:
+      c_parser = self._MakeOshParser(code_str)
+      nodes = []  # type: List[command_t]
+      line_nums = []  # type: List[int]
+      while True:
+        node = c_parser.ParseLogicalLine()  # can raise ParseError
+        if node is None:  # EOF
+          c_parser.CheckForPendingHereDocs()  # can raise ParseError
+          break
+        nodes.append(node)
+        line_nums.append(c_parser.line_reader.line_num)
+      entry = _Entry(nodes, line_nums)
+      self._Put(key, entry)
+
+    if len(entry.nodes) == 1:
+      return entry.nodes[0]
+    else:
+      return command.CommandList(entry.nodes)
+
+  def LogStats(self, debug_f):
+    # type: (DebugFile) -> None
+    debug_f.log('parse cache: %d hits, %d misses, %d entries', self.hits,
+                self.misses, len(self.entries))
+
+
+class _SavingParser(object):
+  """Wraps CommandParser and saves its results when it reaches EOF."""
+
+  def __init__(self, cache, c_parser, key):
+    # type: (ParseCache, CommandParser, Tuple[Any, ...]) -> None
+    self.cache = cache
+    self.c_parser = c_parser
+    self.line_reader = c_parser.line_reader  # for main_loop.Batch()
+    self.key = key
+
+    self.ok = True  # set to False if we can't save
+    self.nodes = []  # type: List[command_t]
+    self.line_nums = []  # type: List[int]
+
+  def ParseLogicalLine(self):
+    # type: () -> Optional[command_t]
+    if self.ok and self.nodes and self.cache._State() != self.key[2:]:
+      self.ok = False  # a command changed how the rest parses
+
+    try:
+      node = self.c_parser.ParseLogicalLine()
+    except Exception:
+      self.ok = False
+      raise
+
+    if node is not None:
+      self.nodes.append(node)
+      self.line_nums.append(self.line_reader.line_num)
+    return node
+
+  def CheckForPendingHereDocs(self):
+    # type: () -> None
+    self.c_parser.CheckForPendingHereDocs()  # may raise error.Parse
+    if self.ok:
+      self.cache._Put(self.key, _Entry(self.nodes, self.line_nums))
+
+
+class _CachedParser(object):
+  """Returns nodes from a cache entry instead of parsing."""
+
+  def __init__(self, cache, code_str, key, entry):
+    # type: (ParseCache, str, Tuple[Any, ...], _Entry) -> None
+    self.cache = cache
+    self.code_str = code_str
+    self.key = key
+    self.entry = entry
+    self.i = 0
+
+    # Set if we have to parse the rest of the code.
+    self.c_parser = None  # type: Optional[CommandParser]
+
+  def ParseLogicalLine(self):
+    # type: () -> Optional[command_t]
+    if self.c_parser:
+      return self.c_parser.ParseLogicalLine()
+
+    nodes = self.entry.nodes
+    i = self.i
+    if i == len(nodes):
+      return None
+
+    if i != 0 and self.cache._State() != self.key[2:]:
+      # The last command changed aliases or parse options.
+      self.cache._Evict(self.key)
+      self.c_parser = self.cache._MakeOshParser(self.code_str,
+                                                self.entry.line_nums[i-1])
+      return self.c_parser.ParseLogicalLine()
+
+    self.i = i + 1
+    return nodes[i]
+
+  def CheckForPendingHereDocs(self):
+    # type: () -> None
+    if self.c_parser:
+      self.c_parser.CheckForPendingHereDocs()
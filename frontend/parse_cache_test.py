@@ -0,0 +1,129 @@
+#!/usr/bin/env python2
+"""
+parse_cache_test.py: Tests for parse_cache.py
+"""
+from __future__ import print_function
+
+import unittest
+
+from _devbuild.gen.option_asdl import option_i
+from _devbuild.gen.syntax_asdl import command_e, source
+from core import test_lib
+from frontend import parse_cache  # module under test
+
+
+# An 'eval' at span ID 1
+SRC = source.EvalArg(1)
+
+CODE = """\
+f() {
+  cat <<EOF
+here doc
+EOF
+}
+echo one; echo two
+"""
+
+
+def _ParseAll(p):
+  """Like main_loop.Batch(), without executing."""
+  nodes = []
+  while True:
+    node = p.ParseLogicalLine()
+    if node is None:
+      p.CheckForPendingHereDocs()
+      break
+    nodes.append(node)
+  return nodes
+
+
+class ParseCacheTest(unittest.TestCase):
+
+  def setUp(self):
+    self.arena = test_lib.MakeArena('<parse_cache_test.py>')
+    self.aliases = {}
+    self.parse_ctx = test_lib.InitParseContext(arena=self.arena,
+                                               aliases=self.aliases)
+    self.cache = parse_cache.ParseCache(self.parse_ctx, max_entries=2)
+
+  def testMakeParser(self):
+    p = self.cache.MakeParser(CODE, SRC)
+    self.assertEqual('_SavingParser', p.__class__.__name__)
+    nodes1 = _ParseAll(p)
+    self.assertEqual(2, len(nodes1))
+    self.assertEqual(0, self.cache.hits)
+    self.assertEqual(1, self.cache.misses)
+
+    p = self.cache.MakeParser(CODE, SRC)
+    self.assertEqual('_CachedParser', p.__class__.__name__)
+    nodes2 = _ParseAll(p)
+    self.assertEqual(nodes1, nodes2)  # the same objects
+    self.assertEqual(1, self.cache.hits)
+
+    # Parse errors aren't cached
+    for i in xrange(2):
+      p = self.cache.MakeParser('echo (', SRC)
+      self.assertRaises(Exception, _ParseAll, p)
+    self.assertEqual(1, len(self.cache.entries))
+
+  def testKey(self):
+    node1 = self.cache.ParseWhole('ll', SRC)
+    self.assertEqual(command_e.Simple, node1.tag_())
+
+    # Aliases and parse options are part of the key
+    self.aliases['ll'] = 'ls -l'
+    node2 = self.cache.ParseWhole('ll', SRC)
+    self.assertNotEqual(node1, node2)
+    self.assertEqual(node2, self.cache.ParseWhole('ll', SRC))
+
+    self.parse_ctx.parse_opts.opt_array[option_i.parse_at] = True
+    node3 = self.cache.ParseWhole('ll', SRC)
+    self.assertNotEqual(node2, node3)
+
+    # Only 2 entries are kept
+    self.assertEqual(2, len(self.cache.entries))
+    self.assertEqual(1, self.cache.hits)
+    self.assertEqual(3, self.cache.misses)
+
+  def testSite(self):
+    # Code eval'd at another location is parsed again, so errors point there
+    node1 = self.cache.ParseWhole('echo hi', SRC)
+    node2 = self.cache.ParseWhole('echo hi', source.EvalArg(2))
+    self.assertNotEqual(node1, node2)
+    self.assertEqual(node1, self.cache.ParseWhole('echo hi', source.EvalArg(1)))
+
+    node3 = self.cache.ParseWhole('echo hi', source.Trap(1))
+    self.assertNotEqual(node1, node3)
+
+  def testStateChanges(self):
+    code = 'alias ll="ls -l"\nll\n'
+
+    # The parse isn't saved if the state changes between lines
+    p = self.cache.MakeParser(code, SRC)
+    p.ParseLogicalLine()
+    self.aliases['ll'] = 'ls -l'
+    p.ParseLogicalLine()
+    p.ParseLogicalLine()
+    self.assertEqual(0, len(self.cache.entries))
+
+    # Save it when the state stays the same
+    del self.aliases['ll']
+    nodes1 = _ParseAll(self.cache.MakeParser(code, SRC))
+    self.assertEqual(1, len(self.cache.entries))
+
+    # If it changes while the entry is replayed, the rest is parsed again.
+    p = self.cache.MakeParser(code, SRC)
+    self.assertEqual(nodes1[0], p.ParseLogicalLine())
+    self.aliases['ll'] = 'ls -l'
+    node = p.ParseLogicalLine()
+    self.assertEqual(command_e.Simple, nodes1[1].tag_())
+    self.assertEqual(command_e.ExpandedAlias, node.tag_())
+    self.assertEqual(None, p.ParseLogicalLine())
+    self.assertEqual(0, len(self.cache.entries))
+
+    # With the same line numbers
+    self.assertEqual(2, p.c_parser.line_reader.line_num - 1)
+
+
+if __name__ == '__main__':
+  unittest.main()
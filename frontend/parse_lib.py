@@ -221,19 +221,12 @@ class ParseContext(object):
     self.parse_opts = parse_opts
     self.aliases = aliases
 
-    self.e_parser = expr_parse.ExprParser(self, oil_grammar)
-    # NOTE: The transformer is really a pure function.
-    if oil_grammar:
-      self.tr = expr_to_ast.Transformer(oil_grammar)
-      if mylib.PYTHON:
-        names = MakeGrammarNames(oil_grammar)
-    else:  # hack for unit tests, which pass None
-      self.tr = None
-      if mylib.PYTHON:  # TODO: Simplify
-        names = {}
+    self.oil_grammar = oil_grammar
+    self.grammar_loader = None  # type: Optional[meta.GrammarLoader]
 
-    if mylib.PYTHON:
-      self.p_printer = expr_parse.ParseTreePrinter(names)  # print raw nodes
+    # Created by _InitOil() when the first Oil expression is parsed.
+    self.e_parser = None  # type: expr_parse.ExprParser
+    self.tr = None  # type: expr_to_ast.Transformer
 
     self.parsing_expr = False  # "single-threaded" state
 
@@ -249,6 +242,33 @@ class ParseContext(object):
     # type: (bool) -> None
     self.one_pass_parse = b
 
+  def Init_GrammarLoader(self, grammar_loader):
+    # type: (meta.GrammarLoader) -> None
+    """Load the grammar on demand, instead of passing it to the constructor."""
+    self.grammar_loader = grammar_loader
+
+  def _InitOil(self):
+    # type: () -> None
+    if self.e_parser is not None:
+      return
+
+    if self.oil_grammar is None and self.grammar_loader is not None:
+      self.oil_grammar = self.grammar_loader.Get()
+    oil_grammar = self.oil_grammar
+
+    self.e_parser = expr_parse.ExprParser(self, oil_grammar)
+    # NOTE: The transformer is really a pure function.
+    if oil_grammar:
+      self.tr = expr_to_ast.Transformer(oil_grammar, self.arena)
+      if mylib.PYTHON:
+        names = MakeGrammarNames(oil_grammar)
+    else:  # hack for unit tests, which pass None
+      if mylib.PYTHON:  # TODO: Simplify
+        names = {}
+
+    if mylib.PYTHON:
+      self.p_printer = expr_parse.ParseTreePrinter(names)  # print raw nodes
+
   def _MakeLexer(self, line_reader):
     # type: (_Reader) -> Lexer
     """Helper function.
@@ -306,6 +326,7 @@ class ParseContext(object):
   def _ParseOil(self, lexer, start_symbol):
     # type: (Lexer, int) -> Tuple[PNode, Token]
     """Helper Oil expression parsing."""
+    self._InitOil()
     self.parsing_expr = True
     try:
       return self.e_parser.Parse(lexer, start_symbol)
@@ -320,6 +341,7 @@ class ParseContext(object):
     if self.parsing_expr:
       p_die("ShAssignment expression can't be nested like this", token=kw_token)
 
+    self._InitOil()
     self.parsing_expr = True
     try:
       pnode, last_token = self.e_parser.Parse(lexer, grammar_nt.oil_var_decl)
@@ -337,6 +359,7 @@ class ParseContext(object):
     # type: (Token, Lexer) -> Tuple[command__PlaceMutation, Token]
 
     # TODO: Create an ExprParser so it's re-entrant.
+    self._InitOil()
     pnode, last_token = self.e_parser.Parse(lexer,
                                             grammar_nt.oil_place_mutation)
     if 0:
@@ -362,6 +385,7 @@ class ParseContext(object):
   def ParseOilExpr(self, lexer, start_symbol):
     # type: (Lexer, int) -> Tuple[expr_t, Token]
     """For Oil expressions that aren't assignments."""
+    self._InitOil()
     pnode, last_token = self.e_parser.Parse(lexer, start_symbol)
 
     if 0:
@@ -373,6 +397,7 @@ class ParseContext(object):
   def ParseOilForExpr(self, lexer, start_symbol):
     # type: (Lexer, int) -> Tuple[List[name_type], expr_t, Token]
     """ for (x Int, y Int in foo) """
+    self._InitOil()
     pnode, last_token = self.e_parser.Parse(lexer, start_symbol)
 
     if 0:
@@ -384,6 +409,7 @@ class ParseContext(object):
   def ParseProc(self, lexer, out):
     # type: (Lexer, command__Proc) -> Token
     """ proc f(x, y, @args) { """
+    self._InitOil()
     pnode, last_token = self.e_parser.Parse(lexer, grammar_nt.oil_proc)
 
     if 0:
@@ -395,6 +421,7 @@ class ParseContext(object):
   def ParseFunc(self, lexer, out):
     # type: (Lexer, command__Func) -> Token
     """ func f(x Int, y Int = 0, ...args; z Int = 3, ...named) { """
+    self._InitOil()
     pnode, last_token = self.e_parser.Parse(lexer, grammar_nt.oil_func)
 
     if 0:
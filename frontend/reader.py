@@ -24,6 +24,9 @@ class _Reader(object):
     self.arena = arena
     self.line_num = 1  # physical line numbers start from 1
 
+    self.file_id = -1  # for FileLineReader.SetBackingFile()
+    self.offset = 0
+
   def _GetLine(self):
     # type: () -> Optional[str]
     raise NotImplementedError()
@@ -35,7 +38,12 @@ class _Reader(object):
       eof_line = None  # type: Optional[str]
       return -1, eof_line, 0
 
-    line_id = self.arena.AddLine(line, self.line_num)
+    if self.file_id == -1:
+      line_id = self.arena.AddLine(line, self.line_num)
+    else:
+      line_id = self.arena.AddFileLine(line, self.line_num, self.file_id,
+                                       self.offset)
+      self.offset += len(line)
     self.line_num += 1
     return line_id, line, 0
 
@@ -79,6 +87,14 @@ class FileLineReader(_Reader):
     self.f = f
     self.last_line_hint = False
 
+  def SetBackingFile(self, file_id):
+    # type: (int) -> None
+    """Don't keep lines in memory; the arena can read them back from file_id.
+
+    The file must be read from the beginning.
+    """
+    self.file_id = file_id
+
   def _GetLine(self):
     # type: () -> Optional[str]
     line = self.f.readline()
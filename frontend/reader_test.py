@@ -4,10 +4,13 @@ reader_test.py: Tests for reader.py
 """
 
 import cStringIO
+import os
+import tempfile
 import unittest
 
 from _devbuild.gen.syntax_asdl import source
 from core import alloc
+from core import pyutil
 from core import test_lib
 from frontend import reader  # module under test
 
@@ -44,6 +47,40 @@ class ReaderTest(unittest.TestCase):
       self.assertEqual((1, 'two', 0), r.GetLine())
       self.assertEqual((-1, None, 0), r.GetLine())
 
+  def testBackingFile(self):
+    fd, path = tempfile.mkstemp()
+    os.write(fd, 'one\ntwo\nthree')
+    os.close(fd)
+
+    arena = test_lib.MakeArena('<reader_test.py>')
+    with open(path) as f:
+      r = reader.FileLineReader(f, arena)
+      abs_path, dev, ino = pyutil.BackingFile(path, f)
+      r.SetBackingFile(arena.AddBackingFile(abs_path, dev, ino))
+
+      self.assertEqual((0, 'one\n', 0), r.GetLine())
+      self.assertEqual((1, 'two\n', 0), r.GetLine())
+      self.assertEqual((2, 'three', 0), r.GetLine())
+      self.assertEqual((-1, None, 0), r.GetLine())
+
+    # Lines aren't kept in memory after the parser is done with them, but can
+    # be read back.
+    arena.ReleaseFileLines()
+    self.assertEqual([None, None, None], arena.line_vals)
+    self.assertEqual([2], arena.file_lines.keys())
+    self.assertEqual('one\n', arena.GetLine(0))
+    self.assertEqual('two\n', arena.GetLine(1))
+    self.assertEqual('three', arena.GetLine(2))
+    self.assertEqual(2, arena.GetLineNumber(1))
+
+    # The file was replaced
+    os.unlink(path)
+    self.assertEqual('', arena.GetLine(0))
+
+    # Not a regular file
+    with open('/dev/null') as f:
+      self.assertEqual(None, pyutil.BackingFile('/dev/null', f))
+
 
 if __name__ == '__main__':
   unittest.main()
@@ -7,6 +7,7 @@ This module is not used directly, but is combined with generated code.
 from _devbuild.gen.id_kind_asdl import Id
 from _devbuild.gen.hnode_asdl import hnode_t
 from asdl import runtime
+from oil_lang import expr_ops
 
 
 def _AbbreviateToken(tok, out):
@@ -137,4 +138,9 @@ def _expr__Const(obj):
 
   n2 = runtime.NewLeaf(tok.val, color_e.StringConst)
   out.append(n2)
+
+  # 2 ^ 3 is folded to (Const Id.Arith_Caret '2 ^ 3' =8)
+  if expr_ops.IsFolded(obj):
+    n3 = runtime.NewLeaf('=%r' % obj.val, color_e.OtherConst)
+    out.append(n3)
   return p_node
@@ -909,6 +909,11 @@ inline Writer* Stderr() {
   return gStderr;
 }
 
+// In Python this is array('i'); List<int> is already compact.
+inline List<int>* NewIntArray() {
+  return new List<int>();
+}
+
 }  // namespace mylib
 
 //
@@ -5,6 +5,7 @@ from __future__ import print_function
 
 import sys
 import cStringIO
+from array import array
 
 from typing import Any
 
@@ -96,3 +97,11 @@ class tagswitch(object):
 def iteritems(d):
   """Make translation a bit easier."""
   return d.iteritems()
+
+
+def NewIntArray():
+  """A compact List[int].  Use for long-lived columns of small integers.
+
+  It's List<int> in C++, which is already compact.
+  """
+  return array('i')
@@ -1,4 +1,4 @@
-from typing import IO, Any, Dict, Iterator, Tuple, TypeVar
+from typing import IO, Any, Dict, Iterator, List, Tuple, TypeVar
 
 CPP: bool
 PYTHON: bool
@@ -57,3 +57,5 @@ class tagswitch(object):
 K = TypeVar('K')
 V = TypeVar('V')
 def iteritems(d: Dict[K, V]) -> Iterator[Tuple[K, V]]: ...
+
+def NewIntArray() -> List[int]: ...
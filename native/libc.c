@@ -13,6 +13,7 @@
 #include <limits.h>
 #include <wchar.h>
 #include <stdlib.h>
+#include <string.h>  // strcmp, strdup
 #include <sys/ioctl.h>
 #include <locale.h>
 #include <fnmatch.h>
@@ -260,6 +261,82 @@ func_regex_parse(PyObject *self, PyObject *args) {
   }
 }
 
+// A small LRU cache of compiled regexes, keyed by the pattern string and the
+// regcomp() flags.  Without it, ${x//pat/rep} calls regcomp() once per match,
+// and [[ $x =~ $pat ]] in a loop recompiles the same pattern every time.
+//
+// The regex_t objects are owned by the cache.  Callers must not regfree()
+// them, and must not hold on to them across another call to
+// regex_cache_get().
+
+#define REGEX_CACHE_SIZE 64
+
+// Not a regcomp() flag.  It's part of the key because a regex compiled in the
+// user's LC_CTYPE isn't the same as one compiled in the C locale.
+#define REGEX_USER_LOCALE (1 << 16)
+
+typedef struct {
+  char* pattern;  // owned copy; NULL if the slot is empty
+  int flags;
+  unsigned long last_used;
+  regex_t compiled;
+} regex_cache_entry;
+
+static regex_cache_entry regex_cache[REGEX_CACHE_SIZE];
+static unsigned long regex_cache_clock = 0;
+
+// Returns a compiled regex, or NULL if regcomp() failed.  *result is set to
+// the return value of regcomp() on a cache miss, and 0 on a hit.
+static regex_t* regex_cache_get(const char* pattern, int flags, int* result) {
+  regex_cache_clock++;
+
+  regex_cache_entry* victim = &regex_cache[0];
+  int i;
+  for (i = 0; i < REGEX_CACHE_SIZE; ++i) {
+    regex_cache_entry* e = &regex_cache[i];
+    if (e->pattern == NULL) {
+      if (victim->pattern != NULL) {
+        victim = e;  // prefer an empty slot
+      }
+      continue;
+    }
+    if (e->flags == flags && strcmp(e->pattern, pattern) == 0) {
+      debug("regex cache hit: %s", pattern);
+      e->last_used = regex_cache_clock;
+      *result = 0;
+      return &e->compiled;
+    }
+    if (victim->pattern != NULL && e->last_used < victim->last_used) {
+      victim = e;  // least recently used
+    }
+  }
+
+  debug("regex cache miss: %s", pattern);
+
+  regex_t compiled;
+  *result = regcomp(&compiled, pattern, flags & ~REGEX_USER_LOCALE);
+  if (*result != 0) {
+    return NULL;  // don't cache errors
+  }
+
+  char* copy = strdup(pattern);
+  if (copy == NULL) {
+    regfree(&compiled);
+    *result = REG_ESPACE;
+    return NULL;
+  }
+
+  if (victim->pattern != NULL) {
+    free(victim->pattern);
+    regfree(&victim->compiled);
+  }
+  victim->pattern = copy;
+  victim->flags = flags;
+  victim->last_used = regex_cache_clock;
+  victim->compiled = compiled;
+  return &victim->compiled;
+}
+
 static PyObject *
 func_regex_match(PyObject *self, PyObject *args) {
   const char* pattern;
@@ -268,24 +345,24 @@ func_regex_match(PyObject *self, PyObject *args) {
     return NULL;
   }
 
-  regex_t pat;
-  if (regcomp(&pat, pattern, REG_EXTENDED) != 0) {
+  int result;
+  regex_t* pat = regex_cache_get(pattern, REG_EXTENDED, &result);
+  if (pat == NULL) {
     // When the regex contains a variable, it can't be checked at compile-time.
     PyErr_SetString(PyExc_RuntimeError, "Invalid regex syntax (func_regex_match)");
     return NULL;
   }
 
-  int outlen = pat.re_nsub + 1;
+  int outlen = pat->re_nsub + 1;
   PyObject *ret = PyList_New(outlen);
 
   if (ret == NULL) {
-    regfree(&pat);
     return NULL;
   }
 
   int match;
   regmatch_t *pmatch = (regmatch_t*) malloc(sizeof(regmatch_t) * outlen);
-  if (match = (regexec(&pat, str, outlen, pmatch, 0) == 0)) {
+  if (match = (regexec(pat, str, outlen, pmatch, 0) == 0)) {
     int i;
     for (i = 0; i < outlen; i++) {
       int len = pmatch[i].rm_eo - pmatch[i].rm_so;
@@ -295,9 +372,9 @@ func_regex_match(PyObject *self, PyObject *args) {
   }
 
   free(pmatch);
-  regfree(&pat);
 
   if (!match) {
+    Py_DECREF(ret);
     Py_RETURN_NONE;
   }
 
@@ -320,7 +397,6 @@ func_regex_first_group_match(PyObject *self, PyObject *args) {
     return NULL;
   }
 
-  regex_t pat;
   regmatch_t m[NMATCH];
 
   const char *old_locale = setlocale(LC_CTYPE, NULL);
@@ -333,7 +409,11 @@ func_regex_first_group_match(PyObject *self, PyObject *args) {
   // Could have been checked by regex_parse for [[ =~ ]], but not for glob
   // patterns like ${foo/x*/y}.
 
-  if (regcomp(&pat, pattern, REG_EXTENDED) != 0) {
+  int result;
+  regex_t* pat = regex_cache_get(pattern, REG_EXTENDED | REGEX_USER_LOCALE,
+                                 &result);
+  if (pat == NULL) {
+    setlocale(LC_CTYPE, old_locale);
     PyErr_SetString(PyExc_RuntimeError,
                     "Invalid regex syntax (func_regex_first_group_match)");
     return NULL;
@@ -342,8 +422,7 @@ func_regex_first_group_match(PyObject *self, PyObject *args) {
   debug("first_group_match pat %s str %s pos %d", pattern, str, pos);
 
   // Match at offset 'pos'
-  int result = regexec(&pat, str + pos, NMATCH, m, 0 /*flags*/);
-  regfree(&pat);
+  result = regexec(pat, str + pos, NMATCH, m, 0 /*flags*/);
 
   setlocale(LC_CTYPE, old_locale);
 
@@ -357,6 +436,176 @@ func_regex_first_group_match(PyObject *self, PyObject *args) {
   return Py_BuildValue("(i,i)", pos + start, pos + end);
 }
 
+// Simple growable output buffer for regex_replace_*.
+
+typedef struct {
+  char* data;
+  size_t len;
+  size_t cap;
+} out_buf;
+
+static int out_buf_append(out_buf* b, const char* s, size_t n) {
+  if (b->len + n > b->cap) {
+    size_t new_cap = b->cap ? b->cap : 64;
+    while (new_cap < b->len + n) {
+      new_cap *= 2;
+    }
+    char* new_data = (char*) realloc(b->data, new_cap);
+    if (new_data == NULL) {
+      return 0;
+    }
+    b->data = new_data;
+    b->cap = new_cap;
+  }
+  memcpy(b->data + b->len, s, n);
+  b->len += n;
+  return 1;
+}
+
+// Length of the UTF-8 character starting at s[0], for skipping past empty
+// matches.  Invalid bytes are treated as one character.
+static int utf8_char_len(const char* s, size_t remaining) {
+  size_t n = 1;
+  while (n < remaining && (s[n] & 0xC0) == 0x80) {
+    n++;
+  }
+  return n;
+}
+
+// For ${x//pat/rep}: replace every non-overlapping match of the regex in the
+// string.  The matching and concatenation are done here with a single output
+// buffer, rather than calling regex_first_group_match() once per match and
+// slicing the string in Python.
+//
+// Like bash, an empty match inserts the replacement and then copies one
+// character, so patterns that can match the empty string terminate.
+static PyObject *
+func_regex_replace_all(PyObject *self, PyObject *args) {
+  const char* pattern;
+  PyObject* str_obj;
+  const char* replacement;
+  int replacement_len;
+  if (!PyArg_ParseTuple(args, "sSs#", &pattern, &str_obj, &replacement,
+                        &replacement_len)) {
+    return NULL;
+  }
+  const char* str = PyString_AS_STRING(str_obj);
+  size_t n = PyString_GET_SIZE(str_obj);
+
+  const char *old_locale = setlocale(LC_CTYPE, NULL);
+  if (setlocale(LC_CTYPE, "") == NULL) {
+	  PyErr_SetString(PyExc_SystemError, "Invalid locale for LC_CTYPE");
+	  return NULL;
+  }
+
+  int result;
+  regex_t* pat = regex_cache_get(pattern, REG_EXTENDED | REGEX_USER_LOCALE,
+                                 &result);
+  if (pat == NULL) {
+    setlocale(LC_CTYPE, old_locale);
+    PyErr_SetString(PyExc_RuntimeError,
+                    "Invalid regex syntax (func_regex_replace_all)");
+    return NULL;
+  }
+
+  out_buf b = {NULL, 0, 0};
+  int ok = 1;
+  int num_matches = 0;
+  size_t pos = 0;  // where to match next
+  size_t copied = 0;  // how much of str is in the buffer
+  regmatch_t m[1];
+
+  while (pos < n) {
+    if (regexec(pat, str + pos, 1, m, 0 /*flags*/) != 0) {
+      break;  // no more matches
+    }
+    num_matches++;
+
+    size_t start = pos + m[0].rm_so;
+    size_t end = pos + m[0].rm_eo;
+    ok = ok && out_buf_append(&b, str + copied, start - copied);
+    ok = ok && out_buf_append(&b, replacement, replacement_len);
+
+    if (end == start && end < n) {  // empty match: move past one character
+      end += utf8_char_len(str + start, n - start);
+      ok = ok && out_buf_append(&b, str + start, end - start);
+    }
+    copied = end;
+    pos = end;
+  }
+
+  setlocale(LC_CTYPE, old_locale);
+
+  if (num_matches == 0) {
+    Py_INCREF(str_obj);  // return the same string
+    return str_obj;
+  }
+
+  ok = ok && out_buf_append(&b, str + copied, n - copied);
+  if (!ok) {
+    free(b.data);
+    return PyErr_NoMemory();
+  }
+  PyObject* ret = PyString_FromStringAndSize(b.data, b.len);
+  free(b.data);
+  return ret;
+}
+
+// For ${x/pat/rep}, and the anchored ${x/#pat/rep} and ${x/%pat/rep}: replace
+// the first match of the regex.  The caller anchors the regex with ^ or $.
+static PyObject *
+func_regex_replace_first(PyObject *self, PyObject *args) {
+  const char* pattern;
+  PyObject* str_obj;
+  const char* replacement;
+  int replacement_len;
+  if (!PyArg_ParseTuple(args, "sSs#", &pattern, &str_obj, &replacement,
+                        &replacement_len)) {
+    return NULL;
+  }
+  const char* str = PyString_AS_STRING(str_obj);
+  size_t n = PyString_GET_SIZE(str_obj);
+
+  const char *old_locale = setlocale(LC_CTYPE, NULL);
+  if (setlocale(LC_CTYPE, "") == NULL) {
+	  PyErr_SetString(PyExc_SystemError, "Invalid locale for LC_CTYPE");
+	  return NULL;
+  }
+
+  int result;
+  regex_t* pat = regex_cache_get(pattern, REG_EXTENDED | REGEX_USER_LOCALE,
+                                 &result);
+  if (pat == NULL) {
+    setlocale(LC_CTYPE, old_locale);
+    PyErr_SetString(PyExc_RuntimeError,
+                    "Invalid regex syntax (func_regex_replace_first)");
+    return NULL;
+  }
+
+  regmatch_t m[1];
+  result = regexec(pat, str, 1, m, 0 /*flags*/);
+
+  setlocale(LC_CTYPE, old_locale);
+
+  if (result != 0) {
+    Py_INCREF(str_obj);  // no match: return the same string
+    return str_obj;
+  }
+
+  size_t start = m[0].rm_so;
+  size_t end = m[0].rm_eo;
+  size_t out_len = start + replacement_len + (n - end);
+  PyObject* ret = PyString_FromStringAndSize(NULL, out_len);
+  if (ret == NULL) {
+    return NULL;
+  }
+  char* out = PyString_AS_STRING(ret);
+  memcpy(out, str, start);
+  memcpy(out + start, replacement, replacement_len);
+  memcpy(out + start + replacement_len, str + end, n - end);
+  return ret;
+}
+
 // We do this in C so we can remove '%f' % 0.1 from the CPython build.  That
 // involves dtoa.c and pystrod.c, which are thousands of lines of code.
 static PyObject *
@@ -427,6 +676,123 @@ func_wcswidth(PyObject *self, PyObject *args){
     return PyInt_FromLong(width);
 }
 
+// IFS splitting.  Walks the state machine in frontend/consts.py, which
+// osh/split.py flattens into two byte tables:
+//
+//   kinds: 256 bytes mapping each byte of the input to a char_kind
+//   edges: 2 bytes (new_state, emit) for each (state, char_kind) pair, at
+//          offset (state * IFS_NUM_KINDS + char_kind) * 2
+//
+// These integers must match the sum types in core/runtime.asdl.
+
+#define IFS_NUM_KINDS 6
+
+enum { SPAN_BLACK = 1, SPAN_DELIM = 2, SPAN_BACKSLASH = 3 };
+enum { EMIT_PART = 1, EMIT_DELIM = 2, EMIT_EMPTY = 3, EMIT_ESCAPE = 4,
+       EMIT_NOTHING = 5 };
+enum { ST_INVALID = 1, ST_START = 2, ST_DONE = 8 };
+enum { CH_DE_WHITE = 1, CH_SENTINEL = 5 };
+
+static int
+append_span(PyObject *spans, int span_type, int end) {
+  PyObject *span = Py_BuildValue("(ii)", span_type, end);
+  if (span == NULL) {
+    return -1;
+  }
+  int ret = PyList_Append(spans, span);
+  Py_DECREF(span);
+  return ret;
+}
+
+static PyObject *
+func_ifs_split(PyObject *self, PyObject *args) {
+  const unsigned char *s;
+  const unsigned char *kinds;
+  const unsigned char *edges;
+  int n, num_kinds, num_edges;
+
+  if (!PyArg_ParseTuple(args, "s#s#s#", &s, &n, &kinds, &num_kinds,
+                        &edges, &num_edges)) {
+    return NULL;
+  }
+  if (num_kinds != 256) {
+    PyErr_SetString(PyExc_ValueError, "kinds should have 256 bytes");
+    return NULL;
+  }
+  if (num_edges != (ST_DONE + 1) * IFS_NUM_KINDS * 2) {
+    PyErr_SetString(PyExc_ValueError, "edges has the wrong size");
+    return NULL;
+  }
+
+  PyObject *spans = PyList_New(0);
+  if (spans == NULL) {
+    return NULL;
+  }
+  if (n == 0) {
+    return spans;
+  }
+
+  // Ad hoc rule from POSIX: ignore leading whitespace.
+  int i = 0;
+  while (i < n && kinds[s[i]] == CH_DE_WHITE) {
+    i++;
+  }
+  if (i != 0 && append_span(spans, SPAN_DELIM, i) < 0) {
+    goto error;
+  }
+  if (i == n) {
+    return spans;
+  }
+
+  int state = ST_START;
+  while (state != ST_DONE) {
+    int ch = (i < n) ? kinds[s[i]] : CH_SENTINEL;
+    const unsigned char *edge = edges + (state * IFS_NUM_KINDS + ch) * 2;
+    int new_state = edge[0];
+    if (new_state == ST_INVALID) {
+      PyErr_Format(PyExc_AssertionError,
+                   "Invalid transition from %d with %d", state, ch);
+      goto error;
+    }
+
+    int ok = 0;
+    switch (edge[1]) {
+    case EMIT_PART:
+      ok = append_span(spans, SPAN_BLACK, i);
+      break;
+    case EMIT_DELIM:
+      ok = append_span(spans, SPAN_DELIM, i);
+      break;
+    case EMIT_EMPTY:
+      // ignored delimiter, then an EMPTY part that is NOT ignored
+      ok = append_span(spans, SPAN_DELIM, i);
+      if (ok == 0) {
+        ok = append_span(spans, SPAN_BLACK, i);
+      }
+      break;
+    case EMIT_ESCAPE:
+      ok = append_span(spans, SPAN_BACKSLASH, i);
+      break;
+    case EMIT_NOTHING:
+      break;
+    default:
+      PyErr_Format(PyExc_AssertionError, "Invalid action %d", edge[1]);
+      goto error;
+    }
+    if (ok < 0) {
+      goto error;
+    }
+
+    state = new_state;
+    i++;
+  }
+  return spans;
+
+error:
+  Py_DECREF(spans);
+  return NULL;
+}
+
 #ifdef OVM_MAIN
 #include "native/libc.c/methods.def"
 #else
@@ -454,6 +820,14 @@ static PyMethodDef methods[] = {
   // the regex is invalid.
   {"regex_first_group_match", func_regex_first_group_match, METH_VARARGS, ""},
 
+  // Replace all matches of a regex in a string.  Returns a new string.
+  // Raises RuntimeError if the regex is invalid.
+  {"regex_replace_all", func_regex_replace_all, METH_VARARGS, ""},
+
+  // Replace the first match of a regex in a string.  Returns a new string.
+  // Raises RuntimeError if the regex is invalid.
+  {"regex_replace_first", func_regex_replace_first, METH_VARARGS, ""},
+
   // "Print three floating point values for the 'time' builtin.
   {"print_time", func_print_time, METH_VARARGS, ""},
 
@@ -464,6 +838,10 @@ static PyMethodDef methods[] = {
 
   // Get the display width of a string. Throw an exception if the string is invalid UTF8.
   {"wcswidth", func_wcswidth, METH_VARARGS, ""},
+
+  // Split a string with tables from osh/split.py.  Returns a list of
+  // (span_t, end_index) pairs, like IfsSplitter.Split().
+  {"ifs_split", func_ifs_split, METH_VARARGS, ""},
   {NULL, NULL},
 };
 #endif
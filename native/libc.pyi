@@ -5,6 +5,9 @@ def glob(pat: str) -> List[str]: ...
 def fnmatch(pat: str, s: str) -> bool: ...
 def regex_first_group_match(regex: str, s: str, pos: int) -> Optional[Tuple[int, int]]: ...
 def regex_match(regex: str, s: str) -> List[str]: ...
+def regex_replace_all(regex: str, s: str, replacement: str) -> str: ...
+def regex_replace_first(regex: str, s: str, replacement: str) -> str: ...
 def wcswidth(s: str) -> int: ...
 def get_terminal_width() -> int: ...
 def print_time(real: float, user: float, sys: float) -> None: ...
+def ifs_split(s: str, kinds: str, edges: str) -> List[Tuple[int, int]]: ...
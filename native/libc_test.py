@@ -169,12 +169,68 @@ class LibcTest(unittest.TestCase):
     self.assertRaises(
         RuntimeError, libc.regex_first_group_match, r'*', 'abcd', 0)
 
+  def testRegexCache(self):
+    # More patterns than fit in the cache, so some are evicted and compiled
+    # again.
+    for i in xrange(3):
+      for j in xrange(200):
+        pat = '(x{%d})' % (j + 1)
+        self.assertEqual((1, 2 + j), libc.regex_first_group_match(pat, 'o' + 'x' * (j + 1), 0))
+        self.assertEqual(['x' * (j + 1)] * 2, libc.regex_match(pat, 'x' * (j + 1)))
+
+    # Errors aren't cached
+    for i in xrange(3):
+      self.assertRaises(RuntimeError, libc.regex_match, r'*', 'abcd')
+      self.assertRaises(
+          RuntimeError, libc.regex_first_group_match, r'*', 'abcd', 0)
+
+  def testRegexReplaceAll(self):
+    s = 'oXooXoooX'
+
+    self.assertEqual('o_o_ooX', libc.regex_replace_all('(X.)', s, '_'))
+    # No match
+    self.assertEqual(s, libc.regex_replace_all('(z)', s, '_'))
+    self.assertEqual('', libc.regex_replace_all('(z)', '', '_'))
+    # Matches the whole string
+    self.assertEqual('_', libc.regex_replace_all('(.*)', s, '_'))
+
+    # Empty matches make progress, like bash
+    self.assertEqual('zbzbzb', libc.regex_replace_all('(a*)', 'bbb', 'z'))
+    self.assertEqual('zbzzb', libc.regex_replace_all('(a*)', 'bab', 'z'))
+
+    # Longer replacement, many matches
+    big = 'ab' * 50000
+    self.assertEqual('xyzb' * 50000, libc.regex_replace_all('(a)', big, 'xyz'))
+
+    self.assertRaises(RuntimeError, libc.regex_replace_all, r'*', s, '_')
+
+  def testRegexReplaceFirst(self):
+    s = 'oXooXoooX'
+
+    self.assertEqual('o_oXoooX', libc.regex_replace_first('(X.)', s, '_'))
+    self.assertEqual('_XooXoooX', libc.regex_replace_first('^(o)', s, '_'))
+    self.assertEqual('oXooXooo_', libc.regex_replace_first('(X)$', s, '_'))
+    # No match
+    self.assertEqual(s, libc.regex_replace_first('^(X)', s, '_'))
+
+    self.assertRaises(RuntimeError, libc.regex_replace_first, r'*', s, '_')
+
   def testRegexFirstGroupMatchError(self):
     # Helping to debug issue #291
     s = ''
     if 0:
       libc.regex_first_group_match("(['+-'])", s, 6)
 
+  def testIfsSplit(self):
+    # Tables are built by osh/split.py; see split_test.py for the semantics.
+    self.assertRaises(ValueError, libc.ifs_split, 'a b', 'x' * 10, 'x' * 108)
+    self.assertRaises(ValueError, libc.ifs_split, 'a b', 'x' * 256, 'x' * 10)
+
+    # Every byte is white, so the whole string is one leading delimiter
+    white = chr(1) * 256
+    self.assertEqual([], libc.ifs_split('', white, 'x' * 108))
+    self.assertEqual([(2, 3)], libc.ifs_split('   ', white, 'x' * 108))
+
   def testRealpathFailOnNonexistentDirectory(self):
     # This behaviour is actually inconsistent with GNU readlink,
     # but matches behaviour of busybox readlink
@@ -11,6 +11,10 @@ environ = ...  # type: Dict[str, str]
 pathconf_names = ...  # type: Dict[str, int]
 sysconf_names = ...  # type: Dict[str, int]
 
+DT_DIR = ...  # type: int
+DT_LNK = ...  # type: int
+DT_REG = ...  # type: int
+DT_UNKNOWN = ...  # type: int
 EX_CANTCREAT = ...  # type: int
 EX_CONFIG = ...  # type: int
 EX_DATAERR = ...  # type: int
@@ -119,6 +123,8 @@ def fdatasync(fd: int) -> None: ...
 def fdopen(fd: int, mode: str = ..., bufsize: int = ...) -> mylib.LineReader: ...
 def fork() -> int:
     raise OSError()
+def spawn(path: str, argv: List[str], env: Dict[str, str], sigdefault: List[int]) -> int:
+    raise OSError()
 def forkpty() -> Tuple[int, int]:
     raise OSError()
 def fpathconf(fd: int, name: str) -> None: ...
@@ -145,13 +151,15 @@ def getsid(pid: int) -> int: ...
 def getuid() -> int: ...
 def initgroups(username: str, gid: int) -> None: ...
 def isatty(fd: int) -> bool: ...
+def input_pending(fd: int) -> bool: ...
 def kill(pid: int, sig: int) -> None: ...
 def killpg(pgid: int, sig: int) -> None: ...
 def lchown(path: unicode, uid: int, gid: int) -> None: ...
 def link(source: unicode, link_name: str) -> None: ...
 _T = TypeVar("_T")
 def listdir(path: _T) -> List[_T]: ...
-def lseek(fd: int, pos: int, how: int) -> None: ...
+def scandir(path: str) -> List[Tuple[str, int]]: ...
+def lseek(fd: int, pos: int, how: int) -> int: ...
 def lstat(path: unicode) -> stat_result: ...
 def major(device: int) -> int: ...
 def makedev(major: int, minor: int) -> int: ...
@@ -163,10 +171,13 @@ def nice(increment: int) -> int: ...
 def open(file: unicode, flags: int, mode: int = ...) -> int: ...
 def openpty() -> Tuple[int, int]: ...
 def pathconf(path: unicode, name: str) -> str: ...
+def pidfd_poll(pids: List[int], timeout_ms: int) -> List[int]:
+    raise OSError()
 def pipe() -> Tuple[int, int]: ...
 def popen(command: str, mode: str = ..., bufsize: int = ...) -> IO[str]: ...
 def putenv(varname: str, value: str) -> None: ...
 def read(fd: int, n: int) -> str: ...
+def read_all(fd: int, strip_newlines: bool) -> str: ...
 def readlink(path: _T) -> _T: ...
 def remove(path: unicode) -> None: ...
 def rename(src: unicode, dst: unicode) -> None: ...
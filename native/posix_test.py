@@ -28,6 +28,7 @@ Other notes:
 """
 from __future__ import print_function
 
+import errno
 import signal
 import subprocess
 import unittest
@@ -43,8 +44,11 @@ FUNCS = [
     "chdir",
     "getcwd",
     "listdir",
+    "scandir",
     "lstat",
     "readlink",
+    "rename",
+    "unlink",
     "stat",
     "umask",
     "uname",
@@ -52,17 +56,23 @@ FUNCS = [
     "execv",
     "execve",
     "fork",
+    "spawn",
     "geteuid",
     "getpid",
     "getuid",
     "wait",
+    "pidfd_poll",
     "open",
     "close",
     "dup2",
+    "lseek",
     "read",
+    "read_all",
     "write",
+    "fstat",
     "fdopen",
     "isatty",
+    "input_pending",
     "pipe",
     "strerror",
     "WIFSIGNALED",
@@ -101,6 +111,28 @@ class PosixTest(unittest.TestCase):
     posix_.read(0, 0)
     posix_.write(1, '')
 
+  def testLseek(self):
+    path = '_tmp/posix_lseek.txt'
+    with open(path, 'w') as f:
+      f.write('0123456789')
+
+    fd = posix_.open(path, posix_.O_RDONLY, 0)
+    self.assertEqual('0123', posix_.read(fd, 4))
+    self.assertEqual(2, posix_.lseek(fd, -2, 1))  # SEEK_CUR
+    self.assertEqual('23', posix_.read(fd, 2))
+    self.assertEqual(10, posix_.fstat(fd).st_size)
+    posix_.close(fd)
+
+    r, w = posix_.pipe()
+    try:
+      posix_.lseek(r, 0, 1)
+    except OSError as e:
+      self.assertEqual(errno.ESPIPE, e.errno)
+    else:
+      self.fail('Expected ESPIPE')
+    posix_.close(r)
+    posix_.close(w)
+
   def testRead(self):
     if posix_.environ.get('EINTR_TEST'):
       # Now we can do kill -TERM PID can get EINTR.
@@ -110,6 +142,90 @@ class PosixTest(unittest.TestCase):
       log('Hanging on read in pid %d', posix_.getpid())
       posix_.read(0, 1)
 
+  def testSpawn(self):
+    r, w = posix_.pipe()
+    pid = posix_.spawn(
+        '/bin/sh', ['sh', '-c', 'echo "$FOO" >&%d; exit 3' % w],
+        {'FOO': 'bar'}, [signal.SIGPIPE])
+    posix_.close(w)
+    self.assertEqual('bar\n', posix_.read(r, 100))
+    posix_.close(r)
+
+    _, status = posix_.waitpid(pid, 0)
+    self.assertEqual(3, posix_.WEXITSTATUS(status))
+
+    try:
+      posix_.spawn('/nonexistent', ['nonexistent'], {}, [])
+    except OSError as e:
+      self.assertEqual(errno.ENOENT, e.errno)
+    else:
+      self.fail('Expected OSError')
+
+  def testReadAll(self):
+    # Bigger than the pipe buffer, so the writer and reader take turns.
+    big = 'x' * 1000000
+    for s, strip, expected in [
+        ('', True, ''),
+        ('\n\n', True, ''),
+        ('a\nb\n\n', True, 'a\nb'),
+        ('a\nb\n\n', False, 'a\nb\n\n'),
+        (big + '\n', True, big),
+        ]:
+      r, w = posix_.pipe()
+      pid = posix_.fork()
+      if pid == 0:
+        posix_.close(r)
+        while s:
+          n = posix_.write(w, s)
+          s = s[n:]
+        posix_._exit(0)
+
+      posix_.close(w)
+      self.assertEqual(expected, posix_.read_all(r, strip))
+      posix_.close(r)
+      posix_.waitpid(pid, 0)
+
+    self.assertRaises(OSError, posix_.read_all, -1, True)
+
+  def testInputPending(self):
+    r, w = posix_.pipe()
+    self.assertEqual(False, posix_.input_pending(r))
+    posix_.write(w, 'x')
+    self.assertEqual(True, posix_.input_pending(r))
+    posix_.close(r)
+    posix_.close(w)
+
+    self.assertRaises(TypeError, posix_.input_pending, 'x')
+
+  def testPidfdPoll(self):
+    fast = posix_.spawn('/bin/sh', ['sh', '-c', 'exit 0'], {}, [])
+    slow = posix_.spawn('/bin/sh', ['sh', '-c', 'sleep 5'], {}, [])
+
+    # Only the fast one exits
+    self.assertEqual([fast], posix_.pidfd_poll([fast, slow], 2000))
+    _, status = posix_.waitpid(fast, 0)
+    self.assertEqual(0, posix_.WEXITSTATUS(status))
+
+    # Timeout
+    self.assertEqual([], posix_.pidfd_poll([slow], 10))
+
+    posix_.kill(slow, signal.SIGTERM)
+    self.assertEqual([slow], posix_.pidfd_poll([slow], -1))
+    posix_.waitpid(slow, 0)
+
+    # Already reaped
+    self.assertRaises(OSError, posix_.pidfd_poll, [slow], 0)
+
+  def testScandir(self):
+    entries = dict(posix_.scandir('native'))
+    self.assertEqual(sorted(posix_.listdir('native')), sorted(entries))
+    self.assertEqual(posix_.DT_REG, entries['posixmodule.c'])
+
+    entries = dict(posix_.scandir('.'))
+    self.assertEqual(posix_.DT_DIR, entries['native'])
+
+    self.assertRaises(OSError, posix_.scandir, '/nonexistent')
+
   def testWait(self):
     if posix_.environ.get('EINTR_TEST'):
       # Now we can do kill -TERM PID can get EINTR.
@@ -48,6 +48,17 @@ corresponding Unix manual entries for more information on calls.");
 #include <signal.h>
 #endif
 
+/* OVM_MAIN: For posix_spawn() */
+#include <spawn.h>
+
+/* OVM_MAIN: For FIONREAD in posix_read_all() */
+#include <sys/ioctl.h>
+
+/* OVM_MAIN: For pidfd_open() in posix_pidfd_poll() */
+#include <poll.h>
+#include <sys/syscall.h>
+#include <time.h>
+
 #ifdef HAVE_FCNTL_H
 #include <fcntl.h>
 #endif /* HAVE_FCNTL_H */
@@ -937,6 +948,86 @@ posix_listdir(PyObject *self, PyObject *args)
     return d;
 }  /* end of posix_listdir */
 
+/* OVM_MAIN: Like listdir(), but also return the type of each entry, so
+   completion doesn't have to stat() every file to find directories.
+
+   scandir(path) -> list of (name, d_type)
+
+   d_type is one of DT_DIR, DT_REG, DT_LNK, etc., or DT_UNKNOWN on file
+   systems that don't fill it in.  The caller has to stat() those, and
+   symlinks.
+*/
+static PyObject *
+posix_scandir(PyObject *self, PyObject *args)
+{
+    char *name = NULL;
+    PyObject *d, *v;
+    DIR *dirp;
+    struct dirent *ep;
+
+    if (!PyArg_ParseTuple(args, "et:scandir", Py_FileSystemDefaultEncoding,
+                          &name))
+        return NULL;
+    Py_BEGIN_ALLOW_THREADS
+    dirp = opendir(name);
+    Py_END_ALLOW_THREADS
+    if (dirp == NULL) {
+        return posix_error_with_allocated_filename(name);
+    }
+    if ((d = PyList_New(0)) == NULL) {
+        Py_BEGIN_ALLOW_THREADS
+        closedir(dirp);
+        Py_END_ALLOW_THREADS
+        PyMem_Free(name);
+        return NULL;
+    }
+    for (;;) {
+        errno = 0;
+        Py_BEGIN_ALLOW_THREADS
+        ep = readdir(dirp);
+        Py_END_ALLOW_THREADS
+        if (ep == NULL) {
+            if (errno == 0) {
+                break;
+            } else {
+                Py_BEGIN_ALLOW_THREADS
+                closedir(dirp);
+                Py_END_ALLOW_THREADS
+                Py_DECREF(d);
+                return posix_error_with_allocated_filename(name);
+            }
+        }
+        if (ep->d_name[0] == '.' &&
+            (NAMLEN(ep) == 1 ||
+             (ep->d_name[1] == '.' && NAMLEN(ep) == 2)))
+            continue;
+#ifdef _DIRENT_HAVE_D_TYPE
+        v = Py_BuildValue("(s#i)", ep->d_name, (int)NAMLEN(ep),
+                          (int)ep->d_type);
+#else
+        v = Py_BuildValue("(s#i)", ep->d_name, (int)NAMLEN(ep), 0);
+#endif
+        if (v == NULL) {
+            Py_DECREF(d);
+            d = NULL;
+            break;
+        }
+        if (PyList_Append(d, v) != 0) {
+            Py_DECREF(v);
+            Py_DECREF(d);
+            d = NULL;
+            break;
+        }
+        Py_DECREF(v);
+    }
+    Py_BEGIN_ALLOW_THREADS
+    closedir(dirp);
+    Py_END_ALLOW_THREADS
+    PyMem_Free(name);
+
+    return d;
+}
+
 PyDoc_STRVAR_remove(posix_mkdir__doc__,
 "mkdir(path [, mode=0777])\n\n\
 Create a directory.");
@@ -1319,6 +1410,116 @@ posix_fork(PyObject *self, PyObject *noargs)
 }
 #endif
 
+/* OVM_MAIN: Start an external program without fork()ing the interpreter.
+   Copying the page tables of a big heap is the dominant cost of running
+   short-lived commands like ls and sed; posix_spawn() uses vfork() or
+   clone(CLONE_VM).
+
+   spawn(path, argv, env, sigdefault) -> pid
+
+     path: path of executable file
+     argv: list of arguments
+     env: dictionary of strings mapping to strings
+     sigdefault: list of signal numbers to reset to SIG_DFL in the child
+
+   Raises OSError if the program couldn't be started. */
+
+static PyObject *
+posix_spawn_(PyObject *self, PyObject *args)
+{
+    char *path;
+    PyObject *argv, *env, *sigdefault;
+    char **argvlist = NULL;
+    char **envlist = NULL;
+    PyObject *key, *val;
+    Py_ssize_t i, pos, argc, envc = 0;
+    posix_spawnattr_t attr;
+    sigset_t sigs;
+    pid_t pid;
+    int err;
+    PyObject *result = NULL;
+
+    if (!PyArg_ParseTuple(args, "sO!O!O!:spawn", &path,
+                          &PyList_Type, &argv, &PyDict_Type, &env,
+                          &PyList_Type, &sigdefault))
+        return NULL;
+
+    argc = PyList_GET_SIZE(argv);
+    argvlist = PyMem_NEW(char *, argc + 1);
+    if (argvlist == NULL)
+        return PyErr_NoMemory();
+    for (i = 0; i < argc; i++) {
+        if (!PyArg_Parse(PyList_GET_ITEM(argv, i),
+                         "s;spawn() arg 2 must contain only strings",
+                         &argvlist[i]))
+            goto fail_1;
+    }
+    argvlist[argc] = NULL;
+
+    envlist = PyMem_NEW(char *, PyDict_Size(env) + 1);
+    if (envlist == NULL) {
+        PyErr_NoMemory();
+        goto fail_1;
+    }
+    pos = 0;
+    while (PyDict_Next(env, &pos, &key, &val)) {
+        char *p, *k, *v;
+        size_t len;
+
+        if (!PyArg_Parse(key, "s;spawn() arg 3 contains a non-string key",
+                         &k) ||
+            !PyArg_Parse(val, "s;spawn() arg 3 contains a non-string value",
+                         &v))
+            goto fail_2;
+
+        len = PyString_Size(key) + PyString_Size(val) + 2;
+        p = PyMem_NEW(char, len);
+        if (p == NULL) {
+            PyErr_NoMemory();
+            goto fail_2;
+        }
+        PyOS_snprintf(p, len, "%s=%s", k, v);
+        envlist[envc++] = p;
+    }
+    envlist[envc] = NULL;
+
+    sigemptyset(&sigs);
+    for (i = 0; i < PyList_GET_SIZE(sigdefault); i++) {
+        long sig = PyInt_AsLong(PyList_GET_ITEM(sigdefault, i));
+        if (sig == -1 && PyErr_Occurred())
+            goto fail_2;
+        sigaddset(&sigs, (int)sig);
+    }
+
+    err = posix_spawnattr_init(&attr);
+    if (err == 0)
+        err = posix_spawnattr_setsigdefault(&attr, &sigs);
+    if (err == 0)
+        err = posix_spawnattr_setflags(&attr, POSIX_SPAWN_SETSIGDEF);
+    if (err == 0) {
+        Py_BEGIN_ALLOW_THREADS
+        err = posix_spawn(&pid, path, NULL, &attr, argvlist, envlist);
+        Py_END_ALLOW_THREADS
+    }
+    posix_spawnattr_destroy(&attr);
+
+    if (err != 0) {
+        errno = err;
+        posix_error();
+    } else {
+        result = PyLong_FromPid(pid);
+    }
+
+  fail_2:
+    while (--envc >= 0)
+        PyMem_DEL(envlist[envc]);
+    PyMem_DEL(envlist);
+  fail_1:
+    /* The argv strings are borrowed from the list */
+    PyMem_DEL(argvlist);
+    return result;
+}
+
 #ifdef HAVE_GETEGID
 PyDoc_STRVAR_remove(posix_getegid__doc__,
 "getegid() -> egid\n\n\
@@ -1723,6 +1924,120 @@ posix_waitpid(PyObject *self, PyObject *args)
 }
 #endif /* HAVE_WAITPID */
 
+/* OVM_MAIN: Wait for any of the given child processes to exit, with a
+   timeout in milliseconds.  A negative timeout waits forever.
+
+   pidfd_poll(pids, timeout_ms) -> list of PIDs that exited
+
+   An empty list means the timeout expired.  The processes aren't reaped; the
+   caller does that with waitpid().  Unlike waitpid(-1), this waits for a
+   subset of children, and it doesn't need a SIGCHLD handler.
+
+   Raises OSError with ENOSYS on kernels without pidfd_open() (before 5.3).
+*/
+static PyObject *
+posix_pidfd_poll(PyObject *self, PyObject *args)
+{
+    PyObject *pid_list;
+    int timeout_ms;
+
+    if (!PyArg_ParseTuple(args, "O!i:pidfd_poll", &PyList_Type, &pid_list,
+                          &timeout_ms))
+        return NULL;
+
+#ifndef SYS_pidfd_open
+    errno = ENOSYS;
+    return posix_error();
+#else
+    Py_ssize_t n = PyList_GET_SIZE(pid_list);
+    Py_ssize_t i;
+    Py_ssize_t num_open = 0;
+    PyObject *result = NULL;
+    struct pollfd *fds;
+    struct timespec deadline;
+    int remaining = timeout_ms;
+    int r;
+
+    fds = PyMem_New(struct pollfd, n > 0 ? n : 1);
+    if (fds == NULL) {
+        return PyErr_NoMemory();
+    }
+    for (i = 0; i < n; ++i) {
+        long pid = PyInt_AsLong(PyList_GET_ITEM(pid_list, i));
+        int fd;
+        if (pid == -1 && PyErr_Occurred()) {
+            goto done;
+        }
+        fd = syscall(SYS_pidfd_open, (pid_t)pid, 0);
+        if (fd < 0) {
+            posix_error();
+            goto done;
+        }
+        fds[i].fd = fd;
+        fds[i].events = POLLIN;  /* readable when the process exits */
+        fds[i].revents = 0;
+        num_open++;
+    }
+
+    if (timeout_ms >= 0) {
+        clock_gettime(CLOCK_MONOTONIC, &deadline);
+        deadline.tv_sec += timeout_ms / 1000;
+        deadline.tv_nsec += (long)(timeout_ms % 1000) * 1000000;
+        if (deadline.tv_nsec >= 1000000000) {
+            deadline.tv_sec++;
+            deadline.tv_nsec -= 1000000000;
+        }
+    }
+
+    while (1) {
+        Py_BEGIN_ALLOW_THREADS
+        r = poll(fds, n, remaining);
+        Py_END_ALLOW_THREADS
+
+        if (r >= 0) {
+            break;
+        }
+        if (PyErr_CheckSignals()) {
+            goto done;  /* Propagate KeyboardInterrupt */
+        }
+        if (errno != EINTR) {
+            posix_error();
+            goto done;
+        }
+        /* Try again on EINTR, with the time that's left. */
+        if (timeout_ms >= 0) {
+            struct timespec now;
+            long ms;
+            clock_gettime(CLOCK_MONOTONIC, &now);
+            ms = (deadline.tv_sec - now.tv_sec) * 1000 +
+                 (deadline.tv_nsec - now.tv_nsec) / 1000000;
+            remaining = ms > 0 ? (int)ms : 0;
+        }
+    }
+
+    result = PyList_New(0);
+    if (result == NULL) {
+        goto done;
+    }
+    for (i = 0; i < n; ++i) {
+        if (fds[i].revents != 0) {
+            PyObject *pid = PyList_GET_ITEM(pid_list, i);
+            if (PyList_Append(result, pid) < 0) {
+                Py_CLEAR(result);
+                goto done;
+            }
+        }
+    }
+
+done:
+    for (i = 0; i < num_open; ++i) {
+        close(fds[i].fd);
+    }
+    PyMem_Free(fds);
+    return result;
+#endif
+}
+
 #ifdef HAVE_WAIT
 PyDoc_STRVAR_remove(posix_wait__doc__,
 "wait() -> (pid, status)\n\n\
@@ -2068,6 +2383,29 @@ posix_dup2(PyObject *self, PyObject *args)
 }
 
 
+PyDoc_STRVAR_remove(posix_lseek__doc__,
+"lseek(fd, pos, how) -> newpos\n\n\
+Set the current position of a file descriptor.");
+
+static PyObject *
+posix_lseek(PyObject *self, PyObject *args)
+{
+    int fd, how;
+    PY_LONG_LONG pos;
+    off_t res;
+    if (!PyArg_ParseTuple(args, "iLi:lseek", &fd, &pos, &how))
+        return NULL;
+    if (!_PyVerify_fd(fd))
+        return posix_error();
+    Py_BEGIN_ALLOW_THREADS
+    res = lseek(fd, (off_t)pos, how);
+    Py_END_ALLOW_THREADS
+    if (res < 0)
+        return posix_error();
+    return PyLong_FromLongLong((PY_LONG_LONG)res);
+}
+
+
 PyDoc_STRVAR_remove(posix_read__doc__,
 "read(fd, buffersize) -> string\n\n\
 Read a file descriptor.");
@@ -2114,6 +2452,90 @@ posix_read(PyObject *self, PyObject *args)
     return buffer;
 }
 
+/* OVM_MAIN: Read until EOF into one growing string, for command
+   substitution.  Reading into a list of small chunks and joining them copies
+   the output several times.
+
+   read_all(fd, strip_newlines) -> string
+
+   If strip_newlines is true, trailing newlines are removed, like $(echo hi).
+*/
+
+#define READ_ALL_INITIAL 65536
+
+static PyObject *
+posix_read_all(PyObject *self, PyObject *args)
+{
+    int fd, strip_newlines;
+    Py_ssize_t cap, len = 0;
+    ssize_t n;
+    PyObject *buffer;
+
+    if (!PyArg_ParseTuple(args, "ii:read_all", &fd, &strip_newlines))
+        return NULL;
+    if (!_PyVerify_fd(fd))
+        return posix_error();
+
+    /* Start with enough room to drain a full pipe in one read(). */
+    cap = READ_ALL_INITIAL;
+#ifdef F_GETPIPE_SZ
+    {
+        int pipe_size = fcntl(fd, F_GETPIPE_SZ);
+        if (pipe_size > cap)
+            cap = pipe_size;
+    }
+#endif
+    buffer = PyString_FromStringAndSize((char *)NULL, cap);
+    if (buffer == NULL)
+        return NULL;
+
+    while (1) {
+        if (len == cap) {
+            /* Grow by at least the number of bytes that are ready, and at
+               least double, so there are O(log n) reallocs. */
+            Py_ssize_t new_cap = cap * 2;
+#ifdef FIONREAD
+            int avail = 0;
+            if (ioctl(fd, FIONREAD, &avail) == 0 && len + avail > new_cap)
+                new_cap = len + avail;
+#endif
+            if (_PyString_Resize(&buffer, new_cap) < 0)
+                return NULL;  /* buffer was freed */
+            cap = new_cap;
+        }
+
+        Py_BEGIN_ALLOW_THREADS
+        n = read(fd, PyString_AS_STRING(buffer) + len, cap - len);
+        Py_END_ALLOW_THREADS
+
+        if (n > 0) {
+            len += n;
+        } else if (n == 0) {  /* EOF */
+            break;
+        } else {
+            if (errno != EINTR) {
+                Py_DECREF(buffer);
+                return posix_error();
+            }
+            /* Retry on EINTR, but propagate KeyboardInterrupt. */
+            if (PyErr_CheckSignals()) {
+                Py_DECREF(buffer);
+                return NULL;
+            }
+        }
+    }
+
+    if (strip_newlines) {
+        char *p = PyString_AS_STRING(buffer);
+        while (len > 0 && p[len - 1] == '\n')
+            len--;
+    }
+    /* Shrinking realloc() of a big block doesn't copy it. */
+    if (len != cap && _PyString_Resize(&buffer, len) < 0)
+        return NULL;
+    return buffer;
+}
+
 
 PyDoc_STRVAR_remove(posix_write__doc__,
 "write(fd, string) -> byteswritten\n\n\
@@ -2287,6 +2709,30 @@ posix_isatty(PyObject *self, PyObject *args)
     return PyBool_FromLong(isatty(fd));
 }
 
+/* OVM_MAIN: Is there input to read on fd right now?  Doesn't block.
+
+   input_pending(fd) -> bool
+
+   Used to cancel a slow completion when the user presses a key.  The terminal
+   is in non-canonical mode then, so a single keypress makes stdin readable.
+*/
+static PyObject *
+posix_input_pending(PyObject *self, PyObject *args)
+{
+    struct pollfd pfd;
+    int r;
+
+    if (!PyArg_ParseTuple(args, "i:input_pending", &pfd.fd))
+        return NULL;
+    pfd.events = POLLIN;
+    pfd.revents = 0;
+
+    r = poll(&pfd, 1, 0);
+    if (r < 0)
+        return posix_error();
+    return PyBool_FromLong(r > 0 && (pfd.revents & POLLIN));
+}
+
 #ifdef HAVE_PIPE
 PyDoc_STRVAR_remove(posix_pipe__doc__,
 "pipe() -> (read_end, write_end)\n\n\
@@ -2672,6 +3118,19 @@ all_ins(PyObject *d)
 #ifdef O_EXCL
     if (ins(d, "O_EXCL", (long)O_EXCL)) return -1;
 #endif
+
+    /* OVM_MAIN: for scandir() */
+#ifdef _DIRENT_HAVE_D_TYPE
+    if (ins(d, "DT_UNKNOWN", (long)DT_UNKNOWN)) return -1;
+    if (ins(d, "DT_DIR", (long)DT_DIR)) return -1;
+    if (ins(d, "DT_REG", (long)DT_REG)) return -1;
+    if (ins(d, "DT_LNK", (long)DT_LNK)) return -1;
+#else
+    if (ins(d, "DT_UNKNOWN", 0)) return -1;
+    if (ins(d, "DT_DIR", -1)) return -1;
+    if (ins(d, "DT_REG", -1)) return -1;
+    if (ins(d, "DT_LNK", -1)) return -1;
+#endif
 #ifdef O_TRUNC
     if (ins(d, "O_TRUNC", (long)O_TRUNC)) return -1;
 #endif
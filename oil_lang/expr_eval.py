@@ -4,7 +4,9 @@ expr_eval.py
 """
 from __future__ import print_function
 
-from _devbuild.gen.id_kind_asdl import Id, Kind
+import operator
+
+from _devbuild.gen.id_kind_asdl import Id, Id_t, Kind
 from _devbuild.gen.syntax_asdl import (
     expr_e, expr_t, re, re_e, re_t, class_literal_term, class_literal_term_e,
     place_expr_e, place_expr_t,
@@ -15,6 +17,7 @@ from _devbuild.gen.runtime_asdl import (
 from core.util import e_die
 from core.util import log
 from frontend import consts
+from oil_lang import expr_ops
 from oil_lang import objects
 from osh import braces
 from core import state
@@ -23,13 +26,22 @@ from osh import word_eval
 
 import libc
 
-from typing import Any, Dict, Optional, List, Union, Tuple, TYPE_CHECKING
+from typing import (
+    Any, Callable, Dict, Optional, List, Union, Tuple, TYPE_CHECKING
+)
 
 if TYPE_CHECKING:
   from _devbuild.gen.runtime_asdl import (
       lvalue_t, lvalue__Named, lvalue__ObjIndex, lvalue__ObjAttr,
   )
-  from _devbuild.gen.syntax_asdl import arg_list
+  from _devbuild.gen.syntax_asdl import (
+      arg_list, expr__Const, expr__Var, expr__Unary, expr__Binary,
+      expr__Range, expr__Slice, expr__Compare, expr__IfExp, expr__List,
+      expr__Tuple, expr__Dict, expr__ListComp, expr__GeneratorExp,
+      expr__Lambda, expr__FuncCall, expr__RegexLiteral, expr__ArrayLiteral,
+      command_sub, sh_array_literal, double_quoted, single_quoted,
+      braced_var_sub, simple_var_sub, subscript, attribute,
+  )
   from core.executor import ShellExecutor
   from core.ui import ErrorFormatter
   from core.state import Mem
@@ -38,6 +50,22 @@ if TYPE_CHECKING:
 _ = log
 
 
+# Comparisons other than ~ and !~
+_COMPARE_OPS = {
+    Id.Arith_Less: operator.lt,
+    Id.Arith_Great: operator.gt,
+    Id.Arith_GreatEqual: operator.ge,
+    Id.Arith_LessEqual: operator.le,
+    Id.Arith_DEqual: operator.eq,
+
+    Id.Expr_In: lambda left, right: left in right,
+    Id.Node_NotIn: lambda left, right: left not in right,
+
+    Id.Expr_Is: operator.is_,
+    Id.Node_IsNot: operator.is_not,
+}  # type: Dict[Id_t, Callable[[Any, Any], Any]]
+
+
 class OilEvaluator(object):
   """Shared between arith and bool evaluators.
 
@@ -60,6 +88,35 @@ class OilEvaluator(object):
     self.funcs = funcs
     self.errfmt = errfmt
 
+    # Indexed by expr_e tag.  This is faster than a chain of 'if' statements.
+    self.dispatch = {
+        expr_e.Const: self._EvalConst,
+        expr_e.Var: self._EvalVar,
+        expr_e.CommandSub: self._EvalCommandSub,
+        expr_e.ShArrayLiteral: self._EvalShArrayLiteral,
+        expr_e.DoubleQuoted: self._EvalDoubleQuoted,
+        expr_e.SingleQuoted: self._EvalSingleQuoted,
+        expr_e.BracedVarSub: self._EvalBracedVarSub,
+        expr_e.SimpleVarSub: self._EvalSimpleVarSub,
+        expr_e.Unary: self._EvalUnary,
+        expr_e.Binary: self._EvalBinary,
+        expr_e.Range: self._EvalRange,
+        expr_e.Slice: self._EvalSlice,
+        expr_e.Compare: self._EvalCompare,
+        expr_e.IfExp: self._EvalIfExp,
+        expr_e.List: self._EvalList,
+        expr_e.Tuple: self._EvalTuple,
+        expr_e.Dict: self._EvalDict,
+        expr_e.ListComp: self._EvalListComp,
+        expr_e.GeneratorExp: self._EvalGeneratorExp,
+        expr_e.Lambda: self._EvalLambda,
+        expr_e.FuncCall: self._EvalFuncCall,
+        expr_e.Subscript: self._EvalSubscript,
+        expr_e.Attribute: self._EvalAttribute,
+        expr_e.RegexLiteral: self._EvalRegexLiteral,
+        expr_e.ArrayLiteral: self._EvalArrayLiteral,
+    }  # type: Dict[int, Callable[[Any], Any]]
+
   def CheckCircularDeps(self):
     # type: () -> None
     assert self.shell_ex is not None
@@ -214,227 +271,200 @@ class OilEvaluator(object):
       node.PrettyPrint()
       print('')
 
-    if node.tag == expr_e.Const:
-      id_ = node.c.id
-
-      if id_ == Id.Expr_DecInt:
-        return int(node.c.val)
-      elif id_ == Id.Expr_BinInt:
-        return int(node.c.val, 2)
-      elif id_ == Id.Expr_OctInt:
-        return int(node.c.val, 8)
-      elif id_ == Id.Expr_HexInt:
-        return int(node.c.val, 16)
-
-      elif id_ == Id.Expr_Float:
-        return float(node.c.val)
-
-      elif id_ == Id.Expr_Null:
-        return None
-      elif id_ == Id.Expr_True:
-        return True
-      elif id_ == Id.Expr_False:
-        return False
-
-      elif id_ == Id.Expr_Name:
-        # for {name: 'bob'}
-        # Maybe also :Symbol?
-        return node.c.val
-
-      # NOTE: We could allow Ellipsis for a[:, ...] here, but we're not using
-      # it yet.
-      raise AssertionError(id_)
+    func = self.dispatch.get(node.tag)
+    if func is None:
+      raise NotImplementedError(node.__class__.__name__)
+    return func(node)
+
+  def _EvalConst(self, node):
+    # type: (expr__Const) -> Any
+    # Converted by expr_to_ast.py when the tree was built, and possibly folded
+    # from a constant subexpression.
+    return node.val
+
+  def _EvalVar(self, node):
+    # type: (expr__Var) -> Any
+    return self.LookupVar(node.name.val)
+
+  def _EvalCommandSub(self, node):
+    # type: (command_sub) -> Any
+    return self.shell_ex.RunCommandSub(node.child)
+
+  def _EvalShArrayLiteral(self, node):
+    # type: (sh_array_literal) -> Any
+    words = braces.BraceExpandWords(node.words)
+    strs = self.word_ev.EvalWordSequence(words)
+    #log('ARRAY LITERAL EVALUATED TO -> %s', strs)
+    return objects.StrArray(strs)
+
+  def _EvalDoubleQuoted(self, node):
+    # type: (double_quoted) -> Any
+    # In an ideal world, I would *statically* disallow:
+    # - "$@" and "${array[@]}"
+    # - backticks like `echo hi`  
+    # - $(( 1+2 )) and $[] -- although useful for refactoring
+    #   - not sure: ${x%%} -- could disallow this
+    #     - these enters the ArgDQ state: "${a:-foo bar}" ?
+    # But that would complicate the parser/evaluator.  So just rely on
+    # strict_array to disallow the bad parts.
+    return self.word_ev.EvalDoubleQuotedToString(node)
+
+  def _EvalSingleQuoted(self, node):
+    # type: (single_quoted) -> Any
+    return word_eval.EvalSingleQuoted(node)
+
+  def _EvalBracedVarSub(self, node):
+    # type: (braced_var_sub) -> Any
+    return self.word_ev.EvalBracedVarSubToString(node)
+
+  def _EvalSimpleVarSub(self, node):
+    # type: (simple_var_sub) -> Any
+    return self.word_ev.EvalSimpleVarSubToString(node.token)
+
+  def _EvalUnary(self, node):
+    # type: (expr__Unary) -> Any
+    child = self.EvalExpr(node.child)
+    func = expr_ops.UNARY_OPS.get(node.op.id)
+    if func is None:
+      raise NotImplementedError(node.op.id)
+    return func(child)
+
+  def _EvalBinary(self, node):
+    # type: (expr__Binary) -> Any
+    left = self.EvalExpr(node.left)
+    right = self.EvalExpr(node.right)
+    func = expr_ops.BINARY_OPS.get(node.op.id)
+    if func is None:
+      raise NotImplementedError(node.op.id)
+    return func(left, right)
+
+  def _EvalRange(self, node):  # 1:10  or  1:10:2
+    # type: (expr__Range) -> Any
+    lower = self.EvalExpr(node.lower)
+    upper = self.EvalExpr(node.upper)
+    return xrange(lower, upper)
+
+  def _EvalSlice(self, node):  # a[:0]
+    # type: (expr__Slice) -> Any
+    lower = self.EvalExpr(node.lower) if node.lower else None
+    upper = self.EvalExpr(node.upper) if node.upper else None
+    return slice(lower, upper)
+
+  def _EvalCompare(self, node):
+    # type: (expr__Compare) -> Any
+    left = self.EvalExpr(node.left)
+    result = True  # Implicit and
+    for op, right_expr in zip(node.ops, node.comparators):
+
+      right = self.EvalExpr(right_expr)
+
+      func = _COMPARE_OPS.get(op.id)
+      if func:
+        result = func(left, right)
+      else:
+        try:
+          if op.id == Id.Arith_Tilde:
+            result = self._EvalMatch(left, right, True)
 
-    if node.tag == expr_e.Var:
-      return self.LookupVar(node.name.val)
-
-    if node.tag == expr_e.CommandSub:
-      return self.shell_ex.RunCommandSub(node.child)
-
-    if node.tag == expr_e.ShArrayLiteral:
-      words = braces.BraceExpandWords(node.words)
-      strs = self.word_ev.EvalWordSequence(words)
-      #log('ARRAY LITERAL EVALUATED TO -> %s', strs)
-      return objects.StrArray(strs)
-
-    if node.tag == expr_e.DoubleQuoted:
-      # In an ideal world, I would *statically* disallow:
-      # - "$@" and "${array[@]}"
-      # - backticks like `echo hi`  
-      # - $(( 1+2 )) and $[] -- although useful for refactoring
-      #   - not sure: ${x%%} -- could disallow this
-      #     - these enters the ArgDQ state: "${a:-foo bar}" ?
-      # But that would complicate the parser/evaluator.  So just rely on
-      # strict_array to disallow the bad parts.
-      return self.word_ev.EvalDoubleQuotedToString(node)
-
-    if node.tag == expr_e.SingleQuoted:
-      return word_eval.EvalSingleQuoted(node)
-
-    if node.tag == expr_e.BracedVarSub:
-      return self.word_ev.EvalBracedVarSubToString(node)
-
-    if node.tag == expr_e.SimpleVarSub:
-      return self.word_ev.EvalSimpleVarSubToString(node.token)
-
-    if node.tag == expr_e.Unary:
-      child = self.EvalExpr(node.child)
-      if node.op.id == Id.Arith_Minus:
-        return -child
-      if node.op.id == Id.Arith_Tilde:
-        return ~child
-      if node.op.id == Id.Expr_Not:
-        return not child
+          elif op.id == Id.Expr_NotTilde:
+            result = not self._EvalMatch(left, right, False)
 
-      raise NotImplementedError(node.op.id)
+          else:
+            raise AssertionError(op.id)
+        except RuntimeError as e:
+          # Status 2 indicates a regex parse error.  This is fatal in OSH but
+          # not in bash, which treats [[ like a command with an exit code.
+          e_die("Invalid regex %r", right, span_id=op.span_id, status=2)
+
+      if not result:
+        return result
+
+      left = right
+    return result
+
+  def _EvalIfExp(self, node):
+    # type: (expr__IfExp) -> Any
+    b = self.EvalExpr(node.test)
+    if b:
+      return self.EvalExpr(node.body)
+    else:
+      return self.EvalExpr(node.orelse)
 
-    if node.tag == expr_e.Binary:
-      left = self.EvalExpr(node.left)
-      right = self.EvalExpr(node.right)
-
-      if node.op.id == Id.Arith_Plus:
-        return left + right
-      if node.op.id == Id.Arith_Minus:
-        return left - right
-      if node.op.id == Id.Arith_Star:
-        return left * right
-      if node.op.id == Id.Arith_Slash:
-        # NOTE: from __future__ import division changes 5/2!
-        # But just make it explicit.
-        return float(left) / right  # floating point division
-
-      if node.op.id == Id.Expr_Div:
-        return left // right  # integer divison
-      if node.op.id == Id.Expr_Mod:
-        return left % right
-
-      if node.op.id == Id.Arith_Caret:  # Exponentiation
-        return left ** right
-
-      # Bitwise
-      if node.op.id == Id.Arith_Amp:
-        return left & right
-      if node.op.id == Id.Arith_Pipe:
-        return left | right
-      if node.op.id == Id.Expr_Xor:
-        return left ^ right
-      if node.op.id == Id.Arith_DGreat:
-        return left >> right
-      if node.op.id == Id.Arith_DLess:
-        return left << right
-
-      # Logical
-      if node.op.id == Id.Expr_And:
-        return left and right
-      if node.op.id == Id.Expr_Or:
-        return left or right
+  def _EvalList(self, node):
+    # type: (expr__List) -> Any
+    return [self.EvalExpr(e) for e in node.elts]
 
-      raise NotImplementedError(node.op.id)
+  def _EvalTuple(self, node):
+    # type: (expr__Tuple) -> Any
+    return tuple(self.EvalExpr(e) for e in node.elts)
 
-    if node.tag == expr_e.Range:  # 1:10  or  1:10:2
-      lower = self.EvalExpr(node.lower)
-      upper = self.EvalExpr(node.upper)
-      return xrange(lower, upper)
-
-    if node.tag == expr_e.Slice:  # a[:0]
-      lower = self.EvalExpr(node.lower) if node.lower else None
-      upper = self.EvalExpr(node.upper) if node.upper else None
-      return slice(lower, upper)
-
-    if node.tag == expr_e.Compare:
-      left = self.EvalExpr(node.left)
-      result = True  # Implicit and
-      for op, right_expr in zip(node.ops, node.comparators):
-
-        right = self.EvalExpr(right_expr)
-
-        if op.id == Id.Arith_Less:
-          result = left < right
-        elif op.id == Id.Arith_Great:
-          result = left > right
-        elif op.id == Id.Arith_GreatEqual:
-          result = left >= right
-        elif op.id == Id.Arith_LessEqual:
-          result = left <= right
-        elif op.id == Id.Arith_DEqual:
-          result = left == right
-
-        elif op.id == Id.Expr_In:
-          result = left in right
-        elif op.id == Id.Node_NotIn:
-          result = left not in right
-
-        elif op.id == Id.Expr_Is:
-          result = left is right
-        elif op.id == Id.Node_IsNot:
-          result = left is not right
+  def _EvalDict(self, node):
+    # type: (expr__Dict) -> Any
+    # NOTE: some keys are expr.Const
+    keys = [self.EvalExpr(e) for e in node.keys]
 
-        else:
-          try:
-            if op.id == Id.Arith_Tilde:
-              result = self._EvalMatch(left, right, True)
-
-            elif op.id == Id.Expr_NotTilde:
-              result = not self._EvalMatch(left, right, False)
-
-            else:
-              raise AssertionError(op.id)
-          except RuntimeError as e:
-            # Status 2 indicates a regex parse error.  This is fatal in OSH but
-            # not in bash, which treats [[ like a command with an exit code.
-            e_die("Invalid regex %r", right, span_id=op.span_id, status=2)
-
-        if not result:
-          return result
-
-        left = right
-      return result
- 
-    if node.tag == expr_e.IfExp:
-      b = self.EvalExpr(node.test)
-      if b:
-        return self.EvalExpr(node.body)
+    values = []
+    for i, e in enumerate(node.values):
+      if e.tag == expr_e.Implicit:
+        v = self.LookupVar(keys[i])  # {name}
       else:
-        return self.EvalExpr(node.orelse)
+        v = self.EvalExpr(e)
+      values.append(v)
 
-    if node.tag == expr_e.List:
-      return [self.EvalExpr(e) for e in node.elts]
+    return dict(zip(keys, values))
 
-    if node.tag == expr_e.Tuple:
-      return tuple(self.EvalExpr(e) for e in node.elts)
+  def _EvalListComp(self, node):
+    # type: (expr__ListComp) -> Any
 
-    if node.tag == expr_e.Dict:
-      # NOTE: some keys are expr.Const
-      keys = [self.EvalExpr(e) for e in node.keys]
+    # TODO:
+    # - Consolidate with command_e.OilForIn in osh/cmd_eval.py?
+    # - Do I have to push a temp frame here?
+    #   Hm... lexical or dynamic scope is an issue.
+    result = []
+    comp = node.generators[0]
+    obj = self.EvalExpr(comp.iter)
 
-      values = []
-      for i, e in enumerate(node.values):
-        if e.tag == expr_e.Implicit:
-          v = self.LookupVar(keys[i])  # {name}
-        else:
-          v = self.EvalExpr(e)
-        values.append(v)
+    # TODO: Handle x,y etc.
+    iter_name = comp.lhs[0].name.val
 
-      return dict(zip(keys, values))
+    if isinstance(obj, str):
+      e_die("Strings aren't iterable")
+    else:
+      it = obj.__iter__()
 
-    if node.tag == expr_e.ListComp:
+    while True:
+      try:
+        loop_val = it.next()  # e.g. x
+      except StopIteration:
+        break
+      self.mem.SetVar(
+          lvalue.Named(iter_name), value.Obj(loop_val), scope_e.LocalOnly)
 
-      # TODO:
-      # - Consolidate with command_e.OilForIn in osh/cmd_eval.py?
-      # - Do I have to push a temp frame here?
-      #   Hm... lexical or dynamic scope is an issue.
-      result = []
-      comp = node.generators[0]
-      obj = self.EvalExpr(comp.iter)
-
-      # TODO: Handle x,y etc.
-      iter_name = comp.lhs[0].name.val
-
-      if isinstance(obj, str):
-        e_die("Strings aren't iterable")
+      if comp.cond:
+        b = self.EvalExpr(comp.cond)
       else:
-        it = obj.__iter__()
+        b = True
 
+      if b:
+        item = self.EvalExpr(node.elt)  # e.g. x*2
+        result.append(item)
+
+    return result
+
+  def _EvalGeneratorExp(self, node):
+    # type: (expr__GeneratorExp) -> Any
+    comp = node.generators[0]
+    obj = self.EvalExpr(comp.iter)
+
+    # TODO: Support (x for x, y in ...)
+    iter_name = comp.lhs[0].name.val
+
+    it = obj.__iter__()
+
+    # TODO: There is probably a much better way to do this!
+    #       The scope of the loop variable is wrong, etc.
+
+    def _gen():
       while True:
         try:
           loop_val = it.next()  # e.g. x
@@ -450,110 +480,82 @@ class OilEvaluator(object):
 
         if b:
           item = self.EvalExpr(node.elt)  # e.g. x*2
-          result.append(item)
-
-      return result
-
-    if node.tag == expr_e.GeneratorExp:
-      comp = node.generators[0]
-      obj = self.EvalExpr(comp.iter)
-
-      # TODO: Support (x for x, y in ...)
-      iter_name = comp.lhs[0].name.val
-
-      it = obj.__iter__()
-
-      # TODO: There is probably a much better way to do this!
-      #       The scope of the loop variable is wrong, etc.
-
-      def _gen():
-        while True:
-          try:
-            loop_val = it.next()  # e.g. x
-          except StopIteration:
-            break
-          self.mem.SetVar(
-              lvalue.Named(iter_name), value.Obj(loop_val), scope_e.LocalOnly)
-
-          if comp.cond:
-            b = self.EvalExpr(comp.cond)
-          else:
-            b = True
-
-          if b:
-            item = self.EvalExpr(node.elt)  # e.g. x*2
-            yield item
-
-      return _gen()
-
-    if node.tag == expr_e.Lambda:
-      raise NotImplementedError()
-      # This used to depend on cmd_ev, but we no longer have it.
-      #return objects.Lambda(node, None)
-
-    if node.tag == expr_e.FuncCall:
-      func = self.EvalExpr(node.func)
-      pos_args, named_args = self.EvalArgList(node.args)
-      ret = func(*pos_args, **named_args)
-      return ret
-
-    if node.tag == expr_e.Subscript:
-      obj = self.EvalExpr(node.obj)
-      index = self._EvalIndices(node.indices)
-      return obj[index]
-
-    # TODO: obj.method() should be separate
-    if node.tag == expr_e.Attribute:  # obj.attr 
-      o = self.EvalExpr(node.obj)
-      id_ = node.op.id
-      if id_ == Id.Expr_Dot:
-        name = node.attr.val
-        # TODO: Does this do the bound method thing we do NOT want?
-        return getattr(o, name)
-
-      if id_ == Id.Expr_RArrow:  # d->key is like d['key']
-        name = node.attr.val
-        return o[name]
-
-      if id_ == Id.Expr_DColon:  # StaticName::member
-        raise NotImplementedError(id_)
-
-        # TODO: We should prevent virtual lookup here?  This is a pure static
-        # namespace lookup?
-        # But Python doesn't any hook for this.
-        # Maybe we can just check that it's a module?  And modules don't lookup
-        # in a supertype or __class__, etc.
-
-      raise AssertionError(id_)
-
-    if node.tag == expr_e.RegexLiteral:  # obj.attr 
-      # TODO: Should this just be an object that ~ calls?
-      return objects.Regex(self.EvalRegex(node.regex))
-
-    if node.tag == expr_e.ArrayLiteral:  # obj.attr 
-      items = [self.EvalExpr(item) for item in node.items]
-      if items:
-        # Determine type at runtime?  If we have something like @[(i) (j)]
-        # then we don't know its type until runtime.
-
-        first = items[0]
-        if isinstance(first, bool):
-          return objects.BoolArray(bool(x) for x in items)
-        elif isinstance(first, int):
-          return objects.IntArray(int(x) for x in items)
-        elif isinstance(first, float):
-          return objects.FloatArray(float(x) for x in items)
-        elif isinstance(first, str):
-          return objects.StrArray(str(x) for x in items)
-        else:
-          raise AssertionError(first)
+          yield item
+
+    return _gen()
+
+  def _EvalLambda(self, node):
+    # type: (expr__Lambda) -> Any
+    raise NotImplementedError()
+    # This used to depend on cmd_ev, but we no longer have it.
+    #return objects.Lambda(node, None)
+
+  def _EvalFuncCall(self, node):
+    # type: (expr__FuncCall) -> Any
+    func = self.EvalExpr(node.func)
+    pos_args, named_args = self.EvalArgList(node.args)
+    ret = func(*pos_args, **named_args)
+    return ret
+
+  def _EvalSubscript(self, node):
+    # type: (subscript) -> Any
+    obj = self.EvalExpr(node.obj)
+    index = self._EvalIndices(node.indices)
+    return obj[index]
+
+  # TODO: obj.method() should be separate
+  def _EvalAttribute(self, node):  # obj.attr 
+    # type: (attribute) -> Any
+    o = self.EvalExpr(node.obj)
+    id_ = node.op.id
+    if id_ == Id.Expr_Dot:
+      name = node.attr.val
+      # TODO: Does this do the bound method thing we do NOT want?
+      return getattr(o, name)
+
+    if id_ == Id.Expr_RArrow:  # d->key is like d['key']
+      name = node.attr.val
+      return o[name]
+
+    if id_ == Id.Expr_DColon:  # StaticName::member
+      raise NotImplementedError(id_)
+
+      # TODO: We should prevent virtual lookup here?  This is a pure static
+      # namespace lookup?
+      # But Python doesn't any hook for this.
+      # Maybe we can just check that it's a module?  And modules don't lookup
+      # in a supertype or __class__, etc.
+
+    raise AssertionError(id_)
+
+  def _EvalRegexLiteral(self, node):
+    # type: (expr__RegexLiteral) -> Any
+    # TODO: Should this just be an object that ~ calls?
+    return objects.Regex(self.EvalRegex(node.regex))
+
+  def _EvalArrayLiteral(self, node):
+    # type: (expr__ArrayLiteral) -> Any
+    items = [self.EvalExpr(item) for item in node.items]
+    if items:
+      # Determine type at runtime?  If we have something like @[(i) (j)]
+      # then we don't know its type until runtime.
+
+      first = items[0]
+      if isinstance(first, bool):
+        return objects.BoolArray(bool(x) for x in items)
+      elif isinstance(first, int):
+        return objects.IntArray(int(x) for x in items)
+      elif isinstance(first, float):
+        return objects.FloatArray(float(x) for x in items)
+      elif isinstance(first, str):
+        return objects.StrArray(str(x) for x in items)
       else:
-        # TODO: Should this have an unknown type?
-        # What happens when you mutate or extend it?  You have to make sure
-        # that the type tags match?
-        return objects.BoolArray(items)
-
-    raise NotImplementedError(node.__class__.__name__)
+        raise AssertionError(first)
+    else:
+      # TODO: Should this have an unknown type?
+      # What happens when you mutate or extend it?  You have to make sure
+      # that the type tags match?
+      return objects.BoolArray(items)
 
   def _EvalClassLiteralPart(self, part):
     # TODO: You can RESOLVE strings -> literal
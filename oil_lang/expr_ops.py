@@ -0,0 +1,66 @@
+#!/usr/bin/env python2
+"""
+expr_ops.py - The operators of expr.Binary and expr.Unary.
+
+OilEvaluator uses them to evaluate expressions, and the Transformer in
+expr_to_ast.py uses them to fold constants, so the values are the same.
+
+This module doesn't import the parser or the evaluator.
+"""
+from __future__ import print_function
+
+import operator
+
+from _devbuild.gen.id_kind_asdl import Id, Id_t
+
+from typing import Any, Callable, Dict, TYPE_CHECKING
+if TYPE_CHECKING:
+  from _devbuild.gen.syntax_asdl import expr__Const
+
+
+def _Divide(left, right):
+  # type: (Any, Any) -> Any
+  # NOTE: from __future__ import division changes 5/2!
+  # But just make it explicit.
+  return float(left) / right  # floating point division
+
+
+BINARY_OPS = {
+    Id.Arith_Plus: operator.add,
+    Id.Arith_Minus: operator.sub,
+    Id.Arith_Star: operator.mul,
+    Id.Arith_Slash: _Divide,
+
+    Id.Expr_Div: operator.floordiv,  # integer divison
+    Id.Expr_Mod: operator.mod,
+
+    Id.Arith_Caret: operator.pow,  # Exponentiation
+
+    # Bitwise
+    Id.Arith_Amp: operator.and_,
+    Id.Arith_Pipe: operator.or_,
+    Id.Expr_Xor: operator.xor,
+    Id.Arith_DGreat: operator.rshift,
+    Id.Arith_DLess: operator.lshift,
+
+    # Logical.  NOTE: Both sides are evaluated.
+    Id.Expr_And: lambda left, right: left and right,
+    Id.Expr_Or: lambda left, right: left or right,
+}  # type: Dict[Id_t, Callable[[Any, Any], Any]]
+
+UNARY_OPS = {
+    Id.Arith_Minus: operator.neg,
+    Id.Arith_Tilde: operator.invert,
+    Id.Expr_Not: operator.not_,
+}  # type: Dict[Id_t, Callable[[Any], Any]]
+
+
+def IsFolded(node):
+  # type: (expr__Const) -> bool
+  """Was the Const folded from a subexpression?  For pretty-printing.
+
+  A folded Const has the ID of its operator, and a token that spans the whole
+  subexpression, e.g. (Const Id.Arith_Caret '2 ^ 3').
+  """
+  id_ = node.c.id
+  return id_ in BINARY_OPS or id_ in UNARY_OPS
@@ -7,7 +7,8 @@ from __future__ import print_function
 import unittest
 
 #from _devbuild.gen.id_kind_asdl import Kind
-from _devbuild.gen.syntax_asdl import source
+from _devbuild.gen.id_kind_asdl import Id
+from _devbuild.gen.syntax_asdl import source, expr_e
 
 from core import alloc
 from core import error
@@ -144,6 +145,61 @@ EOF)
       #print(p)
       pass
 
+  def testGrammarLoader(self):
+    grammar_loader = meta.GrammarLoader(pyutil.GetResourceLoader())
+    parse_ctx = test_lib.InitParseContext(arena=self.arena)
+    parse_ctx.Init_GrammarLoader(grammar_loader)
+
+    # Shell code doesn't load the grammar
+    line_reader = reader.StringLineReader('echo hi\n', self.arena)
+    parse_ctx.MakeOshParser(line_reader).ParseLogicalLine()
+    self.assertEqual(None, grammar_loader.oil_grammar)
+
+    line_reader = reader.StringLineReader('var x = 1 + 2\n', self.arena)
+    node = parse_ctx.MakeOshParser(line_reader).ParseLogicalLine()
+    self.assertNotEqual(None, grammar_loader.oil_grammar)
+    self.assertNotEqual(None, node.rhs)
+
+    # It's only loaded once
+    g = grammar_loader.oil_grammar
+    self.assertEqual(g, grammar_loader.Get())
+
+  def testConstantFolding(self):
+    def _Rhs(code_str):
+      line_reader = reader.StringLineReader(code_str, self.arena)
+      node = self.parse_ctx.MakeOshParser(line_reader).ParseLogicalLine()
+      return node.rhs
+
+    # Literals are converted when parsing
+    for code_str, val in [
+        ('0x1_f', 31), ('0b101', 5), ('1.5', 1.5), ('null', None),
+        ('true', True)]:
+      node = _Rhs('var x = %s\n' % code_str)
+      self.assertEqual(expr_e.Const, node.tag)
+      self.assertEqual(val, node.val)
+
+    node = _Rhs('var x = 2 ^ 3 * 4 + -1\n')
+    self.assertEqual(expr_e.Const, node.tag)
+    self.assertEqual(31, node.val)
+
+    # The token spans the whole expression
+    self.assertEqual(Id.Arith_Plus, node.c.id)
+    self.assertEqual('2 ^ 3 * 4 + -1', node.c.val)
+    span = self.arena.GetLineSpan(node.c.span_id)
+    self.assertEqual((8, 14), (span.col, span.length))
+
+    node = _Rhs('var x = 1 / 2\n')
+    self.assertEqual(0.5, node.val)
+
+    node = _Rhs('var x = y + 2 * 3\n')
+    self.assertEqual(expr_e.Binary, node.tag)
+    self.assertEqual(6, node.right.val)
+
+    # Errors happen at runtime, and huge numbers aren't computed
+    for code_str in ('1 div 0', '~1.5', 'null + 1', '2 ^ 100000'):
+      node = _Rhs('var x = %s\n' % code_str)
+      self.assertNotEqual(expr_e.Const, node.tag, code_str)
+
 
 if __name__ == '__main__':
   unittest.main()
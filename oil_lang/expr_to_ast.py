@@ -8,7 +8,7 @@ from _devbuild.gen.syntax_asdl import (
     Token, speck, double_quoted, single_quoted, simple_var_sub, braced_var_sub,
     command_sub, sh_array_literal,
     command, command__VarDecl, command__PlaceMutation, command__Func,
-    expr, expr_e, expr_t, expr__Var, expr__Dict, expr_context_e,
+    expr, expr_e, expr_t, expr__Var, expr__Dict, expr__Const, expr_context_e,
     re, re_t, re_repeat, re_repeat_t, class_literal_term, class_literal_term_t,
     posix_class, perl_class,
     name_type, place_expr, place_expr_e, place_expr_t, type_expr_t,
@@ -18,9 +18,11 @@ from _devbuild.gen.syntax_asdl import (
 from _devbuild.gen import grammar_nt
 
 from core.util import log, p_die
+from mycpp import mylib
 
-from typing import TYPE_CHECKING, List, Tuple, Optional, cast
+from typing import TYPE_CHECKING, Any, List, Tuple, Optional, cast
 if TYPE_CHECKING:
+  from core.alloc import Arena
   from pgen2.grammar import Grammar
   from pgen2.pnode import PNode
 
@@ -52,6 +54,125 @@ def ISNONTERMINAL(x):
     return x >= NT_OFFSET
 
 
+if mylib.PYTHON:
+  from oil_lang import expr_ops
+
+  def ConstValue(tok):
+    # type: (Token) -> Any
+    """Convert the token of an expr.Const to a Python value."""
+    id_ = tok.id
+
+    if id_ == Id.Expr_DecInt:
+      return int(tok.val.replace('_', ''))
+    elif id_ == Id.Expr_BinInt:
+      return int(tok.val.replace('_', ''), 2)
+    elif id_ == Id.Expr_OctInt:
+      return int(tok.val.replace('_', ''), 8)
+    elif id_ == Id.Expr_HexInt:
+      return int(tok.val.replace('_', ''), 16)
+
+    elif id_ == Id.Expr_Float:
+      return float(tok.val)
+
+    elif id_ == Id.Expr_Null:
+      return None
+    elif id_ == Id.Expr_True:
+      return True
+    elif id_ == Id.Expr_False:
+      return False
+
+    elif id_ == Id.Expr_Name:
+      # for {name: 'bob'}
+      # Maybe also :Symbol?
+      return tok.val
+
+    # NOTE: We could allow Ellipsis for a[:, ...] here, but we're not using
+    # it yet.
+    raise AssertionError(Id_str(id_))
+
+  def _NumberValue(node):
+    # type: (expr_t) -> Any
+    """Return the value of a numeric or boolean Const, or None."""
+    if node.tag != expr_e.Const:
+      return None
+    val = cast(expr__Const, node).val
+    if isinstance(val, (int, long, float)):  # bool is an int
+      return val
+    return None
+
+  # Don't compute 2 ^ 1000000 or 1 << 1000000 while parsing.
+  _MAX_POW_OPERAND = 64
+
+  def _SpanToken(arena, id_, left_tok, right_tok):
+    # type: (Arena, Id_t, Token, Token) -> Optional[Token]
+    """Return a token from the start of left_tok to the end of right_tok.
+
+    Returns None if they're on different lines, because a line_span can't
+    cross lines.
+    """
+    left_span = arena.GetLineSpan(left_tok.span_id)
+    right_span = arena.GetLineSpan(right_tok.span_id)
+    if left_span.line_id != right_span.line_id:
+      return None
+
+    col = left_span.col
+    length = right_span.col + right_span.length - col
+    line = arena.GetLine(left_span.line_id)
+    span_id = arena.AddLineSpan(left_span.line_id, col, length)
+    return Token(id_, span_id, line[col : col + length])
+
+  def FoldBinary(arena, op_tok, left, right):
+    # type: (Arena, Token, expr_t, expr_t) -> Optional[expr_t]
+    """Fold an operation on constants into a Const.
+
+    Returns None if it can't be folded.  The operators are the ones that
+    OilEvaluator uses, so the value is the same.  The Const has the ID of the
+    operator, and its token spans the whole expression, so 2 ^ 3 is
+    (Const Id.Arith_Caret '2 ^ 3').
+    """
+    func = expr_ops.BINARY_OPS.get(op_tok.id)
+    if func is None:
+      return None
+    lval = _NumberValue(left)
+    rval = _NumberValue(right)
+    if lval is None or rval is None:
+      return None
+    if op_tok.id in (Id.Arith_Caret, Id.Arith_DLess):
+      if abs(lval) > _MAX_POW_OPERAND or abs(rval) > _MAX_POW_OPERAND:
+        return None
+
+    try:
+      val = func(lval, rval)
+    except (ArithmeticError, ValueError, TypeError):
+      return None  # e.g. 1 div 0 is an error at runtime, not parse time
+
+    tok = _SpanToken(arena, op_tok.id, cast(expr__Const, left).c,
+                     cast(expr__Const, right).c)
+    if tok is None:
+      return None
+    return expr.Const(tok, val)
+
+  def FoldUnary(arena, op_tok, child):
+    # type: (Arena, Token, expr_t) -> Optional[expr_t]
+    """Like FoldBinary."""
+    func = expr_ops.UNARY_OPS.get(op_tok.id)
+    if func is None:
+      return None
+    cval = _NumberValue(child)
+    if cval is None:
+      return None
+
+    try:
+      val = func(cval)
+    except (ArithmeticError, ValueError, TypeError):
+      return None  # e.g. ~1.0
+
+    tok = _SpanToken(arena, op_tok.id, op_tok, cast(expr__Const, child).c)
+    if tok is None:
+      return None
+    return expr.Const(tok, val)
+
+
 class Transformer(object):
   """Homogeneous parse tree -> heterogeneous AST ("lossless syntax tree")
 
@@ -75,9 +196,10 @@ class Transformer(object):
     Expr, VarDecl
     atom, trailer, etc. are private, named after productions in grammar.pgen2.
   """
-  def __init__(self, gr):
-    # type: (Grammar) -> None
+  def __init__(self, gr, arena=None):
+    # type: (Grammar, Optional[Arena]) -> None
     self.number2symbol = gr.number2symbol
+    self.arena = arena  # to fold constants; None turns it off
 
   def _AssocBinary(self, children):
     # type: (List[PNode]) -> expr_t
@@ -105,7 +227,37 @@ class Transformer(object):
     else:
       right = self._AssocBinary(children[2:])  # Recursive call
 
-    return expr.Binary(op.tok, left, right)
+    return self._Binary(op.tok, left, right)
+
+  #
+  # Constant folding.  Every Const, Unary, and Binary is made by these methods,
+  # so the tree is folded bottom-up as it's built.  OilEvaluator then doesn't
+  # convert literals or recompute constant subexpressions every time it
+  # evaluates them.
+  #
+
+  def _Const(self, tok):
+    # type: (Token) -> expr_t
+    node = expr.Const(tok, None)
+    if mylib.PYTHON:
+      node.val = ConstValue(tok)
+    return node
+
+  def _Binary(self, op_tok, left, right):
+    # type: (Token, expr_t, expr_t) -> expr_t
+    if mylib.PYTHON and self.arena:
+      folded = FoldBinary(self.arena, op_tok, left, right)
+      if folded:
+        return folded
+    return expr.Binary(op_tok, left, right)
+
+  def _Unary(self, op_tok, child):
+    # type: (Token, expr_t) -> expr_t
+    if mylib.PYTHON and self.arena:
+      folded = FoldUnary(self.arena, op_tok, child)
+      if folded:
+        return folded
+    return expr.Unary(op_tok, child)
 
   def _Trailer(self, base, p_trailer):
     # type: (expr_t, PNode) -> expr_t
@@ -173,7 +325,7 @@ class Transformer(object):
     id_ = tok0.id
 
     if id_ == Id.Expr_Name:
-      key = expr.Const(tok0)
+      key = self._Const(tok0)
       if len(children) >= 3:
         value = self.Expr(children[2])
       else:
@@ -475,7 +627,7 @@ class Transformer(object):
           return self.Expr(children[0])
 
         op_tok = children[0].tok  # not
-        return expr.Unary(op_tok, self.Expr(children[1]))
+        return self._Unary(op_tok, self.Expr(children[1]))
 
       elif typ == grammar_nt.comparison:
         if len(children) == 1:
@@ -531,7 +683,7 @@ class Transformer(object):
         e = children[1]
 
         assert isinstance(op.tok, Token)
-        return expr.Unary(op.tok, self.Expr(e))
+        return self._Unary(op.tok, self.Expr(e))
 
       elif typ == grammar_nt.power:
         # power: atom trailer* ['^' factor]
@@ -550,7 +702,7 @@ class Transformer(object):
           op_tok = children[i].tok
           assert op_tok.id == Id.Arith_Caret, op_tok
           factor = self.Expr(children[i+1])
-          node = expr.Binary(op_tok, node, factor)
+          node = self._Binary(op_tok, node, factor)
 
         return node
 
@@ -599,10 +751,10 @@ class Transformer(object):
       if id_ in (
           Id.Expr_DecInt, Id.Expr_BinInt, Id.Expr_OctInt, Id.Expr_HexInt,
           Id.Expr_Float):
-        return expr.Const(tok)
+        return self._Const(tok)
 
       if id_ in (Id.Expr_Null, Id.Expr_True, Id.Expr_False):
-        return expr.Const(tok)
+        return self._Const(tok)
 
       raise NotImplementedError(Id_str(id_))
 
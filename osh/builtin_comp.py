@@ -15,7 +15,7 @@ from core import state
 
 from typing import TYPE_CHECKING
 if TYPE_CHECKING:
-  from core.completion import Lookup, OptionState
+  from core.completion import Lookup, OptionState, DirCache
   from core.ui import ErrorFormatter
   from frontend.parse_lib import ParseContext
   from osh.cmd_eval import CommandEvaluator
@@ -113,18 +113,21 @@ class SpecBuilder(object):
                word_ev,  # type: NormalWordEvaluator
                splitter,  # type: SplitContext
                comp_lookup,  # type: Lookup
+               dir_cache,  # type: DirCache
                ):
     # type: (...) -> None
     """
     Args:
       cmd_ev: CommandEvaluator for compgen -F
       parse_ctx, word_ev, splitter: for compgen -W
+      dir_cache: shared by -A file, -A directory, -A command, etc.
     """
     self.cmd_ev = cmd_ev
     self.parse_ctx = parse_ctx
     self.word_ev = word_ev
     self.splitter = splitter
     self.comp_lookup = comp_lookup
+    self.dir_cache = dir_cache
 
   def Build(self, argv, arg, base_opts):
     """Given flags to complete/compgen, return a UserSpec."""
@@ -159,16 +162,16 @@ class SpecBuilder(object):
         actions.append(_FixedWordsAction(self.parse_ctx.aliases))
         actions.append(_FixedWordsAction(cmd_ev.procs))
         actions.append(_FixedWordsAction(lexer_def.OSH_KEYWORD_NAMES))
-        actions.append(completion.FileSystemAction(exec_only=True))
+        actions.append(completion.FileSystemAction(self.dir_cache, exec_only=True))
 
         # Look on the file system.
-        a = completion.ExternalCommandAction(cmd_ev.mem)
+        a = completion.ExternalCommandAction(cmd_ev.mem, self.dir_cache)
 
       elif name == 'directory':
-        a = completion.FileSystemAction(dirs_only=True)
+        a = completion.FileSystemAction(self.dir_cache, dirs_only=True)
 
       elif name == 'file':
-        a = completion.FileSystemAction()
+        a = completion.FileSystemAction(self.dir_cache)
 
       elif name == 'function':
         a = _FixedWordsAction(cmd_ev.procs)
@@ -226,14 +229,14 @@ class SpecBuilder(object):
 
     extra_actions = []
     if base_opts.get('plusdirs'):
-      extra_actions.append(completion.FileSystemAction(dirs_only=True))
+      extra_actions.append(completion.FileSystemAction(self.dir_cache, dirs_only=True))
 
     # These only happen if there were zero shown.
     else_actions = []
     if base_opts.get('default'):
-      else_actions.append(completion.FileSystemAction())
+      else_actions.append(completion.FileSystemAction(self.dir_cache))
     if base_opts.get('dirnames'):
-      else_actions.append(completion.FileSystemAction(dirs_only=True))
+      else_actions.append(completion.FileSystemAction(self.dir_cache, dirs_only=True))
 
     if not actions and not else_actions:
       raise args.UsageError('No actions defined in completion: %s' % argv)
@@ -260,6 +263,8 @@ COMPLETE_SPEC.ShortFlag('-E',
     help='Define the compspec for an empty line')
 COMPLETE_SPEC.ShortFlag('-D',
     help='Define the compspec that applies when nothing else matches')
+COMPLETE_SPEC.ShortFlag('-T',
+    help='Print how long each compspec took to generate candidates')
 
 
 class Complete(object):
@@ -282,6 +287,10 @@ class Complete(object):
 
     commands = arg_r.Rest()
 
+    if arg.T:
+      self.comp_lookup.PrintStats()
+      return 0
+
     if arg.D:
       commands.append('__fallback')  # if the command doesn't match anything
     if arg.E:
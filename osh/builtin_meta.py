@@ -8,7 +8,7 @@ from _devbuild.gen.runtime_asdl import cmd_value
 from _devbuild.gen.syntax_asdl import source
 from core.error import _ControlFlow
 from core import main_loop
-from core import pyutil  # strerror_OS
+from core import pyutil  # strerror_OS, BackingFile
 from frontend import args
 from frontend import arg_def
 from frontend import consts
@@ -17,10 +17,12 @@ from frontend import reader
 from osh.builtin_pure import ResolveNames
 from mycpp import mylib
 
-from typing import Dict, TYPE_CHECKING
+from typing import Dict, Optional, TYPE_CHECKING
 if TYPE_CHECKING:
   from _devbuild.gen.runtime_asdl import cmd_value__Argv
   from _devbuild.gen.syntax_asdl import command__ShFunction
+  from frontend.ast_cache import AstCache
+  from frontend.parse_cache import ParseCache
   from frontend.parse_lib import ParseContext
   from core import optview
   from core import process
@@ -36,12 +38,13 @@ if mylib.PYTHON:
 
 class Eval(object):
 
-  def __init__(self, parse_ctx, exec_opts, cmd_ev):
-    # type: (ParseContext, optview.Exec, CommandEvaluator) -> None
+  def __init__(self, parse_ctx, exec_opts, cmd_ev, parse_cache):
+    # type: (ParseContext, optview.Exec, CommandEvaluator, ParseCache) -> None
     self.parse_ctx = parse_ctx
     self.arena = parse_ctx.arena
     self.exec_opts = exec_opts
     self.cmd_ev = cmd_ev
+    self.parse_cache = parse_cache
 
   def Run(self, cmd_val):
     # type: (cmd_value__Argv) -> int
@@ -60,10 +63,10 @@ class Eval(object):
       # code_str could be EMPTY, so just use the first one
       eval_spid = cmd_val.arg_spids[0]
 
-    line_reader = reader.StringLineReader(code_str, self.arena)
-    c_parser = self.parse_ctx.MakeOshParser(line_reader)
-
+    # Generated code is often eval'd in a loop, so reuse the parse.
     src = source.EvalArg(eval_spid)
+    c_parser = self.parse_cache.MakeParser(code_str, src)
+
     self.arena.PushSource(src)
     try:
       return main_loop.Batch(self.cmd_ev, c_parser, self.arena)
@@ -73,8 +76,9 @@ class Eval(object):
 
 class Source(object):
 
-  def __init__(self, parse_ctx, search_path, cmd_ev, fd_state, errfmt):
-    # type: (ParseContext, state.SearchPath, CommandEvaluator, process.FdState, ui.ErrorFormatter) -> None
+  def __init__(self, parse_ctx, search_path, cmd_ev, fd_state, errfmt,
+               ast_cache=None):
+    # type: (ParseContext, state.SearchPath, CommandEvaluator, process.FdState, ui.ErrorFormatter, Optional[AstCache]) -> None
     self.parse_ctx = parse_ctx
     self.arena = parse_ctx.arena
 
@@ -85,6 +89,7 @@ class Source(object):
     self.mem = cmd_ev.mem
 
     self.errfmt = errfmt
+    self.ast_cache = ast_cache
 
   def Run(self, cmd_val):
     # type: (cmd_value__Argv) -> int
@@ -108,7 +113,16 @@ class Source(object):
 
     try:
       line_reader = reader.FileLineReader(f, self.arena)
+      # Long-running shells source big libraries, so don't keep their lines
+      # in memory.
+      backing = pyutil.BackingFile(resolved, f)
+      if backing:
+        abs_path, st_dev, st_ino = backing
+        file_id = self.arena.AddBackingFile(abs_path, st_dev, st_ino)
+        line_reader.SetBackingFile(file_id)
       c_parser = self.parse_ctx.MakeOshParser(line_reader)
+      if self.ast_cache:
+        c_parser = self.ast_cache.MaybeWrap(c_parser)
 
       # A sourced module CAN have a new arguments array, but it always shares
       # the same variable scope as the caller.  The caller could be at either a
@@ -10,6 +10,7 @@ builtin_misc.py - Misc builtins.
 """
 from __future__ import print_function
 
+import stat
 import sys
 import termios  # for read -n
 
@@ -35,7 +36,7 @@ if mylib.PYTHON:
   except ImportError:
     help_index = None
 
-from typing import Any, Optional, IO, TYPE_CHECKING
+from typing import Any, List, Optional, IO, TYPE_CHECKING
 if TYPE_CHECKING:
   from _devbuild.gen.runtime_asdl import value__Str
   from core.pyutil import _FileResourceLoader
@@ -155,13 +156,72 @@ if mylib.PYTHON:
   READ_SPEC.ShortFlag('-d', args.Str)
 
 
+# Block size for reading lines from a regular file.  Typical lines are much
+# shorter, so the rest of the block is given back with lseek().
+_READ_BLOCK_SIZE = 4096
+
+_SEEK_CUR = 1
+
+
+def _StdinIsRegularFile():
+  # type: () -> bool
+  try:
+    st = posix.fstat(0)
+  except OSError:
+    return False
+  return stat.S_ISREG(st.st_mode)
+
+
+def _ReadLineFromFile(delim_char):
+  # type: (Optional[str]) -> str
+  """Like ReadLineFromStdin, but for a seekable descriptor 0.
+
+  Read a block at a time, and then seek back to just after the delimiter, so
+  the next reader of the descriptor (e.g. a child process) sees the same
+  offset as if we had read one byte at a time.  bash does this too.
+  """
+  chunks = []  # type: List[str]
+  while True:
+    block = posix.read(0, _READ_BLOCK_SIZE)
+    if not block:  # EOF
+      break
+
+    # The line ends at delim_char, which is discarded, or a newline, which is
+    # kept.
+    end = block.find('\n')
+    if delim_char is not None and delim_char != '\n':
+      d = block.find(delim_char)
+      if d != -1 and (end == -1 or d < end):
+        chunks.append(block[:d])
+        posix.lseek(0, d + 1 - len(block), _SEEK_CUR)
+        break
+
+    if end != -1:
+      if delim_char == '\n':
+        chunks.append(block[:end])
+      else:
+        chunks.append(block[:end+1])
+      posix.lseek(0, end + 1 - len(block), _SEEK_CUR)
+      break
+
+    chunks.append(block)
+  return ''.join(chunks)
+
+
 # sys.stdin.readline() in Python has buffering!  TODO: Rewrite this tight loop
 # in C?  Less garbage probably.
 # NOTE that dash, mksh, and zsh all read a single byte at a time.  It appears
 # to be required by POSIX?  Could try libc getline and make this an option.
+#
+# We only read a byte at a time when descriptor 0 can't seek, e.g. when it's a
+# pipe or terminal.  Bytes we read past the delimiter can't be given back to a
+# pipe, and a child process sharing the pipe would never see them.
 def ReadLineFromStdin(delim_char):
   # type: (Optional[str]) -> str
   """Read a line, or read up until delim_char if set."""
+  if _StdinIsRegularFile():
+    return _ReadLineFromFile(delim_char)
+
   chars = []
   while True:
     c = posix.read(0, 1)
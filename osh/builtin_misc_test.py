@@ -5,6 +5,7 @@ builtin_misc_test.py: Tests for builtin_misc.py
 from __future__ import print_function
 
 import cStringIO
+import os
 import unittest
 # We use native/line_input.c, a fork of readline.c, but this is good enough for
 # unit testing
@@ -38,6 +39,31 @@ class BuiltinTest(unittest.TestCase):
 
       print('---')
 
+  def testReadLineFromStdin(self):
+    path = '_tmp/builtin_misc_read.txt'
+    with open(path, 'w') as f:
+      f.write('one\ntwo,three\n' + 'x' * 5000 + '\nlast')
+
+    saved = os.dup(0)
+    fd = os.open(path, os.O_RDONLY)
+    os.dup2(fd, 0)
+    os.close(fd)
+    try:
+      self.assertEqual('one\n', builtin_misc.ReadLineFromStdin(None))
+      # The newline still ends the line when there's a delimiter
+      self.assertEqual('two', builtin_misc.ReadLineFromStdin(','))
+      self.assertEqual('three', builtin_misc.ReadLineFromStdin('\n'))
+      # Longer than one block
+      self.assertEqual('x' * 5000 + '\n', builtin_misc.ReadLineFromStdin(None))
+
+      # Unconsumed bytes were given back, so other readers see the right offset
+      self.assertEqual('la', os.read(0, 2))
+      self.assertEqual('st', builtin_misc.ReadLineFromStdin(None))
+      self.assertEqual('', builtin_misc.ReadLineFromStdin(None))
+    finally:
+      os.dup2(saved, 0)
+      os.close(saved)
+
   def testPrintHelp(self):
     # Localization: Optionally  use GNU gettext()?  For help only.  Might be
     # useful in parser error messages too.  Good thing both kinds of code are
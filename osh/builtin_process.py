@@ -7,27 +7,28 @@ This is sort of the opposite of builtin_pure.py.
 from __future__ import print_function
 
 import signal  # for calculating numbers
+import time
 
 from _devbuild.gen.runtime_asdl import (
     cmd_value, cmd_value__Argv,
-    job_status_e, job_status__Proc, job_status__Pipeline,
+    job_state_e, job_status_e, job_status__Proc, job_status__Pipeline,
 )
 from _devbuild.gen.syntax_asdl import source
 from asdl import runtime
 from core import error
-from core import main_loop
+from core import process
+from core import state
 from core import ui
 from core.util import log
 from frontend import args
 from frontend import arg_def
-from frontend import reader
 from mycpp import mylib
 from mycpp.mylib import tagswitch
 from osh.builtin_misc import _Builtin
 
 import posix_ as posix
 
-from typing import List, Dict, Any, cast, TYPE_CHECKING
+from typing import List, Dict, Any, Optional, cast, TYPE_CHECKING
 if TYPE_CHECKING:
   from _devbuild.gen.syntax_asdl import command_t
   from core.ui import ErrorFormatter
@@ -35,7 +36,8 @@ if TYPE_CHECKING:
       ExternalProgram, FdState, JobState, SignalState, Waiter
   )
   from core.state import Mem, SearchPath
-  from frontend.parse_lib import ParseContext
+  from frontend.parse_cache import ParseCache
+  from osh.cmd_eval import CommandEvaluator
 
 
 if mylib.PYTHON:
@@ -83,6 +85,10 @@ class Exec(object):
 if mylib.PYTHON:
   WAIT_SPEC = arg_def.Register('wait')
   WAIT_SPEC.ShortFlag('-n')
+  WAIT_SPEC.ShortFlag('-t', args.Float)  # timeout in seconds (not in bash)
+
+# Like 'read -t' in bash: 128 + SIGALRM
+_TIMEOUT_STATUS = 128 + signal.SIGALRM
 
 
 class Wait(object):
@@ -97,7 +103,10 @@ class Wait(object):
       in that job's pipeline.
 
       If the -n option is supplied, waits for the next job to terminate and
-      returns its exit status.
+      returns its exit status.  If IDs are given with -n, waits for the next
+      one of them.
+
+      If -t SECONDS is supplied, gives up after that long and returns 142.
 
       Exit Status:
       Returns the status of the last ID; fails if ID is invalid or an invalid
@@ -116,29 +125,8 @@ class Wait(object):
     job_ids = cmd_val.argv[arg_index:]
     arg_count = len(cmd_val.argv)
 
-    if arg.n:
-      # wait -n returns the exit status of the JOB.
-      # You don't know WHICH process, which is odd.
-
-      # TODO: this should wait for the next JOB, which may be multiple
-      # processes.
-      # Bash has a wait_for_any_job() function, which loops until the jobs
-      # table changes.
-      #
-      # target_count = self.job_state.NumRunning() - 1
-      # while True:
-      #   if not self.waiter.WaitForOne():
-      #     break
-      #
-      #   if self.job_state.NumRunning == target_count:
-      #     break
-      #    
-      #log('wait next')
-
-      if self.waiter.WaitForOne():
-        return self.waiter.last_status
-      else:
-        return 127  # nothing to wait for
+    if arg.n or arg.t is not None:
+      return self._WaitAny(cmd_val, arg_index, arg.n, arg.t)
 
     if arg_index == arg_count:  # no arguments
       #log('wait all')
@@ -205,6 +193,163 @@ class Wait(object):
     return status
 
 
+  def _Pids(self, cmd_val, arg_index):
+    # type: (cmd_value__Argv, int) -> List[int]
+    """Look up the PIDs given as arguments, or None if one isn't a child."""
+    pids = []  # type: List[int]
+    for i in xrange(arg_index, len(cmd_val.argv)):
+      job_id = cmd_val.argv[i]
+      span_id = cmd_val.arg_spids[i]
+      if job_id.startswith('%'):
+        raise args.UsageError(
+            "doesn't support bash-style jobspecs (got %r)" % job_id,
+            span_id=span_id)
+      try:
+        pid = int(job_id)
+      except ValueError:
+        raise args.UsageError('expected PID or jobspec, got %r' % job_id,
+                              span_id=span_id)
+
+      if self.job_state.JobFromPid(pid) is None:
+        self.errfmt.Print("%s isn't a child of this shell", pid,
+                          span_id=span_id)
+        return None
+      pids.append(pid)
+    return pids
+
+  def _WaitAny(self, cmd_val, arg_index, next_only, timeout):
+    # type: (cmd_value__Argv, int, bool, Optional[float]) -> int
+    """wait -n, wait -n PID..., and wait -t SECONDS.
+
+    Waits on the given processes with pidfds, rather than waitpid(-1), which
+    would return for any child.
+    """
+    if timeout is None:
+      if arg_index == len(cmd_val.argv):  # wait -n
+        # TODO: This should wait for the next JOB, which may be multiple
+        # processes, like bash's wait_for_any_job().
+        if self.waiter.WaitForOne():
+          return self.waiter.last_status
+        else:
+          return 127  # nothing to wait for
+      timeout = -1.0
+
+    if arg_index == len(cmd_val.argv):
+      pids = self.job_state.RunningPids()
+      if next_only and len(pids) == 0:
+        return 127  # nothing to wait for
+    else:
+      pids = self._Pids(cmd_val, arg_index)
+      if pids is None:
+        return 127
+
+    pending = pids
+    if next_only:
+      # Like bash, a process is reported once.  Then 'wait -n' waits for the
+      # others.
+      pending = []
+      for pid in pids:
+        if not self.job_state.JobFromPid(pid).reported:
+          pending.append(pid)
+      if len(pending) == 0:
+        return 127  # nothing to wait for
+
+    if timeout >= 0:
+      deadline = time.time() + timeout
+
+    while True:
+      running = []  # type: List[int]
+      for pid in pending:
+        proc = self.job_state.JobFromPid(pid)
+        if proc.state == job_state_e.Running:
+          running.append(pid)
+        elif next_only:  # It already finished
+          proc.reported = True
+          return proc.status
+
+      if len(running) == 0:
+        break
+
+      if timeout >= 0:
+        timeout = max(0.0, deadline - time.time())
+      try:
+        pid = self.waiter.WaitForAny(running, timeout)
+      except OSError as e:
+        # e.g. ENOSYS from pidfd_open() before Linux 5.3, which we need for a
+        # timeout, or ESRCH
+        self.errfmt.Print('wait: %s', posix.strerror(e.errno),
+                          span_id=cmd_val.arg_spids[0])
+        return 2
+      if pid == -1:
+        return _TIMEOUT_STATUS
+      if next_only:
+        proc = self.job_state.JobFromPid(pid)
+        proc.reported = True
+        return proc.status
+      pending = running
+
+    if arg_index == len(cmd_val.argv):
+      return 0
+    # Like 'wait PID...', the status of the last one on the command line
+    return self.job_state.JobFromPid(pids[-1]).status
+
+
+if mylib.PYTHON:
+  POOL_SPEC = arg_def.Register('pool')
+  POOL_SPEC.ShortFlag('-j', args.Int)
+  POOL_SPEC.ShortFlag('-a', args.Str)
+
+
+class Pool(object):
+  """
+  pool -j N [-a NAME] { ... }
+
+  Runs the block, and keeps at most N of the background jobs it starts
+  running at once.  Starting another one waits for one to exit.  After the
+  block, waits for the rest, and puts the status of each job in the array
+  NAME, in the order they started.
+
+  Returns 0 if they all succeeded, or else the status of the last one that
+  failed, like pipefail.
+  """
+  def __init__(self, cmd_ev, waiter, job_state, mem, errfmt):
+    # type: (CommandEvaluator, Waiter, JobState, Mem, ErrorFormatter) -> None
+    self.cmd_ev = cmd_ev
+    self.waiter = waiter
+    self.job_state = job_state
+    self.mem = mem
+    self.errfmt = errfmt
+
+  def Run(self, cmd_val):
+    # type: (cmd_value__Argv) -> int
+    arg, arg_index = POOL_SPEC.ParseCmdVal(cmd_val)
+    if arg_index != len(cmd_val.argv):
+      raise args.UsageError('got unexpected argument %r' %
+                            cmd_val.argv[arg_index],
+                            span_id=cmd_val.arg_spids[arg_index])
+    if arg.j is None or arg.j < 1:
+      raise args.UsageError('expected -j with a positive number of jobs')
+    if cmd_val.block is None:
+      raise args.UsageError('expected a block')
+
+    pool = process.JobPool(self.waiter, self.job_state, arg.j)
+    self.job_state.pools.append(pool)
+    try:
+      unused = self.cmd_ev.EvalBlock(cmd_val.block)
+    finally:
+      self.job_state.pools.pop()
+
+    statuses = pool.WaitAll()
+    if arg.a is not None:
+      state.SetArrayDynamic(self.mem, arg.a, [str(st) for st in statuses])
+
+    status = 0
+    for st in statuses:
+      if st != 0:
+        status = st
+    return status
+
+
 class Jobs(object):
   """List jobs."""
   def __init__(self, job_state):
@@ -351,13 +496,13 @@ if mylib.PYTHON:
 # OVM match sh/bash more closely.
 
 class Trap(object):
-  def __init__(self, sig_state, traps, nodes_to_run, parse_ctx, errfmt):
-    # type: (SignalState, Dict[str, _TrapHandler], List[command_t], ParseContext, ErrorFormatter) -> None
+  def __init__(self, sig_state, traps, nodes_to_run, parse_cache, errfmt):
+    # type: (SignalState, Dict[str, _TrapHandler], List[command_t], ParseCache, ErrorFormatter) -> None
     self.sig_state = sig_state
     self.traps = traps
     self.nodes_to_run = nodes_to_run
-    self.parse_ctx = parse_ctx
-    self.arena = parse_ctx.arena
+    self.parse_cache = parse_cache
+    self.arena = parse_cache.arena
     self.errfmt = errfmt
 
   def _ParseTrapCode(self, code_str):
@@ -366,14 +511,12 @@ class Trap(object):
     Returns:
       A node, or None if the code is invalid.
     """
-    line_reader = reader.StringLineReader(code_str, self.arena)
-    c_parser = self.parse_ctx.MakeOshParser(line_reader)
-
     # TODO: the SPID should be passed through argv
-    self.arena.PushSource(source.Trap(runtime.NO_SPID))
+    src = source.Trap(runtime.NO_SPID)
+    self.arena.PushSource(src)
     try:
       try:
-        node = main_loop.ParseWholeFile(c_parser)
+        node = self.parse_cache.ParseWhole(code_str, src)
       except error.Parse as e:
         ui.PrettyPrintError(e, self.arena)
         return None
@@ -128,6 +128,38 @@ _DISALLOWED = [
     command_e.CommandList,  # Happens in $(command sub)
 ]
 
+# Nodes with a 'redirects' field.  See _EvalRedirects().
+_HAS_REDIRECTS = [
+    command_e.Simple, command_e.ExpandedAlias, command_e.ShAssignment,
+    command_e.BraceGroup, command_e.Subshell, command_e.DParen,
+    command_e.DBracket, command_e.ForEach, command_e.ForExpr,
+    command_e.WhileUntil, command_e.If, command_e.Case,
+]
+
+# Bit flags for each command_e tag, so _Execute() tests a bit instead of
+# comparing the tag against a list of tags on every command.
+_REDIRECTS = 1 << 0       # evaluate redirects
+_ERREXIT_CHECK = 1 << 1   # call _DisallowErrExit() under strict_errexit
+
+
+def _MakeCommandFlags():
+  # type: () -> Dict[int, int]
+  flags = {}  # type: Dict[int, int]
+  for tag in _HAS_REDIRECTS:
+    flags[tag] = flags.get(tag, 0) | _REDIRECTS
+  for tag in _DISALLOWED:
+    flags[tag] = flags.get(tag, 0) | _ERREXIT_CHECK
+  # Only disallowed when it has more than one child
+  flags[command_e.Pipeline] = flags.get(command_e.Pipeline, 0) | _ERREXIT_CHECK
+  return flags
+
+
+_COMMAND_FLAGS = _MakeCommandFlags()
+
+# Shared by commands without redirects.  Never mutated.
+_NO_REDIRECTS = []  # type: List[redirect]
+
+
 def _DisallowErrExit(node):
   # type: (command_t) -> bool
   tag = node.tag_()
@@ -462,6 +494,9 @@ class CommandEvaluator(object):
       else:
         raise AssertionError()
 
+    if len(redirects) == 0:  # common case
+      return _NO_REDIRECTS
+
     result = []  # type: List[redirect]
     for redir in redirects:
       result.append(self._EvalRedirect(redir))
@@ -514,6 +549,7 @@ class CommandEvaluator(object):
         # PS4='+$SOURCE_NAME:$LINENO:'
         # Note that for '> $LINENO' the span_id is set in _EvalRedirect.
         # TODO: Can we avoid setting this so many times?  See issue #567.
+        span_id = runtime.NO_SPID
         if len(node.words):
           span_id = word_.LeftMostSpanForWord(node.words[0])
           self.mem.SetCurrentSpanId(span_id)
@@ -551,6 +587,7 @@ class CommandEvaluator(object):
         # it.  We could trace the env separately?  Also trace unevaluated code
         # with set-o verbose?
         self.tracer.OnSimpleCommand(argv)
+        start_time = self.tracer.StartCommand(node.do_fork)
 
         # NOTE: RunSimpleCommand never returns when do_fork=False!
         if len(node.more_env):  # I think this guard is necessary?
@@ -569,6 +606,8 @@ class CommandEvaluator(object):
         else:
           status = self._RunSimpleCommand(cmd_val, node.do_fork)
 
+        self.tracer.OnCommandDone(span_id, argv, start_time, status)
+
       elif case(command_e.ExpandedAlias):
         node = cast(command__ExpandedAlias, UP_node)
         # Expanded aliases need redirects and env bindings from the calling
@@ -1278,9 +1317,11 @@ class CommandEvaluator(object):
       for trap_node in to_run:  # NOTE: Don't call this 'node'!
         self._Execute(trap_node)
 
+    flags = _COMMAND_FLAGS.get(node.tag_(), 0)
+
     # strict_errexit check for all compound commands.
-    # TODO: Speed this up with some kind of bit mask?
-    if self.exec_opts.strict_errexit() and _DisallowErrExit(node):
+    if (flags & _ERREXIT_CHECK and self.exec_opts.strict_errexit() and
+        _DisallowErrExit(node)):
 
       span_id = self.mutable_opts.errexit.SpidIfDisabled()
       if span_id != runtime.NO_SPID:
@@ -1288,23 +1329,14 @@ class CommandEvaluator(object):
         e_die("errexit is disabled here, but strict_errexit disallows it "
               "with a compound command (%s)", node_str, span_id=span_id)
 
-    # These nodes have no redirects.
-    # TODO: Speed this up with some kind of bit mask?
-    if node.tag_() in (
-        command_e.NoOp, command_e.ControlFlow, command_e.Pipeline,
-        command_e.AndOr, command_e.CommandList, command_e.DoGroup,
-        command_e.Sentence,
-        command_e.TimeBlock, command_e.ShFunction, command_e.VarDecl,
-        command_e.PlaceMutation, command_e.OilCondition, command_e.OilForIn,
-        command_e.Proc, command_e.Func, command_e.Return, command_e.Expr,
-        command_e.BareDecl):
-      redirects = []  # type: List[redirect]
-    else:
+    if flags & _REDIRECTS:
       try:
         redirects = self._EvalRedirects(node)
       except error.RedirectEval as e:
         ui.PrettyPrintError(e, self.arena)
         redirects = None
+    else:
+      redirects = _NO_REDIRECTS
 
     check_errexit = True
 
@@ -2032,6 +2032,9 @@ class CommandParser(object):
     Raises:
       ParseError
     """
+    # We won't read back lines of the previous logical line.
+    self.arena.ReleaseFileLines()
+
     self._NewlineOk()
     self._Peek()
     if self.c_id == Id.Eof_Real:
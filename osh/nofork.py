@@ -0,0 +1,502 @@
+#!/usr/bin/env python2
+"""
+nofork.py - Decide whether a command sub can run without forking.
+
+With shopt -s nofork_command_sub, $(myfunc) runs in the shell process, with
+stdout redirected to a temp file.  That's only valid when the body can't
+change shell state that a forked child would have thrown away, so we walk the
+command_t tree and allow a conservative subset:
+
+- Builtins that only write output: echo, printf (without -v), true, false, :,
+  test, [
+- Shell functions whose bodies are also allowed.  'local' and assignments to
+  names declared 'local' earlier in the function are OK, since the frame is
+  popped when the function returns.
+- Control flow and compound commands made of the above: &&, ||, if, case,
+  while, for (over a local), { }
+- Words without side effects.  ${x:=default}, $(( i++ )), [[ =~ ]] (which
+  sets BASH_REMATCH) and process subs aren't allowed.  Nested command subs
+  are fine; they're checked separately when they run.
+
+Anything else, including external commands, makes us fork as usual.  Mem
+changes the body is allowed to make, like $? and the call stack, are undone
+by Mem.Snapshot() and Mem.Restore().
+"""
+from __future__ import print_function
+
+from _devbuild.gen.id_kind_asdl import Id
+from _devbuild.gen.option_asdl import builtin_i
+from _devbuild.gen.syntax_asdl import (
+    command_e, command_t,
+    command__Simple, command__ExpandedAlias, command__Sentence,
+    command__ShAssignment, command__ControlFlow, command__AndOr,
+    command__DoGroup, command__BraceGroup, command__DBracket,
+    command__ForEach, command__WhileUntil, command__If, command__Case,
+    command__CommandList, command__ShFunction,
+    word_e, word_t, compound_word,
+    word_part_e, word_part_t,
+    word_part__BracedTuple, command_sub, double_quoted, braced_var_sub, sh_lhs_expr_e, sh_lhs_expr__Name,
+    bracket_op_e, bracket_op__ArrayIndex,
+    suffix_op_e, suffix_op__Unary, suffix_op__PatSub, suffix_op__Slice,
+    arith_expr_e, arith_expr_t, arith_expr__ArithWord, arith_expr__Unary,
+    arith_expr__Binary, arith_expr__TernaryOp, word_part__ArithSub,
+    bool_expr_e, bool_expr_t, bool_expr__WordTest, bool_expr__Binary,
+    bool_expr__Unary, bool_expr__LogicalNot, bool_expr__LogicalAnd,
+    bool_expr__LogicalOr,
+    redir, redir_param_e, redir_param__MultiLine,
+)
+from frontend import consts
+from osh import word_
+
+from typing import cast, Dict, List, Optional
+
+
+# Normal builtins that don't change shell state.  printf -v is checked
+# separately.
+_OUTPUT_BUILTINS = [
+    builtin_i.echo, builtin_i.printf, builtin_i.true_, builtin_i.false_,
+    builtin_i.test, builtin_i.bracket,
+]
+
+
+def _Branch(locals_):
+  # type: (Optional[List[str]]) -> Optional[List[str]]
+  """'local' in a branch or loop doesn't declare anything after it."""
+  return None if locals_ is None else list(locals_)
+
+
+class Checker(object):
+  """Decides whether a command sub body can run in the shell process."""
+
+  def __init__(self, procs):
+    # type: (Dict[str, command__ShFunction]) -> None
+    self.procs = procs
+    # Function bodies we've checked.  The result depends on the functions the
+    # body calls, which are looked up by name, so it's cleared when a function
+    # is defined.  Functions can't be defined by a body we allow.
+    self.func_cache = {}  # type: Dict[command__ShFunction, bool]
+    self.procs_seen = {}  # type: Dict[str, command__ShFunction]
+
+    # Functions whose results were cached during the current top-level check.
+    # They may rely on a caller that was assumed OK.
+    self.depth = 0
+    self.tentative = []  # type: List[command__ShFunction]
+    self.any_failed = False
+
+  def _CheckProcs(self):
+    # type: () -> None
+    if self.procs != self.procs_seen:
+      self.func_cache.clear()
+      self.procs_seen = dict(self.procs)
+
+  def CanRunInProcess(self, node):
+    # type: (command_t) -> bool
+
+    # _MakeProcess() makes a bare 'break' or 'return' a fatal error, so fork to
+    # report it the same way.
+    if node.tag_() == command_e.ControlFlow:
+      return False
+
+    self._CheckProcs()
+    return self._Command(node, None)
+
+  def CanRunBeforeReader(self, node):
+    # type: (command_t) -> bool
+    """Can this pipeline stage run to completion before the next one starts?
+
+    Only a single echo or printf, since a loop might never finish, e.g.
+    'while true; do echo y; done | head -n 1'.
+    """
+    if node.tag_() != command_e.Simple:
+      return False
+    simple = cast(command__Simple, node)
+    if len(simple.words) == 0:
+      return False
+
+    ok, arg0, _ = word_.StaticEval(simple.words[0])
+    if not ok or arg0 not in ('echo', 'printf') or arg0 in self.procs:
+      return False
+    self._CheckProcs()
+    return self._Simple(simple, None)
+
+  def _Func(self, func_node):
+    # type: (command__ShFunction) -> bool
+    try:
+      return self.func_cache[func_node]
+    except KeyError:
+      pass
+
+    # Assume True while checking, so recursive functions terminate.
+    self.func_cache[func_node] = True
+    self.depth += 1
+    try:
+      ok = self._Command(func_node.body, [])
+    finally:
+      self.depth -= 1
+    self.func_cache[func_node] = ok
+
+    self.tentative.append(func_node)
+    if not ok:
+      self.any_failed = True
+    if self.depth == 0:
+      # If a function failed, others that called it while it was assumed OK
+      # are wrong.  False results are always right.
+      if self.any_failed:
+        for n in self.tentative:
+          if self.func_cache.get(n):
+            del self.func_cache[n]
+      del self.tentative[:]
+      self.any_failed = False
+    return ok
+
+  def _Commands(self, nodes, locals_):
+    # type: (List[command_t], Optional[List[str]]) -> bool
+    for node in nodes:
+      if not self._Command(node, locals_):
+        return False
+    return True
+
+  def _Command(self, node, locals_):
+    # type: (command_t, Optional[List[str]]) -> bool
+    """
+    Args:
+      locals_: names declared with 'local' so far in the enclosing function,
+        or None if we're not in a function.
+    """
+    UP_node = node
+    tag = node.tag_()
+
+    if tag == command_e.Simple:
+      node = cast(command__Simple, UP_node)
+      return self._Simple(node, locals_)
+
+    if tag == command_e.ExpandedAlias:
+      node = cast(command__ExpandedAlias, UP_node)
+      return (self._Redirects(node.redirects) and
+              self._Words([pair.val for pair in node.more_env]) and
+              self._Command(node.child, locals_))
+
+    if tag == command_e.Sentence:
+      node = cast(command__Sentence, UP_node)
+      if node.terminator.id == Id.Op_Amp:  # background job
+        return False
+      return self._Command(node.child, locals_)
+
+    if tag == command_e.ShAssignment:
+      node = cast(command__ShAssignment, UP_node)
+      if locals_ is None or not self._Redirects(node.redirects):
+        return False
+      for pair in node.pairs:
+        if pair.lhs.tag_() != sh_lhs_expr_e.Name:  # a[i]=x
+          return False
+        lhs = cast(sh_lhs_expr__Name, pair.lhs)
+        if lhs.name not in locals_:
+          return False
+        if pair.rhs and not self._Word(pair.rhs):
+          return False
+      return True
+
+    if tag == command_e.ControlFlow:
+      node = cast(command__ControlFlow, UP_node)
+      if node.token.id == Id.ControlFlow_Exit:
+        return False
+      # 'return' at the top level is OK in a command sub.
+      return node.arg_word is None or self._Word(node.arg_word)
+
+    if tag == command_e.AndOr:
+      node = cast(command__AndOr, UP_node)
+      # 'false && local x' may not declare x
+      return self._Commands(node.children, _Branch(locals_))
+
+    if tag == command_e.DoGroup:
+      node = cast(command__DoGroup, UP_node)
+      return self._Commands(node.children, locals_)
+
+    if tag == command_e.BraceGroup:
+      node = cast(command__BraceGroup, UP_node)
+      return (self._Redirects(node.redirects) and
+              self._Commands(node.children, locals_))
+
+    if tag == command_e.CommandList:
+      node = cast(command__CommandList, UP_node)
+      return self._Commands(node.children, locals_)
+
+    if tag == command_e.DBracket:
+      node = cast(command__DBracket, UP_node)
+      return self._Redirects(node.redirects) and self._BoolExpr(node.expr)
+
+    if tag == command_e.ForEach:
+      node = cast(command__ForEach, UP_node)
+      # The loop variable is assigned, so it has to be local.
+      if locals_ is None or node.iter_name not in locals_:
+        return False
+      return (self._Redirects(node.redirects) and
+              self._Words(node.iter_words) and
+              self._Command(node.body, _Branch(locals_)))
+
+    if tag == command_e.WhileUntil:
+      node = cast(command__WhileUntil, UP_node)
+      locals_ = _Branch(locals_)
+      return (self._Redirects(node.redirects) and
+              self._Commands(node.cond, locals_) and
+              self._Command(node.body, locals_))
+
+    if tag == command_e.If:
+      node = cast(command__If, UP_node)
+      if not self._Redirects(node.redirects):
+        return False
+      for arm in node.arms:
+        arm_locals = _Branch(locals_)
+        if not self._Commands(arm.cond, arm_locals):
+          return False
+        if not self._Commands(arm.action, arm_locals):
+          return False
+      return self._Commands(node.else_action, _Branch(locals_))
+
+    if tag == command_e.Case:
+      node = cast(command__Case, UP_node)
+      if not self._Redirects(node.redirects) or not self._Word(node.to_match):
+        return False
+      for case_arm in node.arms:
+        if not self._Words(case_arm.pat_list):
+          return False
+        if not self._Commands(case_arm.action, _Branch(locals_)):
+          return False
+      return True
+
+    if tag == command_e.NoOp:
+      return True
+
+    # Pipelines, subshells, (( )), for (( )), function definitions, Oil
+    # commands, etc.
+    return False
+
+  def _Simple(self, node, locals_):
+    # type: (command__Simple, Optional[List[str]]) -> bool
+    if node.block:
+      return False
+    if not self._Redirects(node.redirects):
+      return False
+    # FOO=bar myfunc binds FOO in a temp frame.
+    if not self._Words([pair.val for pair in node.more_env]):
+      return False
+
+    if len(node.words) == 0:
+      return True
+
+    ok, arg0, _ = word_.StaticEval(node.words[0])
+    if not ok:  # $cmd
+      return False
+    args = node.words[1:]
+
+    # Same order as CommandEvaluator and ShellExecutor.RunSimpleCommand
+    if consts.LookupAssignBuiltin(arg0) != consts.NO_INDEX:
+      if arg0 != 'local' or locals_ is None:
+        return False
+      return self._Local(args, locals_)
+
+    if consts.LookupSpecialBuiltin(arg0) != consts.NO_INDEX:
+      return arg0 == ':' and self._Words(args)
+
+    func_node = self.procs.get(arg0)
+    if func_node is not None:
+      return self._Words(args) and self._Func(func_node)
+
+    if consts.LookupNormalBuiltin(arg0) not in _OUTPUT_BUILTINS:
+      return False
+
+    if arg0 == 'printf':  # printf -v assigns a variable
+      for w in args:
+        ok, s, _ = word_.StaticEval(w)
+        if not ok or s.startswith('-v'):
+          return False
+        if not s.startswith('-'):  # the format string
+          break
+
+    return self._Words(args)
+
+  def _Local(self, args, locals_):
+    # type: (List[word_t], List[str]) -> bool
+    """'local x y=1' appends x and y to locals_."""
+    for w in args:
+      if w.tag_() != word_e.Compound:
+        return False
+      cw = cast(compound_word, w)
+      left_token, close_token, part_offset = word_.DetectShAssignment(cw)
+      if left_token:
+        # Not a[x]=1, x+=1, etc.
+        if left_token.id != Id.Lit_VarLike or left_token.val.endswith('+='):
+          return False
+        name = left_token.val[:-1]
+        if not self._Parts(cw.parts[part_offset:]):
+          return False
+      else:
+        ok, name, _ = word_.StaticEval(w)
+        if not ok or name.startswith('-') or name.startswith('+'):
+          return False  # local -n, local $dynamic, etc.
+      locals_.append(name)
+    return True
+
+  def _Redirects(self, redirects):
+    # type: (List[redir]) -> bool
+    for r in redirects:
+      UP_arg = r.arg
+      if r.arg.tag_() == redir_param_e.MultiLine:  # here doc
+        arg = cast(redir_param__MultiLine, UP_arg)
+        if not self._Parts(arg.stdin_parts):
+          return False
+      else:
+        if not self._Word(cast(compound_word, UP_arg)):
+          return False
+    return True
+
+  def _Words(self, words):
+    # type: (List[word_t]) -> bool
+    for w in words:
+      if not self._Word(w):
+        return False
+    return True
+
+  def _Word(self, w):
+    # type: (word_t) -> bool
+    UP_w = w
+    tag = w.tag_()
+    if tag == word_e.Compound:
+      w = cast(compound_word, UP_w)
+      return self._Parts(w.parts)
+    if tag == word_e.Empty:
+      return True
+    # BracedTree, etc.
+    return False
+
+  def _Parts(self, parts):
+    # type: (List[word_part_t]) -> bool
+    for part in parts:
+      if not self._Part(part):
+        return False
+    return True
+
+  def _Part(self, part):
+    # type: (word_part_t) -> bool
+    UP_part = part
+    tag = part.tag_()
+
+    if tag in (word_part_e.Literal, word_part_e.EscapedLiteral,
+               word_part_e.SingleQuoted, word_part_e.SimpleVarSub,
+               word_part_e.TildeSub, word_part_e.BracedRange):
+      return True
+
+    if tag == word_part_e.CommandSub:
+      cs_part = cast(command_sub, UP_part)
+      # Process subs start a process that outlives the word.
+      return cs_part.left_token.id in (Id.Left_DollarParen, Id.Left_Backtick)
+
+    if tag == word_part_e.DoubleQuoted:
+      dq = cast(double_quoted, UP_part)
+      return self._Parts(dq.parts)
+
+    if tag == word_part_e.BracedVarSub:
+      return self._BracedVarSub(cast(braced_var_sub, UP_part))
+
+    if tag == word_part_e.ArithSub:
+      part = cast(word_part__ArithSub, UP_part)
+      return self._Arith(part.anode)
+
+    if tag == word_part_e.BracedTuple:
+      part = cast(word_part__BracedTuple, UP_part)
+      return self._Words(part.words)
+
+    # ExtGlob, array literals, Oil splice and expressions, etc.
+    return False
+
+  def _BracedVarSub(self, part):
+    # type: (braced_var_sub) -> bool
+    if part.bracket_op:
+      UP_op = part.bracket_op
+      if part.bracket_op.tag_() == bracket_op_e.ArrayIndex:
+        op = cast(bracket_op__ArrayIndex, UP_op)
+        if not self._Arith(op.expr):
+          return False
+
+    if part.suffix_op:
+      UP_op = part.suffix_op
+      tag = part.suffix_op.tag_()
+      if tag == suffix_op_e.Unary:
+        op = cast(suffix_op__Unary, UP_op)
+        # ${x=default} and ${x:=default} assign
+        if op.op_id in (Id.VTest_Equals, Id.VTest_ColonEquals):
+          return False
+        return self._Word(op.arg_word)
+
+      if tag == suffix_op_e.PatSub:
+        op = cast(suffix_op__PatSub, UP_op)
+        return (self._Word(op.pat) and
+                (op.replace is None or self._Word(op.replace)))
+
+      if tag == suffix_op_e.Slice:
+        op = cast(suffix_op__Slice, UP_op)
+        return ((op.begin is None or self._Arith(op.begin)) and
+                (op.length is None or self._Arith(op.length)))
+
+    return True
+
+  def _Arith(self, node):
+    # type: (arith_expr_t) -> bool
+    UP_node = node
+    tag = node.tag_()
+
+    if tag == arith_expr_e.VarRef:
+      return True
+
+    if tag == arith_expr_e.ArithWord:
+      node = cast(arith_expr__ArithWord, UP_node)
+      return self._Word(node.w)
+
+    if tag == arith_expr_e.Unary:
+      node = cast(arith_expr__Unary, UP_node)
+      return self._Arith(node.child)
+
+    if tag == arith_expr_e.Binary:
+      node = cast(arith_expr__Binary, UP_node)
+      return self._Arith(node.left) and self._Arith(node.right)
+
+    if tag == arith_expr_e.TernaryOp:
+      node = cast(arith_expr__TernaryOp, UP_node)
+      return (self._Arith(node.cond) and self._Arith(node.true_expr) and
+              self._Arith(node.false_expr))
+
+    # UnaryAssign, BinaryAssign
+    return False
+
+  def _BoolExpr(self, node):
+    # type: (bool_expr_t) -> bool
+    UP_node = node
+    tag = node.tag_()
+
+    if tag == bool_expr_e.WordTest:
+      node = cast(bool_expr__WordTest, UP_node)
+      return self._Word(node.w)
+
+    if tag == bool_expr_e.Binary:
+      node = cast(bool_expr__Binary, UP_node)
+      if node.op_id == Id.BoolBinary_EqualTilde:  # sets BASH_REMATCH
+        return False
+      return self._Word(node.left) and self._Word(node.right)
+
+    if tag == bool_expr_e.Unary:
+      node = cast(bool_expr__Unary, UP_node)
+      return self._Word(node.child)
+
+    if tag == bool_expr_e.LogicalNot:
+      node = cast(bool_expr__LogicalNot, UP_node)
+      return self._BoolExpr(node.child)
+
+    if tag == bool_expr_e.LogicalAnd:
+      node = cast(bool_expr__LogicalAnd, UP_node)
+      return self._BoolExpr(node.left) and self._BoolExpr(node.right)
+
+    if tag == bool_expr_e.LogicalOr:
+      node = cast(bool_expr__LogicalOr, UP_node)
+      return self._BoolExpr(node.left) and self._BoolExpr(node.right)
+
+    return False
@@ -0,0 +1,177 @@
+#!/usr/bin/env python2
+"""
+nofork_test.py: Tests for nofork.py
+"""
+from __future__ import print_function
+
+import unittest
+
+from _devbuild.gen.syntax_asdl import command_e
+from core import test_lib
+from osh import nofork  # module under test
+
+
+def _Check(code_str):
+  """Define the functions in code_str, and check the rest as a command sub."""
+  c_parser = test_lib.InitCommandParser(code_str)
+  procs = {}
+  ok = True
+  while True:
+    node = c_parser.ParseLogicalLine()
+    if node is None:
+      break
+    if node.tag_() == command_e.ShFunction:
+      procs[node.name] = node
+      continue
+    checker = nofork.Checker(procs)
+    ok = ok and checker.CanRunInProcess(node)
+  return ok
+
+
+class CheckerTest(unittest.TestCase):
+
+  def testBuiltins(self):
+    for code_str in [
+        'echo hi',
+        'echo "$x" ${y:-default} ${#z} ${a[i+1]} $(( x + 1 ))',
+        'printf "%s\n" a b',
+        'printf -- x',
+        'test -n "$x" && echo yes || echo no',
+        '[[ $x == y* ]] && echo yes',
+        ': ${x:-}',
+        'echo $(nested)',
+        'if true; then echo a; elif false; then echo b; else echo c; fi',
+        'case $x in a) echo a ;; *) echo other ;; esac',
+        'while false; do echo x; done',
+        'echo hi; return 1',
+        ]:
+      self.assertEqual(True, _Check(code_str), code_str)
+
+  def testSideEffects(self):
+    for code_str in [
+        'ls',  # external
+        'x=1',
+        'echo ${x:=default}',
+        'echo $(( i++ ))',
+        'echo ${a[i=2]}',
+        '[[ $x =~ y ]]',
+        'printf -v x %s y',
+        'cd /',
+        'exit',
+        'return 1',  # a fatal error, like in a forked process
+        'break',
+        'echo hi | cat',
+        '( echo hi )',
+        'echo hi &',
+        'for x in a b; do echo $x; done',  # x is global
+        'local x',  # not in a function
+        '$cmd',
+        'cat <(echo hi)',
+        ]:
+      self.assertEqual(False, _Check(code_str), code_str)
+
+  def testFunctions(self):
+    self.assertEqual(True, _Check('''
+f() {
+  local x=$1 y
+  local i
+  y=$(( x * 2 ))
+  for i in 1 2; do
+    echo $x $y $i
+  done
+  return 0
+}
+f 42
+'''))
+
+    # Recursion
+    self.assertEqual(True, _Check('''
+f() {
+  local n=$1
+  test $n -eq 0 && return
+  echo $n
+  f $(( n - 1 ))
+}
+f 3
+'''))
+
+    # Assigns a global
+    self.assertEqual(False, _Check('''
+g() { x=1; echo $x; }
+g
+'''))
+
+    # Calls something that forks
+    self.assertEqual(False, _Check('''
+h() { echo hi; ls; }
+h2() { local x; h; }
+h2
+'''))
+
+    # Assignment before 'local'
+    self.assertEqual(False, _Check('''
+f() { x=1; local x; }
+f
+'''))
+
+    # 'local' in a branch
+    self.assertEqual(False, _Check('''
+f() { if test -n "$1"; then local x; fi; x=1; }
+f
+'''))
+    self.assertEqual(False, _Check('''
+f() { test -n "$1" && local x; x=1; }
+f
+'''))
+
+    self.assertEqual(False, _Check('''
+f() { local -n ref=$1; }
+f
+'''))
+
+  def testRedefinedFunction(self):
+    procs = {}
+    checker = nofork.Checker(procs)
+
+    def _Run(code_str):
+      c_parser = test_lib.InitCommandParser(code_str)
+      ok = True
+      while True:
+        node = c_parser.ParseLogicalLine()
+        if node is None:
+          break
+        if node.tag_() == command_e.ShFunction:
+          procs[node.name] = node
+        else:
+          ok = checker.CanRunInProcess(node)
+      return ok
+
+    self.assertEqual(True, _Run('g() { echo g1; }\nh() { g; }\nh\n'))
+    # h is the same node, but g is different
+    self.assertEqual(False, _Run('g() { cd /; echo g2; }\nh\n'))
+
+    # Mutual recursion: g was checked while f was assumed OK
+    self.assertEqual(False, _Run('''
+f() { if test $1 = 0; then cd /; else g; fi; }
+g() { f 0; }
+f 1
+'''))
+    self.assertEqual(False, _Run('g'))
+
+  def testCanRunBeforeReader(self):
+    def _Stage(code_str, procs=None):
+      c_parser = test_lib.InitCommandParser(code_str)
+      node = c_parser.ParseLogicalLine()
+      return nofork.Checker(procs or {}).CanRunBeforeReader(node)
+
+    self.assertEqual(True, _Stage('echo "$x"'))
+    self.assertEqual(True, _Stage('printf "%s\\n" "${a[@]}"'))
+    self.assertEqual(False, _Stage('printf -v x y'))
+    self.assertEqual(False, _Stage('while true; do echo y; done'))
+    self.assertEqual(False, _Stage('ls'))
+    # A function that shadows echo
+    self.assertEqual(False, _Stage('echo hi', procs={'echo': None}))
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -10,14 +10,12 @@ import pwd
 from _devbuild.gen.id_kind_asdl import Id
 from _devbuild.gen.runtime_asdl import value_e, value_t
 from _devbuild.gen.syntax_asdl import (
-    command_t, source, compound_word
+    source, compound_word
 )
 from asdl import runtime
-from core import main_loop
 from core import error
 from core import ui
 from frontend import match
-from frontend import reader
 from osh import word_
 from pylib import os_path
 
@@ -26,6 +24,7 @@ import posix_ as posix
 
 from typing import Any, Dict, List, Tuple, TYPE_CHECKING
 if TYPE_CHECKING:
+  from frontend.parse_cache import ParseCache
   from frontend.parse_lib import ParseContext
   from osh.cmd_eval import CommandEvaluator
   from core.state import Mem
@@ -242,14 +241,13 @@ class UserPlugin(object):
 
   Similar to core/dev.py:Tracer, which caches $PS4.
   """
-  def __init__(self, mem, parse_ctx, cmd_ev):
-    # type: (Mem, ParseContext, CommandEvaluator) -> None
+  def __init__(self, mem, parse_cache, cmd_ev):
+    # type: (Mem, ParseCache, CommandEvaluator) -> None
     self.mem = mem
-    self.parse_ctx = parse_ctx
+    self.parse_cache = parse_cache
     self.cmd_ev = cmd_ev
 
-    self.arena = parse_ctx.arena
-    self.parse_cache = {}  # type: Dict[str, command_t]
+    self.arena = parse_cache.arena
 
   def Run(self):
     # type: () -> None
@@ -257,28 +255,20 @@ class UserPlugin(object):
     if val.tag != value_e.Str:
       return
 
-    # PROMPT_COMMAND almost never changes, so we try to cache its parsing.
-    # This avoids memory allocations.
-    prompt_cmd = val.s
+    # PROMPT_COMMAND almost never changes, so the parse is cached.  This
+    # avoids memory allocations.
+    # NOTE: This is similar to Trap._ParseTrapCode().
+    # TODO: Add spid
+    src = source.PromptCommand(runtime.NO_SPID)
+    self.arena.PushSource(src)
     try:
-      node = self.parse_cache[prompt_cmd]
-    except KeyError:
-      line_reader = reader.StringLineReader(prompt_cmd, self.arena)
-      c_parser = self.parse_ctx.MakeOshParser(line_reader)
-
-      # NOTE: This is similar to CommandEvaluator.ParseTrapCode().
-      # TODO: Add spid
-      self.arena.PushSource(source.PromptCommand(runtime.NO_SPID))
       try:
-        try:
-          node = main_loop.ParseWholeFile(c_parser)
-        except error.Parse as e:
-          ui.PrettyPrintError(e, self.arena)
-          return  # don't execute
-      finally:
-        self.arena.PopSource()
-
-      self.parse_cache[prompt_cmd] = node
+        node = self.parse_cache.ParseWhole(val.s, src)
+      except error.Parse as e:
+        ui.PrettyPrintError(e, self.arena)
+        return  # don't execute
+    finally:
+      self.arena.PopSource()
 
     # Save this so PROMPT_COMMAND can't set $?
     self.mem.PushStatusFrame()
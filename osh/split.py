@@ -39,6 +39,8 @@ from frontend import consts
 from mycpp import mylib
 from mycpp.mylib import tagswitch
 
+import libc
+
 from typing import List, Tuple, Dict, TYPE_CHECKING, cast
 if TYPE_CHECKING:
   from core.state import Mem
@@ -48,10 +50,73 @@ if TYPE_CHECKING:
 
 DEFAULT_IFS = ' \t\n'
 
+
+if mylib.PYTHON:
+  # The size of the char_kind dimension of the edge table.  Sentinel is the
+  # largest char_kind.
+  _NUM_KINDS = CH.Sentinel + 1
+
+  def _MakeEdgeTable():
+    # type: () -> str
+    """Flatten consts._IFS_EDGES for libc.ifs_split().
+
+    Each (state, char_kind) pair gets 2 bytes: the new state and the action.
+    Pairs that aren't in the dict are invalid transitions.
+    """
+    table = [chr(ST.Invalid), chr(EMIT.Nothing)] * ((ST.Done + 1) * _NUM_KINDS)
+    for state in xrange(ST.Done + 1):
+      for ch in xrange(_NUM_KINDS):
+        try:
+          new_state, action = consts.IfsEdge(state, ch)
+        except KeyError:
+          continue
+        i = (state * _NUM_KINDS + ch) * 2
+        table[i] = chr(new_state)
+        table[i + 1] = chr(action)
+    return ''.join(table)
+
+  _EDGE_TABLE = _MakeEdgeTable()
+
+  # (ifs_whitespace, ifs_other, allow_escape) -> byte -> char_kind table.
+  # Like the regex cache in libc.c, it holds a fixed number of entries, and
+  # the least recently used one is evicted, since $IFS can be set to any
+  # number of values.
+  _MAX_KIND_TABLES = 64
+  _KIND_TABLES = {}  # type: Dict[Tuple[str, str, bool], str]
+  _KIND_TABLES_LRU = []  # type: List[Tuple[str, str, bool]]
+
+  def _KindTable(ws_chars, other_chars, allow_escape):
+    # type: (str, str, bool) -> str
+    """Return a 256 byte table with the char_kind of each byte."""
+    key = (ws_chars, other_chars, allow_escape)
+    result = _KIND_TABLES.get(key)
+    if result is not None:
+      if _KIND_TABLES_LRU[-1] != key:  # usually $IFS doesn't change
+        _KIND_TABLES_LRU.remove(key)
+        _KIND_TABLES_LRU.append(key)
+      return result
+
+    # Same precedence as the loop in IfsSplitter.Split()
+    table = [chr(CH.Black)] * 256
+    if allow_escape:
+      table[ord('\\')] = chr(CH.Backslash)
+    for c in other_chars:
+      table[ord(c)] = chr(CH.DE_Gray)
+    for c in ws_chars:
+      table[ord(c)] = chr(CH.DE_White)
+
+    result = ''.join(table)
+    _KIND_TABLES[key] = result
+    _KIND_TABLES_LRU.append(key)
+    if len(_KIND_TABLES_LRU) > _MAX_KIND_TABLES:
+      del _KIND_TABLES[_KIND_TABLES_LRU.pop(0)]
+    return result
+
+
 def _SpansToParts(s, spans):
   # type: (str, List[Span]) -> List[str]
   """Helper for SplitForWordEval."""
-  parts = [] # type: List[mylib.BufWriter]
+  parts = [] # type: List[str]
   start_index = 0
 
   # If the last span was black, and we get a backslash, set join_next to merge
@@ -62,12 +127,10 @@ def _SpansToParts(s, spans):
   for span_type, end_index in spans:
     if span_type == span_e.Black:
       if len(parts) and join_next:
-        parts[-1].write(s[start_index:end_index])
+        parts[-1] = parts[-1] + s[start_index:end_index]
         join_next = False
       else:
-        buf = mylib.BufWriter()
-        buf.write(s[start_index:end_index])
-        parts.append(buf)
+        parts.append(s[start_index:end_index])
 
       last_span_was_black = True
 
@@ -81,8 +144,7 @@ def _SpansToParts(s, spans):
 
     start_index = end_index
 
-  result = [buf.getvalue() for buf in parts]
-  return result
+  return parts
 
 
 class SplitContext(object):
@@ -228,6 +290,16 @@ class IfsSplitter(_BaseSplitter):
     TODO: This should be (frag, do_split) pairs, to avoid IFS='\'
     double-escaping issue.
     """
+    if mylib.PYTHON:
+      # Walk the same state machine in C, one table lookup per byte.
+      kinds = _KindTable(self.ifs_whitespace, self.ifs_other, allow_escape)
+      return libc.ifs_split(s, kinds, _EDGE_TABLE)
+
+    return self._Split(s, allow_escape)
+
+  def _Split(self, s, allow_escape):
+    # type: (str, bool) -> List[Span]
+    """The state machine loop, for when libc.ifs_split() isn't available."""
     ws_chars = self.ifs_whitespace
     other_chars = self.ifs_other
 
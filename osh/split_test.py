@@ -3,6 +3,7 @@
 split.test.py: Tests for split.py
 """
 
+import itertools
 import unittest
 
 from osh import split  # module under test
@@ -20,6 +21,9 @@ def _RunSplitCases(test, sp, cases):
       for span in spans:
         print('  %s %s' % span)
 
+    # libc.ifs_split() and the state machine in Python agree
+    test.assertEqual(sp._Split(s, allow_escape), spans)
+
     parts = split._SpansToParts(s, spans)
     print('PARTS %s' % parts)
 
@@ -164,6 +168,31 @@ class SplitTest(unittest.TestCase):
     sp = split.IfsSplitter('', '_-')
     _RunSplitCases(self, sp, CASES)
 
+  def testNativeSplit(self):
+    # Every string of length 5 or less made of whitespace, other IFS chars,
+    # backslashes, and black chars.
+    sp = split.IfsSplitter(' \t', '_\\')
+    no_backslash = split.IfsSplitter(' ', '_-')
+
+    for n in xrange(6):
+      for chars in itertools.product(' \t_\\a-', repeat=n):
+        s = ''.join(chars)
+        for allow_escape in (True, False):
+          self.assertEqual(sp._Split(s, allow_escape),
+                           sp.Split(s, allow_escape), repr(s))
+          self.assertEqual(no_backslash._Split(s, allow_escape),
+                           no_backslash.Split(s, allow_escape), repr(s))
+
+  def testKindTables(self):
+    # The tables for many values of $IFS are bounded
+    for i in xrange(split._MAX_KIND_TABLES + 10):
+      c = chr(0x80 + i)
+      sp = split.IfsSplitter(' ', c)
+      s = 'a%sb' % c
+      self.assertEqual(['a', 'b'], split._SpansToParts(s, sp.Split(s, True)))
+    self.assertEqual(split._MAX_KIND_TABLES, len(split._KIND_TABLES))
+    self.assertEqual(split._MAX_KIND_TABLES, len(split._KIND_TABLES_LRU))
+
 
 if __name__ == '__main__':
   unittest.main()
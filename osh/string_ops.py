@@ -354,45 +354,13 @@ def DoUnarySuffixOp(s, op, arg):
     raise NotImplementedError(ui.PrettyId(op.op_id))
 
 
-def _AllMatchPositions(s, regex):
-  # type: (str, str) -> List[Tuple[int, int]]
-  """Returns a list of all (start, end) match positions of the regex against s.
-
-  (If there are no matches, it returns the empty list.)
-  """
-  matches = []  # type: List[Tuple[int, int]]
-  pos = 0
-  n = len(s)
-  while pos < n:  # needed to prevent infinite loop in (.*) case
-    m = libc.regex_first_group_match(regex, s, pos)
-    if m is None:
-      break
-    matches.append(m)
-    start, end = m
-    pos = end  # advance position
-  return matches
-
-
-def _PatSubAll(s, regex, replace_str):
-  # type: (str, str, str) -> str
-  parts = []  # type: List[str]
-  prev_end = 0
-  for start, end in _AllMatchPositions(s, regex):
-    parts.append(s[prev_end:start])
-    parts.append(replace_str)
-    prev_end = end
-  parts.append(s[prev_end:])
-  return ''.join(parts)
-
-
 class GlobReplacer(object):
 
   def __init__(self, regex, replace_str, slash_spid):
     # type: (str, str, int) -> None
 
-    # TODO: It would be nice to cache the compilation of the regex here,
-    # instead of just the string.  That would require more sophisticated use of
-    # the Python/C API in libc.c, which we might want to avoid.
+    # NOTE: libc.c caches the compiled regex, keyed by this string, so we
+    # don't call regcomp() once per match.
     self.regex = regex
     self.replace_str = replace_str
     self.slash_spid = slash_spid
@@ -406,27 +374,23 @@ class GlobReplacer(object):
 
     regex = '(%s)' % self.regex  # make it a group
 
-    if op.replace_mode == Id.Lit_Slash:
-      try:
-        return _PatSubAll(s, regex, self.replace_str)  # loop over matches
-      except RuntimeError as e:
-        # libc.regex_first_group_match raises RuntimeError.
-        # note: MyPy doesn't know RuntimeError has e.message (and e.args)
-        msg = e.message  # type: str
-        e_die('Error matching regex %r: %s', regex, msg,
-              span_id=self.slash_spid)
-
     if op.replace_mode == Id.Lit_Pound:
       regex = '^' + regex
     elif op.replace_mode == Id.Lit_Percent:
       regex = regex + '$'
 
-    m = libc.regex_first_group_match(regex, s, 0)
-    #log('regex = %r, s = %r, match = %r', regex, s, m)
-    if m is None:
-      return s
-    start, end = m
-    return s[:start] + self.replace_str + s[end:]
+    try:
+      if op.replace_mode == Id.Lit_Slash:
+        # The whole loop over matches is done in C.
+        return libc.regex_replace_all(regex, s, self.replace_str)
+      else:
+        return libc.regex_replace_first(regex, s, self.replace_str)
+    except RuntimeError as e:
+      # libc.regex_replace_* raises RuntimeError.
+      # note: MyPy doesn't know RuntimeError has e.message (and e.args)
+      msg = e.message  # type: str
+      e_die('Error matching regex %r: %s', regex, msg,
+            span_id=self.slash_spid)
 
 
 # TODO: Replace with ShellQuoteOneLine?  It may need more testing and
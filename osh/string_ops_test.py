@@ -105,29 +105,6 @@ class LibStrTest(unittest.TestCase):
       print('%d test %06r return %06r' % (i, s[i:], s[:i]))
     print()
 
-  def testPatSubAllMatches(self):
-    s = 'oXooXoooX'
-
-    # Match positions
-    self.assertEqual(
-        [(1, 3), (4, 6)],
-        string_ops._AllMatchPositions(s, '(X.)'))
-
-    # No match
-    self.assertEqual(
-        [],
-        string_ops._AllMatchPositions(s, '(z)'))
-
-    # Replacement
-    self.assertEqual(
-        'o_o_ooX',
-        string_ops._PatSubAll(s, '(X.)', '_'))
-
-    # Replacement with no match
-    self.assertEqual(
-        s,
-        string_ops._PatSubAll(s, '(z)', '_'))
-
   def testShellQuote(self):
     CASES = [
         'x y',
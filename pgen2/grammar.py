@@ -27,6 +27,18 @@ if TYPE_CHECKING:
   first_t = Dict[int, int]
   states_t = List[List[arc_t]]
   dfa_t = Tuple[states_t, first_t]
+  accel_t = List[Dict[int, int]]
+
+# Actions in the accelerator tables.  The label 0 is never a token, so it marks
+# states with a final arc:
+#
+#   ilabel -> newstate                   shift the token
+#   ilabel -> (symbol << 8) | newstate   push the nonterminal
+#   0      -> ACCEPT or ACCEPT_ONLY      pop if no other label matches
+#
+# Symbols are 256 or higher, so an action that's 256 or higher is a push.
+ACCEPT = 0
+ACCEPT_ONLY = 1  # the final arc is the only one, so pop right away
 
 
 class Grammar(object):
@@ -78,6 +90,15 @@ class Grammar(object):
                      Oil patch: this became List[int] where int is the
                      token/symbol number.
 
+    accels        -- a dict mapping symbol numbers to a list with a
+                     dict for each state of its DFA.  Each dict maps a
+                     label number to the action for it (see ACCEPT
+                     above).  This is like the "accelerators" in
+                     CPython's Parser/acceler.c: the arcs and first
+                     sets are compiled into a table, so the parser
+                     does one lookup per token instead of searching the
+                     arcs.
+
     start         -- the number of the grammar's start symbol.
 
     keywords      -- a dict mapping keyword strings to arc labels.
@@ -99,6 +120,7 @@ class Grammar(object):
 
         self.states = []  # type: states_t
         self.dfas = {}  # type: Dict[int, dfa_t]
+        self.accels = {}  # type: Dict[int, accel_t]
         # Oil patch: used to be [(0, "EMPTY")].  I suppose 0 is a special value?
         # Or is it ENDMARKER?
         self.labels = [0]  # type: List[int]
@@ -135,6 +157,7 @@ class Grammar(object):
             self.number2symbol,
             self.states,
             self.dfas,
+            self.accels,
             labels,
             self.keywords,
             tokens,
@@ -173,7 +196,8 @@ namespace grammar_nt {
 }  // namespace grammar_nt
 """)
 
-      MARSHAL_HEADER = 'PGEN2\n'  # arbitrary header
+      # arbitrary header.  Version 2 added accels.
+      MARSHAL_HEADER = 'PGEN2 2\n'
 
       def loads(self, s):
           # type: (str) -> None
@@ -191,6 +215,7 @@ namespace grammar_nt {
             self.number2symbol,
             self.states,
             self.dfas,
+            self.accels,
             self.labels,
             self.keywords,
             self.tokens,
@@ -209,6 +234,7 @@ namespace grammar_nt {
           log("number2symbol: %d entries", len(self.number2symbol))
           log("states: %d entries", len(self.states))
           log("dfas: %d entries", len(self.dfas))
+          log("accels: %d entries", len(self.accels))
           return
           from pprint import pprint
           print("labels")
@@ -13,11 +13,12 @@ from core.util import log
 _ = log
 
 from typing import TYPE_CHECKING, Optional, Any, List
+from pgen2 import grammar
 from pgen2.pnode import PNode
 
 if TYPE_CHECKING:
   from _devbuild.gen.syntax_asdl import Token
-  from pgen2.grammar import Grammar, dfa_t
+  from pgen2.grammar import Grammar, accel_t
 
 
 class ParseError(Exception):
@@ -35,9 +36,9 @@ class ParseError(Exception):
 
 
 class _StackItem(object):
-  def __init__(self, dfa, state, node):
-    # type: (dfa_t, int, PNode) -> None
-    self.dfa = dfa
+  def __init__(self, accel, state, node):
+    # type: (accel_t, int, PNode) -> None
+    self.accel = accel
     self.state = state
     self.node = node
 
@@ -107,79 +108,54 @@ class Parser(object):
         state determined by the (implicit or explicit) start symbol.
         """
         newnode = PNode(start, None, [])
-        # Each stack entry is a tuple: (dfa, state, node).
-        self.stack = [_StackItem(self.grammar.dfas[start], 0, newnode)]
+        # Each stack entry is a tuple: (accel, state, node).
+        self.stack = [_StackItem(self.grammar.accels[start], 0, newnode)]
         self.rootnode = None  # type: Optional[PNode]
 
     def addtoken(self, typ, opaque, ilabel):
         # type: (int, Token, int) -> bool
         """Add a token; return True iff this is the end of the program."""
-        # Loop until the token is shifted; may raise exceptions
-
-        # Andy NOTE: This is not linear time, i.e. a constant amount of work
-        # for each token?  Is it O(n^2) as the ANTLR paper says?
-        # Do the "accelerators" in pgen.c have anything to do with it?
+        # Loop until the token is shifted; may raise exceptions.
+        #
+        # Each iteration is one lookup in the table that pgen compiled from the
+        # arcs and first sets, like the "accelerators" in pgen.c.  See
+        # make_accels() in pgen2/pgen.py.
 
         while True:
             top = self.stack[-1]
-            states, _ = top.dfa
-            state = top.state
-
-            arcs = states[state]
-
-            # Look for a state with this label
-            found = False
-            for ilab, newstate in arcs:
-                t = self.grammar.labels[ilab]
-                if ilabel == ilab:
-                    # Look it up in the list of labels
-                    assert t < 256, t
-                    # Shift a token; we're done with it
-                    self.shift(typ, opaque, newstate)
-                    # Pop while we are in an accept-only state
-                    state = newstate
-                     
-                    # TODO: Does this condition translate?
-                    while states[state] == [(0, state)]:
-                        self.pop()
-                        if len(self.stack) == 0:
-                            # Done parsing!
-                            return True
-                        top = self.stack[-1]
-                        states, _ = top.dfa
-                        state = top.state
-
-                    # Done with this token
-                    return False
-                elif t >= 256:
-                    # See if it's a symbol and if we're in its first set
-                    itsdfa = self.grammar.dfas[t]
-                    _, itsfirst = itsdfa
-                    if ilabel in itsfirst:
-                        # Push a symbol
-                        self.push(t, opaque, self.grammar.dfas[t], newstate)
-                        found = True
-                        break # To continue the outer while loop
-
-            if not found:
-                # Note: this condition was rewritten for mycpp tarnslation.
-                # if (0, state) in arcs:
-                #   ...
-                # else:
-                #   ...
-                found2 = False
-                for left, right in arcs:
-                    if left == 0 and right == state:
-                        # An accepting state, pop it and try something else
-                        self.pop()
-                        if len(self.stack) == 0:
-                            # Done parsing, but another token is input
-                            raise ParseError("too much input", typ, opaque)
-                        found2 = True
-
-                if not found2:
-                    # No success finding a transition
-                    raise ParseError("bad input", typ, opaque)
+            table = top.accel[top.state]
+            action = table.get(ilabel, -1)
+
+            if action == -1:
+                if 0 in table:
+                    # An accepting state, pop it and try something else
+                    self.pop()
+                    if len(self.stack) == 0:
+                        # Done parsing, but another token is input
+                        raise ParseError("too much input", typ, opaque)
+                    continue
+
+                # No success finding a transition
+                raise ParseError("bad input", typ, opaque)
+
+            if action >= 256:
+                # Push a symbol
+                t = action >> 8
+                self.push(t, opaque, self.grammar.accels[t], action & 0xff)
+                continue
+
+            # Shift a token; we're done with it
+            self.shift(typ, opaque, action)
+            # Pop while we are in an accept-only state
+            while top.accel[top.state].get(0, -1) == grammar.ACCEPT_ONLY:
+                self.pop()
+                if len(self.stack) == 0:
+                    # Done parsing!
+                    return True
+                top = self.stack[-1]
+
+            # Done with this token
+            return False
 
     def shift(self, typ, opaque, newstate):
         # type: (int, Token, int) -> None
@@ -190,13 +166,13 @@ class Parser(object):
             top.node.children.append(newnode)
         self.stack[-1].state = newstate
 
-    def push(self, typ, opaque, newdfa, newstate):
-        # type: (int, Token, dfa_t, int) -> None
+    def push(self, typ, opaque, newaccel, newstate):
+        # type: (int, Token, accel_t, int) -> None
         """Push a nonterminal.  (Internal)"""
         top = self.stack[-1]
         newnode = PNode(typ, opaque, [])
         self.stack[-1].state = newstate
-        self.stack.append(_StackItem(newdfa, 0, newnode))
+        self.stack.append(_StackItem(newaccel, 0, newnode))
 
     def pop(self):
         # type: () -> None
@@ -384,6 +384,38 @@ def make_first(tok_def, rawfirst, gr):
     return first
 
 
+def make_accels(gr):
+    """Compile the arcs and first sets into gr.accels.
+
+    The parser used to try each arc of a state in order, looking in the first
+    set of each nonterminal.  The table has the action of the first arc that
+    matches each label, so it parses the same way.  See Parser/acceler.c in the
+    Python distribution.
+    """
+    for symbol, (states, _) in gr.dfas.items():
+        assert len(states) < 256, states  # newstate fits in the low byte
+        accel = []
+        for state, arcs in enumerate(states):
+            table = {}
+            for ilab, newstate in arcs:
+                if ilab == 0:  # the final arc is tried last
+                    continue
+                t = gr.labels[ilab]
+                if t < 256:
+                    table.setdefault(ilab, newstate)
+                else:
+                    _, itsfirst = gr.dfas[t]
+                    for ilabel in sorted(itsfirst):
+                        table.setdefault(ilabel, (t << 8) | newstate)
+            if (0, state) in arcs:
+                if arcs == [(0, state)]:
+                    table[0] = grammar.ACCEPT_ONLY
+                else:
+                    table[0] = grammar.ACCEPT
+            accel.append(table)
+        gr.accels[symbol] = accel
+
+
 def MakeGrammar(f, tok_def=None):
   """Construct a Grammar object from a file."""
 
@@ -425,4 +457,5 @@ def MakeGrammar(f, tok_def=None):
       gr.dfas[gr.symbol2number[name]] = (states, fi)
 
   gr.start = gr.symbol2number[startsymbol]
+  make_accels(gr)
   return gr
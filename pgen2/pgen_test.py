@@ -0,0 +1,91 @@
+#!/usr/bin/env python2
+"""
+pgen_test.py: Tests for pgen.py
+"""
+from __future__ import print_function
+
+import cStringIO
+import unittest
+
+from pgen2 import grammar
+from pgen2 import parse
+from pgen2 import pgen  # module under test
+from pgen2 import token
+
+
+GRAMMAR = """
+start: expr ENDMARKER
+expr: term ('+' term)*
+term: NAME | NUMBER | '(' expr ')'
+"""
+
+
+class PgenTest(unittest.TestCase):
+
+  def setUp(self):
+    self.gr = pgen.MakeGrammar(cStringIO.StringIO(GRAMMAR))
+
+  def _Parse(self, tokens):
+    p = parse.Parser(self.gr)
+    p.setup(self.gr.start)
+    for typ in tokens:
+      done = p.addtoken(typ, None, self.gr.tokens[typ])
+    self.assertEqual(True, done)
+    return p.rootnode
+
+  def testAccels(self):
+    gr = self.gr
+    expr = gr.symbol2number['expr']
+    term = gr.symbol2number['term']
+    name = gr.tokens[token.NAME]
+    plus = gr.tokens[token.PLUS]
+
+    accel = gr.accels[expr]
+    states, _ = gr.dfas[expr]
+    self.assertEqual(len(states), len(accel))
+
+    # NAME is in the first set of 'term', so it's pushed
+    action = accel[0][name]
+    self.assertEqual(term, action >> 8)
+    self.assertNotIn(0, accel[0])
+
+    # After a term, '+' is shifted, or the state is accepted
+    state = action & 0xff
+    self.assertEqual(grammar.ACCEPT, accel[state][0])
+    self.assertLess(accel[state][plus], 256)
+
+    # After a NAME, there's nothing more to a 'term'
+    action = gr.accels[term][0][name]
+    self.assertEqual({0: grammar.ACCEPT_ONLY}, gr.accels[term][action])
+
+  def testParse(self):
+    node = self._Parse([
+        token.NAME, token.PLUS, token.LPAR, token.NUMBER, token.PLUS,
+        token.NAME, token.RPAR, token.ENDMARKER])
+    self.assertEqual(self.gr.symbol2number['start'], node.typ)
+    expr_node, _ = node.children
+    # term + term
+    self.assertEqual(3, len(expr_node.children))
+
+    try:
+      self._Parse([token.NAME, token.PLUS, token.RPAR])
+    except parse.ParseError as e:
+      self.assertEqual('bad input', e.msg)
+    else:
+      self.fail('Expected ParseError')
+
+    # Without ENDMARKER, the start symbol is popped before the second NAME
+    p = parse.Parser(self.gr)
+    p.setup(self.gr.symbol2number['expr'])
+    name = self.gr.tokens[token.NAME]
+    self.assertEqual(False, p.addtoken(token.NAME, None, name))
+    try:
+      p.addtoken(token.NAME, None, name)
+    except parse.ParseError as e:
+      self.assertEqual('too much input', e.msg)
+    else:
+      self.fail('Expected ParseError')
+
+
+if __name__ == '__main__':
+  unittest.main()
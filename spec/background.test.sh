@@ -143,3 +143,58 @@ begin
 end
 status=42
 ## END
+
+#### wait -n with PIDs waits for one of them
+{ sleep 0.5; exit 5; } &
+slow=$!
+{ sleep 0.1; exit 3; } &
+fast=$!
+{ exit 7; } &
+other=$!
+sleep 0.05  # other exits first, but it's not listed
+wait -n $slow $fast
+echo status=$?
+wait
+## STDOUT:
+status=3
+## END
+## N-I dash stdout-json: "status=2\n"
+## N-I mksh stdout-json: "status=1\n"
+
+#### wait -n with PIDs reports each one once
+{ exit 3; } &
+p1=$!
+{ sleep 0.1; exit 5; } &
+p2=$!
+sleep 0.05  # p1 is done
+for i in 1 2 3; do
+  wait -n $p1 $p2
+  echo status=$?
+done
+## STDOUT:
+status=3
+status=5
+status=127
+## END
+## N-I dash/mksh STDOUT:
+status=2
+status=2
+status=2
+## END
+
+#### wait -t with a timeout (OSH only)
+sleep 5 &
+pid=$!
+wait -t 0.1 $pid
+echo status=$?
+kill $pid
+wait $pid
+echo status=$?
+## STDOUT:
+status=142
+status=143
+## END
+## N-I dash/bash/mksh STDOUT:
+status=2
+status=143
+## END
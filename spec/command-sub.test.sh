@@ -271,3 +271,43 @@ status=1
 status=1
 ## END
 ## OK bash stdout-json: "\nstatus=0\n\nstatus=0\n"
+
+#### Command sub with nofork_command_sub
+shopt -s nofork_command_sub 2>/dev/null || true
+f() {
+  local n=$1 i
+  for i in a b; do
+    echo "$n-$i"
+  done
+  return 3
+}
+g() { y=global; echo g; }
+x=$(f 5)
+echo "[$x] $?"
+echo "[$(g)] y=${y:-unset}"
+echo "[$(echo outer $(f 1))]"
+false
+echo "$(echo hi)" $?
+## STDOUT:
+[5-a
+5-b] 3
+[g] y=unset
+[outer 1-a 1-b]
+hi 0
+## END
+
+#### nofork_command_sub when a function is redefined, or $TMPDIR is missing
+shopt -s nofork_command_sub 2>/dev/null || true
+g() { echo g1; }
+h() { g; }
+x=$(h)
+g() { cd /; echo g2; }
+x=$(h)
+echo $x
+test "$PWD" = / && echo 'changed cwd'
+TMPDIR=/nonexistent
+echo "$(h)"
+## STDOUT:
+g2
+g2
+## END
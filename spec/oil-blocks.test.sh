@@ -102,3 +102,49 @@ outer x = 1
 ## END
 
 
+
+#### pool runs at most N jobs at once
+shopt -s parse_brace
+start=$(date +%s%N)
+pool -j 2 -a statuses {
+  for i in 1 2 3 4 5; do
+    { sleep 0.2; exit $i; } &
+  done
+}
+echo status=$?
+echo "${statuses[@]}"
+# 3 rounds of 0.2 seconds
+elapsed=$(( ($(date +%s%N) - start) / 1000000 ))
+test $elapsed -ge 550 && echo throttled
+## STDOUT:
+status=5
+1 2 3 4 5
+throttled
+## END
+
+#### pool with a pipeline, and a usage error
+shopt -s parse_brace
+pool -j 3 -a statuses {
+  echo hi | false &
+  true &
+}
+echo status=$? "${statuses[@]}"
+pool -j 0 { true & }
+echo status=$?
+## STDOUT:
+status=1 1 0
+status=2
+## END
+
+#### pool when jobs finish outside of it
+shopt -s parse_brace
+# the first job is reaped while the foreground sleep runs
+pool -j 1 { sleep 0.1 & sleep 0.3; sleep 0.1 & }
+echo status=$?
+# or by 'wait'
+pool -j 1 { sleep 0.2 & wait; sleep 0.1 & }
+echo status=$?
+## STDOUT:
+status=0
+status=0
+## END
@@ -39,6 +39,22 @@ argv.py @a
 ['1', '2', '3 4', '5']
 ## END
 
+#### push onto FUNCNAME doesn't change the call stack
+f() {
+  push FUNCNAME zz
+  echo "${FUNCNAME[*]}"
+  push BASH_SOURCE qq
+  echo "${#BASH_SOURCE[@]}"
+}
+f
+f
+## STDOUT:
+f
+1
+f
+1
+## END
+
 #### push with invalid type
 s=''
 push :s a b
@@ -149,6 +149,30 @@ echo i=$i
 ## stdout: i=3
 ## N-I dash/mksh stdout: i=0
 
+#### shopt -s nofork_pipeline keeps pipe semantics
+shopt -s lastpipe
+shopt -s nofork_pipeline 2>/dev/null
+echo 'a b' | read first rest
+echo "$first-$rest"
+echo hi | { test -p /dev/stdin && echo pipe; }
+printf '%s\n' x y | while read line; do echo "[$line]"; done
+TMPDIR=/nonexistent
+echo fallback | cat
+## STDOUT:
+a-b
+pipe
+[x]
+[y]
+fallback
+## END
+## N-I dash/mksh STDOUT:
+-
+pipe
+[x]
+[y]
+fallback
+## END
+
 
 #### SIGPIPE causes pipeline to die (regression for issue #295)
 cat /dev/urandom | sleep 0.1